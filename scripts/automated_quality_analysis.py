@@ -26,6 +26,9 @@ logger = logging.getLogger(__name__)
 
 from grape_recorder.paths import GRAPEPaths
 
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+from hf_timestd.core.npz_reader import decode_json_member
+
 class QualityAnalyzer:
     """Analyze decimation and timing quality for dashboard"""
     
@@ -134,7 +137,8 @@ class QualityAnalyzer:
             for f in wide_files[:12]:  # First 12 minutes
                 data = np.load(f, allow_pickle=True)
                 if 'timing_metadata' in data:
-                    meta = data['timing_metadata'].item()
+                    meta = decode_json_member(data['timing_metadata'], trust_pickle=True,
+                                              name='timing_metadata') or {}
                     age = meta.get('time_snap_age_seconds')
                     if age is not None:
                         wide_snap_ages.append(age)
@@ -144,7 +148,8 @@ class QualityAnalyzer:
             for f in carrier_files[:12]:
                 data = np.load(f, allow_pickle=True)
                 if 'timing_metadata' in data:
-                    meta = data['timing_metadata'].item()
+                    meta = decode_json_member(data['timing_metadata'], trust_pickle=True,
+                                              name='timing_metadata') or {}
                     offset = meta.get('ntp_offset_ms')
                     if offset is not None:
                         carrier_ntp_offsets.append(offset)
@@ -172,7 +177,8 @@ class QualityAnalyzer:
             try:
                 data = np.load(f, allow_pickle=True)
                 if 'timing_metadata' in data:
-                    meta = data['timing_metadata'].item()
+                    meta = decode_json_member(data['timing_metadata'], trust_pickle=True,
+                                              name='timing_metadata') or {}
                     quality = meta.get('quality', 'unknown')
                     distribution[quality] = distribution.get(quality, 0) + 1
             except:
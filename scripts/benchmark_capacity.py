@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Channel Capacity Benchmark - how many 20 kHz channels can this host sustain?
+
+A fake radiod (hf_timestd.core.fake_radiod, its own process) sends N
+channels of synthetic WWV/WWVH/CHU IQ over loopback at real-time pace;
+the real recorder stack receives it, writes the Phase 1 archive and runs
+Phase 2 on every completed minute. N is stepped up and each step reports:
+
+    drop rate   - packets sent but never received (socket overflow)
+    CPU         - recorder process CPU as % of the host (all cores), and
+                  the sender's own CPU
+    memory      - peak and final RSS of the recorder process
+    Phase 2     - minutes analyzed and the deepest analysis backlog
+
+The sustained capacity is the largest N whose drop rate, CPU and Phase 2
+backlog all stay within the limits (--max-drop, --max-cpu, and at most
+one queued minute per channel).
+
+Modes:
+    stream-v2 - StreamRecorderV2 per channel on ka9q RadiodStream, as
+                CoreRecorderV2 runs them (multicast on loopback). The
+                channels come from the fake radiod's ChannelInfo instead of
+                radiod discovery/control.
+    pipeline  - PipelineRecorder per channel on one shared RTPReceiver
+                (unicast to 127.0.0.1, since RTPReceiver only joins the
+                group on INADDR_ANY)
+
+Phase 2 runs once per completed minute, so steps shorter than ~70 s
+measure only the receive and archive path.
+
+Usage:
+    python scripts/benchmark_capacity.py
+    python scripts/benchmark_capacity.py --mode pipeline --channels 3 6 9 12 --duration 130
+    python scripts/benchmark_capacity.py --loss 0.001 --reorder 0.01 --json capacity.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import resource
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from hf_timestd.core.fake_radiod import FakeRadiod, FakeRadiodConfig
+
+MULTICAST_GROUP = '239.77.42.2'
+RECEIVER_GRID = 'EM38ww'
+
+
+def free_udp_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(('0.0.0.0', 0))
+        return s.getsockname()[1]
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process (MB)."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+class Sampler:
+    """Samples RSS and Phase 2 backlog once per second while a step runs."""
+    
+    def __init__(self, orchestrators: List[Any]):
+        self.orchestrators = orchestrators
+        self.peak_rss_mb = rss_mb()
+        self.max_backlog = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def _run(self):
+        while not self._stop.wait(1.0):
+            self.peak_rss_mb = max(self.peak_rss_mb, rss_mb())
+            backlog = max((o.analysis_queue.qsize() for o in self.orchestrators), default=0)
+            self.max_backlog = max(self.max_backlog, backlog)
+    
+    def start(self):
+        self._thread.start()
+    
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+def start_recorders(mode: str, radiod: FakeRadiod, output_dir: Path):
+    """Create and start one recorder per channel; returns (recorders, receiver)."""
+    config = radiod.config
+    recorders = []
+    receiver = None
+    
+    if mode == 'pipeline':
+        from hf_timestd.core.pipeline_recorder import PipelineRecorder, PipelineRecorderConfig
+        from hf_timestd.core.rtp_receiver import RTPReceiver
+        
+        receiver = RTPReceiver(config.multicast_group, port=config.port)
+        for ch in radiod.channels:
+            recorders.append(PipelineRecorder(PipelineRecorderConfig(
+                ssrc=ch.ssrc,
+                frequency_hz=ch.frequency_hz,
+                sample_rate=config.sample_rate,
+                description=ch.description,
+                output_dir=output_dir,
+                receiver_grid=RECEIVER_GRID
+            ), receiver))
+        receiver.start()
+    else:
+        from hf_timestd.core.stream_recorder_v2 import StreamRecorderConfig, StreamRecorderV2
+        
+        for ch in radiod.channels:
+            recorders.append(StreamRecorderV2(StreamRecorderConfig(
+                ssrc=ch.ssrc,
+                frequency_hz=ch.frequency_hz,
+                sample_rate=config.sample_rate,
+                description=ch.description,
+                output_dir=output_dir,
+                receiver_grid=RECEIVER_GRID
+            ), radiod.channel_info(ch)))
+    
+    for recorder in recorders:
+        recorder.start()
+    return recorders, receiver
+
+
+def packets_received(mode: str, recorder, final_quality) -> int:
+    if mode == 'pipeline':
+        return recorder.packets_received
+    return final_quality.rtp_packets_received if final_quality else 0
+
+
+def run_step(mode: str, n_channels: int, args, output_dir: Path) -> Dict[str, Any]:
+    radiod = FakeRadiod(FakeRadiodConfig(
+        channels=n_channels,
+        sample_rate=args.sample_rate,
+        multicast_group=MULTICAST_GROUP,
+        port=free_udp_port(),
+        unicast=(mode == 'pipeline'),
+        loss=args.loss,
+        reorder=args.reorder,
+        snr_db=args.snr
+    ))
+    recorders, receiver = start_recorders(mode, radiod, output_dir)
+    radiod.start()  # After the receivers bind, so startup is not counted as loss
+    
+    sampler = Sampler([r.orchestrator for r in recorders])
+    sampler.start()
+    children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu_started = time.process_time()
+    wall_started = time.monotonic()
+    
+    time.sleep(args.duration)
+    
+    cpu_sec = time.process_time() - cpu_started
+    wall_sec = time.monotonic() - wall_started
+    sender = radiod.stop()
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    sender_cpu_sec = (children.ru_utime + children.ru_stime
+                      - children_before.ru_utime - children_before.ru_stime)
+    time.sleep(0.5)  # Drain sockets and handoff rings
+    sampler.stop()
+    
+    minutes_analyzed = sum(r.orchestrator.stats['minutes_analyzed'] for r in recorders)
+    final_backlog = max(r.orchestrator.analysis_queue.qsize() for r in recorders)
+    received = 0
+    for recorder in recorders:
+        final_quality = recorder.stop()
+        received += packets_received(mode, recorder, final_quality)
+    if receiver is not None:
+        receiver.stop()
+    
+    n_cpu = os.cpu_count() or 1
+    drop_rate = max(0.0, 1.0 - received / sender['sent']) if sender['sent'] else 1.0
+    return {
+        'channels': n_channels,
+        'packets_sent': sender['sent'],
+        'packets_received': received,
+        'drop_rate': round(drop_rate, 6),
+        'injected_loss': sender['lost'],
+        'injected_reorder': sender['reordered'],
+        'sender_late_blocks': sender['late_blocks'],
+        'cpu_pct': round(100.0 * cpu_sec / (wall_sec * n_cpu), 1),
+        'sender_cpu_pct': round(100.0 * sender_cpu_sec / (wall_sec * n_cpu), 1),
+        'peak_rss_mb': round(sampler.peak_rss_mb, 1),
+        'final_rss_mb': round(rss_mb(), 1),
+        'phase2_minutes': minutes_analyzed,
+        'phase2_max_backlog': sampler.max_backlog,
+        'phase2_final_backlog': final_backlog,
+    }
+
+
+def sustained(step: Dict[str, Any], args) -> bool:
+    return (step['drop_rate'] <= args.max_drop
+            and step['cpu_pct'] <= args.max_cpu
+            and step['phase2_final_backlog'] <= 1
+            and step['sender_late_blocks'] == 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark sustained recorder channel capacity')
+    parser.add_argument('--mode', choices=['stream-v2', 'pipeline'], default='stream-v2')
+    parser.add_argument('--channels', type=int, nargs='+', default=[1, 3, 6, 9, 13],
+                        help='Channel counts to step through')
+    parser.add_argument('--duration', type=float, default=75.0, help='Seconds per step')
+    parser.add_argument('--sample-rate', type=int, default=20000)
+    parser.add_argument('--loss', type=float, default=0.0, help='Injected packet loss probability')
+    parser.add_argument('--reorder', type=float, default=0.0, help='Injected reorder probability')
+    parser.add_argument('--snr', type=float, default=10.0, help='Synthetic tone SNR (dB)')
+    parser.add_argument('--max-drop', type=float, default=0.001, help='Sustained: max drop rate')
+    parser.add_argument('--max-cpu', type=float, default=80.0, help='Sustained: max CPU %% of host')
+    parser.add_argument('--stop-on-failure', action='store_true',
+                        help='Stop stepping at the first unsustained channel count')
+    parser.add_argument('--json', type=Path, help='Write results to JSON file')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.ERROR)
+    
+    steps = []
+    capacity: Optional[int] = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sorted(args.channels):
+            step = run_step(args.mode, n, args, Path(tmp) / f'{args.mode}_{n}')
+            step['sustained'] = sustained(step, args)
+            steps.append(step)
+            print(f"{n:3d} ch  drop {100 * step['drop_rate']:6.3f}%  "
+                  f"cpu {step['cpu_pct']:5.1f}% (sender {step['sender_cpu_pct']:4.1f}%)  "
+                  f"rss {step['peak_rss_mb']:6.0f} MB  "
+                  f"phase2 {step['phase2_minutes']:3d} min, backlog {step['phase2_max_backlog']}  "
+                  f"{'ok' if step['sustained'] else 'OVERLOADED'}")
+            if step['sustained']:
+                capacity = n
+            elif args.stop_on_failure:
+                break
+    
+    print(f"\nSustained capacity ({args.mode}, {args.sample_rate} Hz): "
+          f"{capacity if capacity is not None else 'none'} channels")
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'mode': args.mode,
+                'sample_rate': args.sample_rate,
+                'cpu_count': os.cpu_count(),
+                'limits': {'max_drop': args.max_drop, 'max_cpu': args.max_cpu},
+                'sustained_channels': capacity,
+                'steps': steps,
+            }, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Import-Time Benchmark - cold-start cost of hf_timestd entry points
+
+Runs each entry-point module in a fresh interpreter with `python -X importtime`
+and reports total import time, peak RSS after import, and the slowest
+top-level imports. Each target is run several times and the median is kept,
+because the first run also pays for filesystem cache misses.
+
+Targets (the modules the services are started with):
+    recorder   - hf_timestd.core.core_recorder_v2      (timestd-core.sh)
+    analytics  - hf_timestd.core.phase2_analytics_service (timestd-analytics.sh)
+    fusion     - hf_timestd.core.multi_broadcast_fusion
+    cli        - hf_timestd.cli                         (hf-timestd command)
+    stream     - hf_timestd.stream                      (subscribe_stream only)
+
+Usage:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --runs 7 --top 15
+    python scripts/benchmark_import_time.py --json results.json
+    python scripts/benchmark_import_time.py --baseline results.json   # compare
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SRC_DIR = Path(__file__).parent.parent / 'src'
+
+TARGETS = {
+    'recorder': 'hf_timestd.core.core_recorder_v2',
+    'analytics': 'hf_timestd.core.phase2_analytics_service',
+    'fusion': 'hf_timestd.core.multi_broadcast_fusion',
+    'cli': 'hf_timestd.cli',
+    'stream': 'hf_timestd.stream',
+}
+
+# Printed by the child after the import so RSS reflects only the import
+CHILD_CODE = (
+    "import importlib, resource, sys\n"
+    "importlib.import_module(sys.argv[1])\n"
+    "print('RSS_KB', resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n"
+    "print('MODULES', len(sys.modules))\n"
+)
+
+IMPORTTIME_RE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def run_once(module: str) -> Dict:
+    """Import one module in a fresh interpreter and parse -X importtime output."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        p for p in (str(SRC_DIR), env.get('PYTHONPATH', '')) if p
+    )
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', CHILD_CODE, module],
+        capture_output=True, text=True, env=env
+    )
+    if proc.returncode != 0:
+        last = proc.stderr.strip().splitlines()[-1:] or ['unknown error']
+        return {'error': last[0]}
+
+    # Top-level entries (indent of one space) sum to the total import time
+    top_level: List[Tuple[str, int]] = []
+    for line in proc.stderr.splitlines():
+        m = IMPORTTIME_RE.match(line)
+        if m and len(m.group(3)) == 1:
+            top_level.append((m.group(4), int(m.group(2))))
+
+    rss_kb = modules = 0
+    for line in proc.stdout.splitlines():
+        if line.startswith('RSS_KB'):
+            rss_kb = int(line.split()[1])
+        elif line.startswith('MODULES'):
+            modules = int(line.split()[1])
+
+    return {
+        'total_ms': sum(us for _, us in top_level) / 1000.0,
+        'rss_mb': rss_kb / 1024.0,
+        'modules': modules,
+        'top': sorted(top_level, key=lambda x: -x[1]),
+    }
+
+
+def benchmark(module: str, runs: int) -> Dict:
+    """Run a target several times and keep the median."""
+    results = [run_once(module) for _ in range(runs)]
+    errors = [r['error'] for r in results if 'error' in r]
+    if errors:
+        return {'module': module, 'error': errors[0]}
+
+    median = sorted(results, key=lambda r: r['total_ms'])[len(results) // 2]
+    return {
+        'module': module,
+        'total_ms': round(statistics.median(r['total_ms'] for r in results), 1),
+        'rss_mb': round(median['rss_mb'], 1),
+        'modules': median['modules'],
+        'top': [(name, round(us / 1000.0, 1)) for name, us in median['top']],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark hf_timestd import (cold-start) time')
+    parser.add_argument('--targets', nargs='+', choices=sorted(TARGETS), default=list(TARGETS),
+                        help='Entry points to measure (default: all)')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per target (median kept)')
+    parser.add_argument('--top', type=int, default=8, help='Slowest top-level imports to show')
+    parser.add_argument('--json', type=Path, help='Write results to JSON file')
+    parser.add_argument('--baseline', type=Path, help='Compare against a previous --json file')
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline and args.baseline.exists():
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {}
+    for name in args.targets:
+        result = benchmark(TARGETS[name], args.runs)
+        results[name] = result
+
+        print(f"\n{name}: {result['module']}")
+        if 'error' in result:
+            print(f"  FAILED: {result['error']}")
+            continue
+
+        line = (f"  import: {result['total_ms']:8.1f} ms   RSS: {result['rss_mb']:6.1f} MB   "
+                f"modules: {result['modules']}")
+        base = baseline.get(name, {})
+        if 'total_ms' in base:
+            delta = result['total_ms'] - base['total_ms']
+            line += f"   (baseline {base['total_ms']:.1f} ms, {delta:+.1f} ms)"
+        print(line)
+        for mod, ms in result['top'][:args.top]:
+            print(f"    {ms:8.1f} ms  {mod}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+IQ Codec Benchmark - lossless IQ codec vs generic zstd/lz4
+
+Per input minute, compares:
+
+    zstd      - zstd level N over complex64 bytes (compression = 'zstd')
+    lz4       - lz4 frame over complex64 bytes (compression = 'lz4')
+    iq        - core.iq_codec on 1 s blocks, as stored in .bin.seek minutes
+                (compression = 'iq-seekable'): int16-origin samples as
+                integer (delta) planes, anything else as byte-shuffled float
+
+Reported: compression ratio, the iq block method mix, and encode/decode
+throughput in MB/s of raw complex64 on one core (single thread, so the
+numbers are per core). Every codec is checked bit-exact.
+
+Inputs are recorded raw_buffer minutes in any format the archive reader
+understands (.bin, .bin.zst, .bin.lz4, .bin.seek). Without --input, two
+synthetic minutes from scripts/generate_synthetic_data.py are used: float
+IQ, and the same minute converted through int16 the way the int16 RTP path
+does (samples_int16.astype(np.float32) / 32768.0).
+
+Usage:
+    python scripts/benchmark_iq_codec.py
+    python scripts/benchmark_iq_codec.py --input /var/lib/hf-timestd/raw_buffer/WWV_10_MHz/20251206/17650*.bin*
+    python scripts/benchmark_iq_codec.py --level 1 3 --json iq_codec.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generate_synthetic_data import synthesize_tone_minute
+from hf_timestd.core.archive_reader import ArchiveReader
+from hf_timestd.core.iq_codec import block_method, decode_iq_into, encode_iq
+
+
+def best_ms(fn: Callable, repeats: int) -> float:
+    """Fastest of `repeats` calls, in ms."""
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def generic_codec(name: str, level: int) -> Tuple[Callable, Callable]:
+    if name == 'zstd':
+        import zstandard as zstd
+        cctx = zstd.ZstdCompressor(level=level)
+        dctx = zstd.ZstdDecompressor()
+        return cctx.compress, dctx.decompress
+    import lz4.frame
+    return (lambda raw: lz4.frame.compress(raw, compression_level=level)), lz4.frame.decompress
+
+
+def benchmark_minute(samples: np.ndarray, level: int, block_samples: int,
+                     repeats: int) -> Dict[str, Dict[str, float]]:
+    raw = samples.tobytes()
+    mb = len(raw) / 1e6
+    results = {}
+    
+    for name in ('zstd', 'lz4'):
+        compress, decompress = generic_codec(name, level)
+        blob = compress(raw)
+        assert decompress(blob) == raw
+        results[name] = {
+            'ratio': len(raw) / len(blob),
+            'encode_mb_s': mb / best_ms(lambda: compress(raw), repeats) * 1000,
+            'decode_mb_s': mb / best_ms(lambda: decompress(blob), repeats) * 1000,
+        }
+    
+    starts = range(0, len(samples), block_samples)
+    
+    def encode():
+        return [encode_iq(samples[i:i + block_samples], level=level) for i in starts]
+    
+    blocks = encode()
+    out = np.empty_like(samples)
+    
+    def decode():
+        for i, blob in zip(starts, blocks):
+            decode_iq_into(blob, out[i:i + block_samples])
+    
+    decode()
+    assert np.array_equal(out.view(np.uint32), samples.view(np.uint32)), "iq codec not bit-exact"
+    
+    methods = [block_method(b) for b in blocks]
+    results['iq'] = {
+        'ratio': len(raw) / sum(len(b) for b in blocks),
+        'int_blocks_pct': 100.0 * methods.count('int') / len(methods),
+        'encode_mb_s': mb / best_ms(encode, repeats) * 1000,
+        'decode_mb_s': mb / best_ms(decode, repeats) * 1000,
+    }
+    return results
+
+
+def synthetic_minutes(sample_rate: int, snr_db: float, seed: int) -> Dict[str, np.ndarray]:
+    iq = synthesize_tone_minute(sample_rate, snr_db=snr_db, seed=seed)
+    # Full scale at ~4 sigma, as an int16 receiver output would be leveled
+    peak = 4.0 * float(np.std(iq.view(np.float32)))
+    as_int16 = np.clip(np.round(iq.view(np.float32) / peak * 32767), -32768, 32767).astype(np.int16)
+    return {
+        'synthetic float': iq,
+        'synthetic int16': (as_int16.astype(np.float32) / 32768.0).view(np.complex64),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the lossless IQ codec')
+    parser.add_argument('--input', type=Path, nargs='*', help='Recorded raw_buffer minutes (default: synthetic)')
+    parser.add_argument('--level', type=int, nargs='+', default=[3], help='zstd/lz4 level(s)')
+    parser.add_argument('--block-seconds', type=float, default=1.0, help='IQ codec block length')
+    parser.add_argument('--sample-rate', type=int, default=20000)
+    parser.add_argument('--snr', type=float, default=10.0, help='Synthetic tone SNR (dB)')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', type=Path, help='Write results to JSON file')
+    args = parser.parse_args()
+    
+    if args.input:
+        reader = ArchiveReader(sample_rate=args.sample_rate, prefetch_minutes=0)
+        groups = {'recorded': [np.array(reader.read_minute(p)[0]) for p in args.input]}
+    else:
+        groups = {k: [v] for k, v in synthetic_minutes(args.sample_rate, args.snr, args.seed).items()}
+    
+    block_samples = max(1, int(args.block_seconds * args.sample_rate))
+    results = {}
+    for group, minutes in groups.items():
+        for level in args.level:
+            runs = [benchmark_minute(m, level, block_samples, args.repeats) for m in minutes]
+            key = f"{group}/level {level}"
+            results[key] = {
+                codec: {metric: round(statistics.median(r[codec][metric] for r in runs), 3)
+                        for metric in runs[0][codec]}
+                for codec in runs[0]
+            }
+            print(f"{key} ({len(minutes)} minute{'s' if len(minutes) != 1 else ''}):")
+            for codec, r in results[key].items():
+                mix = f"  int blocks {r['int_blocks_pct']:.0f}%" if 'int_blocks_pct' in r else ''
+                print(f"  {codec:5s} ratio {r['ratio']:6.3f}  encode {r['encode_mb_s']:7.1f} MB/s  "
+                      f"decode {r['decode_mb_s']:7.1f} MB/s{mix}")
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
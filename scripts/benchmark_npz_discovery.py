@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+NPZ Discovery Benchmark - legacy rglob scan vs watermark discovery
+
+Builds a synthetic archive of empty minute files (1440 per day, named like
+the recorder's YYYYMMDDTHHMMSSZ_freq_iq.npz) in both layouts NPZDiscovery
+handles, ending yesterday (UTC):
+
+    daily  - archive/YYYYMMDD/*.npz
+    flat   - archive/*.npz (paths.py layout)
+
+The archive is grown to each of the --days checkpoints and, per layout,
+the cost of one poll is measured with the watermark at the newest file:
+
+    rglob          - AnalyticsService's former discovery: rglob('*.npz')
+                     plus a name > watermark filter
+    idle           - NPZDiscovery poll with nothing new
+    new minute     - a new file appears in today's directory, then a poll
+                     (the file is checked to be found and the watermark advanced)
+
+Flat layout is measured with inotify and with the mtime-gated listing
+fallback. Results are median ms per poll.
+
+Usage:
+    python scripts/benchmark_npz_discovery.py
+    python scripts/benchmark_npz_discovery.py --days 1 7 30 90 --polls 50 --json discovery.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from hf_timestd.core.npz_discovery import INOTIFY_AVAILABLE, NPZDiscovery
+
+FREQUENCY_HZ = 10000000
+
+
+def minute_name(dt: datetime) -> str:
+    return f"{dt.strftime('%Y%m%dT%H%M%SZ')}_{FREQUENCY_HZ}_iq.npz"
+
+
+def day_dir(root: Path, layout: str, dt: datetime) -> Path:
+    return root / dt.strftime('%Y%m%d') if layout == 'daily' else root
+
+
+def write_day(root: Path, layout: str, day: datetime):
+    directory = day_dir(root, layout, day)
+    directory.mkdir(parents=True, exist_ok=True)
+    for minute in range(1440):
+        (directory / minute_name(day + timedelta(minutes=minute))).touch()
+
+
+def legacy_discover(root: Path, watermark: str) -> List[Path]:
+    return sorted((f for f in root.rglob('*.npz') if f.name > watermark), key=lambda f: f.name)
+
+
+def median_ms(fn: Callable, polls: int) -> float:
+    times = []
+    for _ in range(polls):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000
+
+
+def benchmark(root: Path, layout: str, use_inotify: bool, watermark: str,
+              next_minute: datetime, polls: int) -> Dict[str, float]:
+    discovery = NPZDiscovery(root, watermark=watermark, use_inotify=use_inotify)
+    assert discovery.discover() == [], "watermark should be at the newest file"
+    
+    idle_ms = median_ms(discovery.discover, polls)
+    
+    times = []
+    for i in range(polls):
+        dt = next_minute + timedelta(minutes=i)
+        directory = day_dir(root, layout, dt)
+        directory.mkdir(exist_ok=True)
+        path = directory / minute_name(dt)
+        path.touch()
+        started = time.perf_counter()
+        found = discovery.discover()
+        times.append(time.perf_counter() - started)
+        assert [f.name for f in found] == [path.name], f"{layout}: expected {path.name}, got {found}"
+        discovery.advance(path.name)
+    discovery.close()
+    
+    # Remove this run's new files so every variant starts from the same tree
+    for i in range(polls):
+        dt = next_minute + timedelta(minutes=i)
+        (day_dir(root, layout, dt) / minute_name(dt)).unlink()
+    
+    return {'idle_ms': idle_ms, 'new_minute_ms': statistics.median(times) * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark watermark NPZ discovery')
+    parser.add_argument('--days', type=int, nargs='+', default=[1, 7, 30], help='Archive sizes (days)')
+    parser.add_argument('--polls', type=int, default=20, help='Polls per measurement')
+    parser.add_argument('--json', type=Path, help='Write results to JSON file')
+    args = parser.parse_args()
+    
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    variants = [('daily', False), ('flat', False)]
+    if INOTIFY_AVAILABLE:
+        variants.insert(1, ('flat', True))
+    
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        days_written = 0
+        for days in sorted(args.days):
+            for layout in ('daily', 'flat'):
+                root = Path(tmp) / layout
+                for d in range(days_written + 1, days + 1):
+                    write_day(root, layout, today - timedelta(days=d))
+            days_written = days
+            
+            watermark = minute_name(today - timedelta(minutes=1))
+            for layout, use_inotify in variants:
+                root = Path(tmp) / layout
+                key = f"{layout}{'+inotify' if use_inotify else ''}/{days}d"
+                legacy_ms = median_ms(lambda: legacy_discover(root, watermark), min(args.polls, 5))
+                r = benchmark(root, layout, use_inotify, watermark, today, args.polls)
+                results[key] = {'files': days * 1440, 'rglob_ms': round(legacy_ms, 3),
+                                **{k: round(v, 3) for k, v in r.items()}}
+                print(f"{key:18s} {days * 1440:7d} files  rglob {legacy_ms:8.2f} ms  "
+                      f"idle {r['idle_ms']:7.3f} ms  new minute {r['new_minute_ms']:7.3f} ms")
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
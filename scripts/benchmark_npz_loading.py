@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+NPZ Loading Benchmark - np.load(allow_pickle=True) vs pickle-free NPZReader
+
+Writes N synthetic 1-minute recorder archives (20 kHz complex64, the core
+recorder's member layout) and times scanning them:
+
+    legacy           - NPZArchive.load as it was: np.load(allow_pickle=True),
+                       every member read, IQ fully decompressed/copied
+    archive          - NPZArchive.load now: members read individually,
+                       stored IQ memory-mapped copy-on-write
+    legacy metadata  - sample count + timing scalars via np.load (the
+                       sample count needs the whole IQ member)
+    metadata         - the same via NPZReader header and scalar reads
+
+The two load modes also touch the first second of IQ (a tone-window scan) so the
+mapped pages are really read. Reported: ms per file and peak Python-side
+allocation (tracemalloc) per mode, for stored (np.savez) and compressed
+(np.savez_compressed) archives. Files sit in the page cache, so the
+numbers show decode/allocation cost rather than disk speed.
+
+Usage:
+    python scripts/benchmark_npz_loading.py
+    python scripts/benchmark_npz_loading.py --files 30 --json npz_loading.json
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from hf_timestd.core.analytics_service import NPZArchive
+from hf_timestd.core.npz_reader import NPZReader
+
+SAMPLE_RATE = 20000
+
+
+def write_archive(path: Path, iq: np.ndarray, compressed: bool):
+    save = np.savez_compressed if compressed else np.savez
+    save(path, iq=iq, rtp_timestamp=123456, rtp_ssrc=10000000, sample_rate=SAMPLE_RATE,
+         frequency_hz=10e6, channel_name='WWV 10 MHz', unix_timestamp=1765000000.0,
+         gaps_filled=0, gaps_count=0, packets_received=3000, packets_expected=3000,
+         gap_rtp_timestamps=np.array([], dtype=np.uint32),
+         gap_sample_indices=np.array([], dtype=np.uint64),
+         gap_samples_filled=np.array([], dtype=np.uint32),
+         gap_packets_lost=np.array([], dtype=np.uint32),
+         recorder_version='bench', created_timestamp=1765000060.0,
+         time_snap_rtp=100, time_snap_utc=1765000000.5, time_snap_source='wwv_tone')
+
+
+def legacy_load(path: Path) -> float:
+    data = np.load(path, allow_pickle=True)
+    fields = {k: data[k] for k in data.files}  # Former NPZArchive.load read every member
+    return float(np.mean(np.abs(fields['iq'][:SAMPLE_RATE]) ** 2))
+
+
+def archive_load(path: Path) -> float:
+    archive = NPZArchive.load(path)
+    return float(np.mean(np.abs(archive.iq_samples[:SAMPLE_RATE]) ** 2))
+
+
+def metadata_only(path: Path) -> float:
+    with NPZReader(path) as npz:
+        return npz.shape('iq')[0] / npz.scalar('sample_rate', int) + npz.scalar('rtp_timestamp', int)
+
+
+def legacy_metadata(path: Path) -> float:
+    with np.load(path, allow_pickle=True) as data:
+        return len(data['iq']) / int(data['sample_rate']) + int(data['rtp_timestamp'])
+
+
+def measure(fn: Callable, files: List[Path]) -> Dict[str, float]:
+    fn(files[0])  # Warm imports and page cache
+    started = time.perf_counter()
+    for f in files:
+        fn(f)
+    elapsed = time.perf_counter() - started
+    
+    # Separate pass: tracemalloc slows small allocations and would skew timing
+    tracemalloc.start()
+    for f in files:
+        fn(f)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'ms_per_file': elapsed / len(files) * 1000, 'peak_alloc_mb': peak / 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pickle-free NPZ loading')
+    parser.add_argument('--files', type=int, default=10, help='Minute archives per format')
+    parser.add_argument('--json', type=Path, help='Write results to JSON file')
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(1)
+    n = SAMPLE_RATE * 60
+    iq = (rng.standard_normal(n) + 1j * rng.standard_normal(n)).astype(np.complex64) * 0.1
+    
+    modes = {
+        'legacy': legacy_load,
+        'archive': archive_load,
+        'legacy metadata': legacy_metadata,
+        'metadata': metadata_only,
+    }
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt, compressed in (('stored', False), ('compressed', True)):
+            files = []
+            for i in range(args.files):
+                path = Path(tmp) / f"{fmt}_{i:03d}.npz"
+                write_archive(path, iq, compressed)
+                files.append(path)
+            for name, fn in modes.items():
+                key = f"{fmt}/{name}"
+                results[key] = r = {k: round(v, 3) for k, v in measure(fn, files).items()}
+                print(f"{key:28s} {r['ms_per_file']:8.2f} ms/file  peak alloc {r['peak_alloc_mb']:7.1f} MB")
+            for f in files:
+                f.unlink()
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
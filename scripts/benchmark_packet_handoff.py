@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Packet Handoff Benchmark - RTP receive thread vs a slow archive writer
+
+Drives real RTPReceiver + PipelineRecorder instances with paced RTP over
+loopback (N channels of float IQ at 20 ms blocks) while an injected slow
+writer stalls periodically, the way a minute flush to a busy disk does.
+Two modes are compared:
+
+    inline  - handoff_ring_seconds = 0: decode, resequence and write run
+              in the RTP callback, so a stall stops socket reads for every
+              channel and the kernel buffer overflows
+    ring    - default PipelineRecorder: the RTP thread only copies packets
+              into each channel's PacketRing; per-channel workers absorb
+              the stall
+
+Reported per mode: packets sent, kernel (socket) drops, handoff ring
+drops, deepest ring occupancy and process CPU time.
+
+The writer replaces the recorder's PipelineOrchestrator (only samples are
+counted), so the numbers isolate receive -> handoff -> writer.
+
+--rcvbuf shrinks the socket receive buffer after start; the default
+matches a stock Linux net.core.rmem_max (208 KB). The RTPReceiver asks
+for 25 MB, which hosts tuned for it get.
+
+Usage:
+    python scripts/benchmark_packet_handoff.py
+    python scripts/benchmark_packet_handoff.py --channels 9 --duration 30 --stall 3 --stall-every 10
+    python scripts/benchmark_packet_handoff.py --rcvbuf 0 --json handoff.json
+"""
+
+import argparse
+import json
+import logging
+import socket
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from hf_timestd.core.pipeline_recorder import PipelineRecorder, PipelineRecorderConfig
+from hf_timestd.core.rtp_receiver import RTPReceiver
+
+MULTICAST_GROUP = '239.77.42.1'
+FIRST_SSRC = 20000
+PAYLOAD_TYPE_FLOAT = 11
+
+
+class SlowWriter:
+    """PipelineOrchestrator stand-in that stalls every `every_sec` of data."""
+    
+    def __init__(self, sample_rate: int, stall_sec: float, every_sec: float):
+        self.stall_sec = stall_sec
+        self.stall_samples = int(every_sec * sample_rate) if stall_sec > 0 else 0
+        self.samples = 0
+        self.stalls = 0
+        self._since_stall = 0
+    
+    def start(self):
+        pass
+    
+    def stop(self):
+        pass
+    
+    def process_samples(self, samples, rtp_timestamp, system_time):
+        self.samples += len(samples)
+        self._since_stall += len(samples)
+        if self.stall_samples and self._since_stall >= self.stall_samples:
+            self._since_stall = 0
+            self.stalls += 1
+            time.sleep(self.stall_sec)  # Blocking flush
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {'samples_archived': self.samples, 'stalls': self.stalls}
+
+
+def free_udp_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(('0.0.0.0', 0))
+        return s.getsockname()[1]
+
+
+def send_rtp(port: int, ssrcs: List[int], samples_per_packet: int,
+             blocktime_ms: float, packets: int) -> int:
+    """Send `packets` per channel at real-time pace; returns packets sent."""
+    rng = np.random.default_rng(1)
+    payload = (rng.standard_normal(2 * samples_per_packet) * 0.1).astype(np.float32).tobytes()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    dest = ('127.0.0.1', port)
+    interval = blocktime_ms / 1000.0
+    started = time.monotonic()
+    sent = 0
+    for n in range(packets):
+        for ssrc in ssrcs:
+            header = struct.pack('!BBHII', 0x80, PAYLOAD_TYPE_FLOAT, n & 0xFFFF,
+                                 (n * samples_per_packet) & 0xFFFFFFFF, ssrc)
+            sock.sendto(header + payload, dest)
+            sent += 1
+        delay = started + (n + 1) * interval - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+    sock.close()
+    return sent
+
+
+def run_mode(mode: str, args, output_dir: Path) -> Dict[str, Any]:
+    port = free_udp_port()
+    receiver = RTPReceiver(MULTICAST_GROUP, port=port)
+    ssrcs = [FIRST_SSRC + i for i in range(args.channels)]
+    
+    recorders = []
+    for i, ssrc in enumerate(ssrcs):
+        config = PipelineRecorderConfig(
+            ssrc=ssrc,
+            frequency_hz=5e6 + i * 1e6,
+            sample_rate=args.sample_rate,
+            description=f"BENCH_{mode}_{i}",
+            output_dir=output_dir / mode,
+            receiver_grid='EM38ww',
+            handoff_ring_seconds=args.ring_seconds if mode == 'ring' else 0.0
+        )
+        recorder = PipelineRecorder(config, receiver)
+        slow = i < args.slow_channels
+        recorder.orchestrator = SlowWriter(
+            args.sample_rate, args.stall if slow else 0.0, args.stall_every
+        )
+        recorders.append(recorder)
+    
+    receiver.start()
+    if args.rcvbuf:
+        receiver.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, args.rcvbuf)
+    rcvbuf = receiver.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+    for recorder in recorders:
+        recorder.start()
+    
+    cpu_started = time.process_time()
+    samples_per_packet = recorders[0].config.samples_per_packet
+    packets = int(args.duration * 1000 / args.blocktime_ms)
+    sent = send_rtp(port, ssrcs, samples_per_packet, args.blocktime_ms, packets)
+    
+    # Let the socket drain, then stop (ring workers drain before exiting)
+    time.sleep(args.stall + 0.5)
+    for recorder in recorders:
+        recorder.stop()
+    cpu_sec = time.process_time() - cpu_started
+    receiver.running = False
+    
+    received = sum(r.packets_received for r in recorders)
+    rings = [r.packet_ring.get_stats() for r in recorders if r.packet_ring is not None]
+    return {
+        'socket_rcvbuf_bytes': rcvbuf,
+        'packets_sent': sent,
+        'socket_drops': sent - received,
+        'handoff_drops': sum(s['overflow_packets'] + s['oversize_packets'] for s in rings),
+        'max_ring_depth': max((s['high_watermark'] for s in rings), default=0),
+        'ring_capacity': rings[0]['capacity'] if rings else 0,
+        'writer_stalls': sum(r.orchestrator.stalls for r in recorders),
+        'cpu_seconds': round(cpu_sec, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the RTP receive -> writer handoff')
+    parser.add_argument('--channels', type=int, default=9)
+    parser.add_argument('--duration', type=float, default=20.0, help='Seconds of RTP to send')
+    parser.add_argument('--sample-rate', type=int, default=20000)
+    parser.add_argument('--blocktime-ms', type=float, default=20.0)
+    parser.add_argument('--slow-channels', type=int, default=1, help='Channels with a stalling writer')
+    parser.add_argument('--stall', type=float, default=2.0, help='Writer stall (s)')
+    parser.add_argument('--stall-every', type=float, default=5.0, help='Seconds of data between stalls')
+    parser.add_argument('--ring-seconds', type=float, default=10.0, help='Handoff ring depth (s)')
+    parser.add_argument('--rcvbuf', type=int, default=212992,
+                        help='Socket receive buffer after start (0 keeps the receiver\'s 25 MB request)')
+    parser.add_argument('--mode', choices=['inline', 'ring', 'both'], default='both')
+    parser.add_argument('--json', type=Path, help='Write results to JSON file')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.ERROR)
+    modes = ['inline', 'ring'] if args.mode == 'both' else [args.mode]
+    
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in modes:
+            results[mode] = r = run_mode(mode, args, Path(tmp))
+            print(f"{mode:6s} sent {r['packets_sent']:6d}  socket drops {r['socket_drops']:5d}  "
+                  f"handoff drops {r['handoff_drops']:5d}  "
+                  f"max ring depth {r['max_ring_depth']:4d}/{r['ring_capacity']}  "
+                  f"stalls {r['writer_stalls']}  cpu {r['cpu_seconds']:.1f}s  "
+                  f"(rcvbuf {r['socket_rcvbuf_bytes'] // 1024} KB)")
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+    
+    if 'ring' in results and results['ring']['socket_drops'] + results['ring']['handoff_drops']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Seekable Archive Benchmark - chunked vs monolithic compressed minutes
+
+Compares, per codec (zstd, lz4):
+
+    monolithic - one compression frame per minute (.bin.zst / .bin.lz4, what
+                 BinaryArchiveWriter writes for compression = 'zstd'/'lz4')
+    seekable   - independently compressed chunks plus offset table
+                 (.bin.seek, compression = 'zstd-seekable'/'lz4-seekable')
+
+Reported: compression ratio, write time, full-minute read time, and the
+latency of random reads - a 2 s tone window at the minute mark and a
+10 s window at a random offset - which a monolithic frame can only serve by
+decompressing the whole minute.
+
+Input is a synthetic minute from scripts/generate_synthetic_data.py unless
+--input points at recorded .bin minutes (uncompressed raw_buffer files).
+The page cache is warm; the numbers measure CPU, not disk.
+
+Usage:
+    python scripts/benchmark_seekable_archive.py
+    python scripts/benchmark_seekable_archive.py --input /var/lib/hf-timestd/raw_buffer/WWV_10_MHz/20251206/*.bin
+    python scripts/benchmark_seekable_archive.py --chunk-seconds 0.5 1 2 --json seekable.json
+"""
+
+import argparse
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generate_synthetic_data import synthesize_tone_minute
+from hf_timestd.core.seekable_archive import SeekableMinuteFile, write_seekable_minute
+
+
+def timed(fn: Callable, repeats: int) -> List[float]:
+    """Wall time of each call, in ms."""
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - started) * 1000)
+    return times
+
+
+def write_monolithic(path: Path, samples: np.ndarray, codec: str, level: int):
+    """Same calls as BinaryArchiveWriter._flush_minute."""
+    raw = samples.tobytes()
+    if codec == 'zstd':
+        import zstandard as zstd
+        data = zstd.ZstdCompressor(level=level, threads=-1).compress(raw)
+    else:
+        import lz4.frame
+        data = lz4.frame.compress(raw, compression_level=level)
+    path.write_bytes(data)
+
+
+def read_monolithic(path: Path, codec: str) -> np.ndarray:
+    """Same calls as the pre-seekable readers (whole frame)."""
+    data = path.read_bytes()
+    if codec == 'zstd':
+        import zstandard as zstd
+        raw = zstd.ZstdDecompressor().decompress(data)
+    else:
+        import lz4.frame
+        raw = lz4.frame.decompress(data)
+    return np.frombuffer(raw, dtype=np.complex64)
+
+
+def benchmark_minute(samples: np.ndarray, work_dir: Path, codec: str, level: int,
+                     chunk_seconds: float, sample_rate: int, repeats: int,
+                     rng: np.random.Generator) -> Dict[str, Dict[str, float]]:
+    raw_bytes = samples.nbytes
+    n = len(samples)
+    tone_window = 2 * sample_rate
+    window = 10 * sample_rate
+    offsets = rng.integers(0, max(1, n - window), size=repeats)
+    
+    mono_path = work_dir / f"minute.bin.{codec}"
+    seek_path = work_dir / f"minute_{codec}.bin.seek"
+    chunk_samples = max(1, int(chunk_seconds * sample_rate))
+    
+    mono_write = timed(lambda: write_monolithic(mono_path, samples, codec, level), repeats)
+    seek_write = timed(lambda: write_seekable_minute(
+        seek_path, samples, codec=codec, level=level,
+        chunk_samples=chunk_samples, sample_rate=sample_rate
+    ), repeats)
+    
+    assert np.array_equal(read_monolithic(mono_path, codec), samples)
+    with SeekableMinuteFile(seek_path) as f:
+        assert np.array_equal(f.read_all(), samples)
+    
+    it = iter(offsets)
+    mono = {
+        'ratio': raw_bytes / mono_path.stat().st_size,
+        'write_ms': statistics.median(mono_write),
+        'full_read_ms': statistics.median(timed(lambda: read_monolithic(mono_path, codec), repeats)),
+        'tone_window_ms': statistics.median(timed(
+            lambda: read_monolithic(mono_path, codec)[:tone_window].copy(), repeats)),
+        'random_10s_ms': statistics.median(timed(
+            lambda: (lambda o: read_monolithic(mono_path, codec)[o:o + window].copy())(next(it)), repeats)),
+    }
+    
+    def seek_read(start, count, parallel=True):
+        # Includes opening the file and reading the offset table
+        with SeekableMinuteFile(seek_path) as f:
+            return f.read_range(start, count, parallel=parallel)
+    
+    it = iter(offsets)
+    seek = {
+        'ratio': raw_bytes / seek_path.stat().st_size,
+        'write_ms': statistics.median(seek_write),
+        'full_read_ms': statistics.median(timed(lambda: seek_read(0, n), repeats)),
+        'full_read_serial_ms': statistics.median(timed(lambda: seek_read(0, n, parallel=False), repeats)),
+        'tone_window_ms': statistics.median(timed(lambda: seek_read(0, tone_window), repeats)),
+        'random_10s_ms': statistics.median(timed(lambda: seek_read(int(next(it)), window), repeats)),
+    }
+    return {'monolithic': mono, 'seekable': seek}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark seekable chunked vs monolithic minutes')
+    parser.add_argument('--input', type=Path, nargs='*', help='Uncompressed .bin minutes (default: synthetic)')
+    parser.add_argument('--codec', nargs='+', default=['zstd', 'lz4'], choices=['zstd', 'lz4'])
+    parser.add_argument('--level', type=int, default=3, help='Compression level (config default 3)')
+    parser.add_argument('--chunk-seconds', type=float, nargs='+', default=[1.0])
+    parser.add_argument('--sample-rate', type=int, default=20000)
+    parser.add_argument('--snr', type=float, default=10.0, help='Synthetic tone SNR (dB)')
+    parser.add_argument('--repeats', type=int, default=7)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', type=Path, help='Write results to JSON file')
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.seed)
+    if args.input:
+        minutes = [np.fromfile(p, dtype=np.complex64) for p in args.input]
+    else:
+        minutes = [synthesize_tone_minute(args.sample_rate, snr_db=args.snr, seed=args.seed)]
+    
+    work_dir = Path(tempfile.mkdtemp(prefix='seekable-bench-'))
+    results = {}
+    try:
+        for codec in args.codec:
+            for chunk_seconds in args.chunk_seconds:
+                runs = [
+                    benchmark_minute(m, work_dir, codec, args.level, chunk_seconds,
+                                     args.sample_rate, args.repeats, rng)
+                    for m in minutes
+                ]
+                key = f"{codec}/{chunk_seconds:g}s"
+                results[key] = {
+                    fmt: {metric: round(statistics.median(r[fmt][metric] for r in runs), 3)
+                          for metric in runs[0][fmt]}
+                    for fmt in ('monolithic', 'seekable')
+                }
+                
+                mono, seek = results[key]['monolithic'], results[key]['seekable']
+                print(f"{key:10s} ratio {mono['ratio']:.3f} -> {seek['ratio']:.3f}  "
+                      f"write {mono['write_ms']:.1f} -> {seek['write_ms']:.1f} ms  "
+                      f"full read {mono['full_read_ms']:.1f} -> {seek['full_read_ms']:.1f} ms "
+                      f"(serial {seek['full_read_serial_ms']:.1f})  "
+                      f"2 s tone window {mono['tone_window_ms']:.1f} -> {seek['tone_window_ms']:.2f} ms  "
+                      f"random 10 s {mono['random_10s_ms']:.1f} -> {seek['random_10s_ms']:.2f} ms")
+        
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"\nResults written to {args.json}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
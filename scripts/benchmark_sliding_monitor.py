@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Sliding Window Monitor Benchmark - real-time monitoring cost for N channels
+
+Feeds synthetic station minutes (hf_timestd.core.fake_radiod) packet by
+packet, as the archive writers receive them, through:
+
+    chunked   - per-channel SlidingWindowMonitor: packets buffered and
+                concatenated into 10 s chunks, one FFT and one status
+                write per window (the original writer path)
+    streaming - StreamingMonitorBank: overlapping STFT frames of all
+                channels in one FFT call per tick, status written only on
+                meaningful change
+
+The chunked path's FFT sees only the first 8192 samples of each 10 s
+window (4%); the streaming path's frames cover all of it.
+
+Reports process CPU seconds per second of signal (as % of one core),
+FFT frames, windows and status writes. Fails (exit 1) if the streaming
+path exceeds --max-cpu percent of one core.
+
+Usage:
+    python scripts/benchmark_sliding_monitor.py
+    python scripts/benchmark_sliding_monitor.py --channels 9 --seconds 120 --json monitor.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from hf_timestd.core.fake_radiod import CHANNEL_PLAN, synthesize_station_minute
+from hf_timestd.core.sliding_window_monitor import SlidingWindowMonitor, StreamingMonitorBank
+
+SAMPLE_RATE = 20000
+
+
+def channel_signals(n_channels: int, seconds: int, snr_db: float) -> List[np.ndarray]:
+    minutes = -(-seconds // 60)
+    signals = []
+    for i in range(n_channels):
+        station, _ = CHANNEL_PLAN[i % len(CHANNEL_PLAN)]
+        minute = synthesize_station_minute(station, SAMPLE_RATE, snr_db, seed=i)
+        signals.append(np.tile(minute, minutes)[:seconds * SAMPLE_RATE])
+    return signals
+
+
+def run_chunked(signals, packet: int, status_dir: Path) -> Dict[str, Any]:
+    """Original path: buffer packets, concatenate 10 s, FFT and write status per window."""
+    window = 10 * SAMPLE_RATE
+    monitors = [SlidingWindowMonitor(f"ch{i}", SAMPLE_RATE, output_dir=status_dir, status_max_age_sec=0.0)
+                for i in range(len(signals))]
+    buffers = [[] for _ in signals]
+    counts = [0] * len(signals)
+    started = time.process_time()
+    for pos in range(0, len(signals[0]), packet):
+        for i, signal in enumerate(signals):
+            samples = signal[pos:pos + packet]
+            buffers[i].append(samples.copy())
+            counts[i] += len(samples)
+            if counts[i] >= window:
+                chunk = np.concatenate(buffers[i])
+                monitors[i].process_chunk(chunk[:window], 1e9 + pos / SAMPLE_RATE - 10.0)
+                buffers[i] = [chunk[window:]]
+                counts[i] -= window
+    cpu = time.process_time() - started
+    return {
+        'cpu_sec': cpu,
+        'fft_frames': sum(m.total_windows_processed for m in monitors),
+        'windows': sum(m.total_windows_processed for m in monitors),
+        'status_writes': sum(m.status_writes for m in monitors),
+    }
+
+
+def run_streaming(signals, packet: int, status_dir: Path, tick_frames: int) -> Dict[str, Any]:
+    """Streaming bank: batched overlapping STFT, change-driven status."""
+    bank = StreamingMonitorBank(SAMPLE_RATE, output_dir=status_dir, tick_frames=tick_frames)
+    names = [f"ch{i}" for i in range(len(signals))]
+    for name in names:
+        bank.add_channel(name)
+    started = time.process_time()
+    for pos in range(0, len(signals[0]), packet):
+        for name, signal in zip(names, signals):
+            bank.feed(name, signal[pos:pos + packet], 1e9 + pos / SAMPLE_RATE)
+    cpu = time.process_time() - started
+    stats = bank.get_stats()
+    return {
+        'cpu_sec': cpu,
+        'fft_frames': stats['frames_transformed'],
+        'fft_calls': stats['ticks'],
+        'windows': stats['windows_completed'],
+        'status_writes': stats['status_writes'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark real-time sliding window monitoring cost')
+    parser.add_argument('--channels', type=int, default=9, help='Channels monitored')
+    parser.add_argument('--seconds', type=int, default=120, help='Seconds of signal per channel')
+    parser.add_argument('--packet', type=int, default=400, help='Samples per packet (400 = 20 ms)')
+    parser.add_argument('--tick-frames', type=int, default=4, help='Frames a channel buffers before a tick')
+    parser.add_argument('--snr', type=float, default=10.0, help='Synthetic tone SNR (dB)')
+    parser.add_argument('--max-cpu', type=float, default=5.0,
+                        help='Allowed streaming cost (%% of one core, all channels)')
+    parser.add_argument('--json', type=Path, help='Write results to JSON file')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    
+    print(f"Synthesizing {args.channels} channels x {args.seconds} s...")
+    signals = channel_signals(args.channels, args.seconds, args.snr)
+    
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        results['chunked'] = run_chunked(signals, args.packet, Path(tmp) / 'chunked')
+        results['streaming'] = run_streaming(signals, args.packet, Path(tmp) / 'streaming', args.tick_frames)
+    
+    print(f"\n{args.channels} channels, {args.seconds} s of signal, {args.packet}-sample packets")
+    print(f"{'mode':10s} {'cpu %core':>10s} {'fft frames':>11s} {'windows':>8s} {'status writes':>14s}")
+    for mode, r in results.items():
+        r['cpu_pct_core'] = 100.0 * r['cpu_sec'] / args.seconds
+        print(f"{mode:10s} {r['cpu_pct_core']:10.2f} {r['fft_frames']:11d} {r['windows']:8d} {r['status_writes']:14d}")
+    streaming = results['streaming']
+    print(f"streaming: {streaming['fft_frames'] / max(streaming['fft_calls'], 1):.1f} frames per FFT call")
+    
+    passed = streaming['cpu_pct_core'] <= args.max_cpu
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'channels': args.channels, 'seconds': args.seconds, 'packet': args.packet,
+                       'max_cpu': args.max_cpu, 'passed': passed, 'results': results}, f, indent=2)
+        print(f"Results written to {args.json}")
+    
+    if not passed:
+        print(f"\nFAIL: streaming monitor uses {streaming['cpu_pct_core']:.2f}% of one core (> {args.max_cpu}%)")
+        sys.exit(1)
+    print(f"\nPASS: streaming monitor under {args.max_cpu}% of one core")
+
+
+if __name__ == '__main__':
+    main()
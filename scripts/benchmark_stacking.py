@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Stacking Benchmark - weak-signal rescue by multi-channel correlation stacking
+
+Runs Phase 2 step 1 (tone detection + cross-channel voter) on synthetic weak
+WWV minutes from scripts/generate_synthetic_data.py and compares:
+
+    single   - step 1 with stacking disabled (own matched filter plus the
+               existing strong-anchor fallback)
+    stacked  - step 1 with stacking enabled, on the same minutes
+
+A channel-minute counts as detected when step 1 picks WWV with timing within
+--tolerance-ms of the truth.
+
+Each channel runs in its own thread with its own engine and its own
+file-backed GlobalStationVoter on a shared IPC directory, exactly like the
+per-channel analytics processes share /dev/shm/grape_voter. A channel stacks
+whatever envelopes the others have shared by the time it reaches the rescue;
+nothing waits for slower channels.
+
+Truth per channel: arrival = common clock error + predicted path delay for
+the channel frequency + random dispersion (±MAX_DISPERSION_MS / 2).
+
+Reference results (6 channels, 10 trials, seed 1, --tolerance-ms 10; a
+rescue is a minute the stacked run picks up that single missed):
+
+    SNR     single  stacked  rescues (wrong)  latency median / max
+    -15 dB   75.0%   80.0%     6  (1)          35.7 / 43.2 ms
+    -20 dB   48.3%   53.3%    17 (10)          16.6 / 34.7 ms
+    -24 dB   51.7%   66.7%    18  (8)          20.3 / 60.4 ms
+    -28 dB   33.3%   31.7%     2  (2)          21.7 / 115.7 ms
+    noise    23.3%   23.3%     0               21.3 / 55.3 ms
+
+Stacking compute is ~0.2 ms per minute. Nearly half of all rescues land
+outside the tolerance, and below -24 dB stacking gains nothing. A 3-trial
+run scored -20 dB as a net loss (50.0% -> 44.4%, all 7 rescues wrong), so
+read differences of a few points as noise.
+
+Usage:
+    python scripts/benchmark_stacking.py
+    python scripts/benchmark_stacking.py --snr -20 -24 -28 --trials 5
+    python scripts/benchmark_stacking.py --json stacking.json
+"""
+
+import argparse
+import json
+import logging
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generate_synthetic_data import synthesize_tone_minute
+from hf_timestd.core.global_station_voter import GlobalStationVoter
+from hf_timestd.core.phase2_temporal_engine import Phase2TemporalEngine
+from hf_timestd.core.wwv_constants import MAX_DISPERSION_MS
+
+DEFAULT_CHANNELS = [
+    'WWV 2.5 MHz', 'WWV 5 MHz', 'WWV 10 MHz', 'WWV 15 MHz', 'WWV 20 MHz', 'WWV 25 MHz'
+]
+
+
+def build_engines(channels: List[str], grid: str, sample_rate: int,
+                  work_dir: Path, ipc_dir: Path) -> Dict[str, Phase2TemporalEngine]:
+    """One engine per channel, each with its own voter on the shared IPC dir."""
+    engines = {}
+    for channel in channels:
+        freq_mhz = float(channel.split()[1])
+        engine = Phase2TemporalEngine(
+            raw_archive_dir=work_dir,
+            output_dir=work_dir / channel.replace(' ', '_'),
+            channel_name=channel,
+            frequency_hz=freq_mhz * 1e6,
+            receiver_grid=grid,
+            sample_rate=sample_rate
+        )
+        engine.voter = GlobalStationVoter(
+            channels=channels, sample_rate=sample_rate,
+            use_ipc=True, ipc_root=ipc_dir
+        )
+        engines[channel] = engine
+    return engines
+
+
+def run_minute(engines: Dict[str, Phase2TemporalEngine], minutes: Dict[str, np.ndarray],
+               system_time: float, rtp_timestamp: int, stacking: bool) -> Dict[str, object]:
+    """Step 1 on all channels concurrently; returns channel -> TimeSnapResult."""
+    results = {}
+
+    def worker(channel):
+        engine = engines[channel]
+        engine.enable_stacking = stacking
+        engine.tone_detector.last_detections_by_minute.clear()
+        results[channel] = engine._step1_tone_detection(
+            minutes[channel], system_time, rtp_timestamp
+        )
+
+    threads = [threading.Thread(target=worker, args=(ch,)) for ch in engines]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def is_correct(snap, truth_ms: float, tolerance_ms: float) -> bool:
+    """Step 1 picked WWV at the true arrival time."""
+    return snap.anchor_station == 'WWV' and abs(snap.timing_error_ms - truth_ms) <= tolerance_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark multi-channel correlation stacking')
+    parser.add_argument('--snr', type=float, nargs='+', default=[-15.0, -20.0, -24.0, -28.0, -60.0],
+                        help='Per-channel tone SNR in the IQ bandwidth (dB)')
+    parser.add_argument('--trials', type=int, default=3, help='Minutes per SNR')
+    parser.add_argument('--channels', nargs='+', default=DEFAULT_CHANNELS)
+    parser.add_argument('--grid', default='EM38ww', help='Receiver grid square')
+    parser.add_argument('--sample-rate', type=int, default=20000)
+    parser.add_argument('--tolerance-ms', type=float, default=5.0,
+                        help='Max timing error for a correct detection')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', type=Path, help='Write results to JSON file')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    rng = np.random.default_rng(args.seed)
+
+    work_dir = Path(tempfile.mkdtemp(prefix='stacking-bench-'))
+    try:
+        ipc_dir = work_dir / 'voter'
+        engines = build_engines(args.channels, args.grid, args.sample_rate, work_dir, ipc_dir)
+
+        # Minute 10 of some hour: no special schedule minute
+        base_minute = (int(time.time()) // 3600) * 3600 + 600
+        results = {}
+
+        for snr_db in args.snr:
+            single_ok = stacked_ok = rescues = false_rescues = total = 0
+            errors_ms: List[float] = []
+            latencies_ms: List[float] = []
+            compute_ms: List[float] = []
+            elapsed_s: List[float] = []
+
+            for trial in range(args.trials):
+                system_time = float(base_minute + 60 * (len(results) * args.trials + trial))
+                rtp_timestamp = int(system_time) * args.sample_rate
+                clock_error_ms = rng.uniform(-2.0, 2.0)
+
+                truth = {}
+                minutes = {}
+                for channel, engine in engines.items():
+                    delay = engine._predicted_delay_ms('WWV', system_time)
+                    truth[channel] = (clock_error_ms + delay
+                                      + rng.uniform(-MAX_DISPERSION_MS / 2, MAX_DISPERSION_MS / 2))
+                    minutes[channel] = synthesize_tone_minute(
+                        args.sample_rate, truth[channel], snr_db,
+                        seed=int(rng.integers(1 << 31))
+                    )
+
+                # Baseline first (a fresh detector cache per pass: the
+                # detectors skip minutes they have already detected)
+                baseline = run_minute(engines, minutes, system_time, rtp_timestamp, stacking=False)
+
+                started = time.perf_counter()
+                snaps = run_minute(engines, minutes, system_time, rtp_timestamp, stacking=True)
+                elapsed_s.append(time.perf_counter() - started)
+
+                for channel, snap in snaps.items():
+                    total += 1
+                    if is_correct(baseline[channel], truth[channel], args.tolerance_ms):
+                        single_ok += 1
+
+                    correct = is_correct(snap, truth[channel], args.tolerance_ms)
+                    if correct:
+                        stacked_ok += 1
+                        errors_ms.append(snap.timing_error_ms - truth[channel])
+                    if snap.detection_method == 'stacked_correlation':
+                        rescues += 1
+                        if not correct:
+                            false_rescues += 1
+
+                for engine in engines.values():
+                    stats = engine.voter.stats
+                    if stats['stack_compute_ms']:
+                        latencies_ms.append(stats['stack_latency_ms'])
+                        compute_ms.append(stats['stack_compute_ms'])
+                        stats['stack_latency_ms'] = stats['stack_compute_ms'] = 0.0
+
+            result = {
+                'snr_db': snr_db,
+                'channel_minutes': total,
+                'single_detection_pct': round(100.0 * single_ok / total, 1),
+                'stacked_detection_pct': round(100.0 * stacked_ok / total, 1),
+                'rescues': rescues,
+                'false_rescues': false_rescues,
+                'timing_rms_ms': round(float(np.sqrt(np.mean(np.square(errors_ms)))), 2) if errors_ms else None,
+                'stack_latency_ms_median': round(statistics.median(latencies_ms), 1) if latencies_ms else None,
+                'stack_latency_ms_max': round(max(latencies_ms), 1) if latencies_ms else None,
+                'stack_compute_ms_median': round(statistics.median(compute_ms), 2) if compute_ms else None,
+                'step1_wall_s_median': round(statistics.median(elapsed_s), 2),
+            }
+            results[str(snr_db)] = result
+
+            print(f"SNR {snr_db:+6.1f} dB: single {result['single_detection_pct']:5.1f}%  "
+                  f"stacked {result['stacked_detection_pct']:5.1f}%  "
+                  f"rescues {rescues} ({false_rescues} wrong)  "
+                  f"rms {result['timing_rms_ms']} ms  "
+                  f"latency {result['stack_latency_ms_median']} ms "
+                  f"(max {result['stack_latency_ms_max']}, compute {result['stack_compute_ms_median']} ms)")
+
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"\nResults written to {args.json}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
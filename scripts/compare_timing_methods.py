@@ -15,6 +15,7 @@ Approaches:
 """
 
 import argparse
+import sys
 import numpy as np
 from pathlib import Path
 from scipy import signal as scipy_signal
@@ -23,6 +24,9 @@ matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from datetime import datetime, timezone
 
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+from hf_timestd.core.npz_reader import decode_json_member
+
 
 def load_channel_day(decimated_dir, date_str):
     """
@@ -52,7 +56,11 @@ def load_channel_day(decimated_dir, date_str):
         file_unix_ts = dt.timestamp()
         
         # Extract timing metadata
-        timing_meta = data['timing_metadata'].item() if 'timing_metadata' in data else {}
+        # JSON string (current) or pickled dict (older files; np.load above already trusts them)
+        timing_meta = {}
+        if 'timing_metadata' in data:
+            timing_meta = decode_json_member(data['timing_metadata'], trust_pickle=True,
+                                             name='timing_metadata') or {}
         timing_records.append({
             'timestamp': file_unix_ts,
             'filename': npz_file.name,
@@ -2,7 +2,6 @@
 import os
 import sys
 import numpy as np
-import h5py
 from pathlib import Path
 from datetime import datetime, timezone
 import shutil
@@ -18,6 +17,8 @@ def create_synthetic_archive(
     Create a synthetic Phase 1 Digital RF archive.
     Simulates a WWV signal with varying SNR to test uncertainty scaling.
     """
+    import h5py
+    
     channel_dir = archive_dir / channel_name
     if channel_dir.exists():
         shutil.rmtree(channel_dir)
@@ -98,6 +99,43 @@ def create_synthetic_archive(
             
     logger_print("Synthetic production archive created.")
 
+def synthesize_tone_minute(
+    sample_rate: int = 20000,
+    tone_delay_ms: float = 5.0,
+    snr_db: float = 0.0,
+    tone_freq_hz: float = 1000.0,
+    tone_duration_sec: float = 0.8,
+    modulation_depth: float = 0.5,
+    seed: int = None
+) -> np.ndarray:
+    """
+    One minute of complex IQ with a keyed WWV-style AM tone at the minute mark.
+    
+    The carrier is AM-modulated by a tone starting tone_delay_ms after the
+    first sample (sample 0 = minute boundary). snr_db is the tone sideband
+    power relative to the noise in the full IQ bandwidth, so negative values
+    give minutes in which the tone is buried in noise - the weak-signal
+    case for correlation stacking.
+    
+    Returns:
+        complex64 array of 60 * sample_rate samples
+    """
+    rng = np.random.default_rng(seed)
+    n_samples = 60 * sample_rate
+    t = np.arange(n_samples) / sample_rate
+    
+    t_tone = t - tone_delay_ms / 1000.0
+    keyed = (t_tone >= 0) & (t_tone < tone_duration_sec)
+    envelope = 1.0 + modulation_depth * keyed * np.sin(2 * np.pi * tone_freq_hz * t_tone)
+    
+    # Sideband power of the AM tone: m^2 / 2 (unit carrier); noise is complex
+    tone_power = modulation_depth ** 2 / 2
+    noise_sigma = np.sqrt(tone_power / 10 ** (snr_db / 10) / 2)
+    noise = noise_sigma * (rng.standard_normal(n_samples) + 1j * rng.standard_normal(n_samples))
+    
+    phase = rng.uniform(0, 2 * np.pi)
+    return (envelope * np.exp(1j * phase) + noise).astype(np.complex64)
+
 def logger_print(msg):
     print(f"[SyntheticGen] {msg}")
 
@@ -145,12 +145,16 @@ channel_to_dir() {
 # Collect files to delete
 FILES_TO_DELETE=()
 
+# Model state lives in compact .ckpt checkpoints; the .json name is the
+# legacy format, still loaded when no checkpoint exists
 if [ "$ALL" = true ] || [ "$CONVERGENCE" = true ]; then
     if [ -n "$CHANNEL" ]; then
         CHANNEL_DIR=$(channel_to_dir "$CHANNEL")
-        FILES_TO_DELETE+=("$DATA_ROOT/phase2/$CHANNEL_DIR/status/convergence_state.json")
+        for f in "$DATA_ROOT/phase2/$CHANNEL_DIR/status"/convergence_state.{ckpt,json}; do
+            [ -f "$f" ] && FILES_TO_DELETE+=("$f")
+        done
     else
-        for f in "$DATA_ROOT"/phase2/*/status/convergence_state.json; do
+        for f in "$DATA_ROOT"/phase2/*/status/convergence_state.{ckpt,json}; do
             [ -f "$f" ] && FILES_TO_DELETE+=("$f")
         done
     fi
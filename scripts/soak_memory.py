@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Memory Soak - replay synthetic minutes through Phase 2 and fusion and
+fail if any component keeps growing
+
+Weeks of recorder uptime are compressed into a replay: each channel gets
+synthetic WWV/CHU minutes (hf_timestd.core.fake_radiod) back to back, as
+fast as Phase 2 can process them. Fusion runs on the minute-complete
+trigger, with its lookback window on replay time. tracemalloc checkpoints
+every --every minutes attribute retained memory to components (Phase 2
+service, engine, discrimination, ionosphere, fusion, ...), and probes
+record the length of the structures known to accumulate per minute.
+
+A component still gaining more than --max-growth bytes per replayed
+minute over the second half of the run, or a probe over its bound (or
+still growing without one), fails the soak (exit 1). Bounded histories
+sized for hours (discrimination measurements, TOA history, voter minutes,
+...) would look like growth in a short soak, so --bound caps them at a few
+entries first; fixed-size structures fill during --warmup.
+
+Phase 2 paths:
+    service  - Phase2AnalyticsService per channel (the analytics service
+               processes; minutes replace the archive read)
+    recorder - ClockOffsetEngine per channel, as PipelineOrchestrator runs
+               Phase 2 inside the recorder
+
+Usage:
+    python scripts/soak_memory.py
+    python scripts/soak_memory.py --minutes 240 --every 10 --channels 3
+    python scripts/soak_memory.py --phase2 recorder --json soak.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from hf_timestd.core.clock_offset_series import ClockOffsetEngine
+from hf_timestd.core.fake_radiod import synthesize_station_minute
+from hf_timestd.core.memory_soak import AllocationTracker
+from hf_timestd.core.minute_notify import FusionTrigger
+from hf_timestd.core.multi_broadcast_fusion import MultiBroadcastFusion
+from hf_timestd.core.phase2_analytics_service import Phase2AnalyticsService
+from hf_timestd.core.timing_calibrator import TimingCalibrator
+from hf_timestd.paths import channel_name_to_dir
+
+RECEIVER_GRID = 'EM38ww'
+SAMPLE_RATE = 20000
+
+# Distinct frequencies, alternating stations so fusion has more than one
+SOAK_CHANNELS = [
+    ('WWV', 10e6), ('CHU', 7.85e6), ('WWV', 5e6), ('CHU', 3.33e6),
+    ('WWV', 15e6), ('CHU', 14.67e6), ('WWV', 2.5e6), ('WWV', 20e6), ('WWV', 25e6),
+]
+
+COMPONENTS = {
+    'phase2_service': ['*/phase2_analytics_service.py'],
+    'phase2_engine': ['*/phase2_temporal_engine.py', '*/clock_convergence.py',
+                      '*/global_station_voter.py'],
+    'tone_detection': ['*/tone_detector.py'],
+    'discrimination': ['*/wwvh_discrimination.py', '*/wwv_geographic_predictor.py',
+                       '*/probabilistic_discriminator.py'],
+    'propagation': ['*/transmission_time_solver.py', '*/propagation_mode_solver.py',
+                    '*/ionospheric_model.py'],
+    'clock_offset_engine': ['*/clock_offset_series.py', '*/timing_calibrator.py'],
+    'fusion': ['*/multi_broadcast_fusion.py', '*/minute_notify.py'],
+}
+
+
+class ReplayPhase2Service(Phase2AnalyticsService):
+    """Phase 2 analytics service fed synthetic minutes instead of the archive."""
+    
+    def __init__(self, minute_iq: np.ndarray, **kwargs):
+        super().__init__(**kwargs)
+        self.minute_iq = minute_iq
+    
+    def _read_drf_minute(self, target_minute: int):
+        rtp_timestamp = (target_minute * self.sample_rate) & 0xFFFFFFFF
+        return self.minute_iq, float(target_minute), rtp_timestamp
+
+
+def build_channels(args, data_root: Path) -> List[Dict[str, Any]]:
+    iq = {station: synthesize_station_minute(station, SAMPLE_RATE, args.snr, seed=i)
+          for i, station in enumerate(('WWV', 'CHU'))}
+    calibrator = TimingCalibrator(data_root=data_root, sample_rate=SAMPLE_RATE)
+    channels = []
+    for station, freq in SOAK_CHANNELS[:args.channels]:
+        name = f"{station} {freq / 1e6:g} MHz"
+        channel_dir = channel_name_to_dir(name)
+        if args.phase2 == 'service':
+            processor = ReplayPhase2Service(
+                iq[station],
+                archive_dir=data_root / 'raw_archive' / channel_dir,
+                output_dir=data_root / 'phase2' / channel_dir,
+                channel_name=name,
+                frequency_hz=freq,
+                sample_rate=SAMPLE_RATE,
+                receiver_grid=RECEIVER_GRID
+            )
+        else:
+            processor = ClockOffsetEngine(
+                raw_archive_dir=data_root / 'raw_archive',
+                output_dir=data_root / 'phase2' / channel_dir / 'clock_offset',
+                channel_name=name,
+                frequency_hz=freq,
+                receiver_grid=RECEIVER_GRID,
+                sample_rate=SAMPLE_RATE,
+                timing_calibrator=calibrator
+            )
+        channels.append({'name': name, 'dir': channel_dir, 'iq': iq[station], 'processor': processor})
+    return channels
+
+
+def shrink_bounds(channels, bound: int):
+    """
+    Cap the per-minute histories at `bound` entries so they fill within
+    the soak; whatever still grows afterwards is not one of them.
+    """
+    for ch in channels:
+        processor = ch['processor']
+        if isinstance(processor, Phase2AnalyticsService):
+            processor.processed_minutes.maxlen = bound
+            engine = processor.engine
+        else:
+            processor.max_series_measurements = bound
+            engine = processor.phase2_engine
+        discriminator = getattr(engine, 'discriminator', None)
+        if discriminator is not None:
+            discriminator.max_history = bound
+            geo_predictor = getattr(discriminator, 'geo_predictor', None)
+            if geo_predictor is not None:
+                # Several peaks per minute; deques take maxlen on first use
+                geo_predictor.max_history = 2 * bound
+        voter = getattr(engine, 'voter', None)
+        if voter is not None:
+            voter.history_minutes = min(voter.history_minutes, bound)
+
+
+def add_probes(tracker: AllocationTracker, channels, fusion: MultiBroadcastFusion, trigger: FusionTrigger):
+    for ch in channels:
+        processor = ch['processor']
+        if isinstance(processor, Phase2AnalyticsService):
+            tracker.probe(f"{ch['dir']}.processed_minutes", processor.processed_minutes)
+            engine = processor.engine
+        else:
+            tracker.probe(f"{ch['dir']}.series_measurements",
+                          lambda p=processor: len(p.current_series.measurements),
+                          bound=processor.max_series_measurements)
+            engine = processor.phase2_engine
+        discriminator = getattr(engine, 'discriminator', None)
+        if discriminator is not None:
+            tracker.probe(f"{ch['dir']}.discrimination_measurements",
+                          lambda d=discriminator: len(d.measurements), bound=discriminator.max_history)
+        iono_model = getattr(getattr(engine, 'solver', None), 'iono_model', None)
+        if iono_model is not None:
+            tracker.probe(f"{ch['dir']}.iri_cache", iono_model._iri_cache)
+        voter = getattr(engine, 'voter', None)
+        if voter is not None:
+            tracker.probe(f"{ch['dir']}.voter_minutes",
+                          lambda v=voter: len(v.minute_states), bound=voter.history_minutes)
+    tracker.probe('fusion.measurement_history',
+                  lambda: max((len(h) for h in fusion.measurement_history.values()), default=0),
+                  bound=fusion.history_max_size)
+    # Pending minutes are fused (or expire) within late_sec: a couple at most
+    tracker.probe('fusion.trigger_pending', lambda: trigger.get_stats()['pending_minutes'], bound=2)
+
+
+def replay_minute(channels, minute: int, fusion: MultiBroadcastFusion, trigger: FusionTrigger) -> bool:
+    """One minute on every channel, then fusion when the trigger fires."""
+    for ch in channels:
+        processor = ch['processor']
+        if isinstance(processor, Phase2AnalyticsService):
+            processor.process_minute(minute)
+        else:
+            processor.process_minute(ch['iq'], float(minute), (minute * SAMPLE_RATE) & 0xFFFFFFFF)
+        trigger.report(ch['dir'], minute, now=minute + 60)
+    fire = trigger.due(now=minute + 60)
+    if fire is None:
+        return False
+    fusion.fuse(now=minute + 60)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay synthetic minutes and check for unbounded memory growth')
+    parser.add_argument('--minutes', type=int, default=120, help='Minutes to replay')
+    parser.add_argument('--every', type=int, default=5, help='Checkpoint every N minutes')
+    parser.add_argument('--warmup', type=int, default=15,
+                        help='Minutes before the first checkpoint (fixed-size histories fill first)')
+    parser.add_argument('--channels', type=int, default=2, choices=range(1, len(SOAK_CHANNELS) + 1))
+    parser.add_argument('--phase2', choices=['service', 'recorder'], default='service')
+    parser.add_argument('--snr', type=float, default=10.0, help='Synthetic tone SNR (dB)')
+    parser.add_argument('--bound', type=int, default=10,
+                        help='Cap per-minute histories at N entries so they fill early (0 = keep production sizes)')
+    parser.add_argument('--max-growth', type=float, default=1024.0,
+                        help='Allowed retained growth per component (bytes per replayed minute; '
+                             '1024 is ~1.5 MB/day)')
+    parser.add_argument('--frames', type=int, default=10,
+                        help='Traceback depth kept by tracemalloc (deeper attributes more, runs slower)')
+    parser.add_argument('--json', type=Path, help='Write the report to JSON file')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.CRITICAL)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        data_root = Path(tmp)
+        channels = build_channels(args, data_root)
+        fusion = MultiBroadcastFusion(data_root)
+        trigger = FusionTrigger([ch['dir'] for ch in channels], late_sec=15.0)
+        
+        if args.bound:
+            shrink_bounds(channels, args.bound)
+        
+        tracker = AllocationTracker(COMPONENTS, nframe=args.frames)
+        add_probes(tracker, channels, fusion, trigger)
+        tracker.start()
+        
+        # Replay ends at the current minute (wall-clock based state stays sane)
+        first_minute = (int(time.time()) // 60 - args.minutes) * 60
+        started = time.monotonic()
+        fusions = 0
+        for k in range(args.minutes):
+            fusions += replay_minute(channels, first_minute + 60 * k, fusion, trigger)
+            if k + 1 >= args.warmup and (k + 1 - args.warmup) % args.every == 0:
+                tracker.checkpoint(k + 1)
+                total = tracker.samples['total'][-1][1]
+                print(f"minute {k + 1:5d}  retained {total / 1e6:7.1f} MB  "
+                      f"({(time.monotonic() - started) / (k + 1):.1f} s/minute)", flush=True)
+        
+        report = tracker.report(max_growth_bytes=args.max_growth, minutes=args.minutes)
+        tracker.stop()
+    
+    print(f"\n{args.minutes} minutes x {args.channels} channels ({args.phase2}), {fusions} fusions")
+    print(f"{'':46s} {'first':>10s} {'last':>10s} {'per min':>9s} {'bound':>6s}")
+    for s in report.series:
+        unit = 1e3 if s.kind == 'component' else 1
+        print(f"  {s.name:44s} {s.first / unit:10.1f} {s.last / unit:10.1f} "
+              f"{s.slope_per_minute / unit:9.2f} {s.bound if s.bound is not None else '-':>6}"
+              f"{'  UNBOUNDED' if s.unbounded else ''}")
+    print("(components in KB, probes in entries)")
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(dict(report.to_dict(), channels=args.channels, phase2=args.phase2), f, indent=2)
+        print(f"Report written to {args.json}")
+    
+    if not report.passed:
+        print(f"\nFAIL: {', '.join(s.name for s in report.unbounded)}")
+        sys.exit(1)
+    print("\nPASS: no unbounded growth")
+
+
+if __name__ == '__main__':
+    main()
@@ -39,9 +39,19 @@ start)
     
     # Stop existing
     pkill -f "monitoring-server" 2>/dev/null
+    pkill -f "hf_timestd.core.product_service" 2>/dev/null
     sleep 1
     
     mkdir -p "$DATA_ROOT/logs"
+    
+    # Product service: warm Python process serving spectrogram renders and
+    # time-series slices to the web-UI over $DATA_ROOT/state/product-service.sock
+    GRID=$(grep '^grid_square' "$CONFIG" 2>/dev/null | head -1 | cut -d'"' -f2)
+    nohup $PYTHON -m hf_timestd.core.product_service \
+        --data-root "$DATA_ROOT" --grid "$GRID" \
+        > "$DATA_ROOT/logs/product-service.log" 2>&1 &
+    echo "   ✅ Product service started (PID: $!)"
+    
     cd "$PROJECT_DIR/web-ui"
     
     nohup env TIMESTD_CONFIG="$CONFIG" GRAPE_CONFIG="$CONFIG" node monitoring-server-v3.js \
@@ -70,6 +80,7 @@ stop)
     fi
     
     pkill -f "monitoring-server" 2>/dev/null
+    pkill -f "hf_timestd.core.product_service" 2>/dev/null
     sleep 1
     echo "   ✅ Stopped"
     ;;
@@ -85,5 +96,10 @@ status)
     else
         echo "⭕ Web-UI: STOPPED"
     fi
+    if pgrep -f "hf_timestd.core.product_service" > /dev/null; then
+        echo "✅ Product service: RUNNING → $DATA_ROOT/state/product-service.sock"
+    else
+        echo "⭕ Product service: STOPPED"
+    fi
     ;;
 esac
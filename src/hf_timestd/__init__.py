@@ -32,78 +32,110 @@ Copyright 2025
 __version__ = "3.0.0"  # Major version: renamed from grape_recorder to hf_timestd
 __author__ = "HF Time Standard Analysis Project"
 
-# =============================================================================
-# CORE INFRASTRUCTURE (application-agnostic)
-# Located in hf_timestd/core/ package
-# Note: 'core' was renamed from 'grape' - contains timing analysis modules
-# =============================================================================
-# Core RTP infrastructure is in the 'core' subpackage (formerly 'grape')
-# These are re-exported for convenience
-try:
-    from .core import (
-        RTPReceiver, RTPHeader,
-        RecordingSession, SessionConfig, SessionState,
-        SegmentInfo, SessionMetrics, SegmentWriter,
-        PacketResequencer, RTPPacket, GapInfo,
-    )
-except ImportError:
-    # Core subpackage may have different structure
-    pass
+import importlib
 
 # =============================================================================
-# STREAM API (SSRC-free interface)
-# Located in hf_timestd/stream/ package
+# Lazy exports (PEP 562)
 # =============================================================================
-from .stream import (
-    StreamSpec, StreamRequest,
-    StreamHandle, StreamInfo,
-    StreamManager,
-    subscribe_stream,
-    subscribe_iq,
-    subscribe_usb,
-    subscribe_am,
-    subscribe_batch,
-    discover_streams,
-    find_stream,
-    get_manager,
-    close_all,
-)
-
-# =============================================================================
-# TIME STANDARD APPLICATION (WWV/WWVH/CHU time signals)
-# Located in hf_timestd/core/ package (renamed from grape/)
-# Two-phase pipeline: recording + timing analysis
-# =============================================================================
-try:
-    from .core import (
-        PipelineRecorder, PipelineRecorderConfig, PipelineRecorderState,
-        CoreRecorder,
-    )
-except ImportError:
-    pass
-
-# =============================================================================
-# WSPR APPLICATION (Weak Signal Propagation Reporter)
-# Located in hf_timestd/wspr/ package
-# =============================================================================
-from .wspr import (
-    WsprRecorder, WsprConfig, WsprState,
-    WsprWAVWriter,
-    create_wspr_recorder,
-)
-
-# Channel management (lower-level)
-from .channel_manager import ChannelManager
-from ka9q import discover_channels, ChannelInfo, RadiodControl
-
-# ka9q timing functions (GPS_TIME/RTP_TIMESNAP support)
-from ka9q import rtp_to_wallclock, parse_rtp_header
-
-# Re-export ka9q functions for backward compatibility
-discover_channels_via_control = discover_channels  # Legacy alias
+# Nothing below is imported until first accessed, so `import hf_timestd`
+# (and every `hf_timestd.<sub>` import, which runs this file first) no
+# longer drags in the analytics stack, scipy.signal or digital_rf.
+# Resolved names are cached in the module globals.
+#
+# Maps public name -> (module, attribute)
+_LAZY_IMPORTS = {
+    # =========================================================================
+    # CORE INFRASTRUCTURE (application-agnostic)
+    # Located in hf_timestd/core/ package
+    # =========================================================================
+    "RTPReceiver": (".core.rtp_receiver", "RTPReceiver"),
+    "RTPHeader": ("ka9q", "RTPHeader"),
+    "RecordingSession": (".core.recording_session", "RecordingSession"),
+    "SessionConfig": (".core.recording_session", "SessionConfig"),
+    "SessionState": (".core.recording_session", "SessionState"),
+    "SegmentInfo": (".core.recording_session", "SegmentInfo"),
+    "SessionMetrics": (".core.recording_session", "SessionMetrics"),
+    "SegmentWriter": (".core.recording_session", "SegmentWriter"),
+    "PacketResequencer": (".core.packet_resequencer", "PacketResequencer"),
+    "RTPPacket": (".core.packet_resequencer", "RTPPacket"),
+    "GapInfo": (".core.packet_resequencer", "GapInfo"),
+
+    # =========================================================================
+    # STREAM API (SSRC-free interface)
+    # Located in hf_timestd/stream/ package
+    # =========================================================================
+    "StreamSpec": (".stream", "StreamSpec"),
+    "StreamRequest": (".stream", "StreamRequest"),
+    "StreamHandle": (".stream", "StreamHandle"),
+    "StreamInfo": (".stream", "StreamInfo"),
+    "StreamManager": (".stream", "StreamManager"),
+    "subscribe_stream": (".stream", "subscribe_stream"),
+    "subscribe_iq": (".stream", "subscribe_iq"),
+    "subscribe_usb": (".stream", "subscribe_usb"),
+    "subscribe_am": (".stream", "subscribe_am"),
+    "subscribe_batch": (".stream", "subscribe_batch"),
+    "discover_streams": (".stream", "discover_streams"),
+    "find_stream": (".stream", "find_stream"),
+    "get_manager": (".stream", "get_manager"),
+    "close_all": (".stream", "close_all"),
+
+    # =========================================================================
+    # TIME STANDARD APPLICATION (WWV/WWVH/CHU time signals)
+    # Two-phase pipeline: recording + timing analysis
+    # =========================================================================
+    "PipelineRecorder": (".core.pipeline_recorder", "PipelineRecorder"),
+    "PipelineRecorderConfig": (".core.pipeline_recorder", "PipelineRecorderConfig"),
+    "PipelineRecorderState": (".core.pipeline_recorder", "PipelineRecorderState"),
+    "CoreRecorder": (".core.core_recorder", "CoreRecorder"),
+
+    # =========================================================================
+    # WSPR APPLICATION (Weak Signal Propagation Reporter)
+    # Located in hf_timestd/wspr/ package
+    # =========================================================================
+    "WsprRecorder": (".wspr", "WsprRecorder"),
+    "WsprConfig": (".wspr", "WsprConfig"),
+    "WsprState": (".wspr", "WsprState"),
+    "WsprWAVWriter": (".wspr", "WsprWAVWriter"),
+    "create_wspr_recorder": (".wspr", "create_wspr_recorder"),
+
+    # Channel management (lower-level)
+    "ChannelManager": (".channel_manager", "ChannelManager"),
+    "RadiodChannelDirectory": (".radiod_directory", "RadiodChannelDirectory"),
+    "get_channel_directory": (".radiod_directory", "get_channel_directory"),
+    "discover_channels": ("ka9q", "discover_channels"),
+    "discover_channels_via_control": ("ka9q", "discover_channels"),  # Legacy alias
+    "ChannelInfo": ("ka9q", "ChannelInfo"),
+    "RadiodControl": ("ka9q", "RadiodControl"),
+
+    # ka9q timing functions (GPS_TIME/RTP_TIMESNAP support)
+    "rtp_to_wallclock": ("ka9q", "rtp_to_wallclock"),
+    "parse_rtp_header": ("ka9q", "parse_rtp_header"),
+
+    # Upload (exists but not yet integrated into daemon)
+    "UploadManager": (".uploader", "UploadManager"),
+    "SSHRsyncUpload": (".uploader", "SSHRsyncUpload"),
+}
+
+# Subpackages reachable as attributes (e.g. hf_timestd.core) without an
+# explicit import, as they were when this file imported them eagerly
+_SUBPACKAGES = {"core", "stream", "interfaces", "wspr"}
+
+
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f".{name}", __name__)
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _SUBPACKAGES)
 
-# Upload (exists but not yet integrated into daemon)
-from .uploader import UploadManager, SSHRsyncUpload
 
 __all__ = [
     # === Stream API (primary interface) ===
@@ -147,6 +179,8 @@ __all__ = [
     "create_wspr_recorder",
     # === Lower-level (advanced use) ===
     "ChannelManager",
+    "RadiodChannelDirectory",
+    "get_channel_directory",
     "discover_channels_via_control",
     "ChannelInfo",
     "RadiodControl",
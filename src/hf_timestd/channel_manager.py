@@ -8,7 +8,9 @@ import logging
 import time
 import subprocess
 from typing import List, Dict, Optional
-from ka9q import discover_channels, ChannelInfo, RadiodControl
+from ka9q import ChannelInfo, RadiodControl
+
+from .radiod_directory import get_channel_directory
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +102,7 @@ class ChannelManager:
         """
         self.status_address = status_address
         self.control = RadiodControl(status_address)
+        self.directory = get_channel_directory(status_address)
     
     def discover_existing_channels(self) -> Dict[int, ChannelInfo]:
         """
@@ -109,7 +112,7 @@ class ChannelManager:
             Dictionary mapping SSRC to ChannelInfo
         """
         logger.info(f"Discovering existing channels from {self.status_address}")
-        channels = discover_channels(self.status_address)
+        channels = self.directory.channels()
         logger.info(f"Found {len(channels)} existing channels")
         return channels
     
@@ -163,15 +166,11 @@ class ChannelManager:
                 ssrc=ssrc
             )
             
-            logger.info(f"Channel creation complete (SSRC={allocated_ssrc}), waiting 0.5s...")
-            
-            # Wait for radiod to process
-            time.sleep(0.5)
-            
-            logger.info(f"Verifying channel {allocated_ssrc}...")
+            logger.info(f"Channel creation complete (SSRC={allocated_ssrc}), verifying...")
             
-            # Verify the channel was created
-            if self.control.verify_channel(allocated_ssrc, frequency_hz):
+            # Verify the channel was created (returns as soon as radiod reports it)
+            created = self.directory.wait_for([allocated_ssrc], timeout=5.0).get(allocated_ssrc)
+            if created is not None and abs(created.frequency - frequency_hz) < 1.0:
                 logger.info(f"✓ Channel {allocated_ssrc} ({frequency_hz/1e6:.3f} MHz) created successfully")
                 return allocated_ssrc
             else:
@@ -6,7 +6,6 @@ Command Line Interface for Signal Recorder
 import sys
 import logging
 import argparse
-from .core_recorder import CoreRecorder
 
 def main():
     """Main entry point for signal-recorder command"""
@@ -104,6 +103,25 @@ def main():
                                   help='Skip confirmation prompts')
     clean_all_parser.add_argument('--dev', action='store_true', help='Use development paths')
     
+    # Reprocess command
+    reprocess_parser = subparsers.add_parser('reprocess',
+                                             help='Reprocess archived minutes through Phase 2 in parallel')
+    reprocess_parser.add_argument('--config', '-c', required=True, help='Configuration file path')
+    reprocess_parser.add_argument('--start', required=True,
+                                  help='Start time, UTC (YYYY-MM-DD, YYYYMMDD or YYYY-MM-DDTHH:MM)')
+    reprocess_parser.add_argument('--end', required=True, help='End time, UTC, exclusive')
+    reprocess_parser.add_argument('--channel', action='append',
+                                  help='Channel to reprocess (repeatable, default: all configured)')
+    reprocess_parser.add_argument('--source', choices=['auto', 'raw_buffer', 'raw_archive'], default='auto',
+                                  help='Archive to read (default: binary, falling back to Digital RF)')
+    reprocess_parser.add_argument('--version', default='v2', help='Output version directory')
+    reprocess_parser.add_argument('--workers', '-j', type=int, help='Worker processes (default: CPU count)')
+    reprocess_parser.add_argument('--shard-minutes', type=int, default=60,
+                                  help='Minutes per work unit (default: 60)')
+    reprocess_parser.add_argument('--fresh', action='store_true',
+                                  help='Discard checkpoints from a previous run of the same job')
+    reprocess_parser.add_argument('--debug', '-d', action='store_true', help='Enable DEBUG logging')
+    
     args = parser.parse_args()
     
     # If no command specified, show help
@@ -153,6 +171,7 @@ def main():
         }
         
         # Start daemon mode
+        from .core.core_recorder import CoreRecorder
         recorder = CoreRecorder(recorder_config)
         recorder.run()
     elif args.command == 'discover':
@@ -223,6 +242,48 @@ def main():
         else:
             print("⚠️ Some channels may have failed to create")
             sys.exit(1)
+    elif args.command == 'reprocess':
+        import toml
+        from .core.reprocess_engine import ReprocessEngine, job_from_config, parse_time
+        
+        # Load configuration
+        try:
+            with open(args.config, 'r') as f:
+                config = toml.load(f)
+        except FileNotFoundError:
+            print(f"❌ Configuration file not found: {args.config}")
+            sys.exit(1)
+        except Exception as e:
+            print(f"❌ Error loading configuration: {e}")
+            sys.exit(1)
+        
+        try:
+            job = job_from_config(
+                config,
+                start=parse_time(args.start),
+                end=parse_time(args.end),
+                channel_names=args.channel,
+                source=args.source,
+                output_version=args.version,
+                shard_minutes=args.shard_minutes
+            )
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        
+        engine = ReprocessEngine(job, workers=args.workers)
+        if args.fresh:
+            engine.reset()
+        try:
+            report = engine.run()
+        except KeyboardInterrupt:
+            print("\n⏸️  Interrupted - rerun the same command to resume")
+            sys.exit(130)
+        
+        print(f"\n📊 {report.summary()}")
+        print(f"   Report: {engine.report_file}")
+        if report.shards_failed:
+            sys.exit(1)
     elif args.command == 'data':
         # Data management mode
         from .data_management import DataManager
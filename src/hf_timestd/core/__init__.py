@@ -39,168 +39,198 @@ Example:
     orchestrator.process_samples(iq_samples, rtp_timestamp)
 """
 
-# Tone detection and timing
-from .tone_detector import ToneDetector
+import importlib
 
-# Analytics and discrimination
-from .analytics_service import AnalyticsService
-from .wwvh_discrimination import WWVHDiscriminator
-from .wwv_test_signal import WWVTestSignalDetector
-from .discrimination_csv_writers import DiscriminationCSVWriters
+# Eager: the alias shares its name with the submodule, so it must be bound
+# here rather than lazily (importing the submodule would shadow it). The
+# module only defines a dict.
+from .wwv_tone_schedule import schedule as wwv_tone_schedule
 
-# Decimation
-from .decimation import decimate_for_upload, get_decimator, StatefulDecimator
+# =============================================================================
+# Lazy exports (PEP 562)
+# =============================================================================
+# Importing hf_timestd.core used to import every module below, pulling in
+# scipy.signal, digital_rf, matplotlib, etc. for every process. Names are
+# now resolved on first attribute access and cached in the module globals,
+# so `from hf_timestd.core import X` only loads the module that defines X.
+#
+# Maps public name -> (submodule, attribute)
+_LAZY_IMPORTS = {
+    # Tone detection and timing
+    "ToneDetector": (".tone_detector", "ToneDetector"),
 
-# DRF output
-from .drf_batch_writer import DRFBatchWriter
+    # Analytics and discrimination
+    "AnalyticsService": (".analytics_service", "AnalyticsService"),
+    "NPZDiscovery": (".npz_discovery", "NPZDiscovery"),
+    "NPZReader": (".npz_reader", "NPZReader"),
+    "WWVHDiscriminator": (".wwvh_discrimination", "WWVHDiscriminator"),
+    "WWVTestSignalDetector": (".wwv_test_signal", "WWVTestSignalDetector"),
+    "DiscriminationCSVWriters": (".discrimination_csv_writers", "DiscriminationCSVWriters"),
+
+    # Decimation
+    "decimate_for_upload": (".decimation", "decimate_for_upload"),
+    "get_decimator": (".decimation", "get_decimator"),
+    "StatefulDecimator": (".decimation", "StatefulDecimator"),
+
+    # DRF output
+    "DRFBatchWriter": (".drf_batch_writer", "DRFBatchWriter"),
+
+    # Supporting components
+    "WWVGeographicPredictor": (".wwv_geographic_predictor", "WWVGeographicPredictor"),
+    "WWVBCDEncoder": (".wwv_bcd_encoder", "WWVBCDEncoder"),
+    "QualityMetricsTracker": (".quality_metrics", "QualityMetricsTracker"),
+    "MinuteQualityMetrics": (".quality_metrics", "MinuteQualityMetrics"),
+    "TimingMetricsWriter": (".timing_metrics_writer", "TimingMetricsWriter"),
+    "calculate_solar_zenith_for_day": (".solar_zenith_calculator", "calculate_solar_zenith_for_day"),
+    "find_gaps": (".gap_backfill", "find_gaps"),
+    "backfill_gaps": (".gap_backfill", "backfill_gaps"),
+    "CoreRecorder": (".core_recorder", "CoreRecorder"),
+
+    # Cross-channel coordination (Station Lock)
+    "GlobalStationVoter": (".global_station_voter", "GlobalStationVoter"),
+    "StationAnchor": (".global_station_voter", "StationAnchor"),
+    "AnchorQuality": (".global_station_voter", "AnchorQuality"),
+    "StationLockCoordinator": (".station_lock_coordinator", "StationLockCoordinator"),
+    "GuidedDetection": (".station_lock_coordinator", "GuidedDetection"),
+    "MinuteProcessingResult": (".station_lock_coordinator", "MinuteProcessingResult"),
+
+    # Clock Convergence Model ("Set, Monitor, Intervention" for GPSDO)
+    "ClockConvergenceModel": (".clock_convergence", "ClockConvergenceModel"),
+    "ConvergenceState": (".clock_convergence", "ConvergenceState"),
+    "ConvergenceResult": (".clock_convergence", "ConvergenceResult"),
+    "StationAccumulator": (".clock_convergence", "StationAccumulator"),
+
+    # Primary Time Standard (HF Time Transfer)
+    "PropagationModeSolver": (".propagation_mode_solver", "PropagationModeSolver"),
+    # PropagationMode resolves to transmission_time_solver's enum (below), as
+    # it did when these were eager imports and the later import won
+    "ModeCandidate": (".propagation_mode_solver", "ModeCandidate"),
+    "ModeIdentificationResult": (".propagation_mode_solver", "ModeIdentificationResult"),
+    "EmissionTimeResult": (".propagation_mode_solver", "EmissionTimeResult"),
+    "PrimaryTimeStandard": (".primary_time_standard", "PrimaryTimeStandard"),
+    "ChannelTimeResult": (".primary_time_standard", "ChannelTimeResult"),
+    "StationConsensus": (".primary_time_standard", "StationConsensus"),
+    "MinuteTimeStandardResult": (".primary_time_standard", "MinuteTimeStandardResult"),
+    "TimeStandardCSVWriter": (".time_standard_csv_writer", "TimeStandardCSVWriter"),
+    "TimeStandardSummaryWriter": (".time_standard_csv_writer", "TimeStandardSummaryWriter"),
+
+    # Three-Phase Pipeline (New Architecture)
+    "PipelineRecorder": (".pipeline_recorder", "PipelineRecorder"),
+    "PipelineRecorderConfig": (".pipeline_recorder", "PipelineRecorderConfig"),
+    "PipelineRecorderState": (".pipeline_recorder", "PipelineRecorderState"),
+    "PacketRing": (".packet_ring", "PacketRing"),
+    "Supervisor": (".supervisor", "Supervisor"),
+    "FakeRadiod": (".fake_radiod", "FakeRadiod"),
+    "FakeRadiodConfig": (".fake_radiod", "FakeRadiodConfig"),
+    "AllocationTracker": (".memory_soak", "AllocationTracker"),
+    "LRUDict": (".bounded_cache", "LRUDict"),
+    "RecentSet": (".bounded_cache", "RecentSet"),
+    "create_pipeline_recorder": (".pipeline_recorder", "create_pipeline_recorder"),
+    "RawArchiveWriter": (".raw_archive_writer", "RawArchiveWriter"),
+    "RawArchiveReader": (".raw_archive_writer", "RawArchiveReader"),
+    "ArchiveReader": (".archive_reader", "ArchiveReader"),
+    "ArchiveMinute": (".archive_reader", "ArchiveMinute"),
+    "get_archive_reader": (".archive_reader", "get_archive_reader"),
+    "SeekableMinuteFile": (".seekable_archive", "SeekableMinuteFile"),
+    "write_seekable_minute": (".seekable_archive", "write_seekable_minute"),
+    "encode_iq": (".iq_codec", "encode_iq"),
+    "decode_iq": (".iq_codec", "decode_iq"),
+    "StageTimingRegistry": (".stage_timing", "StageTimingRegistry"),
+    "get_stage_timing": (".stage_timing", "get_stage_timing"),
+    "RawArchiveConfig": (".raw_archive_writer", "RawArchiveConfig"),
+    "SystemTimeReference": (".raw_archive_writer", "SystemTimeReference"),
+    "create_raw_archive_writer": (".raw_archive_writer", "create_raw_archive_writer"),
+    "ClockOffsetEngine": (".clock_offset_series", "ClockOffsetEngine"),
+    "ClockOffsetSeries": (".clock_offset_series", "ClockOffsetSeries"),
+    "ClockOffsetMeasurement": (".clock_offset_series", "ClockOffsetMeasurement"),
+    "ClockOffsetQuality": (".clock_offset_series", "ClockOffsetQuality"),
+    "ClockOffsetSeriesWriter": (".clock_offset_series", "ClockOffsetSeriesWriter"),
+    "create_clock_offset_engine": (".clock_offset_series", "create_clock_offset_engine"),
+    "PipelineOrchestrator": (".pipeline_orchestrator", "PipelineOrchestrator"),
+    "PipelineConfig": (".pipeline_orchestrator", "PipelineConfig"),
+    "PipelineState": (".pipeline_orchestrator", "PipelineState"),
+    "BatchReprocessor": (".pipeline_orchestrator", "BatchReprocessor"),
+    "create_pipeline": (".pipeline_orchestrator", "create_pipeline"),
+
+    # Transmission Time Solver (UTC back-calculation)
+    "TransmissionTimeSolver": (".transmission_time_solver", "TransmissionTimeSolver"),
+    "MultiStationSolver": (".transmission_time_solver", "MultiStationSolver"),
+    "SolverResult": (".transmission_time_solver", "SolverResult"),
+    "CombinedUTCResult": (".transmission_time_solver", "CombinedUTCResult"),
+    "PropagationMode": (".transmission_time_solver", "PropagationMode"),
+    "TransmissionModeCandidate": (".transmission_time_solver", "ModeCandidate"),
+    "create_solver_from_grid": (".transmission_time_solver", "create_solver_from_grid"),
+    "create_multi_station_solver": (".transmission_time_solver", "create_multi_station_solver"),
+    "grid_to_latlon": (".transmission_time_solver", "grid_to_latlon"),
+
+    # Phase 2: Temporal Analysis Engine (Refined temporal analysis order)
+    "Phase2TemporalEngine": (".phase2_temporal_engine", "Phase2TemporalEngine"),
+    "Phase2Result": (".phase2_temporal_engine", "Phase2Result"),
+    "TimeSnapResult": (".phase2_temporal_engine", "TimeSnapResult"),
+    "ChannelCharacterization": (".phase2_temporal_engine", "ChannelCharacterization"),
+    "TransmissionTimeSolution": (".phase2_temporal_engine", "TransmissionTimeSolution"),
+    "create_phase2_engine": (".phase2_temporal_engine", "create_phase2_engine"),
+
+    # Phase 3: Product Generation Engine (10 Hz Decimated DRF with Timing Annotations)
+    "Phase3ProductEngine": (".phase3_product_engine", "Phase3ProductEngine"),
+    "Phase3Config": (".phase3_product_engine", "Phase3Config"),
+    "GapInfo": (".phase3_product_engine", "GapInfo"),
+    "GapAnalysis": (".phase3_product_engine", "GapAnalysis"),
+    "TimingAnnotation": (".phase3_product_engine", "TimingAnnotation"),
+    "create_phase3_engine": (".phase3_product_engine", "create_phase3_engine"),
+    "process_channel_day": (".phase3_product_engine", "process_channel_day"),
+
+    # GPSDO Monitoring
+    "GPSDOMonitor": (".gpsdo_monitor", "GPSDOMonitor"),
+    "AnchorState": (".gpsdo_monitor", "AnchorState"),
+    "GPSDOMonitorState": (".gpsdo_monitor", "GPSDOMonitorState"),
+
+    # Sliding Window Monitor (10-second real-time quality tracking)
+    "SlidingWindowMonitor": (".sliding_window_monitor", "SlidingWindowMonitor"),
+    "WindowMetrics": (".sliding_window_monitor", "WindowMetrics"),
+    "MinuteSummary": (".sliding_window_monitor", "MinuteSummary"),
+    "SignalQuality": (".sliding_window_monitor", "SignalQuality"),
+    "StreamingMonitorBank": (".sliding_window_monitor", "StreamingMonitorBank"),
+
+    # Decimated Binary Buffer (stores 10 Hz IQ with timing metadata)
+    "DecimatedBuffer": (".decimated_buffer", "DecimatedBuffer"),
+    "DayMetadata": (".decimated_buffer", "DayMetadata"),
+    "MinuteMetadata": (".decimated_buffer", "MinuteMetadata"),
+    "get_decimated_buffer": (".decimated_buffer", "get_decimated_buffer"),
+
+    # Spectrogram Generation - CarrierSpectrogramGenerator is the CANONICAL implementation
+    # Supports solar zenith overlays, quality grades, gap visualization, rolling spectrograms
+    "CarrierSpectrogramGenerator": (".carrier_spectrogram", "CarrierSpectrogramGenerator"),
+    "CarrierSpectrogramConfig": (".carrier_spectrogram", "SpectrogramConfig"),
+    "generate_all_channel_spectrograms": (".carrier_spectrogram", "generate_all_channel_spectrograms"),
+
+    # DEPRECATED: SpectrogramGenerator - use CarrierSpectrogramGenerator instead
+    # Kept for backward compatibility but will be removed in future version
+    "SpectrogramGenerator": (".spectrogram_generator", "SpectrogramGenerator"),
+    "SpectrogramConfig": (".spectrogram_generator", "SpectrogramConfig"),
+    "generate_spectrograms_for_day": (".spectrogram_generator", "generate_spectrograms_for_day"),
+
+    # Daily DRF Packager (for PSWS upload)
+    "DailyDRFPackager": (".daily_drf_packager", "DailyDRFPackager"),
+    "IncrementalDRFPackager": (".daily_drf_packager", "IncrementalDRFPackager"),
+    "StationConfig": (".daily_drf_packager", "StationConfig"),
+    "package_for_upload": (".daily_drf_packager", "package_for_upload"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Supporting components
-from .wwv_geographic_predictor import WWVGeographicPredictor
-from .wwv_tone_schedule import schedule as wwv_tone_schedule
-from .wwv_bcd_encoder import WWVBCDEncoder
-from .quality_metrics import QualityMetricsTracker, MinuteQualityMetrics
-from .timing_metrics_writer import TimingMetricsWriter
-from .solar_zenith_calculator import calculate_solar_zenith_for_day
-from .gap_backfill import find_gaps, backfill_gaps
-from .core_recorder import CoreRecorder
-
-# Cross-channel coordination (Station Lock)
-from .global_station_voter import GlobalStationVoter, StationAnchor, AnchorQuality
-from .station_lock_coordinator import StationLockCoordinator, GuidedDetection, MinuteProcessingResult
-
-# Clock Convergence Model ("Set, Monitor, Intervention" for GPSDO)
-from .clock_convergence import (
-    ClockConvergenceModel,
-    ConvergenceState,
-    ConvergenceResult,
-    StationAccumulator
-)
-
-# Primary Time Standard (HF Time Transfer)
-from .propagation_mode_solver import (
-    PropagationModeSolver, 
-    PropagationMode, 
-    ModeCandidate,
-    ModeIdentificationResult,
-    EmissionTimeResult
-)
-from .primary_time_standard import (
-    PrimaryTimeStandard,
-    ChannelTimeResult,
-    StationConsensus,
-    MinuteTimeStandardResult
-)
-from .time_standard_csv_writer import TimeStandardCSVWriter, TimeStandardSummaryWriter
-
-# Three-Phase Pipeline (New Architecture)
-from .pipeline_recorder import (
-    PipelineRecorder,
-    PipelineRecorderConfig,
-    PipelineRecorderState,
-    create_pipeline_recorder
-)
-from .raw_archive_writer import (
-    RawArchiveWriter,
-    RawArchiveReader,
-    RawArchiveConfig,
-    SystemTimeReference,
-    create_raw_archive_writer
-)
-from .clock_offset_series import (
-    ClockOffsetEngine,
-    ClockOffsetSeries,
-    ClockOffsetMeasurement,
-    ClockOffsetQuality,
-    ClockOffsetSeriesWriter,
-    create_clock_offset_engine
-)
-from .pipeline_orchestrator import (
-    PipelineOrchestrator,
-    PipelineConfig,
-    PipelineState,
-    BatchReprocessor,
-    create_pipeline
-)
-
-# Transmission Time Solver (UTC back-calculation)
-from .transmission_time_solver import (
-    TransmissionTimeSolver,
-    MultiStationSolver,
-    SolverResult,
-    CombinedUTCResult,
-    PropagationMode,
-    ModeCandidate as TransmissionModeCandidate,
-    create_solver_from_grid,
-    create_multi_station_solver,
-    grid_to_latlon
-)
-
-# Phase 2: Temporal Analysis Engine (Refined temporal analysis order)
-from .phase2_temporal_engine import (
-    Phase2TemporalEngine,
-    Phase2Result,
-    TimeSnapResult,
-    ChannelCharacterization,
-    TransmissionTimeSolution,
-    create_phase2_engine
-)
-
-# Phase 3: Product Generation Engine (10 Hz Decimated DRF with Timing Annotations)
-from .phase3_product_engine import (
-    Phase3ProductEngine,
-    Phase3Config,
-    GapInfo,
-    GapAnalysis,
-    TimingAnnotation,
-    create_phase3_engine,
-    process_channel_day
-)
-
-# GPSDO Monitoring
-from .gpsdo_monitor import (
-    GPSDOMonitor,
-    AnchorState,
-    GPSDOMonitorState
-)
-
-# Sliding Window Monitor (10-second real-time quality tracking)
-from .sliding_window_monitor import (
-    SlidingWindowMonitor,
-    WindowMetrics,
-    MinuteSummary,
-    SignalQuality
-)
-
-# Decimated Binary Buffer (stores 10 Hz IQ with timing metadata)
-from .decimated_buffer import (
-    DecimatedBuffer,
-    DayMetadata,
-    MinuteMetadata,
-    get_decimated_buffer
-)
-
-# Spectrogram Generation - CarrierSpectrogramGenerator is the CANONICAL implementation
-# Supports solar zenith overlays, quality grades, gap visualization, rolling spectrograms
-from .carrier_spectrogram import (
-    CarrierSpectrogramGenerator,
-    SpectrogramConfig as CarrierSpectrogramConfig,
-    generate_all_channel_spectrograms
-)
-
-# DEPRECATED: SpectrogramGenerator - use CarrierSpectrogramGenerator instead
-# Kept for backward compatibility but will be removed in future version
-from .spectrogram_generator import (
-    SpectrogramGenerator,  # DEPRECATED
-    SpectrogramConfig,     # DEPRECATED - use CarrierSpectrogramConfig
-    generate_spectrograms_for_day  # DEPRECATED
-)
-
-# Daily DRF Packager (for PSWS upload)
-from .daily_drf_packager import (
-    DailyDRFPackager,
-    StationConfig,
-    package_for_upload
-)
 
 __all__ = [
     # Core recorder
@@ -209,6 +239,8 @@ __all__ = [
     "ToneDetector",
     # Analytics
     "AnalyticsService",
+    "NPZDiscovery",
+    "NPZReader",
     "WWVHDiscriminator",
     "WWVTestSignalDetector",
     "DiscriminationCSVWriters",
@@ -256,9 +288,25 @@ __all__ = [
     "PipelineRecorder",
     "PipelineRecorderConfig",
     "PipelineRecorderState",
+    "PacketRing",
+    "Supervisor",
+    "FakeRadiod",
+    "FakeRadiodConfig",
+    "AllocationTracker",
+    "LRUDict",
+    "RecentSet",
     "create_pipeline_recorder",
     "RawArchiveWriter",
     "RawArchiveReader",
+    "ArchiveReader",
+    "ArchiveMinute",
+    "get_archive_reader",
+    "SeekableMinuteFile",
+    "write_seekable_minute",
+    "encode_iq",
+    "decode_iq",
+    "StageTimingRegistry",
+    "get_stage_timing",
     "RawArchiveConfig",
     "SystemTimeReference",
     "create_raw_archive_writer",
@@ -306,6 +354,7 @@ __all__ = [
     "WindowMetrics",
     "MinuteSummary",
     "SignalQuality",
+    "StreamingMonitorBank",
     # Decimated Binary Buffer
     "DecimatedBuffer",
     "DayMetadata",
@@ -317,6 +366,7 @@ __all__ = [
     "generate_all_channel_spectrograms",
     # Daily DRF Packager
     "DailyDRFPackager",
+    "IncrementalDRFPackager",
     "StationConfig",
     "package_for_upload",
 ]
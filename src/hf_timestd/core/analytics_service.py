@@ -42,6 +42,9 @@ from .discrimination_csv_writers import (
     DiscriminationRecord
 )
 from .timing_metrics_writer import TimingMetricsWriter
+from .checkpoint_service import get_checkpoint_service, load_checkpoint
+from .npz_discovery import NPZDiscovery
+from .npz_reader import NPZReader
 from .transmission_time_solver import (
     TransmissionTimeSolver, create_solver_from_grid, SolverResult,
     MultiStationSolver, CombinedUTCResult, create_multi_station_solver
@@ -145,40 +148,50 @@ class NPZArchive:
     ntp_offset_ms: Optional[float] = None        # NTP offset at creation time
     
     @classmethod
-    def load(cls, file_path: Path) -> 'NPZArchive':
-        """Load NPZ archive from file"""
-        data = np.load(file_path, allow_pickle=True)
-        
-        return cls(
-            file_path=file_path,
-            iq_samples=data['iq'],
-            rtp_timestamp=int(data['rtp_timestamp']),
-            rtp_ssrc=int(data['rtp_ssrc']),
-            sample_rate=int(data['sample_rate']),
-            frequency_hz=float(data['frequency_hz']),
-            channel_name=str(data['channel_name']),
-            unix_timestamp=float(data['unix_timestamp']),
-            gaps_filled=int(data['gaps_filled']),
-            gaps_count=int(data['gaps_count']),
-            packets_received=int(data['packets_received']),
-            packets_expected=int(data['packets_expected']),
-            gap_rtp_timestamps=data['gap_rtp_timestamps'],
-            gap_sample_indices=data['gap_sample_indices'],
-            gap_samples_filled=data['gap_samples_filled'],
-            gap_packets_lost=data['gap_packets_lost'],
-            recorder_version=str(data['recorder_version']),
-            created_timestamp=float(data['created_timestamp']),
-            time_snap_rtp=cls._get_optional_scalar(data, 'time_snap_rtp', int),
-            time_snap_utc=cls._get_optional_scalar(data, 'time_snap_utc', float),
-            time_snap_source=cls._get_optional_scalar(data, 'time_snap_source', str),
-            time_snap_confidence=cls._get_optional_scalar(data, 'time_snap_confidence', float),
-            time_snap_station=cls._get_optional_scalar(data, 'time_snap_station', str),
-            tone_power_1000_hz_db=cls._get_optional_scalar(data, 'tone_power_1000_hz_db', float),
-            tone_power_1200_hz_db=cls._get_optional_scalar(data, 'tone_power_1200_hz_db', float),
-            wwvh_differential_delay_ms=cls._get_optional_scalar(data, 'wwvh_differential_delay_ms', float),
-            ntp_wall_clock_time=cls._get_optional_scalar(data, 'ntp_wall_clock_time', float),
-            ntp_offset_ms=cls._get_optional_scalar(data, 'ntp_offset_ms', float)
-        )
+    def load(cls, file_path: Path, mmap: bool = True) -> 'NPZArchive':
+        """
+        Load NPZ archive from file
+        
+        Pickle-free: members are read one at a time, and an uncompressed
+        IQ member is memory-mapped (copy-on-write) instead of copied.
+        """
+        with NPZReader(file_path) as data:
+            def required(key: str, cast):
+                value = data.scalar(key, cast)
+                if value is None:
+                    raise KeyError(f"{Path(file_path).name}: missing or unreadable '{key}'")
+                return value
+            
+            return cls(
+                file_path=file_path,
+                iq_samples=data.array('iq', mmap=mmap),
+                rtp_timestamp=required('rtp_timestamp', int),
+                rtp_ssrc=required('rtp_ssrc', int),
+                sample_rate=required('sample_rate', int),
+                frequency_hz=required('frequency_hz', float),
+                channel_name=required('channel_name', str),
+                unix_timestamp=required('unix_timestamp', float),
+                gaps_filled=required('gaps_filled', int),
+                gaps_count=required('gaps_count', int),
+                packets_received=required('packets_received', int),
+                packets_expected=required('packets_expected', int),
+                gap_rtp_timestamps=data.array('gap_rtp_timestamps', mmap=False),
+                gap_sample_indices=data.array('gap_sample_indices', mmap=False),
+                gap_samples_filled=data.array('gap_samples_filled', mmap=False),
+                gap_packets_lost=data.array('gap_packets_lost', mmap=False),
+                recorder_version=required('recorder_version', str),
+                created_timestamp=required('created_timestamp', float),
+                time_snap_rtp=data.scalar('time_snap_rtp', int),
+                time_snap_utc=data.scalar('time_snap_utc', float),
+                time_snap_source=data.scalar('time_snap_source', str),
+                time_snap_confidence=data.scalar('time_snap_confidence', float),
+                time_snap_station=data.scalar('time_snap_station', str),
+                tone_power_1000_hz_db=data.scalar('tone_power_1000_hz_db', float),
+                tone_power_1200_hz_db=data.scalar('tone_power_1200_hz_db', float),
+                wwvh_differential_delay_ms=data.scalar('wwvh_differential_delay_ms', float),
+                ntp_wall_clock_time=data.scalar('ntp_wall_clock_time', float),
+                ntp_offset_ms=data.scalar('ntp_offset_ms', float)
+            )
     
     def calculate_utc_timestamp(self, time_snap: Optional[TimeSnapReference]) -> float:
         """
@@ -201,19 +214,6 @@ class NPZArchive:
             # Fall back to wall clock (approximate, will be marked as low quality)
             return self.unix_timestamp
 
-    @staticmethod
-    def _get_optional_scalar(data, key: str, cast):
-        """Safely extract optional scalar field from NPZ archive"""
-        if key not in data:
-            return None
-        value = data[key]
-        if isinstance(value, np.ndarray) and value.shape == ():
-            value = value.item()
-        try:
-            return cast(value)
-        except (TypeError, ValueError):
-            return None
-
     def embedded_time_snap(self) -> Optional[TimeSnapReference]:
         """Build TimeSnapReference from embedded NPZ metadata if available"""
         if self.time_snap_rtp is None or self.time_snap_utc is None:
@@ -256,6 +256,7 @@ class ProcessingState:
     """
     last_processed_file: Optional[Path] = None
     last_processed_time: Optional[float] = None
+    watermark: Optional[str] = None  # Name of last processed file (discovery watermark)
     files_processed: int = 0
     time_snap: Optional[TimeSnapReference] = None
     time_snap_history: List[TimeSnapReference] = field(default_factory=list)
@@ -273,6 +274,7 @@ class ProcessingState:
         return {
             'last_processed_file': str(self.last_processed_file) if self.last_processed_file else None,
             'last_processed_time': self.last_processed_time,
+            'watermark': self.watermark,
             'files_processed': self.files_processed,
             'time_snap': self.time_snap.to_dict() if self.time_snap else None,
             'time_snap_history': [ts.to_dict() for ts in time_snap_slice],
@@ -311,6 +313,7 @@ class AnalyticsService:
         self.frequency_hz = frequency_hz
         self.state_file = state_file
         self.station_config = station_config or {}
+        self._checkpoints = get_checkpoint_service()
         
         # Create output directories
         self.quality_dir = self.output_dir / 'quality'
@@ -326,6 +329,9 @@ class AnalyticsService:
         self.state = ProcessingState()
         self._load_state()
         
+        # New-file discovery bounded by the persisted watermark
+        self.discovery = NPZDiscovery(self.archive_dir, watermark=self.state.watermark)
+        
         # Tone detector (resamples 16k → 3k internally)
         self.tone_detector = MultiStationToneDetector(
             channel_name=channel_name,
@@ -467,10 +473,11 @@ class AnalyticsService:
     
     def _load_state(self):
         """Load persistent state from file"""
-        if self.state_file and self.state_file.exists():
+        if self.state_file:
             try:
-                with open(self.state_file, 'r') as f:
-                    state_data = json.load(f)
+                state_data = load_checkpoint(self.state_file)
+                if state_data is None:
+                    return
                 
                 # Restore basic state
                 self.state.files_processed = state_data.get('files_processed', 0)
@@ -479,6 +486,11 @@ class AnalyticsService:
                 if state_data.get('last_processed_file'):
                     self.state.last_processed_file = Path(state_data['last_processed_file'])
                 
+                # Older state files only have last_processed_file
+                self.state.watermark = state_data.get('watermark') or (
+                    self.state.last_processed_file.name if self.state.last_processed_file else None
+                )
+                
                 # Restore time_snap if available
                 if state_data.get('time_snap'):
                     ts = state_data['time_snap']
@@ -533,11 +545,10 @@ class AnalyticsService:
         return current
 
     def _save_state(self):
-        """Save persistent state to file"""
+        """Queue a state snapshot with the checkpoint service"""
         if self.state_file:
             try:
-                with open(self.state_file, 'w') as f:
-                    json.dump(self.state.to_dict(), f, indent=2)
+                self._checkpoints.mark_dirty(self.state_file, self.state.to_dict())
             except Exception as e:
                 logger.warning(f"Failed to save state: {e}")
     
@@ -589,8 +600,11 @@ class AnalyticsService:
                     'age_minutes': age_minutes
                 }
             
-            # Calculate pending files
-            pending_files = len(self.discover_new_files())
+            # Calculate pending files (a peek: discover() must still return them)
+            if self.state.watermark is None and self.state.last_processed_time:
+                pending_files = len(self.discover_new_files())  # Legacy scan keeps no state
+            else:
+                pending_files = self.discovery.pending()
             
             status = {
                 'service': 'analytics_service',
@@ -690,34 +704,24 @@ class AnalyticsService:
         """
         Discover new NPZ files to process
         
+        Only files after the watermark (last processed file name) are
+        returned; see NPZDiscovery for how listing stays bounded.
+        
         Returns:
             List of NPZ file paths, sorted by timestamp in filename (chronological order)
         """
-        # Find all NPZ files recursively
-        all_files = list(self.archive_dir.rglob('*.npz'))
-        
-        # Filter to new files (after last processed)
-        if self.state.last_processed_file:
-            # Use filename comparison instead of mtime to ensure chronological order
-            # NPZ files have format: YYYYMMDDTHHMMSSZ_freq_iq.npz
-            last_processed_name = self.state.last_processed_file.name
+        if self.state.watermark is None and self.state.last_processed_time:
+            # Legacy fallback for old state files (one full scan, until a
+            # file is processed and sets the watermark)
             new_files = [
-                f for f in all_files 
-                if f.name > last_processed_name  # Lexicographic comparison works for ISO timestamps
-            ]
-        elif self.state.last_processed_time:
-            # Legacy fallback for old state files
-            new_files = [
-                f for f in all_files 
+                f for f in self.archive_dir.rglob('*.npz')
                 if f.stat().st_mtime > self.state.last_processed_time
             ]
+            # CRITICAL: Sort by filename to ensure strict chronological order
+            # This prevents out-of-order processing that causes DRF sample index conflicts
+            new_files = sorted(new_files, key=lambda f: f.name)
         else:
-            # First run - process all files
-            new_files = all_files
-        
-        # CRITICAL: Sort by filename to ensure strict chronological order
-        # This prevents out-of-order processing that causes DRF sample index conflicts
-        new_files = sorted(new_files, key=lambda f: f.name)
+            new_files = self.discovery.discover()
         
         logger.info(f"Discovered {len(new_files)} new NPZ files")
         return new_files
@@ -1488,7 +1492,7 @@ class AnalyticsService:
                     ]
                 }
             
-            # Write 10Hz NPZ with metadata
+            # Write 10Hz NPZ with metadata (dicts as JSON strings: no pickled members)
             np.savez_compressed(
                 output_path,
                 iq=decimated_iq,
@@ -1498,9 +1502,9 @@ class AnalyticsService:
                 decimation_factor=archive.sample_rate // 10,
                 created_timestamp=time.time(),
                 source_file=str(archive.file_path.name),
-                timing_metadata=timing_metadata,
-                quality_metadata=quality_metadata,
-                tone_metadata=tone_metadata if tone_metadata else {}
+                timing_metadata=json.dumps(timing_metadata),
+                quality_metadata=json.dumps(quality_metadata),
+                tone_metadata=json.dumps(tone_metadata if tone_metadata else {})
             )
             
             logger.debug(f"Wrote {len(decimated_iq)} samples to {decimated_name}")
@@ -2234,6 +2238,8 @@ class AnalyticsService:
                             # Update state
                             self.state.last_processed_file = file_path
                             self.state.last_processed_time = file_path.stat().st_mtime
+                            self.state.watermark = file_path.name
+                            self.discovery.advance(file_path.name)
                             self.state.files_processed += 1
                             
                             # Save state periodically
@@ -2259,8 +2265,8 @@ class AnalyticsService:
                         self._write_gpsdo_status()
                         last_status_time = now
                     
-                    # Sleep until next poll
-                    time.sleep(poll_interval)
+                    # Sleep until next poll (woken early by new files)
+                    self.discovery.wait(poll_interval)
                 
                 except KeyboardInterrupt:
                     logger.info("Shutting down on keyboard interrupt")
@@ -2272,6 +2278,8 @@ class AnalyticsService:
         finally:
             # Final state save
             self._save_state()
+            self._checkpoints.flush()
+            self.discovery.close()
             
             # Digital RF flushing handled by separate service
             
@@ -0,0 +1,728 @@
+#!/usr/bin/env python3
+"""
+Archive Reader - one time-range reader for the Phase 1 archives
+
+Implements interfaces.archive.ArchiveReader over both Phase 1 formats:
+
+    raw_buffer/{CHANNEL}/YYYYMMDD/{minute}.bin[.zst|.lz4] + {minute}.json
+        Binary minutes (BinaryArchiveWriter), the primary format
+    raw_archive/{CHANNEL}/
+        Digital RF (RawArchiveWriter), the legacy/fallback format
+
+Phase 2 (live and reprocessing), Phase 3 and the archive reader classes all
+read minutes through this module, so they share the same caching:
+
+- Digital RF readers are opened once per directory (get_drf_reader) instead
+  of on every minute.
+- Uncompressed minutes are memory-mapped (zero copy). The kernel is asked to
+  read prefetched minutes ahead (posix_fadvise WILLNEED).
+- zstd/lz4 minutes are decompressed straight into pooled complex64 buffers.
+  A pooled buffer is reused only once no array references it any more, so
+  callers never see their samples overwritten and never have to release
+  anything.
+- After every minute read, the next `prefetch_minutes` minutes of the same
+  channel are loaded on a background thread, so sequential reprocessing
+  overlaps decompression/disk reads with analysis.
+
+Minute samples are returned read-only.
+
+Usage:
+    reader = get_archive_reader(data_root, sample_rate=20000)
+    minute = reader.get_minute('WWV 10 MHz', 1765031100)
+    if minute is not None:
+        engine.process_minute(minute.samples, minute.system_time, minute.rtp_timestamp)
+    
+    samples, metadata = reader.read_time_range(t0, t0 + 600, 'WWV 10 MHz')
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..interfaces.archive import ArchiveReader as ArchiveReaderInterface
+from ..paths import GRAPEPaths, channel_name_to_dir
+from .seekable_archive import SEEKABLE_EXTENSION, SeekableMinuteFile
+
+logger = logging.getLogger(__name__)
+
+# Binary minute file extensions, in lookup order, and their compression
+BINARY_EXTENSIONS = (
+    ('.bin', None), ('.bin.zst', 'zstd'), ('.bin.lz4', 'lz4'), (SEEKABLE_EXTENSION, 'seekable')
+)
+_EXTENSIONS = {ext for ext, _ in BINARY_EXTENSIONS}
+
+# A minute needs at least this fraction of its samples to be used
+MIN_MINUTE_COMPLETENESS = 0.9
+
+DEFAULT_PREFETCH_MINUTES = 2
+
+SOURCES = ('auto', 'raw_buffer', 'raw_archive')
+
+
+@dataclass
+class ArchiveMinute:
+    """One minute of Phase 1 IQ samples"""
+    minute: int  # Unix timestamp of minute boundary
+    samples: np.ndarray  # complex64, read-only (memmap or pooled buffer view)
+    system_time: float
+    rtp_timestamp: int
+    source: str  # 'bin', 'zstd', 'lz4', 'seekable' or 'drf'
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def as_tuple(self) -> Tuple[np.ndarray, float, int]:
+        """(iq_samples, system_time, rtp_timestamp) as used by process_minute()"""
+        return self.samples, self.system_time, self.rtp_timestamp
+
+
+# =============================================================================
+# Shared Digital RF readers
+# =============================================================================
+
+_drf_readers: Dict[str, Any] = {}
+_drf_locks: Dict[str, threading.Lock] = {}
+_drf_readers_lock = threading.Lock()
+
+
+def get_drf_reader(directory: Path):
+    """
+    Process-wide cached DigitalRFReader for a directory.
+    
+    Returns:
+        (reader, lock) - hold the lock around reads (the reader is not
+        thread-safe) - or (None, None) if digital_rf is not installed or the
+        directory holds no Digital RF data
+    """
+    key = str(directory)
+    with _drf_readers_lock:
+        if key in _drf_readers:
+            return _drf_readers[key], _drf_locks[key]
+    
+    if not Path(directory).exists():
+        return None, None
+    try:
+        import digital_rf as drf
+        reader = drf.DigitalRFReader(key)
+    except Exception as e:
+        logger.debug(f"No Digital RF archive at {directory}: {e}")
+        return None, None
+    
+    with _drf_readers_lock:
+        if key not in _drf_readers:
+            _drf_readers[key] = reader
+            _drf_locks[key] = threading.Lock()
+        return _drf_readers[key], _drf_locks[key]
+
+
+def read_drf_minute(
+    reader,
+    target_minute: int,
+    sample_rate: int
+) -> Optional[Tuple[np.ndarray, float, int]]:
+    """
+    Read one minute from a Digital RF archive.
+    
+    Args:
+        reader: digital_rf.DigitalRFReader opened on raw_archive/{CHANNEL}
+        target_minute: Unix timestamp of minute boundary
+        sample_rate: Sample rate of the archive
+    
+    Returns:
+        Tuple of (iq_samples, system_time, rtp_timestamp) or None if not available
+    """
+    channels = reader.get_channels()
+    
+    if not channels:
+        return None
+    
+    target_start_index = int(target_minute * sample_rate)
+    samples_per_minute = sample_rate * 60
+    
+    channel = None
+    bounds = None
+    for ch in sorted(channels, reverse=True):
+        ch_bounds = reader.get_bounds(ch)
+        if ch_bounds[0] is not None and ch_bounds[1] is not None:
+            if ch_bounds[0] <= target_start_index < ch_bounds[1]:
+                channel = ch
+                bounds = ch_bounds
+                break
+            if bounds is None or ch_bounds[1] > bounds[1]:
+                channel = ch
+                bounds = ch_bounds
+    
+    if channel is None or bounds is None:
+        return None
+    
+    if target_start_index < bounds[0] or target_start_index >= bounds[1]:
+        return None
+    
+    iq_samples = reader.read_vector(target_start_index, samples_per_minute, channel)
+    
+    if iq_samples is None or len(iq_samples) < samples_per_minute:
+        return None
+    
+    iq_samples = iq_samples.squeeze().astype(np.complex64)
+    system_time = target_start_index / sample_rate
+    rtp_timestamp = target_start_index
+    
+    return iq_samples, system_time, rtp_timestamp
+
+
+# =============================================================================
+# Buffer pool
+# =============================================================================
+
+class _BufferPool:
+    """
+    Fixed set of one-minute complex64 buffers for decompressed minutes.
+    
+    A buffer is free when only the pool references it: every view handed
+    out (and every slice of it - numpy keeps the owning array as .base)
+    holds a reference, so sys.getrefcount tells when all consumers are done.
+    """
+    
+    def __init__(self, num_samples: int, max_buffers: int):
+        self.num_samples = num_samples
+        self.max_buffers = max_buffers
+        self._buffers: List[np.ndarray] = []
+        self._lock = threading.Lock()
+        self.allocations = 0  # Buffers allocated outside the pool (pool exhausted)
+    
+    def acquire(self) -> np.ndarray:
+        with self._lock:
+            for i in range(len(self._buffers)):
+                # References: the list slot and getrefcount's argument
+                if sys.getrefcount(self._buffers[i]) <= 2:
+                    return self._buffers[i]
+            if len(self._buffers) < self.max_buffers:
+                self._buffers.append(np.empty(self.num_samples, dtype=np.complex64))
+                return self._buffers[-1]
+            # Counted under the lock: the prefetch thread acquires too
+            self.allocations += 1
+        return np.empty(self.num_samples, dtype=np.complex64)
+    
+    def in_use(self) -> int:
+        with self._lock:
+            return sum(1 for i in range(len(self._buffers)) if sys.getrefcount(self._buffers[i]) > 2)
+
+
+# =============================================================================
+# Archive reader
+# =============================================================================
+
+class ArchiveReader(ArchiveReaderInterface):
+    """
+    Minute and time-range reads over raw_buffer (binary) and raw_archive (DRF).
+    
+    Channel directories default to {data_root}/raw_buffer/{CHANNEL} and
+    {data_root}/raw_archive/{CHANNEL}; register_channel() overrides them.
+    Thread-safe.
+    """
+    
+    def __init__(
+        self,
+        data_root: Optional[Path] = None,
+        sample_rate: int = 20000,
+        source: str = 'auto',
+        prefetch_minutes: int = DEFAULT_PREFETCH_MINUTES,
+        pool_buffers: Optional[int] = None
+    ):
+        """
+        Initialize archive reader.
+        
+        Args:
+            data_root: Data root containing raw_buffer/ and raw_archive/
+            sample_rate: Archive sample rate
+            source: 'auto' (binary, then DRF), 'raw_buffer' or 'raw_archive'
+            prefetch_minutes: Minutes to load ahead after each read (0 = off)
+            pool_buffers: Pooled decompression buffers (default: prefetch + 3)
+        """
+        if source not in SOURCES:
+            raise ValueError(f"source must be one of {SOURCES}, got {source!r}")
+        
+        self.data_root = Path(data_root) if data_root is not None else None
+        self.sample_rate = sample_rate
+        self.source = source
+        self.prefetch_minutes = max(0, prefetch_minutes)
+        self.samples_per_minute = sample_rate * 60
+        
+        self._pool = _BufferPool(
+            self.samples_per_minute,
+            pool_buffers if pool_buffers is not None else self.prefetch_minutes + 3
+        )
+        self._channel_dirs: Dict[str, Tuple[Optional[Path], Optional[Path]]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()  # Per-thread zstd decompressor
+        
+        # Background prefetch
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[Tuple[str, int], Future] = {}
+        
+        # Statistics
+        self.stats = {
+            'minutes_read': 0,
+            'minutes_missing': 0,
+            'prefetch_hits': 0,
+            'bytes_mapped': 0,
+            'bytes_decompressed': 0,
+        }
+    
+    # -------------------------------------------------------------------------
+    # Channel directories
+    # -------------------------------------------------------------------------
+    
+    def register_channel(
+        self,
+        channel_name: str,
+        binary_dir: Optional[Path] = None,
+        drf_dir: Optional[Path] = None
+    ):
+        """Use explicit raw_buffer/raw_archive directories for a channel."""
+        with self._lock:
+            self._channel_dirs[channel_name] = (
+                Path(binary_dir) if binary_dir is not None else None,
+                Path(drf_dir) if drf_dir is not None else None
+            )
+    
+    def _dirs(self, channel_name: str) -> Tuple[Optional[Path], Optional[Path]]:
+        """(binary_dir, drf_dir) for a channel"""
+        with self._lock:
+            if channel_name in self._channel_dirs:
+                return self._channel_dirs[channel_name]
+        if self.data_root is None:
+            return None, None
+        return (
+            self.data_root / 'raw_buffer' / channel_name_to_dir(channel_name),
+            GRAPEPaths(self.data_root).get_raw_archive_dir(channel_name)
+        )
+    
+    def binary_minute_path(self, channel_name: str, minute: int) -> Optional[Path]:
+        """Path of a binary minute file (any compression), or None."""
+        binary_dir, _ = self._dirs(channel_name)
+        if binary_dir is None:
+            return None
+        date_str = datetime.fromtimestamp(minute, tz=timezone.utc).strftime('%Y%m%d')
+        base = binary_dir / date_str / f"{minute}"
+        for ext, _ in BINARY_EXTENSIONS:
+            candidate = Path(f"{base}{ext}")
+            if candidate.exists():
+                return candidate
+        return None
+    
+    # -------------------------------------------------------------------------
+    # Binary minutes
+    # -------------------------------------------------------------------------
+    
+    @staticmethod
+    def _compression(path: Path) -> Optional[str]:
+        for ext, compression in reversed(BINARY_EXTENSIONS):
+            if path.name.endswith(ext):
+                return compression
+        raise ValueError(f"Not a binary archive minute: {path}")
+    
+    def _zstd_decompressor(self):
+        dctx = getattr(self._local, 'zstd', None)
+        if dctx is None:
+            import zstandard as zstd
+            dctx = self._local.zstd = zstd.ZstdDecompressor()
+        return dctx
+    
+    def _decompress_into(self, path: Path, compression: str) -> np.ndarray:
+        """Decompress a minute into a pooled buffer; returns a read-only view."""
+        if compression == 'seekable':
+            with SeekableMinuteFile(path) as f:
+                if f.total_samples > self.samples_per_minute:
+                    raise ValueError(f"Minute file larger than {self.samples_per_minute} samples: {path}")
+                samples = f.read_all(out=self._pool.acquire())
+            self.stats['bytes_decompressed'] += samples.nbytes
+            samples.flags.writeable = False
+            return samples
+        
+        if compression == 'zstd':
+            stream = self._zstd_decompressor().stream_reader(open(path, 'rb'), closefd=True)
+        else:
+            import lz4.frame
+            stream = lz4.frame.open(path, 'rb')
+        
+        buffer = self._pool.acquire()
+        target = memoryview(buffer.view(np.uint8))
+        filled = 0
+        with stream:
+            while filled < len(target):
+                n = stream.readinto(target[filled:])
+                if not n:
+                    break
+                filled += n
+            if filled == len(target) and stream.read(1):
+                # Longer than a minute: not written by BinaryArchiveWriter
+                raise ValueError(f"Minute file larger than {self.samples_per_minute} samples: {path}")
+        
+        self.stats['bytes_decompressed'] += filled
+        view = buffer[:filled // 8]
+        view.flags.writeable = False
+        return view
+    
+    def read_minute(self, file_path: Path) -> Tuple[np.ndarray, dict]:
+        """
+        Read a single binary minute file (interfaces.archive.ArchiveReader).
+        
+        Returns:
+            (samples, metadata): samples as written (memmap for .bin), metadata
+            from the JSON sidecar ({} if absent)
+        
+        Raises:
+            FileNotFoundError: File doesn't exist
+            ValueError: File corrupt or invalid format
+        """
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(file_path)
+        compression = self._compression(file_path)
+        
+        try:
+            if compression is None:
+                samples = np.memmap(file_path, dtype=np.complex64, mode='r')
+                self.stats['bytes_mapped'] += samples.nbytes
+            else:
+                samples = self._decompress_into(file_path, compression)
+        except ImportError as e:
+            raise ValueError(f"Cannot read {file_path.name}: {e}") from e
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Corrupt minute file {file_path}: {e}") from e
+        
+        minute = file_path.name.split('.')[0]
+        json_path = file_path.parent / f"{minute}.json"
+        metadata = {}
+        if json_path.exists():
+            with open(json_path) as f:
+                metadata = json.load(f)
+        return samples, metadata
+    
+    def _load_binary(self, channel_name: str, minute: int, prefetch: bool) -> Optional[ArchiveMinute]:
+        path = self.binary_minute_path(channel_name, minute)
+        if path is None:
+            return None
+        
+        # The writer finishes the sidecar after the samples: a prefetch must
+        # not catch a minute that is still being written
+        json_path = path.parent / f"{minute}.json"
+        if prefetch and not json_path.exists():
+            return None
+        
+        if prefetch and self._compression(path) is None and hasattr(os, 'posix_fadvise'):
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+        
+        try:
+            samples, metadata = self.read_minute(path)
+        except ValueError as e:
+            logger.warning(f"{e}")
+            return None
+        
+        if len(samples) < self.samples_per_minute * MIN_MINUTE_COMPLETENESS:
+            logger.debug(f"Incomplete minute: {len(samples)}/{self.samples_per_minute}")
+            return None
+        
+        # Pad if slightly short
+        if len(samples) < self.samples_per_minute:
+            padded = self._pool.acquire()
+            padded[:len(samples)] = samples
+            padded[len(samples):] = 0
+            samples = padded[:self.samples_per_minute]
+            samples.flags.writeable = False
+        
+        # Use actual RTP timestamp from metadata, not synthesized from Unix time
+        if 'start_rtp_timestamp' in metadata and metadata['start_rtp_timestamp'] is not None:
+            rtp_timestamp = int(metadata['start_rtp_timestamp'])
+        else:
+            # Fallback: synthesize from Unix time (less accurate)
+            rtp_timestamp = int(minute * self.sample_rate)
+            logger.warning("No RTP timestamp in metadata, using synthesized value")
+        
+        return ArchiveMinute(
+            minute=minute,
+            samples=samples,
+            system_time=float(minute),
+            rtp_timestamp=rtp_timestamp,
+            source=self._compression(path) or 'bin',
+            metadata=metadata
+        )
+    
+    # -------------------------------------------------------------------------
+    # Digital RF minutes
+    # -------------------------------------------------------------------------
+    
+    def get_drf_reader(self, channel_name: str):
+        """Shared DigitalRFReader for a channel's raw_archive (or None)."""
+        _, drf_dir = self._dirs(channel_name)
+        if drf_dir is None:
+            return None
+        return get_drf_reader(drf_dir)[0]
+    
+    def _load_drf(self, channel_name: str, minute: int) -> Optional[ArchiveMinute]:
+        _, drf_dir = self._dirs(channel_name)
+        if drf_dir is None:
+            return None
+        reader, lock = get_drf_reader(drf_dir)
+        if reader is None:
+            return None
+        
+        try:
+            with lock:
+                data = read_drf_minute(reader, minute, self.sample_rate)
+        except Exception as e:
+            logger.debug(f"Error reading DRF minute {minute}: {e}")
+            return None
+        if data is None:
+            return None
+        
+        samples, system_time, rtp_timestamp = data
+        samples.flags.writeable = False
+        return ArchiveMinute(
+            minute=minute,
+            samples=samples,
+            system_time=system_time,
+            rtp_timestamp=rtp_timestamp,
+            source='drf'
+        )
+    
+    # -------------------------------------------------------------------------
+    # Minute reads with prefetch
+    # -------------------------------------------------------------------------
+    
+    def _load_minute(self, channel_name: str, minute: int, prefetch: bool = False) -> Optional[ArchiveMinute]:
+        data = None
+        if self.source in ('auto', 'raw_buffer'):
+            data = self._load_binary(channel_name, minute, prefetch)
+        if data is None and self.source in ('auto', 'raw_archive'):
+            data = self._load_drf(channel_name, minute)
+        return data
+    
+    def get_minute(self, channel_name: str, minute: int) -> Optional[ArchiveMinute]:
+        """
+        Read one minute (binary first, then DRF, per `source`).
+        
+        Minutes with less than 90% of their samples are treated as missing;
+        slightly short minutes are zero-padded.
+        
+        Args:
+            channel_name: Channel identifier
+            minute: Unix timestamp of minute boundary
+        
+        Returns:
+            ArchiveMinute or None if not available
+        """
+        minute = (int(minute) // 60) * 60
+        
+        with self._lock:
+            future = self._pending.pop((channel_name, minute), None)
+        
+        data = None
+        if future is not None:
+            try:
+                data = future.result()
+            except Exception as e:
+                logger.debug(f"Prefetch of minute {minute} failed: {e}")
+            if data is not None:
+                self.stats['prefetch_hits'] += 1
+        
+        # A prefetch can run before the minute is written - retry now
+        if data is None:
+            data = self._load_minute(channel_name, minute)
+        
+        if data is None:
+            self.stats['minutes_missing'] += 1
+        else:
+            self.stats['minutes_read'] += 1
+        
+        if self.prefetch_minutes:
+            self._schedule_prefetch(channel_name, minute)
+        return data
+    
+    def read_range(
+        self,
+        channel_name: str,
+        minute: int,
+        start_sample: int,
+        num_samples: int
+    ) -> Optional[np.ndarray]:
+        """
+        Read part of one binary minute, by sample offset from the minute boundary.
+        
+        Seekable (.bin.seek) minutes decompress only the chunks overlapping
+        the range and .bin minutes return a memmap slice; monolithic
+        .bin.zst/.bin.lz4 minutes have to be decompressed whole.
+        
+        Returns:
+            complex64 samples (shorter if the range passes the end of the
+            minute), or None if the minute is not in raw_buffer
+        """
+        path = self.binary_minute_path(channel_name, (int(minute) // 60) * 60)
+        if path is None:
+            return None
+        
+        try:
+            if self._compression(path) == 'seekable':
+                with SeekableMinuteFile(path) as f:
+                    samples = f.read_range(start_sample, num_samples)
+                self.stats['bytes_decompressed'] += samples.nbytes
+                samples.flags.writeable = False
+                return samples
+            samples, _ = self.read_minute(path)
+        except ValueError as e:
+            logger.warning(f"{e}")
+            return None
+        start = max(0, start_sample)
+        return samples[start:max(start, start_sample + num_samples)]
+    
+    def _schedule_prefetch(self, channel_name: str, minute: int):
+        """Queue the next prefetch_minutes minutes; drop passed ones."""
+        with self._lock:
+            for key in [k for k in self._pending if k[0] == channel_name and k[1] <= minute]:
+                self._pending.pop(key).cancel()
+            
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='archive-prefetch')
+            
+            for i in range(1, self.prefetch_minutes + 1):
+                key = (channel_name, minute + 60 * i)
+                if key not in self._pending:
+                    self._pending[key] = self._executor.submit(
+                        self._load_minute, channel_name, key[1], True
+                    )
+    
+    def read_samples(
+        self,
+        channel_name: str,
+        start_index: int,
+        num_samples: int
+    ) -> Optional[np.ndarray]:
+        """
+        Read samples by global sample index (unix_time * sample_rate).
+        
+        Missing minutes are zero-filled.
+        
+        Returns:
+            complex64 array of num_samples, or None if no sample is available
+        """
+        out = np.zeros(num_samples, dtype=np.complex64)
+        end_index = start_index + num_samples
+        found = False
+        
+        first_minute = (start_index // self.samples_per_minute) * 60
+        for minute in range(first_minute, -(-end_index // self.samples_per_minute) * 60, 60):
+            data = self.get_minute(channel_name, minute)
+            if data is None:
+                continue
+            found = True
+            minute_start = minute * self.sample_rate
+            lo = max(start_index, minute_start)
+            hi = min(end_index, minute_start + len(data.samples))
+            if hi > lo:
+                out[lo - start_index:hi - start_index] = data.samples[lo - minute_start:hi - minute_start]
+        
+        return out if found else None
+    
+    def read_time_range(
+        self,
+        start_time: float,
+        end_time: float,
+        channel_name: str
+    ) -> Tuple[np.ndarray, List[dict]]:
+        """
+        Read samples across multiple minutes (interfaces.archive.ArchiveReader).
+        
+        Missing minutes are zero-filled and listed with 'missing': True.
+        
+        Returns:
+            (samples, metadata_list) - one metadata dict per minute touched
+        """
+        start_index = int(round(start_time * self.sample_rate))
+        end_index = int(round(end_time * self.sample_rate))
+        num_samples = max(0, end_index - start_index)
+        out = np.zeros(num_samples, dtype=np.complex64)
+        metadata_list: List[dict] = []
+        
+        first_minute = (start_index // self.samples_per_minute) * 60
+        for minute in range(first_minute, -(-end_index // self.samples_per_minute) * 60, 60):
+            data = self.get_minute(channel_name, minute)
+            if data is None:
+                metadata_list.append({'minute_boundary': minute, 'missing': True})
+                continue
+            metadata_list.append(dict(data.metadata, minute_boundary=minute, source=data.source))
+            minute_start = minute * self.sample_rate
+            lo = max(start_index, minute_start)
+            hi = min(end_index, minute_start + len(data.samples))
+            if hi > lo:
+                out[lo - start_index:hi - start_index] = data.samples[lo - minute_start:hi - minute_start]
+        
+        return out, metadata_list
+    
+    def get_available_minutes(
+        self,
+        channel_name: str,
+        date_str: str
+    ) -> List[Path]:
+        """Binary minute files for a channel/date (YYYYMMDD), sorted by time."""
+        binary_dir, _ = self._dirs(channel_name)
+        if binary_dir is None or not (binary_dir / date_str).exists():
+            return []
+        
+        files = {}
+        for path in (binary_dir / date_str).glob('*.bin*'):
+            stem, _, ext = path.name.partition('.')
+            if stem.isdigit() and f'.{ext}' in _EXTENSIONS and stem not in files:
+                files[stem] = path
+        return [files[k] for k in sorted(files, key=int)]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats['pool_buffers_in_use'] = self._pool.in_use()
+        stats['pool_allocations'] = self._pool.allocations
+        with self._lock:
+            stats['prefetch_pending'] = len(self._pending)
+        return stats
+    
+    def close(self):
+        """Stop the prefetch thread."""
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+_shared_readers: Dict[Tuple[Optional[str], int, str], ArchiveReader] = {}
+_shared_lock = threading.Lock()
+
+
+def get_archive_reader(
+    data_root: Optional[Path] = None,
+    sample_rate: int = 20000,
+    source: str = 'auto'
+) -> ArchiveReader:
+    """Process-wide ArchiveReader per (data_root, sample_rate, source)."""
+    key = (str(data_root) if data_root is not None else None, sample_rate, source)
+    with _shared_lock:
+        if key not in _shared_readers:
+            _shared_readers[key] = ArchiveReader(data_root, sample_rate=sample_rate, source=source)
+        return _shared_readers[key]
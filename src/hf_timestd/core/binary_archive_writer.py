@@ -16,6 +16,9 @@ File structure:
         1765031100.bin      # Raw complex64 samples
         1765031100.json     # Metadata sidecar
         1765031040.bin.zst  # Compressed older minute (optional)
+        1765030980.bin.seek # Chunked, randomly accessible compressed minute
+                            # (compression = 'zstd-seekable' / 'lz4-seekable' /
+                            # 'iq-seekable', see seekable_archive and iq_codec)
 """
 
 import json
@@ -28,6 +31,9 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field
 
+from ..size_ledger import SizeLedger
+from .stage_timing import get_stage_timing
+
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -44,8 +50,10 @@ class BinaryArchiveConfig:
     output_dir: Path = Path('/tmp/grape-test/raw_buffer')
     station_config: Dict[str, Any] = field(default_factory=dict)
     compress_completed: bool = False  # Async compression of old minutes
-    compression: str = 'none'  # 'none', 'zstd', or 'lz4' - reduces disk I/O by ~2-3x
+    compression: str = 'none'  # 'none', 'zstd', 'lz4', 'zstd-seekable', 'lz4-seekable' or 'iq-seekable' - reduces disk I/O by ~2-3x
     compression_level: int = 3  # zstd: 1-22 (3 = good balance), lz4: 1-12
+    chunk_seconds: float = 1.0  # Chunk length of *-seekable minutes
+    size_ledger_dir: Optional[Path] = None  # SizeLedger state dir (None = not reported)
 
 
 @dataclass
@@ -86,6 +94,7 @@ class BinaryArchiveWriter:
         # Current minute buffer
         self.current_buffer: Optional[MinuteBuffer] = None
         self._lock = threading.Lock()
+        self.stage_timing = get_stage_timing()
         
         # Statistics
         self.minutes_written = 0
@@ -100,6 +109,11 @@ class BinaryArchiveWriter:
         self.last_rtp_timestamp: Optional[int] = None
         self.cumulative_samples: int = 0  # Total samples processed
         
+        # Size ledger for quota management (root = data root above raw_buffer/)
+        self.size_ledger: Optional[SizeLedger] = None
+        if config.size_ledger_dir is not None:
+            self.size_ledger = SizeLedger(config.size_ledger_dir, config.output_dir.parent)
+        
         logger.info(f"BinaryArchiveWriter initialized for {config.channel_name}")
         logger.info(f"  Output: {self.archive_dir}")
         logger.info(f"  Format: raw complex64 binary + JSON metadata")
@@ -140,13 +154,19 @@ class BinaryArchiveWriter:
         return buffer
     
     def _flush_minute(self, buffer: MinuteBuffer) -> bool:
-        """Write completed minute buffer to disk."""
+        """Write completed minute buffer to disk (timed as stage 'flush_minute')."""
+        with self.stage_timing.span('flush_minute', self.config.channel_name):
+            return self._write_minute(buffer)
+    
+    def _write_minute(self, buffer: MinuteBuffer) -> bool:
         try:
             minute_dir = self._get_minute_dir(buffer.minute_boundary)
             
             # Binary file path - extension depends on compression
             compression = self.config.compression.lower()
-            if compression == 'zstd':
+            if compression.endswith('-seekable'):
+                bin_path = minute_dir / f"{buffer.minute_boundary}.bin.seek"
+            elif compression == 'zstd':
                 bin_path = minute_dir / f"{buffer.minute_boundary}.bin.zst"
             elif compression == 'lz4':
                 bin_path = minute_dir / f"{buffer.minute_boundary}.bin.lz4"
@@ -159,7 +179,24 @@ class BinaryArchiveWriter:
             raw_data = buffer.samples[:actual_samples].tobytes()
             
             # Apply compression if configured
-            if compression == 'zstd':
+            if compression.endswith('-seekable'):
+                try:
+                    from .seekable_archive import write_seekable_minute
+                    nbytes = write_seekable_minute(
+                        bin_path,
+                        buffer.samples[:actual_samples],
+                        codec=compression[:-len('-seekable')],
+                        level=self.config.compression_level,
+                        chunk_samples=max(1, int(self.config.chunk_seconds * self.config.sample_rate)),
+                        sample_rate=self.config.sample_rate
+                    )
+                    raw_bytes = actual_samples * BYTES_PER_SAMPLE
+                    logger.debug(f"{compression}: {raw_bytes} -> {nbytes} ({raw_bytes / nbytes:.1f}x)")
+                except ImportError as e:
+                    logger.warning(f"{e}, falling back to uncompressed")
+                    bin_path = minute_dir / f"{buffer.minute_boundary}.bin"
+                    buffer.samples[:actual_samples].tofile(bin_path)
+            elif compression == 'zstd':
                 try:
                     import zstandard as zstd
                     # Use multi-threaded compression (threads=-1 = auto-detect cores)
@@ -212,6 +249,10 @@ class BinaryArchiveWriter:
             with open(json_path, 'w') as f:
                 json.dump(metadata, f, indent=2)
             
+            if self.size_ledger is not None:
+                nbytes = bin_path.stat().st_size + json_path.stat().st_size
+                self.size_ledger.record(minute_dir, 'raw', nbytes, nfiles=2)
+            
             self.minutes_written += 1
             logger.info(
                 f"📁 Wrote minute {buffer.minute_boundary}: "
@@ -350,9 +391,12 @@ class BinaryArchiveReader:
     def __init__(self, archive_dir: Path, channel_name: str):
         # Use channel_name_to_dir for consistent path format (preserves dots)
         from ..paths import channel_name_to_dir
+        from .archive_reader import ArchiveReader
         self.archive_dir = archive_dir / channel_name_to_dir(channel_name)
         self.channel_name = channel_name
         self.sample_rate = 20000
+        self._reader = ArchiveReader(sample_rate=self.sample_rate, source='raw_buffer', prefetch_minutes=0)
+        self._reader.register_channel(channel_name, binary_dir=self.archive_dir)
     
     def get_available_minutes(self, date_str: Optional[str] = None) -> List[int]:
         """Get list of available minute boundaries."""
@@ -384,43 +428,26 @@ class BinaryArchiveReader:
         Read samples for a specific minute.
         
         Handles both compressed and uncompressed files.
-        Returns numpy array (memory-mapped for uncompressed, loaded for compressed).
+        Returns a read-only numpy array (memory-mapped for uncompressed,
+        decompressed into a pooled buffer for compressed).
         """
-        dt = datetime.fromtimestamp(minute_boundary, tz=timezone.utc)
-        date_str = dt.strftime('%Y%m%d')
-        base_path = self.archive_dir / date_str / f"{minute_boundary}"
-        
-        # Try uncompressed first (fastest - memory-mappable)
-        bin_path = Path(f"{base_path}.bin")
-        if bin_path.exists():
-            return np.memmap(bin_path, dtype=np.complex64, mode='r')
-        
-        # Try zstd compressed
-        zst_path = Path(f"{base_path}.bin.zst")
-        if zst_path.exists():
-            try:
-                import zstandard as zstd
-                with open(zst_path, 'rb') as f:
-                    dctx = zstd.ZstdDecompressor()
-                    decompressed = dctx.decompress(f.read())
-                return np.frombuffer(decompressed, dtype=np.complex64)
-            except ImportError:
-                logger.warning("zstandard not installed, cannot read .bin.zst files")
-                return None
-        
-        # Try lz4 compressed
-        lz4_path = Path(f"{base_path}.bin.lz4")
-        if lz4_path.exists():
-            try:
-                import lz4.frame
-                with open(lz4_path, 'rb') as f:
-                    decompressed = lz4.frame.decompress(f.read())
-                return np.frombuffer(decompressed, dtype=np.complex64)
-            except ImportError:
-                logger.warning("lz4 not installed, cannot read .bin.lz4 files")
-                return None
+        path = self._reader.binary_minute_path(self.channel_name, minute_boundary)
+        if path is None:
+            return None
+        try:
+            samples, _ = self._reader.read_minute(path)
+        except ValueError as e:
+            logger.warning(f"{e}")
+            return None
+        return samples
+    
+    def read_range(self, minute_boundary: int, start_sample: int, num_samples: int) -> Optional[np.ndarray]:
+        """
+        Read samples [start_sample, start_sample + num_samples) of a minute.
         
-        return None
+        Only .bin.seek minutes avoid decompressing the whole minute.
+        """
+        return self._reader.read_range(self.channel_name, minute_boundary, start_sample, num_samples)
     
     def read_metadata(self, minute_boundary: int) -> Optional[Dict]:
         """Read metadata for a specific minute."""
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Bounded Cache - size-limited containers for long-running services
+
+A recorder runs for weeks; any per-minute dict or set that is never
+pruned grows its RSS for as long. These drop-in containers keep only the
+most recent entries:
+
+- LRUDict: dict evicting the least recently used key beyond maxsize
+  (caches keyed by time slot, location, ...)
+- RecentSet: membership of the last maxlen added keys (e.g. processed
+  minutes - only recent minutes can be offered again)
+
+Both expose maxsize/maxlen so the memory soak harness can check their
+length against the bound.
+"""
+
+from collections import OrderedDict
+from typing import Hashable, Iterator
+
+
+class LRUDict(OrderedDict):
+    """Dict that evicts its least recently used entry beyond maxsize."""
+    
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        self.evictions = 0
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+            self.evictions += 1
+
+
+class RecentSet:
+    """Set remembering only the last maxlen added keys."""
+    
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self._keys: OrderedDict = OrderedDict()
+    
+    def add(self, key: Hashable):
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        while len(self._keys) > self.maxlen:
+            self._keys.popitem(last=False)
+    
+    def discard(self, key: Hashable):
+        self._keys.pop(key, None)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._keys
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def __iter__(self) -> Iterator:
+        return iter(self._keys)
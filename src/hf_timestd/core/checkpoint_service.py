@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Checkpoint Service - Write-behind persistence for model state
+
+Calibration and convergence models used to encode their whole state as
+pretty-printed JSON and write it on the processing path each time they
+updated. With this service they hand over a snapshot instead:
+
+    checkpoints = get_checkpoint_service()
+    checkpoints.mark_dirty(self.state_file, self._state_dict())
+
+A background thread persists the latest snapshot per file at most once per
+`interval_sec`, so the minute loop never waits on encoding, write or fsync.
+Repeated updates between writes coalesce into one.
+
+File format: `{state_file stem}.ckpt` next to the legacy JSON path -
+a 6-byte header (b'HFCK', format version, codec) followed by msgpack
+(if installed) or zlib-compressed compact JSON. Writes go to a temp file,
+are fsync'd and renamed into place. load_checkpoint() reads the .ckpt file
+and falls back to the legacy JSON file so existing state carries over; the
+first checkpoint written removes the legacy file, so resetting a model means
+deleting its .ckpt file.
+
+Pending snapshots are flushed on close() and at interpreter exit.
+Files that several processes read back and update (TimingCalibrator's
+shared timing_calibration state) can't hand over a snapshot - the last
+writer would win. They pass a merge callable instead, which the writer
+thread runs to reload, merge and write the file under their own lock.
+
+Metric: checkpoint lag - how long the oldest unpersisted change has been
+waiting - is reported by get_stats() for the status files.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'HFCK'
+FORMAT_VERSION = 1
+CODEC_MSGPACK = b'M'
+CODEC_ZJSON = b'Z'
+CHECKPOINT_SUFFIX = '.ckpt'
+
+DEFAULT_INTERVAL_SEC = 5.0
+
+
+def checkpoint_path(state_file: Path) -> Path:
+    """Binary checkpoint location for a model's (legacy JSON) state file."""
+    return Path(state_file).with_suffix(CHECKPOINT_SUFFIX)
+
+
+def _to_plain(obj: Any) -> Any:
+    """Fallback encoder for numpy values and anything else (as str)."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return str(obj)
+
+
+def encode_checkpoint(state: Any) -> bytes:
+    """Encode a state snapshot with the compact binary format."""
+    if HAS_MSGPACK:
+        payload = msgpack.packb(state, default=_to_plain, use_bin_type=True)
+        codec = CODEC_MSGPACK
+    else:
+        text = json.dumps(state, separators=(',', ':'), default=_to_plain)
+        payload = zlib.compress(text.encode(), 1)
+        codec = CODEC_ZJSON
+    return MAGIC + bytes([FORMAT_VERSION]) + codec + payload
+
+
+def decode_checkpoint(data: bytes) -> Any:
+    """Decode bytes written by encode_checkpoint()."""
+    if data[:4] != MAGIC:
+        raise ValueError("not a checkpoint file")
+    if data[4] != FORMAT_VERSION:
+        raise ValueError(f"unsupported checkpoint format {data[4]}")
+    
+    codec = data[5:6]
+    payload = data[6:]
+    if codec == CODEC_MSGPACK:
+        if not HAS_MSGPACK:
+            raise ValueError("checkpoint was written with msgpack, which is not installed")
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    if codec == CODEC_ZJSON:
+        return json.loads(zlib.decompress(payload))
+    raise ValueError(f"unknown checkpoint codec {codec!r}")
+
+
+def load_checkpoint(state_file: Path) -> Optional[Any]:
+    """
+    Load a model's persisted state.
+    
+    Reads the binary checkpoint next to `state_file`, falling back to the
+    legacy JSON file at `state_file` itself. Returns None if neither exists.
+    Raises on corrupt files (callers already guard their loaders).
+    """
+    ckpt = checkpoint_path(state_file)
+    if ckpt.exists():
+        return decode_checkpoint(ckpt.read_bytes())
+    if Path(state_file).exists():
+        with open(state_file, 'r') as f:
+            return json.load(f)
+    return None
+
+
+def write_checkpoint(state_file: Path, state: Any) -> int:
+    """Encode and atomically write a checkpoint now; returns bytes written."""
+    path = checkpoint_path(state_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = encode_checkpoint(state)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp.replace(path)
+    
+    # The state has been migrated: a leftover legacy file would come back
+    # as soon as the checkpoint is deleted
+    legacy = Path(state_file)
+    if legacy != path:
+        legacy.unlink(missing_ok=True)
+    return len(data)
+
+
+class CheckpointService:
+    """
+    Coalescing write-behind writer for model state snapshots.
+    
+    mark_dirty() only stores the snapshot; a daemon thread writes every
+    pending snapshot once per interval. Thread-safe.
+    """
+    
+    def __init__(self, interval_sec: float = DEFAULT_INTERVAL_SEC):
+        """
+        Initialize checkpoint service.
+        
+        Args:
+            interval_sec: Longest time a snapshot waits before being written
+        """
+        self.interval_sec = interval_sec
+        
+        # path -> (snapshot, dirty_since monotonic); dirty_since is kept
+        # across coalesced updates so lag measures the oldest unsaved change
+        self._pending: Dict[Path, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        
+        # Statistics
+        self.writes = 0
+        self.bytes_written = 0
+        self.errors = 0
+        self.coalesced = 0
+        self.last_lag_sec = 0.0
+        self.max_lag_sec = 0.0
+        self.last_write_ms = 0.0
+    
+    def mark_dirty(self, state_file: Path, snapshot: Any):
+        """
+        Queue a state snapshot for `state_file` (latest wins).
+        
+        The snapshot must not be mutated afterwards - build a fresh dict.
+        It may instead be a callable that writes the file itself and
+        returns the bytes written; it runs on the writer thread.
+        """
+        state_file = Path(state_file)
+        with self._lock:
+            previous = self._pending.get(state_file)
+            if previous is not None:
+                self.coalesced += 1
+            dirty_since = previous[1] if previous else time.monotonic()
+            self._pending[state_file] = (snapshot, dirty_since)
+            
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name='checkpoint-writer', daemon=True
+                    )
+                    self._thread.start()
+        
+        if closed:
+            # Late updates after shutdown are written synchronously
+            self.flush()
+    
+    def is_pending(self, state_file: Path) -> bool:
+        """True if `state_file` has changes not yet on disk."""
+        with self._lock:
+            return Path(state_file) in self._pending
+    
+    def flush(self):
+        """Write all pending snapshots now (on the calling thread)."""
+        with self._write_lock:
+            with self._lock:
+                batch = self._pending
+                self._pending = {}
+            
+            for state_file, (snapshot, dirty_since) in batch.items():
+                started = time.monotonic()
+                try:
+                    if callable(snapshot):
+                        size = snapshot()
+                    else:
+                        size = write_checkpoint(state_file, snapshot)
+                except Exception as e:
+                    self.errors += 1
+                    logger.warning(f"Failed to write checkpoint {checkpoint_path(state_file)}: {e}")
+                    continue
+                
+                finished = time.monotonic()
+                self.writes += 1
+                self.bytes_written += size
+                self.last_write_ms = (finished - started) * 1000
+                self.last_lag_sec = finished - dirty_since
+                self.max_lag_sec = max(self.max_lag_sec, self.last_lag_sec)
+    
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.interval_sec)
+            self._wake.clear()
+            self.flush()
+    
+    def close(self):
+        """Stop the writer thread and flush everything still pending."""
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        self._wake.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=10)
+        self.flush()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Checkpoint lag and write statistics."""
+        now = time.monotonic()
+        with self._lock:
+            pending = len(self._pending)
+            oldest = min((since for _, since in self._pending.values()), default=None)
+        return {
+            'pending': pending,
+            'lag_sec': round(now - oldest, 3) if oldest is not None else 0.0,
+            'last_lag_sec': round(self.last_lag_sec, 3),
+            'max_lag_sec': round(self.max_lag_sec, 3),
+            'writes': self.writes,
+            'coalesced': self.coalesced,
+            'bytes_written': self.bytes_written,
+            'last_write_ms': round(self.last_write_ms, 2),
+            'errors': self.errors,
+            'codec': 'msgpack' if HAS_MSGPACK else 'zlib-json',
+            'interval_sec': self.interval_sec,
+        }
+
+
+_default_service: Optional[CheckpointService] = None
+_default_pid: Optional[int] = None
+_default_lock = threading.Lock()
+
+
+def get_checkpoint_service() -> CheckpointService:
+    """Process-wide checkpoint service, flushed at interpreter exit."""
+    global _default_service, _default_pid
+    with _default_lock:
+        # A forked child has no writer thread: it gets a service of its own
+        if _default_service is None or _default_pid != os.getpid():
+            _default_service = CheckpointService()
+            _default_pid = os.getpid()
+            atexit.register(_default_service.close)
+        return _default_service
@@ -34,7 +34,7 @@ import numpy as np
 import logging
 from dataclasses import dataclass, field
 from typing import Optional, Tuple, List, Dict
-from scipy.signal import butter, filtfilt, hilbert
+from scipy.signal import firwin, oaconvolve
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +54,41 @@ BITS_PER_FRAME = 110  # 10 bytes × 11 bits
 # Valid FSK seconds
 FSK_SECONDS = [31, 32, 33, 34, 35, 36, 37, 38, 39]
 
+# Baseband demodulator
+DECIMATED_SAMPLES_PER_BIT = 8  # Baseband rate after integrate-and-dump decimation
+BASEBAND_CUTOFF_HZ = 100.0  # Half the mark/space spacing (timing envelope)
+BIT_WINDOW = (0.0, 1.0)  # Part of each bit integrated for its mark/space energy
+TIMING_SEARCH_MS = 10.0  # ± window around the 500ms mark-to-silence transition
+SEGMENT_GUARD_MS = 20.0  # Filter settling margin either side of the data
+
+# BCD digit layouts after nibble swap: field -> (first digit, end digit)
+# Frame A: 6d dd hh mm ss
+FRAME_A_LAYOUT = {
+    'marker': (0, 1),
+    'day_of_year': (1, 4),
+    'hour': (4, 6),
+    'minute': (6, 8),
+    'second': (8, 10),
+}
+# Frame B: xz yy yy tt aa
+FRAME_B_LAYOUT = {
+    'dut1_sign': (0, 1),
+    'dut1_tenths': (1, 2),
+    'year': (2, 6),
+    'tai_utc': (6, 8),
+    'dst_pattern': (8, 10),
+}
+
+# Byte -> its two BCD digits after swapping nibbles (low nibble is sent first)
+_BCD_DIGITS = np.stack([np.arange(256) & 0x0F, np.arange(256) >> 4], axis=1)
+
+# Data bits of one byte are sent LSB first
+_BYTE_WEIGHTS = 1 << np.arange(8)
+
+# Expected sign of every bit's soft decision that is fixed by the framing:
+# start bit space (-1), both stop bits mark (+1), data bits 0
+_FRAMING_SIGNS = np.tile(np.array([-1] + [0] * 8 + [1, 1]), 10)
+
 
 @dataclass
 class CHUFrameA:
@@ -135,234 +170,282 @@ class CHUFSKDecoder:
         self.sample_rate = sample_rate
         self.channel_name = channel_name
         
-        # Pre-calculate filter coefficients for mark/space detection
-        # Bandpass filters centered on mark and space frequencies
-        self.mark_filter = self._design_bandpass(MARK_FREQ, bandwidth=100)
-        self.space_filter = self._design_bandpass(SPACE_FREQ, bandwidth=100)
-        
-        # Samples per bit
-        self.samples_per_bit = int(sample_rate / BAUD_RATE)
-        
-        logger.debug(f"CHU FSK Decoder initialized: {sample_rate} Hz, {self.samples_per_bit} samples/bit")
+        # Samples per bit (fractional: 66.67 at 20 kHz)
+        self.samples_per_bit = sample_rate / BAUD_RATE
+        
+        # Integrate-and-dump decimation to a few samples per bit
+        self.decimation = max(1, int(self.samples_per_bit / DECIMATED_SAMPLES_PER_BIT))
+        self.baseband_rate = sample_rate / self.decimation
+        
+        # Per-second analysis segment: data plus timing window plus guard,
+        # trimmed to a whole number of decimation blocks
+        self.segment_offset = int((DATA_START_MS - SEGMENT_GUARD_MS) * sample_rate / 1000)
+        segment_end = int((DATA_END_MS + TIMING_SEARCH_MS + SEGMENT_GUARD_MS) * sample_rate / 1000)
+        self.segment_length = (segment_end - self.segment_offset) // self.decimation * self.decimation
+        
+        # Mark/space local oscillators over one segment
+        t = np.arange(self.segment_length) / sample_rate
+        self.mark_lo = np.exp(-2j * np.pi * MARK_FREQ * t).astype(np.complex64)
+        self.space_lo = np.exp(-2j * np.pi * SPACE_FREQ * t).astype(np.complex64)
+        
+        # Zero-phase baseband lowpass at the decimated rate
+        numtaps = int(3.3 * self.baseband_rate / BASEBAND_CUTOFF_HZ) | 1
+        self.baseband_filter = firwin(
+            numtaps, BASEBAND_CUTOFF_HZ, fs=self.baseband_rate
+        ).astype(np.float32)
+        
+        # Baseband sample range integrated for every bit: [bit_first, bit_end)
+        bit_starts = (DATA_START_MS * sample_rate / 1000 - self.segment_offset
+                      + np.arange(BITS_PER_FRAME) * self.samples_per_bit)
+        self.bit_first, self.bit_end = (
+            np.round(self._to_baseband_index(bit_starts + f * self.samples_per_bit)).astype(int)
+            for f in BIT_WINDOW
+        )
+        # Bit sync search range: half a bit either way
+        self.bit_search = int(np.ceil(self.samples_per_bit / self.decimation / 2))
+        
+        # Baseband windows for the 500ms transition search: the search
+        # window itself, FSK-on level before it and silence level after it
+        expected_end = DATA_END_MS * sample_rate / 1000 - self.segment_offset
+        search = TIMING_SEARCH_MS * sample_rate / 1000
+        self.expected_end = expected_end
+        self.timing_window = self._baseband_slice(expected_end - search, expected_end + search)
+        self.on_window = self._baseband_slice(expected_end - 3 * search, expected_end - search)
+        self.off_window = self._baseband_slice(expected_end + search, expected_end + 1.5 * search)
+        
+        logger.debug(f"CHU FSK Decoder initialized: {sample_rate} Hz, {self.samples_per_bit:.2f} samples/bit, "
+                     f"baseband {self.baseband_rate:.0f} Hz")
     
-    def _design_bandpass(self, center_freq: float, bandwidth: float) -> Tuple[np.ndarray, np.ndarray]:
-        """Design a bandpass filter for mark or space frequency"""
-        nyq = self.sample_rate / 2
-        low = (center_freq - bandwidth/2) / nyq
-        high = (center_freq + bandwidth/2) / nyq
-        
-        # Ensure valid range
-        low = max(0.01, min(low, 0.99))
-        high = max(low + 0.01, min(high, 0.99))
-        
-        b, a = butter(4, [low, high], btype='band')
-        return b, a
+    def _to_baseband_index(self, segment_sample):
+        """Segment sample position -> fractional baseband index (block centers)"""
+        return (segment_sample - (self.decimation - 1) / 2) / self.decimation
     
-    def _am_demodulate(self, iq_samples: np.ndarray) -> np.ndarray:
-        """AM demodulate IQ samples to audio"""
-        magnitude = np.abs(iq_samples)
-        audio = magnitude - np.mean(magnitude)
-        return audio.astype(np.float64)
+    def _baseband_slice(self, start_sample: float, end_sample: float) -> slice:
+        """Baseband slice covering segment samples start_sample..end_sample"""
+        return slice(int(np.floor(self._to_baseband_index(start_sample))),
+                     int(np.ceil(self._to_baseband_index(end_sample))) + 1)
     
-    def _fsk_demodulate(self, audio: np.ndarray) -> np.ndarray:
-        """
-        FSK demodulation using mark/space power comparison.
-        Returns array of soft decisions (-1 to +1, positive = mark)
+    def _segments(self, samples: np.ndarray, seconds: List[int]) -> np.ndarray:
+        """Gather the analysis segment of each FSK second: (seconds, segment_length)"""
+        starts = np.array(seconds) * self.sample_rate + self.segment_offset
+        return samples[starts[:, np.newaxis] + np.arange(self.segment_length)]
+    
+    def _fsk_demodulate(self, audio: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        # Apply bandpass filters
-        mark_signal = filtfilt(self.mark_filter[0], self.mark_filter[1], audio)
-        space_signal = filtfilt(self.space_filter[0], self.space_filter[1], audio)
-        
-        # Envelope detection
-        mark_power = np.abs(hilbert(mark_signal)) ** 2
-        space_power = np.abs(hilbert(space_signal)) ** 2
+        Mix each row to baseband against the mark and space tones.
         
-        # Soft decision: positive = mark, negative = space
-        # Normalize to prevent division issues
-        total_power = mark_power + space_power + 1e-10
-        soft_decision = (mark_power - space_power) / total_power
+        All seconds at once: mixed, then decimated by block mean. The
+        lowpass filtered power of both is the FSK envelope used for timing;
+        bit decisions integrate the unfiltered baseband one bit at a time
+        (see _slice_bytes).
         
-        return soft_decision
-    
-    def _extract_bits(self, soft_decision: np.ndarray, start_sample: int, num_bits: int) -> Tuple[List[int], float]:
-        """
-        Extract bits from soft decision signal.
+        Args:
+            audio: AM demodulated segments (seconds, segment_length)
         
         Returns:
-            bits: List of decoded bits (0 or 1)
-            confidence: Average absolute soft decision value
+            mark, space: complex baseband at the baseband rate,
+                shape (seconds, segment_length / decimation)
+            envelope: FSK amplitude (mark + space), same shape
         """
-        bits = []
-        confidences = []
+        blocks = (audio.shape[0], -1, self.decimation)
+        taps = self.baseband_filter[np.newaxis, :]
         
-        for i in range(num_bits):
-            bit_start = start_sample + int(i * self.samples_per_bit)
-            bit_end = bit_start + self.samples_per_bit
-            
-            if bit_end > len(soft_decision):
-                break
-            
-            # Sample in middle of bit for best decision
-            mid_start = bit_start + self.samples_per_bit // 4
-            mid_end = bit_start + 3 * self.samples_per_bit // 4
-            bit_value = np.mean(soft_decision[mid_start:mid_end])
-            
-            bits.append(1 if bit_value > 0 else 0)
-            confidences.append(abs(bit_value))
+        mark = (audio * self.mark_lo).reshape(blocks).mean(axis=2)
+        space = (audio * self.space_lo).reshape(blocks).mean(axis=2)
+        mark_power = np.abs(oaconvolve(mark, taps, mode='same', axes=1)) ** 2
+        space_power = np.abs(oaconvolve(space, taps, mode='same', axes=1)) ** 2
         
-        avg_confidence = np.mean(confidences) if confidences else 0.0
-        return bits, avg_confidence
+        return mark, space, np.sqrt(mark_power + space_power + 1e-10)
     
-    def _bits_to_bytes(self, bits: List[int]) -> List[int]:
+    def _measure_timing(self, envelope: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Convert bit stream to bytes (1 start + 8 data + 2 stop = 11 bits per byte)
+        Timing offset (ms) of the FSK end from the 500ms boundary, per row.
+        
+        The last stop bit should end at exactly 500ms. The zero-phase lowpass
+        puts the edge where the FSK amplitude crosses halfway between its
+        level before the search window and the silence after it.
         
-        Returns list of decoded bytes, or empty list if framing error
+        Returns:
+            offsets_ms: (seconds,) timing offsets, 0.0 where no edge was found
+            found: (seconds,) True where the edge was found
         """
-        bytes_out = []
+        window = envelope[:, self.timing_window]
+        on_level = np.median(envelope[:, self.on_window], axis=1)
+        off_level = np.median(envelope[:, self.off_window], axis=1)
+        threshold = ((on_level + off_level) / 2)[:, np.newaxis]
+        
+        # First fall through the threshold
+        falls = (window[:, :-1] >= threshold) & (window[:, 1:] < threshold)
+        found = falls.any(axis=1) & (on_level > 2 * off_level)
+        first = np.argmax(falls, axis=1)
+        
+        # Interpolated between baseband samples
+        rows = np.arange(len(window))
+        before = window[rows, first]
+        after = window[rows, first + 1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraction = np.clip((before - threshold[:, 0]) / (before - after), 0.0, 1.0)
+        fraction = np.nan_to_num(fraction)
+        
+        baseband_index = self.timing_window.start + first + fraction
+        actual_end = baseband_index * self.decimation + (self.decimation - 1) / 2
+        offsets = (actual_end - self.expected_end) / self.sample_rate * 1000
+        return np.where(found, offsets, 0.0), found
+    
+    def _slice_bytes(
+        self,
+        mark: np.ndarray,
+        space: np.ndarray,
+        shift_ms: float = 0.0
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Slice bits and frame bytes (1 start + 8 data + 2 stop = 11 bits per byte)
+        for every row at once.
+        
+        Each bit is decided by its own mark and space energy: the baseband
+        is summed over the bit and then squared, so the decision does not
+        depend on the tone phase carrying over from the previous bit
+        (transmitters whose phase jumps at bit boundaries decode like
+        continuous-phase ones). The measured arrival only seeds the bit
+        sync, which picks the alignment within half a bit that best fits
+        the start and stop bits: phase jumps dip the envelope and bias the
+        500ms edge by a fraction of a bit.
         
-        for byte_num in range(10):  # 10 bytes per frame
-            bit_offset = byte_num * 11
-            
-            if bit_offset + 11 > len(bits):
-                break
-            
-            # Check start bit (should be 0/space)
-            start_bit = bits[bit_offset]
-            if start_bit != 0:
-                logger.debug(f"Framing error: start bit is 1 at byte {byte_num}")
-                continue
-            
-            # Extract 8 data bits (LSB first)
-            data_byte = 0
-            for i in range(8):
-                if bits[bit_offset + 1 + i]:
-                    data_byte |= (1 << i)
-            
-            # Check stop bits (should be 1/mark)
-            stop1 = bits[bit_offset + 9]
-            stop2 = bits[bit_offset + 10]
-            if stop1 != 1 or stop2 != 1:
-                logger.debug(f"Framing error: stop bits wrong at byte {byte_num}")
-            
-            bytes_out.append(data_byte)
+        Args:
+            mark, space: (seconds, baseband samples) from _fsk_demodulate
+            shift_ms: Arrival offset of the data stream, from _measure_timing
         
-        return bytes_out
+        Returns:
+            raw_bytes: (seconds, 10) decoded data bytes
+            framed: (seconds,) True where every start bit is a space
+            confidence: (seconds,) average absolute soft decision per bit
+        """
+        # Candidate bit alignments (baseband samples) around the measured
+        # arrival: (shifts, 1) against (bits,) window edges
+        shift = int(round(shift_ms * self.baseband_rate / 1000))
+        shifts = shift + np.arange(-self.bit_search, self.bit_search + 1)[:, np.newaxis]
+        first, end = self.bit_first + shifts, self.bit_end + shifts
+        
+        energies = []
+        for baseband in (mark, space):
+            cumulative = np.zeros((len(baseband), baseband.shape[1] + 1), dtype=baseband.dtype)
+            np.cumsum(baseband, axis=1, out=cumulative[:, 1:])
+            energies.append(np.abs(cumulative[:, end] - cumulative[:, first]) ** 2)
+        mark_energy, space_energy = energies
+        
+        # Soft decision per bit: -1 to +1, positive = mark; (seconds, shifts, bits)
+        soft = (mark_energy - space_energy) / (mark_energy + space_energy + 1e-20)
+        
+        # Bit sync: the alignment whose start bits read most like space and
+        # stop bits most like mark over all seconds
+        best = int(np.argmax((soft * _FRAMING_SIGNS).sum(axis=(0, 2))))
+        bit_values = soft[:, best]
+        bits = (bit_values > 0).reshape(len(mark), 10, 11)
+        
+        raw_bytes = bits[:, :, 1:9].astype(int) @ _BYTE_WEIGHTS
+        framed = ~bits[:, :, 0].any(axis=1)
+        
+        stop_errors = ~bits[:, :, 9:11].all(axis=2)
+        if stop_errors.any():
+            logger.debug(f"Framing error: {int(stop_errors.sum())} bytes with wrong stop bits")
+        
+        return raw_bytes, framed, np.abs(bit_values).mean(axis=1)
     
-    def _swap_nibbles(self, byte_val: int) -> int:
-        """Swap least and most significant nibbles in a byte"""
-        return ((byte_val & 0x0F) << 4) | ((byte_val & 0xF0) >> 4)
+    @staticmethod
+    def _bcd_fields(raw_bytes: np.ndarray, layout: Dict[str, Tuple[int, int]]) -> Dict[str, np.ndarray]:
+        """Decode BCD fields of the first 5 bytes of each row per a frame layout"""
+        digits = _BCD_DIGITS[raw_bytes[:, :5]].reshape(len(raw_bytes), 10)
+        fields = {}
+        for name, (first, end) in layout.items():
+            weights = 10 ** np.arange(end - first - 1, -1, -1)
+            fields[name] = digits[:, first:end] @ weights
+        return fields
     
-    def _decode_frame_a(self, raw_bytes: List[int]) -> Optional[CHUFrameA]:
-        """Decode Frame A (time of day) from raw bytes"""
-        if len(raw_bytes) < 10:
-            return None
-        
-        # Check redundancy (bytes 5-9 should equal bytes 0-4)
-        data_bytes = raw_bytes[:5]
-        redundancy = raw_bytes[5:10]
-        
-        if data_bytes != redundancy:
-            logger.debug("Frame A redundancy check failed")
-            return None
-        
-        # Swap nibbles in each byte
-        swapped = [self._swap_nibbles(b) for b in data_bytes]
+    def _decode_frames(self, raw_bytes: np.ndarray, seconds: List[int]) -> List[Optional[object]]:
+        """
+        Decode Frame A (time of day) or Frame B (second 31) for each row.
         
-        # Parse BCD: 6d dd hh mm ss
-        # Byte 0: 0x6d where d is high digit of day
-        marker = (swapped[0] >> 4) & 0x0F
-        if marker != 6:
-            logger.debug(f"Frame A marker invalid: {marker}")
+        Frame A repeats bytes 0-4 as bytes 5-9; Frame B repeats them inverted.
+        """
+        frame_b_rows = np.array(seconds) == 31
+        expected = np.where(frame_b_rows[:, np.newaxis], (~raw_bytes[:, :5]) & 0xFF, raw_bytes[:, :5])
+        redundant = (expected == raw_bytes[:, 5:10]).all(axis=1)
+        
+        frame_a = self._bcd_fields(raw_bytes, FRAME_A_LAYOUT)
+        frame_b = self._bcd_fields(raw_bytes, FRAME_B_LAYOUT)
+        
+        frames: List[Optional[object]] = []
+        for row in range(len(raw_bytes)):
+            if not redundant[row]:
+                logger.debug(f"Frame {'B' if frame_b_rows[row] else 'A'} redundancy check failed")
+                frames.append(None)
+            elif frame_b_rows[row]:
+                frames.append(self._frame_b({k: int(v[row]) for k, v in frame_b.items()}))
+            else:
+                frames.append(self._frame_a({k: int(v[row]) for k, v in frame_a.items()}))
+        return frames
+    
+    @staticmethod
+    def _frame_a(fields: Dict[str, int]) -> Optional[CHUFrameA]:
+        """Validate decoded Frame A fields"""
+        if fields['marker'] != 6:
+            logger.debug(f"Frame A marker invalid: {fields['marker']}")
             return None
         
-        day_high = swapped[0] & 0x0F
-        day_mid = (swapped[1] >> 4) & 0x0F
-        day_low = swapped[1] & 0x0F
-        day = day_high * 100 + day_mid * 10 + day_low
-        
-        hour_high = (swapped[2] >> 4) & 0x0F
-        hour_low = swapped[2] & 0x0F
-        hour = hour_high * 10 + hour_low
-        
-        min_high = (swapped[3] >> 4) & 0x0F
-        min_low = swapped[3] & 0x0F
-        minute = min_high * 10 + min_low
-        
-        sec_high = (swapped[4] >> 4) & 0x0F
-        sec_low = swapped[4] & 0x0F
-        second = sec_high * 10 + sec_low
-        
-        # Validate ranges
+        day, hour, minute, second = (fields['day_of_year'], fields['hour'],
+                                     fields['minute'], fields['second'])
         if not (1 <= day <= 366 and 0 <= hour <= 23 and 0 <= minute <= 59 and 32 <= second <= 39):
             logger.debug(f"Frame A values out of range: day={day}, hour={hour}, min={minute}, sec={second}")
             return None
         
-        return CHUFrameA(
-            day_of_year=day,
-            hour=hour,
-            minute=minute,
-            second=second,
-            valid=True
-        )
+        return CHUFrameA(day_of_year=day, hour=hour, minute=minute, second=second, valid=True)
     
-    def _decode_frame_b(self, raw_bytes: List[int]) -> Optional[CHUFrameB]:
-        """Decode Frame B (auxiliary data) from raw bytes"""
-        if len(raw_bytes) < 10:
-            return None
-        
-        # Check redundancy (bytes 5-9 should be inverted bytes 0-4)
-        data_bytes = raw_bytes[:5]
-        redundancy = raw_bytes[5:10]
-        
-        inverted = [(~b) & 0xFF for b in data_bytes]
-        if inverted != redundancy:
-            logger.debug("Frame B redundancy check failed")
-            return None
-        
-        # Swap nibbles in each byte
-        swapped = [self._swap_nibbles(b) for b in data_bytes]
-        
-        # Parse: xz yy yy tt aa
-        # x: DUT1 sign (even = positive, odd = negative)
-        # z: |DUT1| in tenths of seconds
-        x_nibble = (swapped[0] >> 4) & 0x0F
-        z_nibble = swapped[0] & 0x0F
-        
-        dut1_negative = (x_nibble % 2) == 1
-        dut1_tenths = z_nibble
-        
-        # Year (4 BCD digits in bytes 1-2)
-        year_1000 = (swapped[1] >> 4) & 0x0F
-        year_100 = swapped[1] & 0x0F
-        year_10 = (swapped[2] >> 4) & 0x0F
-        year_1 = swapped[2] & 0x0F
-        year = year_1000 * 1000 + year_100 * 100 + year_10 * 10 + year_1
-        
-        # TAI-UTC (2 BCD digits)
-        tai_high = (swapped[3] >> 4) & 0x0F
-        tai_low = swapped[3] & 0x0F
-        tai_utc = tai_high * 10 + tai_low
-        
-        # DST pattern (2 BCD digits)
-        dst_high = (swapped[4] >> 4) & 0x0F
-        dst_low = swapped[4] & 0x0F
-        dst_pattern = dst_high * 10 + dst_low
-        
-        # Validate
+    @staticmethod
+    def _frame_b(fields: Dict[str, int]) -> Optional[CHUFrameB]:
+        """Validate decoded Frame B fields"""
+        # x: DUT1 sign (even = positive, odd = negative), z: |DUT1| in tenths
+        year, tai_utc = fields['year'], fields['tai_utc']
         if not (1990 <= year <= 2100 and 0 <= tai_utc <= 99):
             logger.debug(f"Frame B values out of range: year={year}, tai_utc={tai_utc}")
             return None
         
         return CHUFrameB(
-            dut1_tenths=dut1_tenths,
-            dut1_negative=dut1_negative,
+            dut1_tenths=fields['dut1_tenths'],
+            dut1_negative=(fields['dut1_sign'] % 2) == 1,
             year=year,
             tai_utc=tai_utc,
-            dst_pattern=dst_pattern,
+            dst_pattern=fields['dst_pattern'],
             valid=True
         )
     
+    def _decode_segments(
+        self,
+        audio: np.ndarray,
+        seconds: List[int]
+    ) -> List[Tuple[Optional[object], float, float]]:
+        """
+        Demodulate, slice and decode the audio segments of several seconds at once.
+        
+        The bits are sliced at the data arrival measured from the 500ms edges
+        (median over the seconds), so path delay and clock offset within the
+        ±10ms search window do not push the slicer into neighbouring bits.
+        """
+        mark, space, envelope = self._fsk_demodulate(audio)
+        timing_offsets, found = self._measure_timing(envelope)
+        shift_ms = float(np.median(timing_offsets[found])) if found.any() else 0.0
+        
+        raw_bytes, framed, confidences = self._slice_bytes(mark, space, shift_ms)
+        frames = self._decode_frames(raw_bytes, seconds)
+        
+        results = []
+        for row in range(len(seconds)):
+            if not framed[row]:
+                logger.debug(f"Framing error: start bit is 1 in second {seconds[row]}")
+                results.append((None, 0.0, float(confidences[row])))
+            else:
+                results.append((frames[row], float(timing_offsets[row]), float(confidences[row])))
+        return results
+    
     def decode_second(
         self,
         audio: np.ndarray,
@@ -382,55 +465,12 @@ class CHUFSKDecoder:
             timing_offset_ms: Measured timing offset from expected 500ms boundary
             confidence: Decode confidence (0-1)
         """
-        # FSK demodulate
-        soft_decision = self._fsk_demodulate(audio)
-        
-        # Calculate expected data start (133.33ms into second)
-        data_start_sample = second_start_sample + int(DATA_START_MS * self.sample_rate / 1000)
-        
-        # Extract bits
-        bits, bit_confidence = self._extract_bits(soft_decision, data_start_sample, BITS_PER_FRAME)
-        
-        if len(bits) < BITS_PER_FRAME:
+        start = second_start_sample + self.segment_offset
+        segment = np.asarray(audio[start:start + self.segment_length], dtype=np.float32)
+        if len(segment) < self.segment_length:
             return None, 0.0, 0.0
         
-        # Convert to bytes
-        raw_bytes = self._bits_to_bytes(bits)
-        
-        if len(raw_bytes) < 10:
-            return None, 0.0, bit_confidence
-        
-        # Decode based on second number
-        if second_number == 31:
-            frame = self._decode_frame_b(raw_bytes)
-        else:
-            frame = self._decode_frame_a(raw_bytes)
-        
-        # Measure timing offset from 500ms boundary
-        # The last stop bit should end at exactly 500ms
-        # Find where the mark tone ends (transition to silence)
-        expected_end_sample = second_start_sample + int(DATA_END_MS * self.sample_rate / 1000)
-        
-        # Look for mark-to-silence transition near expected end
-        search_window = int(10 * self.sample_rate / 1000)  # ±10ms
-        window_start = max(0, expected_end_sample - search_window)
-        window_end = min(len(soft_decision), expected_end_sample + search_window)
-        
-        if window_end > window_start:
-            window = soft_decision[window_start:window_end]
-            # Find where soft decision drops (mark ends)
-            threshold = np.mean(window) * 0.5
-            transitions = np.where(np.diff(window > threshold))[0]
-            
-            if len(transitions) > 0:
-                actual_end = window_start + transitions[-1]
-                timing_offset_ms = (actual_end - expected_end_sample) / self.sample_rate * 1000
-            else:
-                timing_offset_ms = 0.0
-        else:
-            timing_offset_ms = 0.0
-        
-        return frame, timing_offset_ms, bit_confidence
+        return self._decode_segments(segment[np.newaxis, :], [second_number])[0]
     
     def decode_minute(
         self,
@@ -454,47 +494,44 @@ class CHUFSKDecoder:
         """
         result = CHUFSKResult()
         
-        # AM demodulate entire buffer
-        audio = self._am_demodulate(iq_samples)
+        # Only the FSK seconds present in the buffer
+        seconds = [
+            second for second in FSK_SECONDS
+            if (second + 1) * self.sample_rate <= len(iq_samples)
+        ]
+        if len(seconds) < len(FSK_SECONDS):
+            logger.debug(f"Insufficient data for seconds {sorted(set(FSK_SECONDS) - set(seconds))}")
         
         frame_a_results: List[CHUFrameA] = []
         frame_b_result: Optional[CHUFrameB] = None
         timing_offsets: List[float] = []
         confidences: List[float] = []
         
-        for second in FSK_SECONDS:
-            # Calculate second start sample
-            second_start_sample = int(second * self.sample_rate)
+        decoded = []
+        if seconds:
+            # AM demodulate only the data segments of each FSK second
+            magnitude = np.abs(self._segments(iq_samples, seconds)).astype(np.float32)
+            audio = magnitude - magnitude.mean(axis=1, keepdims=True)
+            decoded = self._decode_segments(audio, seconds)
+        
+        for second, (frame, timing_offset, confidence) in zip(seconds, decoded):
+            result.frame_results.append({
+                'second': second,
+                'decoded': frame is not None,
+                'timing_offset_ms': timing_offset,
+                'confidence': confidence
+            })
             
-            if second_start_sample + int(1.0 * self.sample_rate) > len(audio):
-                logger.debug(f"Insufficient data for second {second}")
-                continue
-            
-            try:
-                frame, timing_offset, confidence = self.decode_second(
-                    audio, second_start_sample, second
-                )
+            if frame is not None:
+                result.frames_decoded += 1
                 
-                result.frame_results.append({
-                    'second': second,
-                    'decoded': frame is not None,
-                    'timing_offset_ms': timing_offset,
-                    'confidence': confidence
-                })
+                if isinstance(frame, CHUFrameA):
+                    frame_a_results.append(frame)
+                elif isinstance(frame, CHUFrameB):
+                    frame_b_result = frame
                 
-                if frame is not None:
-                    result.frames_decoded += 1
-                    
-                    if isinstance(frame, CHUFrameA):
-                        frame_a_results.append(frame)
-                    elif isinstance(frame, CHUFrameB):
-                        frame_b_result = frame
-                    
-                    timing_offsets.append(timing_offset)
-                    confidences.append(confidence)
-                    
-            except Exception as e:
-                logger.debug(f"Error decoding second {second}: {e}")
+                timing_offsets.append(timing_offset)
+                confidences.append(confidence)
         
         # Aggregate results
         if result.frames_decoded > 0:
@@ -181,6 +181,8 @@ from pathlib import Path
 
 import numpy as np
 
+from .checkpoint_service import get_checkpoint_service, load_checkpoint
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -691,6 +693,7 @@ class ClockConvergenceModel:
         self.anomaly_sigma = anomaly_sigma
         self.max_consecutive_anomalies = max_consecutive_anomalies
         self.state_file = state_file
+        self._checkpoints = get_checkpoint_service()
         
         # Per-station accumulators: key = "STATION_FREQ" e.g., "WWV_10.0"
         self.accumulators: Dict[str, StationAccumulator] = {}
@@ -701,7 +704,7 @@ class ClockConvergenceModel:
         self.best_source: Optional[str] = None
         
         # Load persisted state if available
-        if state_file and state_file.exists():
+        if state_file:
             self._load_state()
     
     def _get_key(self, station: str, frequency_mhz: float) -> str:
@@ -849,8 +852,8 @@ class ClockConvergenceModel:
         else:
             progress = 0.5
         
-        # Persist state periodically
-        if self.state_file and acc.count % 10 == 0:
+        # Persist state (write-behind: snapshot only, written asynchronously)
+        if self.state_file:
             self._save_state()
         
         return ConvergenceResult(
@@ -927,7 +930,7 @@ class ClockConvergenceModel:
     
     def _save_state(self) -> None:
         """
-        Persist state to file.
+        Queue a state snapshot with the checkpoint service.
         
         Issue 1.2 Fix (2025-12-08): Now uses STATE_FILE_VERSION constant
         and UTC timestamp for proper version tracking and age validation.
@@ -944,12 +947,7 @@ class ClockConvergenceModel:
             }
         }
         
-        try:
-            self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
-        except Exception as e:
-            logger.warning(f"Failed to save convergence state: {e}")
+        self._checkpoints.mark_dirty(self.state_file, state)
     
     def _load_state(self) -> None:
         """
@@ -959,12 +957,13 @@ class ClockConvergenceModel:
         Issue 1.3 Fix (2025-12-08): Validates Kalman filter state is physically
         reasonable before using it. Corrupted state is discarded.
         """
-        if not self.state_file or not self.state_file.exists():
+        if not self.state_file:
             return
         
         try:
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
+            state = load_checkpoint(self.state_file)
+            if state is None:
+                return
             
             # Issue 1.2: Version validation
             file_version = state.get('version', 0)
@@ -266,6 +266,14 @@ class ClockOffsetSeries:
         if self.end_time is None or measurement.system_time > self.end_time:
             self.end_time = measurement.system_time
     
+    def trim(self, max_measurements: int):
+        """Keep only the most recent max_measurements measurements."""
+        excess = len(self.measurements) - max_measurements
+        if excess <= 0:
+            return
+        del self.measurements[:excess]
+        self.start_time = min(m.system_time for m in self.measurements) if self.measurements else None
+    
     def get_offset_at_time(
         self,
         target_time: float,
@@ -504,7 +512,8 @@ class ClockOffsetEngine:
         frequency_hz: float,
         receiver_grid: str,
         sample_rate: int = 20000,
-        timing_calibrator: Optional['TimingCalibrator'] = None
+        timing_calibrator: Optional['TimingCalibrator'] = None,
+        max_series_measurements: Optional[int] = 1440
     ):
         """
         Initialize the clock offset engine.
@@ -517,6 +526,10 @@ class ClockOffsetEngine:
             receiver_grid: Receiver grid square (for propagation calculation)
             sample_rate: Sample rate (default 20000)
             timing_calibrator: Optional TimingCalibrator for RTP-first timing
+            max_series_measurements: Measurements kept in memory in live
+                operation (default one day of minutes; the CSV keeps the full
+                series). None keeps all, for reprocessing that ends in
+                save_series()
         """
         self.raw_archive_dir = Path(raw_archive_dir)
         self.output_dir = Path(output_dir)
@@ -525,6 +538,7 @@ class ClockOffsetEngine:
         self.receiver_grid = receiver_grid
         self.sample_rate = sample_rate
         self.timing_calibrator = timing_calibrator
+        self.max_series_measurements = max_series_measurements
         
         # Initialize output writer
         self.writer = ClockOffsetSeriesWriter(output_dir, channel_name)
@@ -698,6 +712,8 @@ class ClockOffsetEngine:
         # Add to series and write to CSV
         with self._lock:
             self.current_series.add_measurement(measurement)
+            if self.max_series_measurements is not None:
+                self.current_series.trim(self.max_series_measurements)
             self.writer.write_measurement(measurement)
             self.measurements_processed += 1
         
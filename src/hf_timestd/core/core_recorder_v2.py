@@ -33,10 +33,13 @@ from typing import Dict, Optional, List
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
-from ka9q import discover_channels, RadiodControl, ChannelInfo, StreamQuality
+from ka9q import RadiodControl, ChannelInfo, StreamQuality
 
 from ..quota_manager import QuotaManager
+from ..radiod_directory import get_channel_directory
+from .stage_timing import get_stage_timing
 from .stream_recorder_v2 import StreamRecorderV2, StreamRecorderConfig
+from .supervisor import Supervisor
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +89,7 @@ class CoreRecorderV2:
         # Channel management via ka9q-python RadiodControl
         self.status_address = config.get('status_address', '239.192.152.141')
         self.control = RadiodControl(self.status_address)
+        self.channel_directory = get_channel_directory(self.status_address)
         
         # Station config
         self.station_config = config.get('station', {})
@@ -126,6 +130,11 @@ class CoreRecorderV2:
         self.status_file = self.output_dir / 'status' / 'core-recorder-status.json'
         self.status_file.parent.mkdir(parents=True, exist_ok=True)
         
+        # Event-driven supervisor: stalls, writer errors and shutdown are
+        # posted to it; housekeeping runs on its deadline schedule
+        self.supervisor = Supervisor()
+        self.stall_timeout_sec = float(self.recorder_config.get('stall_timeout_sec', 5.0))
+        
         # Graceful shutdown
         self.running = False
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -142,12 +151,20 @@ class CoreRecorderV2:
         
         self.running = True
         
-        # Start all recorders
+        # Events pushed by recorders and the signal handler
+        self.supervisor.on('stall', self._on_channel_stall)
+        self.supervisor.on('recovered', self._on_channel_recovered)
+        self.supervisor.on('writer_error', self._on_writer_error)
+        self.supervisor.on('shutdown', self._on_shutdown)
+        
+        # Start all recorders; each one's watchdog is fed per delivered batch
         for ssrc, recorder in self.recorders.items():
             recorder.start()
+            self.supervisor.watch(ssrc, self.stall_timeout_sec)
             logger.info(f"Started recorder for SSRC {ssrc:x} ({recorder.config.description})")
         
-        logger.info("Core recorder running. Press Ctrl+C to stop.")
+        logger.info(f"Core recorder running (stall timeout {self.stall_timeout_sec:.0f}s). "
+                    f"Press Ctrl+C to stop.")
         
         # Write initial status
         self._write_status()
@@ -160,46 +177,30 @@ class CoreRecorderV2:
             dry_run=False
         )
         
-        # Main loop
-        last_status_time = 0
-        last_health_check = 0
-        last_quota_check = 0
+        # Housekeeping deadlines
+        self.supervisor.every('status', 10.0, self._update_status, first_delay=0.0)
+        self.supervisor.every('log', 60.0, self._log_status)
+        self.supervisor.every('quota', 300.0, self._enforce_quota, first_delay=0.0)
         
         try:
-            while self.running:
-                time.sleep(1)
-                now = time.time()
-                
-                # Update NTP status (every 10 seconds)
-                if now - last_status_time >= 10:
-                    self._update_ntp_status()
-                    self._write_status()
-                    last_status_time = now
-                
-                # Periodic status logging (every 60 seconds)
-                if int(now) % 60 == 0:
-                    self._log_status()
-                
-                # Health monitoring (every 30 seconds)
-                if now - last_health_check >= 30:
-                    self._monitor_health()
-                    last_health_check = now
-                
-                # Quota enforcement (every 5 minutes)
-                if now - last_quota_check >= 300:
-                    self._enforce_quota()
-                    last_quota_check = now
+            self.supervisor.run()
         
         except KeyboardInterrupt:
             logger.info("Received interrupt signal")
         
         finally:
+            self.running = False
             self._shutdown()
+            self.supervisor.close()
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
         logger.info(f"Received signal {signum}, shutting down...")
         self.running = False
+        self.supervisor.stop()
+    
+    def _on_shutdown(self, key, data):
+        self.running = False
     
     def _initialize_channels(self) -> bool:
         """
@@ -217,8 +218,8 @@ class CoreRecorderV2:
             logger.info(f"Ensuring {len(self.channel_specs)} channels exist in radiod...")
             logger.info(f"  Our multicast destination: {self.data_destination}")
             
-            # Discover existing channels
-            all_channels = discover_channels(self.status_address)
+            # Existing channels (shared directory, no per-call listen period)
+            all_channels = self.channel_directory.channels()
             
             # Build lookup: channels by frequency, separated by ownership
             our_channels: Dict[int, tuple] = {}  # freq_hz -> (ssrc, ChannelInfo)
@@ -295,9 +296,8 @@ class CoreRecorderV2:
                 logger.error("No channels could be created/found")
                 return False
             
-            # Re-discover to get fresh ChannelInfo with timing data
-            time.sleep(0.5)
-            all_channels = discover_channels(self.status_address)
+            # Fresh ChannelInfo with timing data, including just-created channels
+            all_channels = self.channel_directory.wait_for(freq_to_ssrc.values(), timeout=5.0)
             
             # Create StreamRecorderV2 for each channel
             for ch_spec in self.channel_specs:
@@ -330,7 +330,8 @@ class CoreRecorderV2:
                 recorder = StreamRecorderV2(
                     config=recorder_config,
                     channel_info=channel_info,
-                    get_ntp_status=self.get_ntp_status
+                    get_ntp_status=self.get_ntp_status,
+                    supervisor=self.supervisor
                 )
                 self.recorders[ssrc] = recorder
             
@@ -368,6 +369,12 @@ class CoreRecorderV2:
                 status['overall']['total_samples_received'] += ch_stats.get('samples_received', 0)
                 status['overall']['total_samples_written'] += ch_stats.get('samples_written', 0)
             
+            # Per-stage latency histograms (minute flushes of all channels)
+            timing = get_stage_timing()
+            timing.service = 'core_recorder'
+            status['stage_timing'] = timing.snapshot()
+            status['supervisor'] = self.supervisor.get_stats()
+            
             # Write atomically
             temp_file = self.status_file.with_suffix('.tmp')
             with open(temp_file, 'w') as f:
@@ -377,6 +384,11 @@ class CoreRecorderV2:
         except Exception as e:
             logger.error(f"Failed to write status file: {e}")
     
+    def _update_status(self):
+        """Housekeeping: refresh NTP status, then write the status file."""
+        self._update_ntp_status()
+        self._write_status()
+    
     def _log_status(self):
         """Log periodic status."""
         for ssrc, recorder in self.recorders.items():
@@ -430,25 +442,32 @@ class CoreRecorderV2:
             pass
         return None
     
-    def _monitor_health(self):
-        """Monitor stream health."""
-        try:
-            for ssrc, recorder in self.recorders.items():
-                if not recorder.is_healthy():
-                    silence = recorder.get_silence_duration()
-                    logger.warning(
-                        f"Channel {recorder.config.description} silent for {silence:.0f}s"
-                    )
-                    
-                    # Check if channel still exists
-                    try:
-                        channels = discover_channels(self.status_address, listen_duration=1.0)
-                        if ssrc not in channels:
-                            logger.error(f"Channel {ssrc:x} missing from radiod")
-                    except Exception:
-                        pass
-        except Exception as e:
-            logger.error(f"Health monitoring error: {e}")
+    def _on_channel_stall(self, ssrc: int, silence: float):
+        """A channel delivered nothing for stall_timeout_sec."""
+        recorder = self.recorders.get(ssrc)
+        name = recorder.config.description if recorder else f"{ssrc:x}"
+        logger.warning(f"Channel {name} silent for {silence:.0f}s")
+        
+        # Cached directory: no discovery round-trip on the supervisor thread
+        if not self.channel_directory.is_alive():
+            logger.error("radiod status stream is silent - radiod down or unreachable")
+        elif self.channel_directory.get(ssrc) is None:
+            logger.error(f"Channel {ssrc:x} missing from radiod")
+        
+        self._write_status()
+    
+    def _on_channel_recovered(self, ssrc: int, data):
+        recorder = self.recorders.get(ssrc)
+        name = recorder.config.description if recorder else f"{ssrc:x}"
+        logger.info(f"Channel {name} receiving again")
+        self._write_status()
+    
+    def _on_writer_error(self, ssrc: int, error: Exception):
+        """First failure of a run of recorder/writer errors on a channel."""
+        recorder = self.recorders.get(ssrc)
+        name = recorder.config.description if recorder else f"{ssrc:x}"
+        logger.error(f"Channel {name}: writer error: {error}")
+        self._write_status()
     
     def _enforce_quota(self):
         """Enforce disk quota."""
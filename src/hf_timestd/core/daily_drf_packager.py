@@ -11,6 +11,7 @@ Output: upload/{YYYYMMDD}/{CALLSIGN}_{GRID}/{RECEIVER}@{ID}/OBS.../ch0/
 Features:
 ---------
 - Combines all 9 channels into single multi-subchannel DRF
+- IncrementalDRFPackager appends each minute as it completes
 - Includes comprehensive metadata (station info, timing quality, gaps)
 - PSWS/wsprdaemon compatible format
 
@@ -26,12 +27,19 @@ Usage:
         --data-root /tmp/grape-test \\
         --date 2025-12-05 \\
         --callsign AC0G --grid EM28
+    
+    # Continuous mode (upload ready a few seconds after 00:00 UTC):
+    python -m hf_timestd.core.daily_drf_packager \\
+        --data-root /tmp/grape-test --incremental \\
+        --callsign AC0G --grid EM28
 """
 
 import numpy as np
 import json
 import logging
+import shutil
 import sys
+import time
 from pathlib import Path
 from datetime import datetime, timezone, date, timedelta
 from typing import Optional, Dict, List, Tuple, Any
@@ -47,7 +55,14 @@ except ImportError:
     DRF_AVAILABLE = False
     logger.warning("digital_rf not available - DRF packaging disabled")
 
-from .decimated_buffer import DecimatedBuffer, SAMPLE_RATE, SAMPLES_PER_DAY
+from .decimated_buffer import (
+    DecimatedBuffer, SAMPLE_RATE, SAMPLES_PER_MINUTE, SAMPLES_PER_DAY
+)
+
+MINUTES_PER_DAY = 1440
+
+# Incremental packaging state (kept in upload/{YYYYMMDD}/, outside the OBS dir)
+INCREMENTAL_STATE_FILE = 'incremental_state.json'
 
 # Standard GRAPE channels (sorted by frequency)
 STANDARD_CHANNELS = [
@@ -130,12 +145,16 @@ class DailyDRFPackager:
         logger.info(f"  Channels: {len(self.channels)}")
         logger.info(f"  Output: {self.upload_dir}")
     
-    def package_day(self, date_str: str) -> Optional[Path]:
+    def package_day(self, date_str: str, force: bool = False) -> Optional[Path]:
         """
         Package a day's decimated data into DRF format.
         
+        If the IncrementalDRFPackager has already finalized the day, its
+        output is returned as-is unless force=True.
+        
         Args:
             date_str: Date in YYYYMMDD or YYYY-MM-DD format
+            force: Rebuild even if an incremental package is complete
             
         Returns:
             Path to output directory or None if failed
@@ -144,6 +163,14 @@ class DailyDRFPackager:
         if '-' in date_str:
             date_str = date_str.replace('-', '')
         
+        if not force:
+            state = load_incremental_state(self.upload_dir, date_str)
+            if state and state.get('finalized') and state.get('output_dir'):
+                output_path = Path(state['output_dir'])
+                if output_path.exists():
+                    logger.info(f"{date_str} already packaged incrementally: {output_path}")
+                    return output_path
+        
         logger.info(f"Packaging {date_str} for upload")
         
         # Load all channel data
@@ -245,8 +272,23 @@ class DailyDRFPackager:
         logger.info(f"  Shape: {stacked.shape}")
         logger.info(f"  Start index: {start_global_index}")
         
-        # Create DRF writer
-        writer = drf.DigitalRFWriter(
+        # Write data
+        writer = self._create_writer(output_dir, date_obj, num_channels)
+        writer.rf_write(stacked)
+        writer.close()
+        
+        logger.info(f"  ✓ DRF data written")
+    
+    def _create_writer(
+        self,
+        output_dir: Path,
+        date_obj: datetime,
+        num_channels: int
+    ) -> 'drf.DigitalRFWriter':
+        """Create the multi-subchannel DRF writer for a day (index 0 = 00:00 UTC)."""
+        start_global_index = int(date_obj.timestamp() * SAMPLE_RATE)
+        
+        return drf.DigitalRFWriter(
             str(output_dir),
             dtype='f4',  # float32
             subdir_cadence_secs=86400,
@@ -262,12 +304,6 @@ class DailyDRFPackager:
             is_continuous=True,
             marching_periods=False
         )
-        
-        # Write data
-        writer.rf_write(stacked)
-        writer.close()
-        
-        logger.info(f"  ✓ DRF data written")
     
     def _write_metadata(
         self,
@@ -353,6 +389,413 @@ class DailyDRFPackager:
         return self.package_day(yesterday.strftime('%Y%m%d'))
 
 
+def _incremental_state_path(upload_dir: Path, date_str: str) -> Path:
+    """State file kept beside (not inside) the uploaded OBS directory."""
+    return Path(upload_dir) / date_str / INCREMENTAL_STATE_FILE
+
+
+def load_incremental_state(upload_dir: Path, date_str: str) -> Optional[Dict[str, Any]]:
+    """Load the incremental packaging state for a day (None if absent)."""
+    state_file = _incremental_state_path(upload_dir, date_str)
+    if not state_file.exists():
+        return None
+    try:
+        with open(state_file, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"Error loading {state_file}: {e}")
+        return None
+
+
+class IncrementalDRFPackager(DailyDRFPackager):
+    """
+    Build the day's multi-subchannel DRF one minute at a time.
+    
+    Instead of waiting for the day to end and stacking 864000 × 2N samples
+    in memory, each minute is appended to an open DigitalRFWriter as soon
+    as every channel has written it to its DecimatedBuffer (or once
+    late_grace_sec has passed since the minute ended). Memory stays at one
+    (600, 2N) block regardless of time of day.
+    
+    Gap handling:
+    -------------
+    - A minute with no data on any channel is skipped; the writer is given
+      the next minute's sample index, so DRF records the gap.
+    - A channel missing from an otherwise present minute is zero-filled,
+      as in package_day().
+    - A minute that arrives after its slot was written cannot be inserted
+      (DRF writes are strictly in sequence). Such late minutes are
+      recorded, and at finalization only the hour files that contain them
+      are rewritten from the buffers (DRF files are hourly), leaving the
+      rest of the day untouched.
+    
+    The day is finalized (writer closed, metadata and gap summary written)
+    as soon as minute 1439 is written, normally a few seconds after
+    00:00 UTC. package_day() then returns the finished output immediately.
+    
+    Usage:
+    ------
+        packager = IncrementalDRFPackager(data_root, station_config)
+        packager.run()          # long-running service
+        
+        # or drive it from an existing loop:
+        packager.poll()
+    """
+    
+    def __init__(
+        self,
+        data_root: Path,
+        station_config: StationConfig,
+        channels: Optional[List[Tuple[str, float]]] = None,
+        late_grace_sec: float = 120.0,
+        poll_interval: float = 5.0
+    ):
+        """
+        Initialize incremental packager.
+        
+        Args:
+            data_root: Root data directory
+            station_config: Station configuration
+            channels: List of (channel_name, frequency_hz) tuples
+            late_grace_sec: How long after a minute ends to wait for slow
+                            channels before writing it without them
+            poll_interval: Seconds between polls in run()
+        """
+        super().__init__(data_root, station_config, channels)
+        
+        self.late_grace_sec = late_grace_sec
+        self.poll_interval = poll_interval
+        
+        self._buffers = {
+            name: DecimatedBuffer(self.data_root, name)
+            for name, _ in self.channels
+        }
+        
+        # Reused (600, 2N) float32 block - the only per-minute allocation
+        self._block = np.zeros(
+            (SAMPLES_PER_MINUTE, 2 * len(self.channels)), dtype=np.float32
+        )
+        
+        # Per-day state
+        self._date_str: Optional[str] = None
+        self._date_obj: Optional[datetime] = None
+        self._output_dir: Optional[Path] = None
+        self._writer = None
+        self._next_minute = 0
+        self._written: Dict[str, set] = {}
+        self._late: Dict[str, set] = {}
+        self._minutes_written = 0
+        self._gaps: set = set()
+        self._finalized = False
+    
+    # -------------------------------------------------------------------------
+    # Day lifecycle
+    # -------------------------------------------------------------------------
+    
+    def start_day(self, date_str: str, now: Optional[float] = None):
+        """
+        Open the DRF dataset for a day and catch up on minutes already written.
+        
+        Any partial dataset from a previous run is discarded and rebuilt
+        from the decimated buffers, because DRF cannot append into an
+        existing hour file.
+        """
+        if '-' in date_str:
+            date_str = date_str.replace('-', '')
+        
+        self._date_str = date_str
+        self._date_obj = datetime.strptime(date_str, '%Y%m%d').replace(tzinfo=timezone.utc)
+        self._next_minute = 0
+        self._written = {name: set() for name, _ in self.channels}
+        self._late = {name: set() for name, _ in self.channels}
+        self._minutes_written = 0
+        self._gaps = set()
+        self._finalized = False
+        
+        state = load_incremental_state(self.upload_dir, date_str)
+        if state and state.get('finalized'):
+            logger.info(f"{date_str} already finalized - nothing to do")
+            self._finalized = True
+            self._next_minute = MINUTES_PER_DAY
+            return
+        
+        self._output_dir = self._build_output_structure(self._date_obj)
+        self._open_writer()
+        
+        logger.info(f"Incremental packaging started for {date_str}")
+        self.poll(now)
+    
+    def _open_writer(self):
+        """(Re)create an empty DRF dataset for the current day."""
+        if any(self._output_dir.iterdir()):
+            logger.info(f"Discarding partial DRF in {self._output_dir}")
+            shutil.rmtree(self._output_dir)
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._writer = self._create_writer(
+            self._output_dir, self._date_obj, len(self.channels)
+        )
+    
+    def finalize_day(self) -> Optional[Path]:
+        """
+        Flush remaining minutes, close the writer and write metadata.
+        
+        Returns:
+            Path to the OBS directory or None if nothing was written
+        """
+        if self._date_str is None or self._finalized:
+            return None
+        
+        # Anything still outstanding is written with whatever exists now
+        valid = self._load_valid_minutes()
+        self._write_ready_minutes(valid, force=True)
+        self._collect_late_minutes(valid)
+        
+        self._writer.close()
+        self._writer = None
+        
+        if any(self._late.values()):
+            late_hours = sorted({m // 60 for late in self._late.values() for m in late})
+            late_total = sum(len(m) for m in self._late.values())
+            logger.info(
+                f"Rewriting {len(late_hours)} hour(s) of {self._date_str} "
+                f"to include {late_total} late channel-minutes"
+            )
+            for hour in late_hours:
+                self._rewrite_hour(hour)
+            self._late = {name: set() for name, _ in self.channels}
+        
+        if self._minutes_written == 0:
+            logger.warning(f"No data for {self._date_str} - nothing packaged")
+            self._finalized = True
+            self._save_state()
+            return None
+        
+        channel_metadata = {}
+        for name, _ in self.channels:
+            day_meta = self._buffers[name].get_day_metadata(self._date_str)
+            if day_meta is not None:
+                channel_metadata[name] = day_meta
+        
+        self._write_metadata(
+            output_dir=self._output_dir,
+            frequencies=[freq for _, freq in self.channels],
+            channel_metadata=channel_metadata,
+            date_obj=self._date_obj
+        )
+        self._write_gap_summary(
+            output_dir=self._output_dir.parent,
+            channel_metadata=channel_metadata,
+            date_obj=self._date_obj
+        )
+        
+        self._finalized = True
+        self._save_state()
+        
+        logger.info(
+            f"✅ {self._date_str} finalized: {self._minutes_written} minutes, "
+            f"{len(self._gaps)} gap minutes"
+        )
+        return self._output_dir.parent
+    
+    # -------------------------------------------------------------------------
+    # Minute processing
+    # -------------------------------------------------------------------------
+    
+    def poll(self, now: Optional[float] = None) -> int:
+        """
+        Append every minute that is ready and handle the day rollover.
+        
+        Args:
+            now: Current UTC timestamp (default: time.time())
+            
+        Returns:
+            Number of minutes appended (including gap minutes)
+        """
+        if now is None:
+            now = time.time()
+        
+        today = datetime.fromtimestamp(now, tz=timezone.utc).strftime('%Y%m%d')
+        
+        if self._date_str is None:
+            # Just after midnight the previous day may still be in its grace period
+            start = datetime.fromtimestamp(now - self.late_grace_sec, tz=timezone.utc)
+            self.start_day(start.strftime('%Y%m%d'), now)
+            return self._next_minute
+        
+        before = self._next_minute
+        if not self._finalized:
+            valid = self._load_valid_minutes()
+            self._write_ready_minutes(valid, now=now)
+            self._collect_late_minutes(valid)
+            if self._next_minute >= MINUTES_PER_DAY:
+                self.finalize_day()
+        
+        if today > self._date_str:
+            if not self._finalized:
+                # Grace period for the last minute has not expired yet
+                day_end = self._date_obj.timestamp() + 86400
+                if now < day_end + self.late_grace_sec:
+                    return self._next_minute - before
+                self.finalize_day()
+            self.start_day(today, now)
+            return self._next_minute
+        
+        return self._next_minute - before
+    
+    def _load_valid_minutes(self) -> Dict[str, set]:
+        """Read each channel's written-minute set from its metadata file."""
+        return {
+            name: buf.get_valid_minutes(self._date_str)
+            for name, buf in self._buffers.items()
+        }
+    
+    def _write_ready_minutes(
+        self,
+        valid: Dict[str, set],
+        now: Optional[float] = None,
+        force: bool = False
+    ):
+        """Append minutes in order until one is not yet ready."""
+        day_start = self._date_obj.timestamp()
+        
+        while self._next_minute < MINUTES_PER_DAY:
+            minute = self._next_minute
+            present = [name for name, _ in self.channels if minute in valid[name]]
+            
+            if len(present) < len(self.channels) and not force:
+                minute_end = day_start + (minute + 1) * 60
+                if now is None or now < minute_end + self.late_grace_sec:
+                    break
+            
+            self._append_minute(minute, present)
+            self._next_minute += 1
+    
+    def _append_minute(self, minute: int, present: List[str]):
+        """Write one minute for all channels (zero-filled where missing)."""
+        if not present:
+            # Nothing to write: the next rf_write skips ahead, leaving a DRF gap
+            self._gaps.add(minute)
+            return
+        
+        minute_utc = self._date_obj.timestamp() + minute * 60
+        block = self._block
+        block.fill(0.0)
+        
+        for i, (name, _) in enumerate(self.channels):
+            if name not in present:
+                continue
+            iq, _ = self._buffers[name].read_minute(minute_utc)
+            if iq is None:
+                continue
+            block[:, 2 * i] = iq.real
+            block[:, 2 * i + 1] = iq.imag
+            self._written[name].add(minute)
+        
+        self._writer.rf_write(block, next_sample=minute * SAMPLES_PER_MINUTE)
+        self._minutes_written += 1
+    
+    def _collect_late_minutes(self, valid: Dict[str, set]):
+        """Record channel-minutes that appeared after their slot was written."""
+        for name in self._buffers:
+            late = {
+                m for m in valid[name]
+                if m < self._next_minute and m not in self._written[name]
+            }
+            new_late = late - self._late[name]
+            if new_late:
+                logger.debug(f"{name}: {len(new_late)} late minutes for {self._date_str}")
+                self._late[name].update(new_late)
+    
+    def _hour_file(self, hour: int) -> Optional[Path]:
+        """The DRF file holding `hour` of the current day, if it was written."""
+        file_start = int(self._date_obj.timestamp()) + hour * 3600
+        matches = list(self._output_dir.glob(f"*/rf@{file_start}.000.h5"))
+        return matches[0] if matches else None
+    
+    def _rewrite_hour(self, hour: int):
+        """
+        Rewrite one hour file from the buffers (writer must be closed).
+        
+        Each hour is its own DRF file, so deleting it and writing the same
+        sample range again with a fresh writer leaves the other hours as
+        they are.
+        """
+        minutes = range(hour * 60, min((hour + 1) * 60, self._next_minute))
+        
+        hour_file = self._hour_file(hour)
+        if hour_file is not None:
+            hour_file.unlink()
+        
+        self._minutes_written -= sum(1 for m in minutes if m not in self._gaps)
+        self._gaps.difference_update(minutes)
+        for written in self._written.values():
+            written.difference_update(minutes)
+        
+        valid = self._load_valid_minutes()
+        self._writer = self._create_writer(
+            self._output_dir, self._date_obj, len(self.channels)
+        )
+        try:
+            for minute in minutes:
+                present = [name for name, _ in self.channels if minute in valid[name]]
+                self._append_minute(minute, present)
+        finally:
+            self._writer.close()
+            self._writer = None
+    
+    def _save_state(self):
+        """Record day completion so package_day() can skip rebuilding."""
+        state_file = _incremental_state_path(self.upload_dir, self._date_str)
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            'date': self._date_str,
+            'finalized': self._finalized,
+            'finalized_at': datetime.now(tz=timezone.utc).isoformat(),
+            'output_dir': (
+                str(self._output_dir.parent) if self._minutes_written else None
+            ),
+            'minutes_written': self._minutes_written,
+            'gap_minutes': len(self._gaps),
+            'channels': [name for name, _ in self.channels],
+        }
+        temp_file = state_file.with_suffix('.tmp')
+        with open(temp_file, 'w') as f:
+            json.dump(state, f, indent=2)
+        temp_file.replace(state_file)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get packaging progress for the current day."""
+        return {
+            'date': self._date_str,
+            'next_minute': self._next_minute,
+            'minutes_written': self._minutes_written,
+            'gap_minutes': len(self._gaps),
+            'late_channel_minutes': sum(len(m) for m in self._late.values()),
+            'finalized': self._finalized,
+        }
+    
+    def run(self):
+        """Main loop: poll for completed minutes until interrupted."""
+        logger.info(f"Incremental DRF packager running (poll {self.poll_interval}s)")
+        
+        while True:
+            try:
+                self.poll()
+                time.sleep(self.poll_interval)
+            except KeyboardInterrupt:
+                logger.info("Shutting down...")
+                break
+            except Exception as e:
+                logger.error(f"Error in packager loop: {e}")
+                time.sleep(10)
+        
+        # Leave the partial day closed cleanly; it is rebuilt on restart
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
 def package_for_upload(
     data_root: Path,
     callsign: str,
@@ -399,6 +842,10 @@ if __name__ == '__main__':
                        help='Date to package (YYYYMMDD or YYYY-MM-DD)')
     parser.add_argument('--yesterday', action='store_true',
                        help='Package yesterday\'s data')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Run continuously, appending each completed minute')
+    parser.add_argument('--force', action='store_true',
+                       help='Rebuild even if the day was packaged incrementally')
     parser.add_argument('--callsign', type=str, required=True,
                        help='Station callsign')
     parser.add_argument('--grid', type=str, required=True,
@@ -424,12 +871,16 @@ if __name__ == '__main__':
         psws_station_id=args.psws_station_id or f"{args.callsign}_1"
     )
     
+    if args.incremental:
+        IncrementalDRFPackager(args.data_root, station).run()
+        sys.exit(0)
+    
     packager = DailyDRFPackager(args.data_root, station)
     
     if args.yesterday:
         result = packager.package_yesterday()
     elif args.date:
-        result = packager.package_day(args.date)
+        result = packager.package_day(args.date, force=args.force)
     else:
         parser.print_help()
         sys.exit(1)
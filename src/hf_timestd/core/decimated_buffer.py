@@ -30,7 +30,7 @@ import logging
 import fcntl
 from pathlib import Path
 from datetime import datetime, timezone, date, timedelta
-from typing import Optional, Dict, Tuple, List, Any
+from typing import Optional, Dict, Tuple, List, Any, Set
 from dataclasses import dataclass, field, asdict
 
 logger = logging.getLogger(__name__)
@@ -137,6 +137,10 @@ class DecimatedBuffer:
         self.buffer_dir = self.data_root / 'products' / self.channel_dir / 'decimated'
         self.buffer_dir.mkdir(parents=True, exist_ok=True)
         
+        # date_str -> ((st_mtime_ns, st_size), DayMetadata) for readers;
+        # the writer is another process, so entries are checked by stat
+        self._meta_cache: Dict[str, Tuple[Tuple[int, int], DayMetadata]] = {}
+        
         logger.debug(f"DecimatedBuffer initialized: {self.buffer_dir}")
     
     def _get_paths(self, date_str: str) -> Tuple[Path, Path]:
@@ -164,12 +168,51 @@ class DecimatedBuffer:
             start_utc=date_obj.timestamp()
         )
     
+    def _cached_metadata(self, date_str: str) -> DayMetadata:
+        """
+        Metadata for reading, parsed again only when the file has changed.
+        
+        Callers must not modify the returned object.
+        """
+        _, meta_path = self._get_paths(date_str)
+        try:
+            st = meta_path.stat()
+        except FileNotFoundError:
+            self._meta_cache.pop(date_str, None)
+            return self._load_metadata(date_str)
+        
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._meta_cache.get(date_str)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        try:
+            with open(meta_path, 'r') as f:
+                metadata = DayMetadata.from_dict(json.load(f))
+        except Exception as e:
+            # Possibly caught mid-write; not cached, so the next call retries
+            logger.warning(f"Error loading metadata {meta_path}: {e}")
+            return self._load_metadata(date_str)
+        
+        self._remember_metadata(date_str, key, metadata)
+        return metadata
+    
+    def _remember_metadata(self, date_str: str, key: Tuple[int, int], metadata: DayMetadata):
+        """Cache one day's metadata, keeping only the most recent few days."""
+        self._meta_cache.pop(date_str, None)
+        if len(self._meta_cache) >= 3:
+            self._meta_cache.pop(next(iter(self._meta_cache)))
+        self._meta_cache[date_str] = (key, metadata)
+    
     def _save_metadata(self, date_str: str, metadata: DayMetadata):
         """Save metadata to JSON file."""
         _, meta_path = self._get_paths(date_str)
         
         with open(meta_path, 'w') as f:
             json.dump(metadata.to_dict(), f, indent=2)
+        
+        st = meta_path.stat()
+        self._remember_metadata(date_str, (st.st_mtime_ns, st.st_size), metadata)
     
     def write_minute(
         self,
@@ -288,8 +331,8 @@ class DecimatedBuffer:
             
             iq = np.frombuffer(data, dtype=np.complex64)
             
-            # Get metadata
-            metadata = self._load_metadata(date_str)
+            # Get metadata (parsed once per change, not once per minute)
+            metadata = self._cached_metadata(date_str)
             minute_meta = metadata.minutes.get(str(minute_index))
             
             return iq, minute_meta
@@ -323,7 +366,7 @@ class DecimatedBuffer:
                 data = f.read()
             
             iq = np.frombuffer(data, dtype=np.complex64)
-            metadata = self._load_metadata(date_str)
+            metadata = self._cached_metadata(date_str)
             
             logger.info(f"Read {len(iq)} samples for {date_str} ({self.channel_name})")
             return iq, metadata
@@ -376,6 +419,32 @@ class DecimatedBuffer:
             dates.append(date_str)
         return sorted(dates)
     
+    def get_day_metadata(self, date_str: str) -> Optional[DayMetadata]:
+        """Get full day metadata without loading IQ data (None if absent)."""
+        if '-' in date_str:
+            date_str = date_str.replace('-', '')
+        
+        _, meta_path = self._get_paths(date_str)
+        
+        if not meta_path.exists():
+            return None
+        return self._cached_metadata(date_str)
+    
+    def get_valid_minutes(self, date_str: str) -> Set[int]:
+        """
+        Get minute indices (0-1439) that have been written for a day.
+        
+        Only the small metadata file is read, so this is cheap enough to
+        poll once per minute per channel.
+        """
+        metadata = self.get_day_metadata(date_str)
+        if metadata is None:
+            return set()
+        return {
+            int(idx) for idx, m in metadata.minutes.items()
+            if m.get('valid', False)
+        }
+    
     def get_day_summary(self, date_str: str) -> Optional[Dict]:
         """Get summary info for a day without loading all data."""
         if '-' in date_str:
@@ -10,19 +10,30 @@ Structure matches wsprdaemon/wav2grape.py:
 - IQ data horizontally stacked: [freq1_IQ | freq2_IQ | ... | freq9_IQ]
 - center_frequencies metadata as array of all frequencies
 - Optional extended metadata (time_snap, gap analysis)
+
+Loading is streamed: iter_aligned_time_slices() merges all channels' NPZ
+files in time order, loads each aligned slice on a small thread pool and
+write_drf_dataset() appends slices to DRF as they arrive, so only a few
+slices are held in memory instead of a whole day.
 """
 
 import argparse
+import heapq
 import json
 import logging
 import numpy as np
 import sys
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, date
+from itertools import groupby
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
+from .npz_reader import NPZReader
+
 try:
     import digital_rf as drf
     DRF_AVAILABLE = True
@@ -32,6 +43,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Slice loading: worker threads and how many slices may be in flight
+LOAD_WORKERS = 4
+LOAD_PREFETCH_SLICES = 8
+
 
 @dataclass
 class ChannelConfig:
@@ -80,12 +95,20 @@ class DRFBatchWriter:
         channels: List[ChannelConfig],
         output_dir: Path,
         station_config: Dict,
-        include_extended_metadata: bool = False
+        include_extended_metadata: bool = False,
+        trust_legacy_pickle: bool = False
     ):
+        """
+        Args:
+            trust_legacy_pickle: Unpickle extended metadata of NPZ files
+                written before metadata was stored as JSON (only for this
+                station's own archive); otherwise it is dropped with a warning
+        """
         self.channels = sorted(channels, key=lambda c: c.frequency_hz)  # Sort by frequency
         self.output_dir = Path(output_dir)
         self.station_config = station_config
         self.include_extended_metadata = include_extended_metadata
+        self.trust_legacy_pickle = trust_legacy_pickle
         
         self.sample_rate = 10  # 10 Hz decimated data
         self.num_subchannels = len(channels)
@@ -128,41 +151,74 @@ class DRFBatchWriter:
         Load and align IQ data from all channels by timestamp
         
         Returns time slices where ALL channels have data at that timestamp.
+        Holds the whole day in memory; write_drf_dataset() accepts the
+        iter_aligned_time_slices() generator directly instead.
+        """
+        return list(self.iter_aligned_time_slices(files_by_channel))
+    
+    def iter_aligned_time_slices(
+        self,
+        files_by_channel: Dict[str, List[Path]],
+        max_workers: int = LOAD_WORKERS,
+        prefetch: int = LOAD_PREFETCH_SLICES
+    ) -> Iterator[TimeSlice]:
         """
-        # Build timestamp -> {channel: file_path} mapping
-        timestamp_map = {}
+        Stream aligned time slices in time order
         
-        for channel_name, files in files_by_channel.items():
-            for file_path in files:
-                # Extract timestamp from filename: YYYYMMDDTHHMMSSZ_freq_iq_10hz.npz
-                filename = file_path.stem
-                time_part = filename.split('_')[0]  # YYYYMMDDTHHMMSSZ
-                
-                if time_part not in timestamp_map:
-                    timestamp_map[time_part] = {}
-                timestamp_map[time_part][channel_name] = file_path
+        Merges every channel's (sorted) file list in one pass, keeps the
+        timestamps present in ALL channels, and loads up to `prefetch`
+        slices ahead on a thread pool (np.load releases the GIL while
+        inflating). Slices are yielded in time order as they complete.
         
-        # Filter to timestamps where ALL channels have data
+        Args:
+            files_by_channel: {channel_name: [file_paths sorted by time]}
+            max_workers: Loader threads
+            prefetch: Maximum slices loaded ahead of the consumer
+        """
         all_channel_names = set(c.name for c in self.channels)
-        complete_timestamps = sorted([
-            ts for ts, channels in timestamp_map.items()
-            if set(channels.keys()) == all_channel_names
-        ])
-        
-        logger.info(f"Found {len(complete_timestamps)} complete time slices (all {self.num_subchannels} channels)")
-        
-        # Load data for complete timestamps
-        time_slices = []
-        for ts in complete_timestamps:
-            try:
-                slice_data = self._load_time_slice(ts, timestamp_map[ts])
+        
+        def _keyed(channel_name: str, files: List[Path]):
+            # Filename: YYYYMMDDTHHMMSSZ_freq_iq_10hz.npz
+            for file_path in files:
+                yield file_path.stem.split('_')[0], channel_name, file_path
+        
+        merged = heapq.merge(
+            *(_keyed(name, sorted(files)) for name, files in files_by_channel.items())
+        )
+        
+        complete = 0
+        incomplete = 0
+        pending = deque()
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='npz-load') as pool:
+            for time_part, group in groupby(merged, key=lambda item: item[0]):
+                channel_files = {channel: path for _, channel, path in group}
+                if set(channel_files) != all_channel_names:
+                    incomplete += 1
+                    continue
+                complete += 1
+                pending.append((time_part, pool.submit(self._load_time_slice, time_part, channel_files)))
+                
+                while len(pending) >= prefetch:
+                    slice_data = self._collect(*pending.popleft())
+                    if slice_data:
+                        yield slice_data
+            
+            while pending:
+                slice_data = self._collect(*pending.popleft())
                 if slice_data:
-                    time_slices.append(slice_data)
-            except Exception as e:
-                logger.warning(f"Failed to load time slice {ts}: {e}")
-                continue
+                    yield slice_data
         
-        return time_slices
+        logger.info(f"Found {complete} complete time slices (all {self.num_subchannels} channels), "
+                    f"{incomplete} incomplete skipped")
+    
+    @staticmethod
+    def _collect(time_part: str, future) -> Optional[TimeSlice]:
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning(f"Failed to load time slice {time_part}: {e}")
+            return None
     
     def _load_time_slice(
         self, 
@@ -179,30 +235,30 @@ class DRFBatchWriter:
         
         for channel in self.channels:
             file_path = channel_files[channel.name]
-            data = np.load(file_path, allow_pickle=True)
-            
-            iq = data['iq']
-            
-            # Validate consistent sample count
-            if samples_per_channel is None:
-                samples_per_channel = len(iq)
-            elif len(iq) != samples_per_channel:
-                logger.warning(f"Sample count mismatch in {file_path}: {len(iq)} vs {samples_per_channel}")
-                return None
-            
-            # Get timestamp from first file
-            if utc_timestamp is None:
-                utc_timestamp = float(data['created_timestamp'])
-                rtp_timestamp = int(data['rtp_timestamp'])
+            # Members are read individually; nothing is unpickled
+            with NPZReader(file_path) as data:
+                # Validate consistent sample count from the header, before reading IQ
+                n_samples = data.shape('iq')[0]
+                if samples_per_channel is None:
+                    samples_per_channel = n_samples
+                elif n_samples != samples_per_channel:
+                    logger.warning(f"Sample count mismatch in {file_path}: {n_samples} vs {samples_per_channel}")
+                    return None
+                
+                # Get timestamp from first file
+                if utc_timestamp is None:
+                    utc_timestamp = data.scalar('created_timestamp', float)
+                    rtp_timestamp = data.scalar('rtp_timestamp', int)
+                    if utc_timestamp is None or rtp_timestamp is None:
+                        raise KeyError(f"{file_path.name}: missing timestamps")
+                    
+                    if self.include_extended_metadata:
+                        timing_metadata = data.json_member('timing_metadata', self.trust_legacy_pickle)
+                        quality_metadata = data.json_member('quality_metadata', self.trust_legacy_pickle)
                 
-                # Load extended metadata if enabled
-                if self.include_extended_metadata:
-                    if 'timing_metadata' in data.files:
-                        timing_metadata = data['timing_metadata'].item()
-                    if 'quality_metadata' in data.files:
-                        quality_metadata = data['quality_metadata'].item()
+                iq = data.array('iq')
             
-            channel_data[channel.name] = iq.astype(np.complex64)
+            channel_data[channel.name] = iq.astype(np.complex64, copy=False)
         
         return TimeSlice(
             timestamp=utc_timestamp,
@@ -216,7 +272,7 @@ class DRFBatchWriter:
     def write_drf_dataset(
         self,
         target_date: date,
-        time_slices: List[TimeSlice]
+        time_slices: Iterable[TimeSlice]
     ) -> Optional[Path]:
         """
         Write complete DRF dataset for a day
@@ -224,15 +280,21 @@ class DRFBatchWriter:
         Creates wsprdaemon-compatible structure:
         - OBS{date}T00-00/ch0/
         - All frequencies as subchannels in single ch0
-        """
-        if not time_slices:
-            logger.error("No time slices to write")
-            return None
         
+        Slices are appended as they arrive, so time_slices may be the
+        iter_aligned_time_slices() generator; IQ is not retained after
+        each slice is written.
+        """
         if not DRF_AVAILABLE:
             logger.error("digital_rf not available")
             return None
         
+        time_slices = iter(time_slices)
+        first = next(time_slices, None)
+        if first is None:
+            logger.error("No time slices to write")
+            return None
+        
         # Build output directory structure
         # Note: output_dir should already include the date level (e.g., /upload/20251128)
         obs_date = target_date.strftime('%Y-%m-%dT00-00')
@@ -250,35 +312,11 @@ class DRFBatchWriter:
         logger.info(f"Writing DRF dataset to: {channel_dir}")
         
         # Calculate start index from first timestamp
-        first_ts = time_slices[0].timestamp
-        start_global_index = int(first_ts * self.sample_rate)
+        start_global_index = int(first.timestamp * self.sample_rate)
         
-        # Prepare stacked IQ data for all time slices
-        # Shape: (total_samples, 2, num_subchannels) -> flatten to (total_samples, 2 * num_subchannels)
-        all_samples = []
-        
-        for ts in time_slices:
-            # Stack channels horizontally: [ch1_I, ch1_Q, ch2_I, ch2_Q, ...]
-            slice_samples = []
-            for channel in self.channels:
-                iq = ts.channel_data[channel.name]
-                # Convert complex to float32 [I, Q] pairs
-                iq_float = np.zeros((len(iq), 2), dtype=np.float32)
-                iq_float[:, 0] = iq.real
-                iq_float[:, 1] = iq.imag
-                slice_samples.append(iq_float)
-            
-            # Horizontal stack: (samples, 2 * num_channels)
-            stacked = np.hstack(slice_samples)
-            all_samples.append(stacked)
-        
-        # Concatenate all time slices
-        all_data = np.vstack(all_samples)
-        total_samples = len(all_data)
-        
-        logger.info(f"  Total samples: {total_samples}")
-        logger.info(f"  Data shape: {all_data.shape}")
-        logger.info(f"  Start index: {start_global_index}")
+        # Per-slice summaries (no IQ) for the extended metadata
+        summaries: List[TimeSlice] = []
+        total_samples = 0
         
         # Write DRF dataset
         try:
@@ -299,9 +337,43 @@ class DRFBatchWriter:
                 False               # marching_periods
             )
             
-            writer.rf_write(all_data)
+            block = None
+            next_index = 0
+            for ts in _chain_first(first, time_slices):
+                n = ts.samples_per_channel
+                if block is None or len(block) != n:
+                    block = np.empty((n, 2 * self.num_subchannels), dtype=np.float32)
+                
+                # Interleave channels horizontally: [ch1_I, ch1_Q, ch2_I, ch2_Q, ...]
+                for i, channel in enumerate(self.channels):
+                    iq = ts.channel_data[channel.name]
+                    block[:, 2 * i] = iq.real
+                    block[:, 2 * i + 1] = iq.imag
+                
+                # A slice starting half a slice or more past the end of the
+                # previous one follows a missing minute: write it at its own
+                # index (the gap reads as NaN) rather than shifting it earlier
+                index = int(ts.timestamp * self.sample_rate) - start_global_index
+                if index - next_index >= n // 2:
+                    next_index = writer.rf_write(block, index)
+                else:
+                    next_index = writer.rf_write(block)
+                total_samples += n
+                
+                summaries.append(TimeSlice(
+                    timestamp=ts.timestamp,
+                    rtp_timestamp=ts.rtp_timestamp,
+                    samples_per_channel=n,
+                    channel_data={},
+                    timing_metadata=ts.timing_metadata,
+                    quality_metadata=ts.quality_metadata
+                ))
+            
             writer.close()
             
+            logger.info(f"  Time slices: {len(summaries)}")
+            logger.info(f"  Data shape: ({total_samples}, {2 * self.num_subchannels})")
+            logger.info(f"  Start index: {start_global_index}")
             logger.info(f"✅ Wrote {total_samples} samples to DRF")
             
         except Exception as e:
@@ -309,7 +381,7 @@ class DRFBatchWriter:
             return None
         
         # Write metadata
-        self._write_metadata(channel_dir, start_global_index, time_slices)
+        self._write_metadata(channel_dir, start_global_index, summaries)
         
         return drf_base
     
@@ -413,12 +485,19 @@ class DRFBatchWriter:
         logger.info(f"✅ Extended metadata written: {len(extended_data['gaps'])} gaps detected")
 
 
+def _chain_first(first: TimeSlice, rest: Iterator[TimeSlice]) -> Iterator[TimeSlice]:
+    """Re-attach an already consumed first slice to its iterator"""
+    yield first
+    yield from rest
+
+
 def process_day(
     target_date: date,
     analytics_root: Path,
     output_dir: Path,
     station_config: Dict,
-    include_extended_metadata: bool = False
+    include_extended_metadata: bool = False,
+    trust_legacy_pickle: bool = False
 ) -> Optional[Path]:
     """
     Process a full day's data from all channels into a single DRF dataset
@@ -468,7 +547,8 @@ def process_day(
         channels=channels,
         output_dir=output_dir,
         station_config=station_config,
-        include_extended_metadata=include_extended_metadata
+        include_extended_metadata=include_extended_metadata,
+        trust_legacy_pickle=trust_legacy_pickle
     )
     
     # Discover files for target date
@@ -480,15 +560,12 @@ def process_day(
         logger.error(f"No files found for {target_date}")
         return None
     
-    # Load aligned time slices
-    time_slices = writer.load_aligned_time_slices(files_by_channel)
-    
-    if not time_slices:
-        logger.error("No complete time slices (missing channels)")
-        return None
+    # Stream aligned time slices straight into the DRF writer
+    time_slices = writer.iter_aligned_time_slices(files_by_channel)
     
-    # Write DRF dataset
     obs_dir = writer.write_drf_dataset(target_date, time_slices)
+    if obs_dir is None:
+        logger.error("No complete time slices written (missing channels?)")
     
     return obs_dir
 
@@ -514,6 +591,9 @@ def main():
     
     parser.add_argument('--include-extended-metadata', action='store_true',
                        help='Include timing quality and gap analysis metadata')
+    parser.add_argument('--trust-legacy-pickle', action='store_true',
+                       help='Unpickle extended metadata of NPZ files from before it was '
+                            'stored as JSON (own archive only)')
     parser.add_argument('--log-level', default='INFO',
                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
     
@@ -545,7 +625,8 @@ def main():
         analytics_root=args.analytics_root,
         output_dir=args.output_dir,
         station_config=station_config,
-        include_extended_metadata=args.include_extended_metadata
+        include_extended_metadata=args.include_extended_metadata,
+        trust_legacy_pickle=args.trust_legacy_pickle
     )
     
     if obs_dir:
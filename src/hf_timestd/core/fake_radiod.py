@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Fake Radiod - synthetic RTP IQ source for load and capacity testing
+
+Sends N channels of 20 kHz float32 IQ the way radiod does: one RTP packet
+per channel per block (20 ms), RTP timestamp in samples, one SSRC per
+channel, all channels on one multicast group and port. Each channel
+carries a synthetic WWV, WWVH or CHU minute (carrier, per-second ticks,
+minute mark, noise) aligned to the wall clock, so Phase 2 sees tones
+where it expects them.
+
+The sender runs in its own process, as radiod does, so it does not compete
+with the recorder under test for the GIL. Loss and reordering are applied
+per packet:
+
+- loss: the packet is never sent (its sequence number is consumed, so the
+  receiver sees a gap)
+- reorder: the packet is held back and sent after the channel's next one
+
+Destinations:
+- multicast (default): the group on the loopback interface, for ka9q
+  RadiodStream (StreamRecorderV2 / CoreRecorderV2)
+- unicast: 127.0.0.1:port, for RTPReceiver (PipelineRecorder), which
+  joins the group on INADDR_ANY only
+
+Usage:
+    radiod = FakeRadiod(FakeRadiodConfig(channels=9, loss=0.001, reorder=0.01))
+    radiod.start()
+    channel_info = radiod.channel_info(radiod.channels[0])  # For RadiodStream
+    ...
+    stats = radiod.stop()
+"""
+
+import logging
+import multiprocessing
+import socket
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PAYLOAD_TYPE_FLOAT = 11
+ENCODING_F32LE = 4  # ka9q.types.Encoding.F32LE
+
+# Tone frequency (Hz), minute mark duration (s), second tick duration (s)
+STATION_TONES = {
+    'WWV': (1000.0, 0.8, 0.005),
+    'WWVH': (1200.0, 0.8, 0.005),
+    'CHU': (1000.0, 0.5, 0.3),
+}
+
+# Frequencies cycled through when building an N-channel plan
+CHANNEL_PLAN = [
+    ('WWV', 2.5e6), ('WWV', 5e6), ('WWV', 10e6), ('WWV', 15e6), ('WWV', 20e6), ('WWV', 25e6),
+    ('CHU', 3.33e6), ('CHU', 7.85e6), ('CHU', 14.67e6),
+    ('WWVH', 2.5e6), ('WWVH', 5e6), ('WWVH', 10e6), ('WWVH', 15e6),
+]
+
+_COUNTERS = ('sent', 'lost', 'reordered', 'late_blocks')
+
+
+@dataclass
+class FakeChannel:
+    """One synthetic channel."""
+    ssrc: int
+    station: str
+    frequency_hz: float
+    
+    @property
+    def description(self) -> str:
+        return f"{self.station} {self.frequency_hz / 1e6:g} MHz"
+
+
+@dataclass
+class FakeRadiodConfig:
+    """Configuration for the fake radiod sender."""
+    channels: int = 9
+    sample_rate: int = 20000
+    blocktime_ms: float = 20.0
+    
+    # Destination
+    multicast_group: str = '239.77.42.2'
+    port: int = 5004
+    unicast: bool = False
+    
+    # Impairments (per packet probabilities)
+    loss: float = 0.0
+    reorder: float = 0.0
+    
+    # Signal
+    snr_db: float = 10.0
+    first_ssrc: int = 30000
+    seed: int = 1
+    
+    plan: List[FakeChannel] = field(default_factory=list)
+    
+    def __post_init__(self):
+        if not self.plan:
+            self.plan = [
+                FakeChannel(self.first_ssrc + i, *CHANNEL_PLAN[i % len(CHANNEL_PLAN)])
+                for i in range(self.channels)
+            ]
+    
+    @property
+    def samples_per_packet(self) -> int:
+        return int(self.sample_rate * self.blocktime_ms / 1000)
+
+
+def synthesize_station_minute(
+    station: str,
+    sample_rate: int = 20000,
+    snr_db: float = 10.0,
+    seed: Optional[int] = None
+) -> np.ndarray:
+    """
+    One minute of complex IQ for a station: AM carrier keyed with the
+    station's second ticks and minute mark (sample 0 = minute boundary).
+    
+    snr_db is the tone sideband power relative to the noise in the full
+    IQ bandwidth.
+    
+    Returns:
+        complex64 array of 60 * sample_rate samples
+    """
+    tone_hz, minute_mark_sec, tick_sec = STATION_TONES[station]
+    rng = np.random.default_rng(seed)
+    n_samples = 60 * sample_rate
+    t = np.arange(n_samples) / sample_rate
+    
+    into_second = t % 1.0
+    second = (t // 1.0).astype(int)
+    keyed = np.where(second == 0, into_second < minute_mark_sec, into_second < tick_sec)
+    if station == 'WWV' or station == 'WWVH':
+        keyed &= (second != 29) & (second != 59)  # Omitted ticks
+    modulation_depth = 0.5
+    envelope = 1.0 + modulation_depth * keyed * np.sin(2 * np.pi * tone_hz * t)
+    
+    tone_power = modulation_depth ** 2 / 2
+    noise_sigma = np.sqrt(tone_power / 10 ** (snr_db / 10) / 2)
+    noise = noise_sigma * (rng.standard_normal(n_samples) + 1j * rng.standard_normal(n_samples))
+    
+    phase = rng.uniform(0, 2 * np.pi)
+    return (envelope * np.exp(1j * phase) + noise).astype(np.complex64)
+
+
+def _send_loop(config: FakeRadiodConfig, counters, stop_event, ready_event):
+    """Sender process body: paced packets for every channel until stopped."""
+    sr = config.sample_rate
+    spp = config.samples_per_packet
+    samples_per_minute = 60 * sr
+    interval = config.blocktime_ms / 1000.0
+    
+    # One minute per station type, shared by its channels, as float32 I/Q
+    minutes = {
+        station: synthesize_station_minute(station, sr, config.snr_db, config.seed + i).view(np.float32)
+        for i, station in enumerate(sorted({ch.station for ch in config.plan}))
+    }
+    rng = np.random.default_rng(config.seed)
+    
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+    if config.unicast:
+        dest = ('127.0.0.1', config.port)
+    else:
+        dest = (config.multicast_group, config.port)
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton('127.0.0.1'))
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 1)
+    
+    held: Dict[int, bytes] = {}   # ssrc -> packet held back for reordering
+    sent = lost = reordered = late_blocks = 0
+    ready_event.set()
+    
+    # Block n starts at wall time started + n * interval; RTP timestamp is
+    # the wall clock in samples, so minute boundaries fall on the tones
+    started = (time.time() // interval + 1) * interval
+    block = 0
+    while not stop_event.is_set():
+        block_time = started + block * interval
+        delay = block_time - time.time()
+        if delay > 0:
+            time.sleep(delay)
+        elif delay < -interval:
+            late_blocks += 1
+        
+        abs_sample = int(round(block_time * sr))
+        rtp_ts = abs_sample & 0xFFFFFFFF
+        offset = 2 * (abs_sample % samples_per_minute)
+        losses = rng.random(len(config.plan)) < config.loss
+        reorders = rng.random(len(config.plan)) < config.reorder
+        
+        for i, ch in enumerate(config.plan):
+            header = struct.pack('!BBHII', 0x80, PAYLOAD_TYPE_FLOAT, block & 0xFFFF, rtp_ts, ch.ssrc)
+            packet = header + minutes[ch.station][offset:offset + 2 * spp].tobytes()
+            previous = held.pop(ch.ssrc, None)
+            if losses[i]:
+                lost += 1
+            elif reorders[i] and previous is None:
+                held[ch.ssrc] = packet
+                reordered += 1
+            else:
+                sock.sendto(packet, dest)
+                sent += 1
+            if previous is not None:
+                sock.sendto(previous, dest)
+                sent += 1
+        
+        block += 1
+        if block % 50 == 0:
+            counters[:] = [sent, lost, reordered, late_blocks]
+    
+    for packet in held.values():
+        sock.sendto(packet, dest)
+        sent += 1
+    counters[:] = [sent, lost, reordered, late_blocks]
+    sock.close()
+
+
+class FakeRadiod:
+    """Paced multi-channel RTP sender in a child process."""
+    
+    def __init__(self, config: FakeRadiodConfig):
+        self.config = config
+        self.channels = config.plan
+        
+        ctx = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn')
+        self._counters = ctx.Array('q', len(_COUNTERS))
+        self._stop_event = ctx.Event()
+        self._ready_event = ctx.Event()
+        self._process = ctx.Process(
+            target=_send_loop,
+            args=(config, self._counters, self._stop_event, self._ready_event),
+            name='fake-radiod',
+            daemon=True
+        )
+        self.started_at: Optional[float] = None
+    
+    def start(self, timeout: float = 30.0):
+        """Start sending; returns once the signal tables are built."""
+        self._process.start()
+        if not self._ready_event.wait(timeout):
+            self.stop()
+            raise RuntimeError("Fake radiod did not start")
+        self.started_at = time.time()
+        logger.info(f"Fake radiod: {len(self.channels)} channels -> "
+                    f"{'127.0.0.1' if self.config.unicast else self.config.multicast_group}:{self.config.port}")
+    
+    def stop(self, timeout: float = 5.0) -> Dict[str, Any]:
+        """Stop sending and return the final statistics."""
+        self._stop_event.set()
+        if self._process.pid is not None:
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+        return self.get_stats()
+    
+    def channel_info(self, channel: FakeChannel):
+        """ka9q ChannelInfo for one channel, with a timing anchor matching the sender's RTP clock."""
+        from ka9q import ChannelInfo
+        from ka9q.rtp_recorder import GPS_LEAP_SECONDS, GPS_UTC_OFFSET
+        
+        now = time.time()
+        rtp_timesnap = int(round(now * self.config.sample_rate)) & 0xFFFFFFFF
+        gps_time = int(now * 1e9) - 1_000_000_000 * (GPS_UTC_OFFSET - GPS_LEAP_SECONDS)
+        return ChannelInfo(
+            ssrc=channel.ssrc,
+            preset='iq',
+            sample_rate=self.config.sample_rate,
+            frequency=channel.frequency_hz,
+            snr=self.config.snr_db,
+            multicast_address=self.config.multicast_group,
+            port=self.config.port,
+            gps_time=gps_time,
+            rtp_timesnap=rtp_timesnap,
+            encoding=ENCODING_F32LE,
+        )
+    
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(zip(_COUNTERS, self._counters[:]))
+        stats['channels'] = len(self.channels)
+        stats['elapsed_sec'] = time.time() - self.started_at if self.started_at else 0.0
+        return stats
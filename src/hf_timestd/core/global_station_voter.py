@@ -105,6 +105,24 @@ class StationAnchor:
         return max(SAMPLES_PER_MS, window_samples)
 
 
+@dataclass
+class CorrelationEnvelope:
+    """
+    One channel's tone correlation envelope for one minute.
+    
+    envelope[i] is the matched-filter output for a tone arriving at
+    start_offset_ms + i * bin_ms after the minute boundary, in units of
+    noise sigma (see MultiStationToneDetector._correlation_envelope).
+    """
+    channel: str
+    station: str
+    envelope: np.ndarray
+    start_offset_ms: float
+    bin_ms: float
+    predicted_delay_ms: float = 0.0  # Path delay used to align channels
+    reported_at: float = 0.0  # time.time() when shared
+
+
 @dataclass
 class MinuteState:
     """
@@ -123,13 +141,10 @@ class MinuteState:
     # Per-channel results
     channel_results: Dict[str, Any] = field(default_factory=dict)
     
-    # Correlation arrays for stacking (channel -> array)
-    wwv_correlations: Dict[str, np.ndarray] = field(default_factory=dict)
-    wwvh_correlations: Dict[str, np.ndarray] = field(default_factory=dict)
-    
-    # Stacking results (computed on demand)
-    stacked_wwv_correlation: Optional[np.ndarray] = None
-    stacked_wwvh_correlation: Optional[np.ndarray] = None
+    # Correlation envelopes for stacking (station -> channel -> envelope)
+    correlations: Dict[str, Dict[str, CorrelationEnvelope]] = field(
+        default_factory=lambda: defaultdict(dict)
+    )
     
     def get_anchor(self, station: str) -> Optional[StationAnchor]:
         """Get anchor for specified station"""
@@ -162,11 +177,22 @@ class VoterBackend:
         
     def get_anchors(self, minute_rtp: int) -> List[StationAnchor]:
         raise NotImplementedError
+    
+    def save_correlation(self, minute_rtp: int, envelope: CorrelationEnvelope):
+        raise NotImplementedError
+    
+    def get_correlations(self, minute_rtp: int, station: str) -> List[CorrelationEnvelope]:
+        raise NotImplementedError
+    
+    def prune(self, oldest_minute_rtp: int):
+        """Drop state for minutes before oldest_minute_rtp"""
+        pass
 
 class MemoryBackend(VoterBackend):
     """In-memory backend for single-process use (testing/monolithic)"""
     def __init__(self):
         self.anchors: Dict[int, List[StationAnchor]] = defaultdict(list)
+        self.correlations: Dict[int, Dict[Tuple[str, str], CorrelationEnvelope]] = defaultdict(dict)
         
     def save_anchor(self, minute_rtp: int, anchor: StationAnchor):
         # Remove existing anchor for this station/channel if present
@@ -179,6 +205,20 @@ class MemoryBackend(VoterBackend):
         
     def get_anchors(self, minute_rtp: int) -> List[StationAnchor]:
         return self.anchors[minute_rtp]
+    
+    def save_correlation(self, minute_rtp: int, envelope: CorrelationEnvelope):
+        self.correlations[minute_rtp][(envelope.station, envelope.channel)] = envelope
+    
+    def get_correlations(self, minute_rtp: int, station: str) -> List[CorrelationEnvelope]:
+        return [
+            env for (env_station, _), env in self.correlations.get(minute_rtp, {}).items()
+            if env_station == station
+        ]
+    
+    def prune(self, oldest_minute_rtp: int):
+        for store in (self.anchors, self.correlations):
+            for key in [k for k in store if k < oldest_minute_rtp]:
+                del store[key]
 
 class FileBackend(VoterBackend):
     """
@@ -263,6 +303,86 @@ class FileBackend(VoterBackend):
             logger.error(f"Failed to read anchors from IPC: {e}")
             
         return anchors
+    
+    def save_correlation(self, minute_rtp: int, envelope: CorrelationEnvelope):
+        """Save a correlation envelope as an uncompressed .npz (no pickle)"""
+        try:
+            minute_dir = self.root_dir / str(minute_rtp)
+            minute_dir.mkdir(parents=True, exist_ok=True)
+            
+            filename = f"corr_{envelope.station}_{envelope.channel.replace(' ', '_')}.npz"
+            filepath = minute_dir / filename
+            
+            # Atomic write: readers never see a partial file
+            tmp_path = minute_dir / f".{filename}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.savez(
+                    f,
+                    envelope=np.asarray(envelope.envelope, dtype=np.float32),
+                    meta=np.array([
+                        envelope.start_offset_ms,
+                        envelope.bin_ms,
+                        envelope.predicted_delay_ms,
+                        envelope.reported_at
+                    ]),
+                    channel=np.array(envelope.channel),
+                    station=np.array(envelope.station)
+                )
+            tmp_path.rename(filepath)
+        
+        except Exception as e:
+            logger.error(f"Failed to save correlation to IPC: {e}")
+    
+    def get_correlations(self, minute_rtp: int, station: str) -> List[CorrelationEnvelope]:
+        """Read all channels' correlation envelopes for a station and minute"""
+        envelopes = []
+        minute_dir = self.root_dir / str(minute_rtp)
+        
+        for filepath in minute_dir.glob(f"corr_{station}_*.npz"):
+            try:
+                with np.load(filepath, allow_pickle=False) as data:
+                    meta = data['meta']
+                    envelopes.append(CorrelationEnvelope(
+                        channel=str(data['channel']),
+                        station=str(data['station']),
+                        envelope=data['envelope'],
+                        start_offset_ms=float(meta[0]),
+                        bin_ms=float(meta[1]),
+                        predicted_delay_ms=float(meta[2]),
+                        reported_at=float(meta[3])
+                    ))
+            except (OSError, ValueError, KeyError, IndexError):
+                continue  # Pruned or corrupt file
+        
+        return envelopes
+    
+    def prune(self, oldest_minute_rtp: int):
+        """
+        Remove minute directories older than oldest_minute_rtp.
+        
+        Keeps /dev/shm bounded: the minute directories form a ring of the
+        last history_minutes minutes shared by all channel processes.
+        """
+        try:
+            entries = list(self.root_dir.iterdir())
+        except OSError:
+            return
+        
+        for minute_dir in entries:
+            try:
+                if int(minute_dir.name) >= oldest_minute_rtp:
+                    continue
+            except ValueError:
+                continue
+            for filepath in minute_dir.iterdir():
+                try:
+                    filepath.unlink()
+                except OSError:
+                    pass
+            try:
+                minute_dir.rmdir()
+            except OSError:
+                pass  # Another process is still writing to it
 
 
 class GlobalStationVoter:
@@ -280,7 +400,8 @@ class GlobalStationVoter:
         channels: List[str],
         sample_rate: int = 20000,
         history_minutes: int = 60,
-        use_ipc: bool = True
+        use_ipc: bool = True,
+        ipc_root: Optional[Path] = None
     ):
         """
         Initialize global voter.
@@ -290,15 +411,17 @@ class GlobalStationVoter:
             sample_rate: Sample rate for RTP calculations
             history_minutes: Number of minutes to keep in history
             use_ipc: If True, use /dev/shm for cross-process coordination
+            ipc_root: IPC directory (default /dev/shm/grape_voter)
         """
         self.channels = set(channels)
         self.sample_rate = sample_rate
         self.history_minutes = history_minutes
+        self.use_ipc = use_ipc
         
         # Select backend
         if use_ipc:
-            self.backend = FileBackend()
-            logger.info("GlobalStationVoter: Using FileBackend (IPC) at /dev/shm/grape_voter")
+            self.backend = FileBackend(ipc_root) if ipc_root else FileBackend()
+            logger.info(f"GlobalStationVoter: Using FileBackend (IPC) at {self.backend.root_dir}")
         else:
             self.backend = MemoryBackend()
             logger.info("GlobalStationVoter: Using MemoryBackend (Local)")
@@ -318,7 +441,10 @@ class GlobalStationVoter:
             'anchors_found': 0,
             'guided_searches': 0,
             'stacked_detections': 0,
-            'weak_channel_rescues': 0  # Detections that wouldn't exist without guidance
+            'weak_channel_rescues': 0,  # Detections that wouldn't exist without guidance
+            'stack_latency_ms': 0.0,  # Own envelope shared -> stacked result
+            'stack_latency_max_ms': 0.0,
+            'stack_compute_ms': 0.0
         }
         
         logger.info(f"GlobalStationVoter initialized with {len(channels)} channels")
@@ -365,6 +491,7 @@ class GlobalStationVoter:
             to_remove = sorted_keys[:-self.history_minutes]
             for key in to_remove:
                 del self.minute_states[key]
+            self.backend.prune(sorted_keys[-self.history_minutes])
 
     def _sync_from_backend(self, minute_rtp: int):
         """Update local state with anchors from backend"""
@@ -429,12 +556,48 @@ class GlobalStationVoter:
                 f"(quality={quality.value}, offset={toa_offset_samples} samples)"
             )
         
-        # Store correlation for stacking
+        # Store correlation for stacking (raw array: one sample per bin,
+        # starting at the minute boundary)
         if correlation_array is not None:
-            if station == 'WWV':
-                minute_state.wwv_correlations[channel] = correlation_array
-            elif station == 'WWVH':
-                minute_state.wwvh_correlations[channel] = correlation_array
+            self.report_correlation(
+                channel=channel,
+                rtp_timestamp=rtp_timestamp,
+                station=station,
+                envelope=correlation_array,
+                start_offset_ms=0.0,
+                bin_ms=1000.0 / self.sample_rate
+            )
+    
+    def report_correlation(
+        self,
+        channel: str,
+        rtp_timestamp: int,
+        station: str,
+        envelope: np.ndarray,
+        start_offset_ms: float,
+        bin_ms: float,
+        predicted_delay_ms: float = 0.0
+    ):
+        """
+        Share a channel's correlation envelope for cross-channel stacking.
+        
+        Reported every minute whether or not the channel detected anything:
+        weak channels are exactly the ones the stack is for.
+        """
+        minute_rtp = self._minute_rtp_key(rtp_timestamp)
+        minute_state = self._get_or_create_minute(minute_rtp)
+        
+        correlation = CorrelationEnvelope(
+            channel=channel,
+            station=station,
+            envelope=envelope,
+            start_offset_ms=start_offset_ms,
+            bin_ms=bin_ms,
+            predicted_delay_ms=predicted_delay_ms,
+            reported_at=time.time()
+        )
+        minute_state.correlations[station][channel] = correlation
+        self.backend.save_correlation(minute_rtp, correlation)
     
     def get_search_window(
         self,
@@ -486,57 +649,114 @@ class GlobalStationVoter:
         self,
         minute_rtp: int,
         station: str,
-        normalize: bool = True
+        normalize: bool = True,
+        channel: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """
-        Get coherently stacked correlation across all channels.
-        """
-        minute_key = self._minute_rtp_key(minute_rtp)
+        Get the incoherently stacked correlation across all channels.
         
-        if minute_key not in self.minute_states:
-            return None
+        Each channel's envelope is shifted by its predicted path delay so
+        all channels line up on the emission time, then summed. The stacked
+        peak is the common emission offset (clock error); a channel's own
+        arrival offset is peak_offset_ms + its predicted delay.
         
-        minute_state = self.minute_states[minute_key]
+        Envelopes from other processes are read from the backend once;
+        channels that have not shared this minute yet are left out rather
+        than waited for, so the caller never blocks.
         
-        # Get correlation arrays for this station
-        if station == 'WWV':
-            correlations = minute_state.wwv_correlations
-        elif station == 'WWVH':
-            correlations = minute_state.wwvh_correlations
-        else:
-            return None
+        Args:
+            minute_rtp: RTP timestamp in the minute
+            station: 'WWV', 'WWVH' or 'CHU'
+            normalize: Divide the sum by sqrt(N) so the stack stays in units
+                of noise sigma (envelopes are noise-normalized)
+            channel: Requesting channel (used for the latency metric)
+        """
+        minute_key = self._minute_rtp_key(minute_rtp)
+        minute_state = self._get_or_create_minute(minute_key)
+        local = minute_state.correlations[station]
+        
+        envelopes = dict(local)
+        for env in self.backend.get_correlations(minute_key, station):
+            envelopes.setdefault(env.channel, env)
         
-        if len(correlations) < 2:
+        if len(envelopes) < 2:
             # Need at least 2 channels to stack
             return None
-        
-        # Find common length (trim to shortest)
-        min_len = min(len(arr) for arr in correlations.values())
-        
-        # Stack correlations
-        stacked = np.zeros(min_len, dtype=np.float64)
-        for channel, arr in correlations.items():
-            # Normalize each channel's correlation to unit peak
-            arr_trimmed = arr[:min_len]
-            if normalize:
-                peak = np.max(np.abs(arr_trimmed))
-                if peak > 0:
-                    arr_trimmed = arr_trimmed / peak
-            stacked += arr_trimmed
-        
-        # Theoretical SNR improvement: sqrt(N) for incoherent stacking
-        n_channels = len(correlations)
-        snr_improvement_db = 10 * np.log10(n_channels)  # Best case
-        
+        result = self._stack_envelopes(list(envelopes.values()), normalize)
+        
+        own = envelopes.get(channel) if channel else None
+        if own is not None and own.reported_at:
+            latency_ms = (time.time() - own.reported_at) * 1000
+            result['latency_ms'] = latency_ms
+            self.stats['stack_latency_ms'] = latency_ms
+            self.stats['stack_latency_max_ms'] = max(self.stats['stack_latency_max_ms'], latency_ms)
+        self.stats['stack_compute_ms'] = result['compute_ms']
         self.stats['stacked_detections'] += 1
         
+        return result
+    
+    def _stack_envelopes(
+        self,
+        envelopes: List[CorrelationEnvelope],
+        normalize: bool
+    ) -> Dict[str, Any]:
+        """Align envelopes on emission time and sum them."""
+        started = time.perf_counter()
+        
+        # Common grid at the coarsest resolution, in emission-time offset
+        bin_ms = max(env.bin_ms for env in envelopes)
+        starts = [env.start_offset_ms - env.predicted_delay_ms for env in envelopes]
+        ends = [
+            start + len(env.envelope) * env.bin_ms
+            for start, env in zip(starts, envelopes)
+        ]
+        grid_start = min(starts)
+        n_bins = int(np.ceil((max(ends) - grid_start) / bin_ms))
+        
+        stacked = np.zeros(n_bins, dtype=np.float64)
+        coverage = np.zeros(n_bins, dtype=np.float64)
+        for start, env in zip(starts, envelopes):
+            values = np.asarray(env.envelope, dtype=np.float64)
+            if env.bin_ms != bin_ms:
+                # Resample finer envelopes onto the common grid
+                src = start + np.arange(len(values)) * env.bin_ms
+                dst = grid_start + np.arange(n_bins) * bin_ms
+                inside = (dst >= src[0]) & (dst <= src[-1])
+                stacked[inside] += np.interp(dst[inside], src, values)
+                coverage[inside] += 1
+            else:
+                first = int(round((start - grid_start) / bin_ms))
+                last = min(n_bins, first + len(values))
+                stacked[first:last] += values[:last - first]
+                coverage[first:last] += 1
+        
+        if normalize:
+            stacked = np.where(coverage > 0, stacked / np.sqrt(np.maximum(coverage, 1)), 0.0)
+        
+        peak_index = int(np.argmax(stacked))
+        
+        # Parabolic interpolation of the peak position
+        delta = 0.0
+        if 0 < peak_index < n_bins - 1:
+            y_m1, y_0, y_p1 = stacked[peak_index - 1:peak_index + 2]
+            denominator = y_m1 - 2 * y_0 + y_p1
+            if abs(denominator) > 1e-12:
+                delta = max(-0.5, min(0.5, 0.5 * (y_m1 - y_p1) / denominator))
+        
+        n_channels = len(envelopes)
         return {
             'stacked_correlation': stacked,
-            'channels_used': list(correlations.keys()),
+            'channels_used': [env.channel for env in envelopes],
             'n_channels': n_channels,
-            'snr_improvement_db': snr_improvement_db,
-            'peak_index': int(np.argmax(stacked)),
-            'peak_value': float(np.max(stacked))
+            # Incoherent stacking of equal-SNR channels: sqrt(N) in amplitude
+            'snr_improvement_db': 10 * np.log10(n_channels),
+            'peak_index': peak_index,
+            'peak_value': float(stacked[peak_index]),
+            'peak_sigma': float(stacked[peak_index]) if normalize else float('nan'),
+            'peak_offset_ms': grid_start + (peak_index + delta) * bin_ms,
+            'bin_ms': bin_ms,
+            'predicted_delays_ms': {env.channel: env.predicted_delay_ms for env in envelopes},
+            'compute_ms': (time.perf_counter() - started) * 1000
         }
     
     def get_minute_summary(self, minute_rtp: int) -> Optional[Dict[str, Any]]:
@@ -567,8 +787,8 @@ class GlobalStationVoter:
             'wwv_anchor': anchor_to_dict(minute_state.wwv_anchor),
             'wwvh_anchor': anchor_to_dict(minute_state.wwvh_anchor),
             'chu_anchor': anchor_to_dict(minute_state.chu_anchor),
-            'wwv_channels_with_correlation': list(minute_state.wwv_correlations.keys()),
-            'wwvh_channels_with_correlation': list(minute_state.wwvh_correlations.keys())
+            'wwv_channels_with_correlation': list(minute_state.correlations.get('WWV', {}).keys()),
+            'wwvh_channels_with_correlation': list(minute_state.correlations.get('WWVH', {}).keys())
         }
     
     def get_statistics(self) -> Dict[str, Any]:
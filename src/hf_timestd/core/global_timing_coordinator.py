@@ -5,32 +5,31 @@ Aggregates tone detections from all channels and runs the GlobalDifferentialSolv
 to produce a single, verified UTC(NIST) back-calculation.
 
 Architecture:
-- Each analytics service writes detections to: {data_root}/shared/detections/{minute}.json
+- Each analytics service appends its detections to: {data_root}/shared/detections/{minute}.jsonl
 - This coordinator polls the shared directory and runs global solve
 - Results written to: {data_root}/shared/global_timing.json
 
-The shared detection file format:
-{
-    "minute_utc": "2025-12-03T12:00:00Z",
-    "minute_boundary_rtp": 123456789,
-    "sample_rate": 20000,
-    "detections": [
-        {
-            "channel": "WWV 10 MHz",
-            "station": "WWV",
-            "frequency_mhz": 10.0,
-            "arrival_rtp": 123456900,
-            "snr_db": 15.2,
-            "timing_ms": 5.55,
-            "timestamp": "2025-12-03T12:00:05.123Z"
-        },
-        ...
-    ]
-}
+The shared detection store is append-only, one JSON record per line:
+
+    {"channel": "WWV 10 MHz", "station": "WWV", "frequency_mhz": 10.0,
+     "timing_error_ms": 5.55, "snr_db": 15.2, "timestamp": "2025-12-03T12:00:05.123Z"}
+
+Every channel process writes its records with a single write() on an
+O_APPEND descriptor. The kernel positions each append atomically, so
+concurrent writers never overwrite each other. With a shared
+read-modify-write JSON file, the last writer of a minute used to drop
+the other channels' detections. No lock or parse of the existing data is
+needed, and solve_minute gathers a minute with one read. If a channel
+writes a record again for the same (channel, station), the later record
+wins. A partial trailing line from an in-flight append is ignored. Legacy
+{minute}.json files are still read.
+
+Appends are atomic on local filesystems; the shared directory must not be on NFS.
 """
 
 import json
 import logging
+import os
 import time
 import math
 from pathlib import Path
@@ -115,6 +114,9 @@ class GlobalTimingCoordinator:
         logger.info(f"  Grid: {grid_square} → ({lat:.2f}, {lon:.2f})")
         logger.info(f"  Min channels: {min_channels}")
     
+    def _minute_stem(self, minute_utc: datetime) -> str:
+        return minute_utc.strftime("%Y%m%d_%H%M")
+    
     def write_detection(
         self,
         minute_utc: datetime,
@@ -125,9 +127,10 @@ class GlobalTimingCoordinator:
         snr_db: float = 0.0
     ) -> None:
         """
-        Write a detection from one channel to the shared file.
+        Append a detection from one channel to the minute's shared record file.
         
-        Called by each analytics service when it detects a tone.
+        Called by each analytics service when it detects a tone. Safe to call
+        concurrently from any number of processes.
         
         Args:
             minute_utc: UTC minute of detection
@@ -137,8 +140,7 @@ class GlobalTimingCoordinator:
             timing_error_ms: Timing error from detector (arrival - expected)
             snr_db: Signal-to-noise ratio
         """
-        minute_str = minute_utc.strftime("%Y%m%d_%H%M")
-        detection_file = self.detections_dir / f"{minute_str}.json"
+        detection_file = self.detections_dir / f"{self._minute_stem(minute_utc)}.jsonl"
         
         detection = {
             "channel": channel,
@@ -148,42 +150,53 @@ class GlobalTimingCoordinator:
             "snr_db": snr_db,
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
+        record = (json.dumps(detection, separators=(',', ':')) + '\n').encode()
         
-        # Read existing or create new
-        if detection_file.exists():
+        # One write() on an O_APPEND descriptor: positioned atomically, never interleaved
+        fd = os.open(detection_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            written = os.write(fd, record)
+        finally:
+            os.close(fd)
+        if written != len(record):
+            raise IOError(f"Short append to {detection_file}: {written}/{len(record)} bytes")
+        
+        logger.debug(f"Wrote detection: {channel} {station} {frequency_mhz}MHz → {timing_error_ms:.2f}ms")
+    
+    def read_detections(self, minute_utc: datetime) -> List[Dict]:
+        """
+        All detections of a minute, latest record per (channel, station).
+        
+        One read of the minute's record file (plus a legacy .json file if present).
+        """
+        stem = self._minute_stem(minute_utc)
+        latest: Dict[tuple, Dict] = {}
+        
+        legacy_file = self.detections_dir / f"{stem}.json"
+        if legacy_file.exists():
             try:
-                with open(detection_file) as f:
-                    data = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                data = None
-        else:
-            data = None
-        
-        if data is None:
-            data = {
-                "minute_utc": minute_utc.isoformat(),
-                "detections": []
-            }
-        
-        # Update or add detection for this channel
-        existing_idx = None
-        for i, d in enumerate(data["detections"]):
-            if d["channel"] == channel:
-                existing_idx = i
-                break
-        
-        if existing_idx is not None:
-            data["detections"][existing_idx] = detection
-        else:
-            data["detections"].append(detection)
+                with open(legacy_file) as f:
+                    for det in json.load(f).get("detections", []):
+                        latest[(det.get("channel"), det.get("station"))] = det
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning(f"Failed to read {legacy_file}: {e}")
         
-        # Write atomically
-        temp_file = detection_file.with_suffix('.tmp')
-        with open(temp_file, 'w') as f:
-            json.dump(data, f, indent=2)
-        temp_file.rename(detection_file)
+        try:
+            with open(self.detections_dir / f"{stem}.jsonl", 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b''
         
-        logger.debug(f"Wrote detection: {channel} {station} {frequency_mhz}MHz → {timing_ms:.2f}ms")
+        # Complete lines only: the last one may be an append in flight
+        for line in data.split(b'\n')[:-1]:
+            try:
+                det = json.loads(line)
+            except ValueError:
+                logger.debug(f"Skipping malformed detection record in {stem}.jsonl")
+                continue
+            latest[(det.get("channel"), det.get("station"))] = det
+        
+        return list(latest.values())
     
     def solve_minute(self, minute_utc: datetime) -> Optional[GlobalTimingResult]:
         """
@@ -191,20 +204,7 @@ class GlobalTimingCoordinator:
         
         Returns None if insufficient data.
         """
-        minute_str = minute_utc.strftime("%Y%m%d_%H%M")
-        detection_file = self.detections_dir / f"{minute_str}.json"
-        
-        if not detection_file.exists():
-            return None
-        
-        try:
-            with open(detection_file) as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Failed to read {detection_file}: {e}")
-            return None
-        
-        detections = data.get("detections", [])
+        detections = self.read_detections(minute_utc)
         
         if len(detections) < self.min_channels:
             logger.debug(f"Only {len(detections)} channels, need {self.min_channels}")
@@ -311,7 +311,7 @@ class GlobalTimingCoordinator:
         cutoff = time.time() - (max_age_hours * 3600)
         removed = 0
         
-        for f in self.detections_dir.glob("*.json"):
+        for f in self.detections_dir.glob("*.json*"):
             if f.stat().st_mtime < cutoff:
                 f.unlink()
                 removed += 1
@@ -107,6 +107,8 @@ from collections import deque
 
 import numpy as np
 
+from .checkpoint_service import get_checkpoint_service, load_checkpoint
+
 logger = logging.getLogger(__name__)
 
 
@@ -247,6 +249,7 @@ class GroundTruthValidator:
         self.data_dir = data_dir
         self.max_history = max_history
         self.auto_persist = auto_persist
+        self._checkpoints = get_checkpoint_service()
         
         # GPS PPS reference tracking
         self.gps_pps_events: deque = deque(maxlen=1000)
@@ -681,22 +684,20 @@ class GroundTruthValidator:
         return self.data_dir / f"validation_state_{self.receiver_id}.json"
     
     def _save_state(self) -> None:
-        """Save validation state to disk."""
+        """Queue a validation state snapshot with the checkpoint service."""
         state_file = self._get_state_file()
         if not state_file:
             return
         
         try:
-            state_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Convert deques to lists for JSON serialization
+            # Convert deques to lists for serialization
             state = {
                 'receiver_id': self.receiver_id,
                 'timestamp': datetime.now(timezone.utc).isoformat(),
                 'd_clock_validations': [asdict(v) for v in list(self.d_clock_validations)[-1000:]],
                 'discrimination_validations': [asdict(v) for v in list(self.discrimination_validations)[-1000:]],
                 'mode_validations': [asdict(v) for v in list(self.mode_validations)[-1000:]],
-                'discrimination_stats': self._discrimination_stats,
+                'discrimination_stats': dict(self._discrimination_stats),
                 'd_clock_stats': {
                     'count': self._d_clock_stats.count,
                     'mean': self._d_clock_stats.mean,
@@ -705,10 +706,7 @@ class GroundTruthValidator:
                 'calibration_history': list(self._calibration_history)
             }
             
-            with open(state_file, 'w') as f:
-                json.dump(state, f, indent=2, default=str)
-            
-            logger.debug(f"Saved validation state to {state_file}")
+            self._checkpoints.mark_dirty(state_file, state)
             
         except Exception as e:
             logger.warning(f"Failed to save validation state: {e}")
@@ -716,12 +714,13 @@ class GroundTruthValidator:
     def _load_state(self) -> None:
         """Load validation state from disk."""
         state_file = self._get_state_file()
-        if not state_file or not state_file.exists():
+        if not state_file:
             return
         
         try:
-            with open(state_file, 'r') as f:
-                state = json.load(f)
+            state = load_checkpoint(state_file)
+            if state is None:
+                return
             
             # Restore discrimination stats
             self._discrimination_stats = state.get('discrimination_stats', {'correct': 0, 'total': 0})
@@ -110,6 +110,8 @@ from enum import Enum
 
 import numpy as np
 
+from .bounded_cache import LRUDict
+
 logger = logging.getLogger(__name__)
 
 
@@ -232,8 +234,9 @@ class IonosphericModel:
         # Calibration storage: keyed by location hash
         self._calibration_data: Dict[str, list] = {}
         
-        # Cache for IRI results (avoid repeated calculations)
-        self._iri_cache: Dict[str, LayerHeights] = {}
+        # Cache for IRI results (avoid repeated calculations); keys include
+        # the 5-minute slot, so old entries are evicted rather than kept forever
+        self._iri_cache: Dict[str, LayerHeights] = LRUDict(maxsize=256)
         self._cache_ttl_seconds = 300  # 5 minute cache
         
         # Statistics
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+IQ Codec - lossless compression stage for complex64 IQ
+
+Generic zstd/lz4 sees complex64 IQ as near-random bytes. This codec first
+removes the redundancy specific to receiver IQ, then hands the result to
+zstd (whose Huffman/FSE stage is the entropy coder):
+
+    int     - Samples that are integers times (or divided by) a common
+              float32 scale - IQ converted from int16, e.g.
+              samples_int16.astype(np.float32) / 32768.0 - are stored as
+              the integers: zigzag-coded, optionally as first differences
+              (chosen per block when that is smaller), byte-shuffled into
+              planes so the mostly-zero high bytes compress to nothing.
+    float   - Everything else: float32 byte-shuffle (sign/exponent bytes
+              end up in their own plane), still lossless.
+
+The int path is taken only after verifying that decoding reproduces every
+float32 bit pattern (-0.0, NaN and non-representable values force float),
+so decode is always bit-exact.
+
+Block layout (little-endian):
+
+    magic    4s   b'HFIQ'
+    version  u1   1
+    method   u1   0 = float, 1 = int (multiply), 2 = int (divide)
+    order    u1   int: 0 = values, 1 = first differences
+    width    u1   bytes per value plane set (int: 2 or 4; float: 4)
+    samples  u4   complex samples in the block
+    scale    f4   int: sample = float32(q) * scale (or / scale)
+    payload       zstd frame of the byte planes
+
+Usage:
+    blob = encode_iq(samples)             # complex64 -> bytes
+    decode_iq_into(blob, out)             # bytes -> complex64 out[:n]
+    samples = decode_iq(blob)
+"""
+
+import struct
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+MAGIC = b'HFIQ'
+VERSION = 1
+METHOD_FLOAT = 0
+METHOD_INT = 1
+METHOD_INT_DIV = 2
+
+_HEADER = struct.Struct('<4sBBBBIf')
+
+# (scale, divide) tried before the data-derived scale: int16 full-scale
+# conventions (x / 32768.0 is exactly x * 2**-15)
+_COMMON_SCALES = ((2.0 ** -15, False), (32767.0, True), (1.0 / 32767.0, False), (1.0, False))
+
+# Values checked before verifying a candidate scale on the whole block
+_PROBE_VALUES = 512
+
+DEFAULT_LEVEL = 3
+
+_local = threading.local()
+
+
+def _compressor(level: int):
+    cache = getattr(_local, 'cctx', None)
+    if cache is None:
+        cache = _local.cctx = {}
+    if level not in cache:
+        cache[level] = zstd.ZstdCompressor(level=level)
+    return cache[level]
+
+
+def _decompressor():
+    dctx = getattr(_local, 'dctx', None)
+    if dctx is None:
+        dctx = _local.dctx = zstd.ZstdDecompressor()
+    return dctx
+
+
+def _exact_scale(values: np.ndarray, scale: float, divide: bool = False) -> Optional[np.ndarray]:
+    """Integers q with float32(q) * float32(scale) == values bit for bit, or None."""
+    scale32 = np.float32(scale)
+    if not np.isfinite(scale32) or scale32 == 0:
+        return None
+    with np.errstate(invalid='ignore', over='ignore'):
+        if divide:
+            q = np.rint(values.astype(np.float64) * float(scale32))
+        else:
+            q = np.rint(values.astype(np.float64) / float(scale32))
+    if not np.all(np.abs(q) < 2 ** 24):  # Also rejects NaN/inf
+        return None
+    q = q.astype(np.int32)
+    decoded = q.astype(np.float32) / scale32 if divide else q.astype(np.float32) * scale32
+    if not np.array_equal(decoded.view(np.uint32), values.view(np.uint32)):
+        return None
+    return q
+
+
+def detect_int_scale(values: np.ndarray) -> Optional[Tuple[float, bool]]:
+    """
+    Float32 scale under which the interleaved I/Q values are exact integers.
+    
+    Tries the common int16 conventions and the smallest nonzero magnitude,
+    first on a probe of the block, then on all of it.
+    
+    Returns:
+        (scale, divide) - values == float32(q) / scale if divide, else
+        float32(q) * scale - or None if there is no such scale
+    """
+    if len(values) == 0:
+        return 1.0, False
+    probe = values[:_PROBE_VALUES]
+    finite = probe[np.isfinite(probe)]
+    nonzero = np.abs(finite[finite != 0])
+    candidates = list(_COMMON_SCALES)
+    if len(nonzero):
+        candidates.append((float(nonzero.min()), False))
+    
+    for scale, divide in candidates:
+        if (_exact_scale(probe, scale, divide) is not None
+                and _exact_scale(values, scale, divide) is not None):
+            return float(np.float32(scale)), divide
+    return None
+
+
+def _zigzag(v: np.ndarray) -> np.ndarray:
+    v = v.astype(np.int64)
+    return ((v << 1) ^ (v >> 63)).astype(np.uint64)
+
+
+def _unzigzag(u: np.ndarray) -> np.ndarray:
+    u = u.astype(np.int64)
+    return (u >> 1) ^ -(u & 1)
+
+
+def _shuffle(u: np.ndarray, width: int) -> bytes:
+    """Byte planes of the low `width` bytes of each value, plane-major."""
+    b = u.astype(np.dtype(f'<u{width}')).view(np.uint8).reshape(-1, width)
+    return np.ascontiguousarray(b.T).tobytes()
+
+
+def _unshuffle(raw: bytes, count: int, width: int) -> np.ndarray:
+    planes = np.frombuffer(raw, dtype=np.uint8).reshape(width, count)
+    return np.ascontiguousarray(planes.T).view(np.dtype(f'<u{width}')).reshape(count)
+
+
+def encode_iq(samples: np.ndarray, level: int = DEFAULT_LEVEL) -> bytes:
+    """
+    Losslessly compress complex64 samples.
+    
+    Args:
+        samples: complex64 IQ
+        level: zstd level of the entropy stage
+    
+    Returns:
+        Encoded block (see module docstring)
+    """
+    if not ZSTD_AVAILABLE:
+        raise ImportError("zstandard required for the IQ codec")
+    
+    samples = np.ascontiguousarray(samples, dtype=np.complex64)
+    values = samples.view(np.float32)
+    n = len(samples)
+    
+    detected = detect_int_scale(values)
+    if detected is None:
+        header = _HEADER.pack(MAGIC, VERSION, METHOD_FLOAT, 0, 4, n, 0.0)
+        return header + _compressor(level).compress(_shuffle(values.view(np.uint32), 4))
+    
+    scale, divide = detected
+    q = _exact_scale(values, scale, divide).reshape(n, 2)
+    deltas = np.diff(q, axis=0, prepend=np.zeros((1, 2), dtype=np.int32))
+    
+    # First differences win for oversampled/narrowband IQ, lose for white noise
+    order = 1 if np.abs(deltas).sum(dtype=np.int64) < np.abs(q).sum(dtype=np.int64) else 0
+    u = _zigzag((deltas if order else q).reshape(-1))
+    width = 2 if n == 0 or u.max() < 1 << 16 else 4
+    
+    method = METHOD_INT_DIV if divide else METHOD_INT
+    header = _HEADER.pack(MAGIC, VERSION, method, order, width, n, scale)
+    return header + _compressor(level).compress(_shuffle(u, width))
+
+
+def decode_iq_into(blob: bytes, out: np.ndarray) -> int:
+    """
+    Decode a block into out (complex64, at least the block's sample count).
+    
+    Returns:
+        Number of samples written
+    """
+    if not ZSTD_AVAILABLE:
+        raise ImportError("zstandard required for the IQ codec")
+    if len(blob) < _HEADER.size:
+        raise ValueError("Truncated IQ codec block")
+    
+    magic, version, method, order, width, n, scale = _HEADER.unpack_from(blob)
+    if magic != MAGIC or version != VERSION or method not in (METHOD_FLOAT, METHOD_INT, METHOD_INT_DIV):
+        raise ValueError(f"Not an IQ codec block (magic {magic!r}, version {version}, method {method})")
+    if len(out) < n:
+        raise ValueError(f"Output holds {len(out)} samples, block has {n}")
+    
+    count = 2 * n
+    raw = _decompressor().decompress(memoryview(blob)[_HEADER.size:], max_output_size=count * width)
+    if len(raw) != count * width:
+        raise ValueError(f"IQ codec payload is {len(raw)} bytes, expected {count * width}")
+    
+    target = out[:n].view(np.float32)
+    if method == METHOD_FLOAT:
+        target.view(np.uint32)[:] = _unshuffle(raw, count, 4)
+        return n
+    
+    q = _unzigzag(_unshuffle(raw, count, width)).reshape(n, 2)
+    if order:
+        q = np.cumsum(q, axis=0)
+    q = q.reshape(-1).astype(np.float32)
+    if method == METHOD_INT_DIV:
+        target[:] = q / np.float32(scale)
+    else:
+        target[:] = q * np.float32(scale)
+    return n
+
+
+def decode_iq(blob: bytes) -> np.ndarray:
+    """Decode a block into a new complex64 array."""
+    n = _HEADER.unpack_from(blob)[5] if len(blob) >= _HEADER.size else 0
+    out = np.empty(n, dtype=np.complex64)
+    decode_iq_into(blob, out)
+    return out
+
+
+def block_method(blob: bytes) -> str:
+    """'int' or 'float' (for statistics and benchmarks)."""
+    return 'float' if _HEADER.unpack_from(blob)[2] == METHOD_FLOAT else 'int'
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Memory Soak - per-component allocation tracking for long-run growth checks
+
+A recorder that runs for weeks must not retain anything per minute
+without a bound. The soak harness (scripts/soak_memory.py) replays
+synthetic minutes through Phase 2 and fusion and takes a checkpoint every
+few minutes; this module does the bookkeeping:
+
+- components: named groups of source files. At each checkpoint the live
+  tracemalloc traces with any frame in a component's files are summed, so
+  e.g. numpy scalars kept by the discriminator count as 'discrimination'.
+- probes: named structures whose len() is recorded, with an optional
+  bound (read from maxsize/maxlen when the structure has one).
+
+GrowthReport flags a component whose retained bytes still rise by more
+than max_growth_bytes per replayed minute over the second half of the
+run (after any bounded structure has filled), and a probe that exceeds its
+bound or, without one, is still growing over the second half.
+
+Usage:
+    tracker = AllocationTracker({'fusion': ['*/multi_broadcast_fusion.py']})
+    tracker.probe('processed_minutes', service.processed_minutes)
+    tracker.start()
+    for minute in range(n):
+        replay(minute)
+        if minute % 5 == 0:
+            tracker.checkpoint(minute)
+    report = tracker.report(max_growth_bytes=512)
+    tracker.stop()
+"""
+
+import fnmatch
+import gc
+import logging
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SeriesGrowth:
+    """Growth of one component (bytes) or probe (entries) over a soak."""
+    name: str
+    kind: str                      # 'component' or 'probe'
+    first: float
+    last: float
+    peak: float
+    slope_per_minute: float        # Over the second half of the run
+    bound: Optional[int] = None
+    unbounded: bool = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'kind': self.kind,
+            'first': self.first,
+            'last': self.last,
+            'peak': self.peak,
+            'slope_per_minute': round(self.slope_per_minute, 2),
+            'bound': self.bound,
+            'unbounded': self.unbounded,
+        }
+
+
+@dataclass
+class GrowthReport:
+    """Result of a soak: per-component and per-probe growth."""
+    minutes: int
+    checkpoints: int
+    series: List[SeriesGrowth] = field(default_factory=list)
+    
+    @property
+    def unbounded(self) -> List[SeriesGrowth]:
+        return [s for s in self.series if s.unbounded]
+    
+    @property
+    def passed(self) -> bool:
+        return not self.unbounded
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'minutes': self.minutes,
+            'checkpoints': self.checkpoints,
+            'passed': self.passed,
+            'series': [s.to_dict() for s in self.series],
+        }
+
+
+def _second_half_slope(points: List[Tuple[int, float]]) -> float:
+    """Least-squares slope (per step) over the second half of the points."""
+    half = points[len(points) // 2:]
+    if len(half) < 2:
+        return 0.0
+    x = np.array([p[0] for p in half], dtype=float)
+    y = np.array([p[1] for p in half], dtype=float)
+    if np.ptp(x) == 0:
+        return 0.0
+    return float(np.polyfit(x, y, 1)[0])
+
+
+class AllocationTracker:
+    """tracemalloc checkpoints grouped by component, plus structure probes."""
+    
+    def __init__(self, components: Dict[str, List[str]], nframe: int = 25):
+        """
+        Args:
+            components: Component name -> filename glob patterns
+                (e.g. '*/multi_broadcast_fusion.py')
+            nframe: Frames kept per traceback; allocations are attributed
+                to every component with a file anywhere in the stack
+        """
+        self.components = components
+        self.nframe = nframe
+        self._probes: Dict[str, Tuple[Callable[[], int], Optional[int]]] = {}
+        self.samples: Dict[str, List[Tuple[int, float]]] = {name: [] for name in components}
+        self.samples['total'] = []
+        self.probe_samples: Dict[str, List[Tuple[int, float]]] = {}
+        self._file_owners: Dict[str, Tuple[str, ...]] = {}
+        self._started_tracing = False
+    
+    def probe(self, name: str, target: Union[Callable[[], int], Any], bound: Optional[int] = None):
+        """
+        Record len(target) (or target() if callable) at each checkpoint.
+        
+        The bound defaults to target.maxsize / target.maxlen when present.
+        """
+        if bound is None:
+            bound = getattr(target, 'maxsize', None) or getattr(target, 'maxlen', None)
+        fn = target if callable(target) and not hasattr(target, '__len__') else (lambda t=target: len(t))
+        self._probes[name] = (fn, bound)
+        self.probe_samples[name] = []
+    
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframe)
+            self._started_tracing = True
+    
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+    
+    def _owners(self, filename: str) -> Tuple[str, ...]:
+        """Components a source file belongs to (cached)."""
+        owners = self._file_owners.get(filename)
+        if owners is None:
+            owners = tuple(name for name, patterns in self.components.items()
+                           if any(fnmatch.fnmatch(filename, p) for p in patterns))
+            self._file_owners[filename] = owners
+        return owners
+    
+    def checkpoint(self, minute: int):
+        """Snapshot retained allocations per component and probe lengths."""
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot()
+        totals = {name: 0 for name in self.components}
+        total = 0
+        for trace in snapshot.traces:
+            total += trace.size
+            owners = set()
+            for frame in trace.traceback:
+                owners.update(self._owners(frame.filename))
+            for name in owners:
+                totals[name] += trace.size
+        for name, size in totals.items():
+            self.samples[name].append((minute, float(size)))
+        self.samples['total'].append((minute, float(total)))
+        
+        for name, (fn, _) in self._probes.items():
+            try:
+                self.probe_samples[name].append((minute, float(fn())))
+            except Exception as e:
+                logger.warning(f"Probe {name} failed: {e}")
+    
+    def report(self, max_growth_bytes: float = 512.0, minutes: Optional[int] = None) -> GrowthReport:
+        """
+        Evaluate growth.
+        
+        Args:
+            max_growth_bytes: Retained bytes per replayed minute a component
+                may still gain over the second half of the run
+            minutes: Replayed minutes (for the report only)
+        """
+        checkpoints = len(self.samples['total'])
+        report = GrowthReport(minutes=minutes or 0, checkpoints=checkpoints)
+        
+        for name, points in self.samples.items():
+            if not points:
+                continue
+            slope = _second_half_slope(points)
+            report.series.append(SeriesGrowth(
+                name=name,
+                kind='component',
+                first=points[0][1],
+                last=points[-1][1],
+                peak=max(p[1] for p in points),
+                slope_per_minute=slope,
+                # 'total' includes interpreter noise; reported, not judged
+                unbounded=name != 'total' and slope > max_growth_bytes
+            ))
+        
+        for name, points in self.probe_samples.items():
+            if not points:
+                continue
+            _, bound = self._probes[name]
+            peak = max(p[1] for p in points)
+            mid = points[len(points) // 2][1]
+            if bound is not None:
+                unbounded = peak > bound
+            else:
+                unbounded = len(points) >= 3 and points[-1][1] > mid
+            report.series.append(SeriesGrowth(
+                name=name,
+                kind='probe',
+                first=points[0][1],
+                last=points[-1][1],
+                peak=peak,
+                slope_per_minute=_second_half_slope(points),
+                bound=bound,
+                unbounded=unbounded
+            ))
+        return report
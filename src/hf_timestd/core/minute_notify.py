@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Minute Notify - minute-complete notifications from Phase 2 to fusion
+
+Each Phase 2 analytics service runs in its own process and appends one
+row per minute to phase2/{CHANNEL}/clock_offset/clock_offset_series.csv.
+Instead of the fusion service re-reading those CSVs on a fixed sleep, a
+channel announces each finished minute with one datagram on a Unix socket:
+
+    {data_root}/status/minute-complete.sock
+
+- MinuteNotifier (Phase 2 side): fire-and-forget, non-blocking. With no
+  fusion service listening the datagram is simply dropped, so Phase 2 never
+  waits on fusion.
+- MinuteCompleteListener (fusion side): binds the socket; its fileno() goes
+  into select() next to the fallback deadline.
+- FusionTrigger: decides when a minute is ready to fuse - as soon as every
+  active channel has reported it, or late_sec after its first report if some
+  channels are late. Channels that stop reporting drop out of the active
+  set after a few minutes, so a dead receiver does not delay every minute.
+  Without any reports (e.g. producers that predate this module) it falls
+  back to a plain fallback_sec interval.
+
+Usage:
+    # Phase 2 process
+    notifier = MinuteNotifier(data_root)
+    notifier.notify('WWV_10_MHz', minute_boundary)
+    
+    # Fusion process
+    listener = MinuteCompleteListener(data_root)
+    trigger = FusionTrigger(expected_channels=fusion.channels)
+    while running:
+        select.select([listener], [], [], trigger.next_deadline() - time.time())
+        for channel, minute in listener.read():
+            trigger.report(channel, minute)
+        fire = trigger.due()
+        if fire:
+            fuse(fire[0])
+"""
+
+import errno
+import json
+import logging
+import os
+import socket
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+MINUTE_SOCKET_NAME = 'minute-complete.sock'
+
+# Sender errors that just mean "nobody is listening right now"
+_NO_LISTENER_ERRNOS = (errno.ENOENT, errno.ECONNREFUSED, errno.EAGAIN, errno.ENOBUFS)
+
+
+def minute_socket_path(data_root: Path) -> Path:
+    """Rendezvous socket of the minute-complete notifications."""
+    return Path(data_root) / 'status' / MINUTE_SOCKET_NAME
+
+
+class MinuteNotifier:
+    """Announces finished minutes of one channel to the fusion service."""
+    
+    def __init__(self, data_root: Path):
+        self.socket_path = minute_socket_path(data_root)
+        self._sock: Optional[socket.socket] = None
+        
+        # Statistics
+        self.sent = 0
+        self.dropped = 0
+    
+    def notify(self, channel: str, minute_boundary: int) -> bool:
+        """
+        Send (channel, minute) to the fusion service. Never blocks.
+        
+        Returns:
+            True if the datagram was delivered to a listener
+        """
+        if not hasattr(socket, 'AF_UNIX'):
+            return False
+        if self._sock is None:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            self._sock.setblocking(False)
+        message = json.dumps({
+            'channel': channel,
+            'minute': int(minute_boundary),
+            'sent': time.time(),
+        }).encode()
+        try:
+            self._sock.sendto(message, str(self.socket_path))
+        except OSError as e:
+            if e.errno not in _NO_LISTENER_ERRNOS:
+                logger.debug(f"Minute notification failed: {e}")
+            self.dropped += 1
+            return False
+        self.sent += 1
+        return True
+    
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+class MinuteCompleteListener:
+    """Receives minute-complete datagrams (fusion side)."""
+    
+    def __init__(self, data_root: Path):
+        self.socket_path = minute_socket_path(data_root)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self.socket_path.unlink()  # Stale socket of a previous run
+        except FileNotFoundError:
+            pass
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.bind(str(self.socket_path))
+        self._sock.setblocking(False)
+        
+        # Statistics
+        self.received = 0
+        self.malformed = 0
+    
+    def fileno(self) -> int:
+        return self._sock.fileno()
+    
+    def read(self) -> List[Tuple[str, int]]:
+        """Drain pending notifications as (channel, minute_boundary)."""
+        reports = []
+        while True:
+            try:
+                data = self._sock.recv(4096)
+            except (BlockingIOError, InterruptedError):
+                break
+            if not data:
+                continue  # wake()
+            try:
+                message = json.loads(data)
+                reports.append((str(message['channel']), int(message['minute'])))
+                self.received += 1
+            except (ValueError, KeyError, TypeError):
+                self.malformed += 1
+        return reports
+    
+    def wake(self):
+        """Interrupt a select() on this listener (e.g. to stop)."""
+        try:
+            self._sock.sendto(b'', str(self.socket_path))
+        except OSError:
+            pass
+    
+    def close(self):
+        self._sock.close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+class FusionTrigger:
+    """
+    When to fuse: per-minute completion tracking with deadline fallbacks.
+    
+    Times are wall-clock (time.time()), matching minute boundaries.
+    """
+    
+    def __init__(
+        self,
+        expected_channels: Iterable[str] = (),
+        late_sec: float = 15.0,
+        fallback_sec: float = 60.0,
+        channel_ttl_minutes: int = 3
+    ):
+        """
+        Args:
+            expected_channels: Channels assumed active at startup (until they
+                miss channel_ttl_minutes minutes)
+            late_sec: Wait this long after a minute's first report for the
+                remaining channels
+            fallback_sec: Fuse at this interval when no reports arrive at all
+            channel_ttl_minutes: Minutes without a report before a channel
+                stops being waited for
+        """
+        self.late_sec = late_sec
+        self.fallback_sec = fallback_sec
+        self.channel_ttl_sec = channel_ttl_minutes * 60
+        
+        now = time.time()
+        self._last_report: Dict[str, float] = {ch: now for ch in expected_channels}
+        self._pending: Dict[int, Set[str]] = {}       # minute -> channels reported
+        self._first_report: Dict[int, float] = {}     # minute -> wall time
+        self._last_fused_minute: Optional[int] = None
+        self._last_fire = now
+        
+        # Statistics
+        self.fired_complete = 0
+        self.fired_deadline = 0
+        self.fired_fallback = 0
+        self.late_reports = 0
+    
+    def active_channels(self, now: Optional[float] = None) -> Set[str]:
+        """Channels that reported within the TTL."""
+        now = time.time() if now is None else now
+        return {ch for ch, t in self._last_report.items() if now - t <= self.channel_ttl_sec}
+    
+    def report(self, channel: str, minute: int, now: Optional[float] = None):
+        """Record that a channel finished a minute."""
+        now = time.time() if now is None else now
+        self._last_report[channel] = now
+        if self._last_fused_minute is not None and minute <= self._last_fused_minute:
+            self.late_reports += 1  # Already fused (or a backfilled minute)
+            return
+        if minute not in self._pending:
+            self._pending[minute] = set()
+            self._first_report[minute] = now
+        self._pending[minute].add(channel)
+    
+    def next_deadline(self) -> float:
+        """Wall time by which due() must be called next."""
+        if self._first_report:
+            return min(self._first_report.values()) + self.late_sec
+        return self._last_fire + self.fallback_sec
+    
+    def due(self, now: Optional[float] = None) -> Optional[Tuple[Optional[int], str]]:
+        """
+        The minute to fuse now, if any, as (minute, reason) with reason
+        'complete', 'deadline' or 'fallback' (minute None). Older minutes
+        still pending are superseded: one fusion covers the lookback window.
+        """
+        now = time.time() if now is None else now
+        active = self.active_channels(now)
+        ready = None
+        for minute in sorted(self._pending):
+            if self._pending[minute] >= active:
+                ready = (minute, 'complete')
+            elif now >= self._first_report[minute] + self.late_sec:
+                ready = (minute, 'deadline')
+        
+        if ready is not None:
+            minute, reason = ready
+            for m in [m for m in self._pending if m <= minute]:
+                del self._pending[m]
+                del self._first_report[m]
+            self._last_fused_minute = minute
+            self._last_fire = now
+            if reason == 'complete':
+                self.fired_complete += 1
+            else:
+                self.fired_deadline += 1
+            return ready
+        
+        if not self._pending and now >= self._last_fire + self.fallback_sec:
+            self._last_fire = now
+            self.fired_fallback += 1
+            return (None, 'fallback')
+        return None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'active_channels': len(self.active_channels()),
+            'pending_minutes': len(self._pending),
+            'last_fused_minute': self._last_fused_minute,
+            'fired_complete': self.fired_complete,
+            'fired_deadline': self.fired_deadline,
+            'fired_fallback': self.fired_fallback,
+            'late_reports': self.late_reports,
+        }
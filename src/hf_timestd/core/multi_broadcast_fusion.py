@@ -106,6 +106,9 @@ Continuous service mode (typical):
         --data-root /data \\
         --interval 60
 
+Fusion runs when the Phase 2 channels report a finished minute (see
+minute_notify); --interval is the fallback period without reports.
+
 Programmatic usage:
 
     fusion = MultiBroadcastFusion(data_root=Path('/data'))
@@ -375,15 +378,16 @@ class MultiBroadcastFusion:
     
     def _read_latest_measurements(
         self, 
-        lookback_minutes: int = 5
+        lookback_minutes: int = 5,
+        now: Optional[float] = None
     ) -> List[BroadcastMeasurement]:
         """
         Read latest D_clock measurements from all channels.
         
-        Returns measurements from the last N minutes.
+        Returns measurements from the N minutes before now.
         """
         measurements = []
-        now = time.time()
+        now = time.time() if now is None else now
         cutoff = now - (lookback_minutes * 60)
         
         for channel in self.channels:
@@ -667,18 +671,23 @@ class MultiBroadcastFusion:
         
         return max(kalman_uncertainty, min_uncertainty)
     
-    def fuse(self, lookback_minutes: int = 10) -> Optional[FusedResult]:
+    def fuse(self, lookback_minutes: int = 10, now: Optional[float] = None) -> Optional[FusedResult]:
         """
         Perform multi-broadcast fusion.
         
         Combines all available broadcasts into a single D_clock estimate
         that converges toward UTC(NIST).
         
+        Args:
+            lookback_minutes: Fuse measurements from this many minutes
+            now: End of the lookback window (default: current time; set
+                when replaying past minutes)
+        
         Returns:
             FusedResult with fused D_clock and statistics
         """
         # Read latest measurements
-        measurements = self._read_latest_measurements(lookback_minutes)
+        measurements = self._read_latest_measurements(lookback_minutes, now)
         
         if not measurements:
             logger.debug("No measurements available for fusion")
@@ -913,17 +922,186 @@ class MultiBroadcastFusion:
         }
 
 
-def run_fusion_service(data_root: Path, interval_sec: float = 60.0, enable_chrony: bool = True):
+class FusionService:
+    """
+    Continuous fusion, triggered by Phase 2 minute-complete notifications.
+    
+    A minute is fused as soon as every active channel has reported it
+    (FusionTrigger), or late_sec after its first report; with no reports
+    at all it falls back to fusing every interval_sec. The time from the
+    end of the minute to the Chrony SHM update is recorded in the stage
+    timing registry ('minute_to_shm', also 'minute_to_fusion') and
+    published in status/fusion-status.json.
+    """
+    
+    def __init__(
+        self,
+        fusion: MultiBroadcastFusion,
+        chrony_shm=None,
+        interval_sec: float = 60.0,
+        late_sec: float = 15.0,
+        listen: bool = True
+    ):
+        """
+        Args:
+            fusion: Fusion engine
+            chrony_shm: Connected ChronySHM (or None)
+            interval_sec: Fallback fusion interval without notifications
+            late_sec: Wait for late channels this long after a minute's first report
+            listen: Bind the minute-complete socket (False: interval only)
+        """
+        from .minute_notify import FusionTrigger, MinuteCompleteListener
+        from .stage_timing import get_stage_timing
+        
+        self.fusion = fusion
+        self.chrony_shm = chrony_shm
+        self.trigger = FusionTrigger(
+            expected_channels=fusion.channels,
+            late_sec=late_sec,
+            fallback_sec=interval_sec
+        )
+        self.listener = None
+        if listen:
+            try:
+                self.listener = MinuteCompleteListener(fusion.data_root)
+            except OSError as e:
+                logger.warning(f"Minute-complete socket unavailable ({e}) - fusing every {interval_sec}s")
+        
+        self.stage_timing = get_stage_timing()
+        self.stage_timing.service = 'fusion'
+        self.status_file = fusion.data_root / 'status' / 'fusion-status.json'
+        self.running = False
+        self.last_result: Optional[FusedResult] = None
+    
+    def run(self):
+        """Wait for minute notifications / deadlines and fuse until stop()."""
+        import select
+        
+        self.running = True
+        try:
+            while self.running:
+                timeout = max(0.0, self.trigger.next_deadline() - time.time())
+                if self.listener is not None:
+                    select.select([self.listener], [], [], timeout)
+                    for channel, minute in self.listener.read():
+                        self.trigger.report(channel, minute)
+                else:
+                    time.sleep(min(timeout, 1.0))
+                
+                fire = self.trigger.due() if self.running else None
+                if fire is None:
+                    continue
+                minute, reason = fire
+                try:
+                    self.fuse_and_publish(minute, reason)
+                except Exception as e:
+                    logger.error(f"Fusion error: {e}")
+        finally:
+            if self.listener is not None:
+                self.listener.close()
+    
+    def stop(self):
+        """Make run() return."""
+        self.running = False
+        if self.listener is not None:
+            self.listener.wake()
+    
+    def fuse_and_publish(self, minute: Optional[int] = None, reason: str = 'fallback') -> Optional[FusedResult]:
+        """Fuse, update Chrony SHM and record latency from the end of minute."""
+        result = self.fusion.fuse()
+        minute_end = minute + 60 if minute is not None else None
+        if minute_end is not None:
+            self.stage_timing.record('minute_to_fusion', time.time() - minute_end)
+        
+        if result:
+            self.last_result = result
+            self._log_result(result, reason)
+            
+            # Write to Chrony SHM if available and quality is acceptable
+            # Allow grade D during initial calibration - Chrony will weight by precision
+            if self.chrony_shm and result.quality_grade in ('A', 'B', 'C', 'D'):
+                # D_clock = T_system - T_UTC(NIST)
+                # So T_UTC(NIST) = T_system - D_clock
+                system_time = time.time()
+                reference_time = system_time - (result.d_clock_fused_ms / 1000.0)
+                
+                # Precision based on uncertainty (log2 of seconds)
+                # uncertainty_ms=1 -> precision=-10, uncertainty_ms=10 -> precision=-7
+                precision = max(-13, min(-4, int(-10 - np.log2(max(0.1, result.uncertainty_ms)))))
+                
+                if self.chrony_shm.update(reference_time, system_time, precision):
+                    logger.debug(f"Chrony SHM updated: ref={reference_time:.6f}, precision={precision}")
+                    if minute_end is not None:
+                        self.stage_timing.record('minute_to_shm', time.time() - minute_end)
+        
+        self._write_status()
+        return result
+    
+    @staticmethod
+    def _log_result(result: FusedResult, reason: str):
+        # Log main fusion result
+        logger.info(
+            f"Fused D_clock: {result.d_clock_fused_ms:+.3f} ms "
+            f"(raw: {result.d_clock_raw_ms:+.3f} ms) "
+            f"± {result.uncertainty_ms:.3f} ms "
+            f"[{result.n_broadcasts} broadcasts, grade {result.quality_grade}, {reason}]"
+        )
+        
+        # Log consistency check results
+        intra_stds = []
+        if result.wwv_intra_std_ms is not None:
+            intra_stds.append(f"WWV={result.wwv_intra_std_ms:.1f}")
+        if result.wwvh_intra_std_ms is not None:
+            intra_stds.append(f"WWVH={result.wwvh_intra_std_ms:.1f}")
+        if result.chu_intra_std_ms is not None:
+            intra_stds.append(f"CHU={result.chu_intra_std_ms:.1f}")
+        
+        if intra_stds:
+            spread = result.inter_station_spread_ms
+            spread_str = f"{spread:.1f}" if spread is not None else "N/A"  # One station only
+            logger.debug(
+                f"  Intra-station σ: {', '.join(intra_stds)} ms | "
+                f"Inter-station spread: {spread_str} ms | "
+                f"Flag: {result.consistency_flag}"
+            )
+        
+        if result.consistency_flag != 'OK':
+            logger.warning(f"  ⚠️ Consistency: {result.consistency_flag}")
+    
+    def _write_status(self):
+        """Trigger statistics and latency histograms for stage_timing's /metrics."""
+        try:
+            status = {
+                'service': 'fusion',
+                'timestamp': time.time(),
+                'trigger': self.trigger.get_stats(),
+                'notifications_received': self.listener.received if self.listener else 0,
+                'chrony_shm': self.chrony_shm is not None,
+                'stage_timing': self.stage_timing.snapshot(),
+            }
+            self.status_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.status_file.with_suffix('.tmp')
+            with open(temp_file, 'w') as f:
+                json.dump(status, f, indent=2)
+            temp_file.replace(self.status_file)
+        except Exception as e:
+            logger.error(f"Failed to write fusion status: {e}")
+
+
+def run_fusion_service(data_root: Path, interval_sec: float = 60.0, enable_chrony: bool = True,
+                       late_sec: float = 15.0):
     """
     Run continuous fusion service.
     
-    Produces fused D_clock estimate every interval_sec.
+    Fuses as Phase 2 channels report finished minutes (see FusionService),
+    falling back to every interval_sec without reports.
     Optionally writes to Chrony SHM refclock for system clock discipline.
     
     Args:
         data_root: Base data directory
-        interval_sec: Fusion interval in seconds
+        interval_sec: Fallback fusion interval in seconds
         enable_chrony: If True, write fused time to Chrony SHM refclock
+        late_sec: Seconds to wait for late channels after a minute's first report
     """
     fusion = MultiBroadcastFusion(data_root)
     
@@ -942,66 +1120,19 @@ def run_fusion_service(data_root: Path, interval_sec: float = 60.0, enable_chron
             logger.warning(f"Chrony SHM not available: {e}")
             chrony_shm = None
     
+    service = FusionService(fusion, chrony_shm, interval_sec=interval_sec, late_sec=late_sec)
+    
     logger.info("Starting Multi-Broadcast Fusion Service")
-    logger.info(f"  Interval: {interval_sec} seconds")
+    logger.info(f"  Trigger: minute-complete notifications "
+                f"({'listening' if service.listener else 'unavailable'}), late after {late_sec}s, "
+                f"fallback every {interval_sec}s")
     logger.info(f"  Output: {fusion.fusion_csv}")
     logger.info(f"  Chrony SHM: {'enabled' if chrony_shm else 'disabled'}")
     
-    while True:
-        try:
-            result = fusion.fuse()
-            
-            if result:
-                # Log main fusion result
-                logger.info(
-                    f"Fused D_clock: {result.d_clock_fused_ms:+.3f} ms "
-                    f"(raw: {result.d_clock_raw_ms:+.3f} ms) "
-                    f"± {result.uncertainty_ms:.3f} ms "
-                    f"[{result.n_broadcasts} broadcasts, grade {result.quality_grade}]"
-                )
-                
-                # Log consistency check results
-                intra_stds = []
-                if result.wwv_intra_std_ms is not None:
-                    intra_stds.append(f"WWV={result.wwv_intra_std_ms:.1f}")
-                if result.wwvh_intra_std_ms is not None:
-                    intra_stds.append(f"WWVH={result.wwvh_intra_std_ms:.1f}")
-                if result.chu_intra_std_ms is not None:
-                    intra_stds.append(f"CHU={result.chu_intra_std_ms:.1f}")
-                
-                if intra_stds:
-                    logger.debug(
-                        f"  Intra-station σ: {', '.join(intra_stds)} ms | "
-                        f"Inter-station spread: {result.inter_station_spread_ms:.1f} ms | "
-                        f"Flag: {result.consistency_flag}"
-                    )
-                
-                if result.consistency_flag != 'OK':
-                    logger.warning(f"  ⚠️ Consistency: {result.consistency_flag}")
-                
-                # Write to Chrony SHM if available and quality is acceptable
-                # Allow grade D during initial calibration - Chrony will weight by precision
-                if chrony_shm and result.quality_grade in ('A', 'B', 'C', 'D'):
-                    # D_clock = T_system - T_UTC(NIST)
-                    # So T_UTC(NIST) = T_system - D_clock
-                    system_time = time.time()
-                    reference_time = system_time - (result.d_clock_fused_ms / 1000.0)
-                    
-                    # Precision based on uncertainty (log2 of seconds)
-                    # uncertainty_ms=1 -> precision=-10, uncertainty_ms=10 -> precision=-7
-                    precision = max(-13, min(-4, int(-10 - np.log2(max(0.1, result.uncertainty_ms)))))
-                    
-                    if chrony_shm.update(reference_time, system_time, precision):
-                        logger.debug(f"Chrony SHM updated: ref={reference_time:.6f}, precision={precision}")
-            
-            time.sleep(interval_sec)
-            
-        except KeyboardInterrupt:
-            logger.info("Fusion service stopped")
-            break
-        except Exception as e:
-            logger.error(f"Fusion error: {e}")
-            time.sleep(interval_sec)
+    try:
+        service.run()
+    except KeyboardInterrupt:
+        logger.info("Fusion service stopped")
 
 
 if __name__ == '__main__':
@@ -1009,7 +1140,10 @@ if __name__ == '__main__':
     
     parser = argparse.ArgumentParser(description='Multi-Broadcast D_clock Fusion')
     parser.add_argument('--data-root', type=Path, required=True)
-    parser.add_argument('--interval', type=float, default=60.0)
+    parser.add_argument('--interval', type=float, default=60.0,
+                        help='Fallback fusion interval without minute notifications (s)')
+    parser.add_argument('--late', type=float, default=15.0,
+                        help='Wait for late channels after a minute\'s first report (s)')
     parser.add_argument('--log-level', default='INFO')
     parser.add_argument('--enable-chrony', action='store_true', default=True,
                         help='Enable Chrony SHM refclock output (default: enabled)')
@@ -1024,4 +1158,4 @@ if __name__ == '__main__':
     )
     
     enable_chrony = args.enable_chrony and not args.disable_chrony
-    run_fusion_service(args.data_root, args.interval, enable_chrony=enable_chrony)
+    run_fusion_service(args.data_root, args.interval, enable_chrony=enable_chrony, late_sec=args.late)
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+NPZ Discovery - watermark-based discovery of new minute archives
+
+Replaces the full-archive rglob('*.npz') per poll in AnalyticsService.
+A per-channel watermark (name of the last processed file; names start
+with YYYYMMDDTHHMMSSZ, so name order is time order) bounds what has to
+be looked at:
+
+- Day-partitioned trees (archive_dir/YYYYMMDD/...): only day directories
+  from the watermark's day through today are listed - in steady state the
+  previous and current day - however many days are on disk.
+- Flat directories (archive_dir/*.npz, as written via paths.py): new
+  files come from inotify (IN_CLOSE_WRITE / IN_MOVED_TO) after a single
+  catch-up listing. Without inotify the directory is listed only when its
+  mtime has changed.
+
+The watermark itself is persisted by the caller (AnalyticsService keeps it
+in its checkpointed ProcessingState).
+
+Usage:
+    discovery = NPZDiscovery(archive_dir, watermark=state.watermark)
+    while running:
+        for path in discovery.discover():
+            process(path)
+            discovery.advance(path.name)
+        discovery.wait(poll_interval)   # Returns early on inotify events
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# inotify via libc (Linux only, optional)
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    _libc.inotify_init1
+    _libc.inotify_add_watch
+    INOTIFY_AVAILABLE = sys.platform.startswith('linux')
+except (OSError, AttributeError):
+    _libc = None
+    INOTIFY_AVAILABLE = False
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+def _is_day_dir(name: str) -> bool:
+    return len(name) == 8 and name.isdigit()
+
+
+class _Inotify:
+    """Minimal non-blocking inotify reader for one or more directories"""
+    
+    def __init__(self):
+        self.fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+    
+    def add_watch(self, path: Path, mask: int = IN_CLOSE_WRITE | IN_MOVED_TO):
+        wd = _libc.inotify_add_watch(self.fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(path))
+    
+    def read(self) -> Tuple[List[str], bool]:
+        """Drain pending events; returns (file names, queue overflowed)"""
+        names = []
+        overflowed = False
+        while True:
+            try:
+                buf = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buf):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                if mask & IN_Q_OVERFLOW:
+                    overflowed = True
+                elif length:
+                    names.append(buf[offset:offset + length].rstrip(b'\0').decode(errors='replace'))
+                offset += length
+        return names, overflowed
+    
+    def fileno(self) -> int:
+        return self.fd
+    
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class NPZDiscovery:
+    """
+    Finds NPZ files newer than a watermark at a cost that does not grow
+    with the number of days in the archive.
+    """
+    
+    def __init__(
+        self,
+        archive_dir: Path,
+        watermark: Optional[str] = None,
+        use_inotify: bool = True,
+        suffix: str = '.npz'
+    ):
+        """
+        Args:
+            archive_dir: Channel archive directory (flat or YYYYMMDD/ subdirectories)
+            watermark: Name of the last processed file (None: everything is new)
+            use_inotify: Use inotify for flat directories when available
+            suffix: File name suffix to discover
+        """
+        self.archive_dir = Path(archive_dir)
+        self.watermark = watermark
+        self.suffix = suffix
+        self.use_inotify = use_inotify and INOTIFY_AVAILABLE
+        
+        self.layout: Optional[str] = None  # 'daily' or 'flat', detected on first files
+        self._inotify: Optional[_Inotify] = None
+        self._needs_listing = True
+        self._dir_mtime_ns: Optional[int] = None
+        self._held_names: Set[str] = set()  # inotify names read by pending(), not yet discovered
+        
+        # Statistics
+        self.polls = 0
+        self.listings = 0
+        self.entries_listed = 0
+    
+    def advance(self, name: str):
+        """Move the watermark forward to a processed file name."""
+        if self.watermark is None or name > self.watermark:
+            self.watermark = name
+    
+    def _is_new(self, name: str) -> bool:
+        return name.endswith(self.suffix) and (self.watermark is None or name > self.watermark)
+    
+    def discover(self) -> List[Path]:
+        """
+        Files newer than the watermark, sorted by name (chronological).
+        """
+        self.polls += 1
+        if self.layout is None:
+            self.layout = self._detect_layout()
+            if self.layout is None:
+                return []
+        
+        if self.layout == 'daily':
+            new_files = self._discover_daily()
+        else:
+            new_files = self._discover_flat()
+        return sorted(new_files, key=lambda f: f.name)
+    
+    def _detect_layout(self) -> Optional[str]:
+        """'daily' if YYYYMMDD subdirectories exist, 'flat' if NPZ files do."""
+        try:
+            with os.scandir(self.archive_dir) as it:
+                has_files = False
+                for entry in it:
+                    if entry.is_dir() and _is_day_dir(entry.name):
+                        logger.info(f"NPZ discovery: day-partitioned layout in {self.archive_dir}")
+                        return 'daily'
+                    if entry.name.endswith(self.suffix):
+                        has_files = True
+        except FileNotFoundError:
+            return None
+        if has_files:
+            logger.info(f"NPZ discovery: flat layout in {self.archive_dir} "
+                        f"(inotify={'on' if self.use_inotify else 'off'})")
+            return 'flat'
+        return None
+    
+    def _discover_daily(self) -> List[Path]:
+        """List the watermark's day through today; older days are never touched."""
+        try:
+            day = datetime.strptime(self.watermark[:8], '%Y%m%d').date() if self.watermark else None
+        except ValueError:
+            day = None
+        if day is None:
+            # First run (or unparseable watermark): every day directory is a candidate
+            days = sorted(e.name for e in os.scandir(self.archive_dir)
+                          if e.is_dir() and _is_day_dir(e.name))
+        else:
+            today = datetime.now(timezone.utc).date()
+            days = []
+            while day <= today:
+                days.append(day.strftime('%Y%m%d'))
+                day += timedelta(days=1)
+        
+        new_files = []
+        for day in days:
+            day_dir = self.archive_dir / day
+            if not day_dir.is_dir():
+                continue
+            self.listings += 1
+            for root, _, names in os.walk(day_dir):
+                self.entries_listed += len(names)
+                new_files.extend(Path(root) / n for n in names if self._is_new(n))
+        return new_files
+    
+    def _discover_flat(self) -> List[Path]:
+        """inotify names after one catch-up listing; else list on mtime change."""
+        if self.use_inotify and self._inotify is None:
+            try:
+                self._inotify = _Inotify()
+                self._inotify.add_watch(self.archive_dir)  # Before listing: nothing slips between
+            except OSError as e:
+                logger.warning(f"NPZ discovery: inotify unavailable ({e}), listing on change")
+                self.use_inotify = False
+                self._close_inotify()
+        
+        if self._inotify is not None and not self._needs_listing:
+            names, overflowed = self._inotify.read()
+            names = self._held_names.union(names)
+            self._held_names = set()
+            if not overflowed:
+                return [self.archive_dir / n for n in names if self._is_new(n)]
+            logger.warning("NPZ discovery: inotify queue overflowed, relisting")
+        self._held_names = set()
+        
+        try:
+            mtime_ns = os.stat(self.archive_dir).st_mtime_ns
+        except FileNotFoundError:
+            return []
+        if self._inotify is None and not self._needs_listing and mtime_ns == self._dir_mtime_ns:
+            return []
+        
+        self.listings += 1
+        new_files = []
+        with os.scandir(self.archive_dir) as it:
+            for entry in it:
+                self.entries_listed += 1
+                if self._is_new(entry.name):
+                    new_files.append(Path(entry.path))
+        self._dir_mtime_ns = mtime_ns
+        self._needs_listing = False
+        return new_files
+    
+    def pending(self) -> int:
+        """
+        Number of files newer than the watermark, for status reporting.
+        
+        Does not consume anything discover() would return: inotify events
+        read here are held for the next discover(), and the flat-directory
+        mtime it compares against is left alone.
+        """
+        if self.layout is None:
+            self.layout = self._detect_layout()
+            if self.layout is None:
+                return 0
+        if self.layout == 'daily':
+            return len(self._discover_daily())
+        
+        if self._inotify is not None and not self._needs_listing:
+            names, overflowed = self._inotify.read()
+            self._held_names.update(names)
+            if not overflowed:
+                return sum(1 for n in self._held_names if self._is_new(n))
+            self._needs_listing = True  # Events lost: next discover() relists
+        
+        try:
+            with os.scandir(self.archive_dir) as it:
+                return sum(1 for entry in it if self._is_new(entry.name))
+        except FileNotFoundError:
+            return 0
+    
+    def wait(self, timeout: float):
+        """Sleep up to timeout; returns early when inotify reports a file."""
+        if self._inotify is None:
+            time.sleep(timeout)
+            return
+        select.select([self._inotify], [], [], timeout)
+    
+    def _close_inotify(self):
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+    
+    def close(self):
+        """Release the inotify descriptor."""
+        self._close_inotify()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'layout': self.layout,
+            'watermark': self.watermark,
+            'inotify': self._inotify is not None,
+            'polls': self.polls,
+            'listings': self.listings,
+            'entries_listed': self.entries_listed,
+        }
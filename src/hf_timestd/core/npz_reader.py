@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+NPZ Reader - pickle-free, member-at-a-time NPZ access
+
+np.load(path, allow_pickle=True) on an .npz opens the zip lazily, but
+every data['x'] access decompresses the whole member, and object members
+go through pickle. NPZReader reads an NPZ the way the archive pipeline
+uses it:
+
+- Header-only queries: shape/dtype of a member (e.g. the IQ sample count)
+  come from the .npy header, without reading the payload.
+- Small members (scalars, strings) are read one at a time, so metadata
+  never touches the IQ payload.
+- Uncompressed members (np.savez) are memory-mapped in place
+  (copy-on-write), so scanning historical minutes costs page-cache I/O
+  instead of a fresh allocation per file. Compressed members
+  (np.savez_compressed) are decompressed as before.
+- Object (pickled) members are never unpickled. Structured metadata is
+  stored as JSON strings instead (see json_member()); archives written
+  before that hold pickled dicts, which are only decoded when the caller
+  explicitly trusts them (trust_pickle=True, for the station's own files).
+
+Usage:
+    with NPZReader(path) as npz:
+        n = npz.shape('iq')[0]                     # Header only
+        rtp = npz.scalar('rtp_timestamp', int)
+        iq = npz.array('iq')                       # mmap if stored
+        timing = npz.json_member('timing_metadata')
+    
+    # Members already loaded with np.load (scripts)
+    timing = decode_json_member(data['timing_metadata'], trust_pickle=True)
+"""
+
+import json
+import logging
+import struct
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from numpy.lib import format as npy_format
+
+logger = logging.getLogger(__name__)
+
+_LOCAL_HEADER = struct.Struct('<4s22xHH')  # signature, ..., name length, extra length
+_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+
+# Member names whose dropped legacy metadata has been warned about
+_dropped_warned: Set[str] = set()
+
+_HEADER_READERS = {
+    (1, 0): npy_format.read_array_header_1_0,
+    (2, 0): npy_format.read_array_header_2_0,
+    (3, 0): npy_format.read_array_header_2_0,  # Same layout, UTF-8 field names
+}
+
+
+class NPZReader:
+    """Read-only access to the members of one .npz file."""
+    
+    def __init__(self, file_path: Path):
+        self.file_path = Path(file_path)
+        self._zip = zipfile.ZipFile(self.file_path)
+        self._members: Dict[str, zipfile.ZipInfo] = {
+            info.filename[:-4]: info
+            for info in self._zip.infolist()
+            if info.filename.endswith('.npy')
+        }
+        self._headers: Dict[str, Tuple[Tuple[int, ...], bool, np.dtype, int]] = {}
+    
+    @property
+    def files(self) -> List[str]:
+        """Member names (as in np.load(...).files)"""
+        return list(self._members)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._members
+    
+    def _read_header(self, fp, name: str) -> Tuple[Tuple[int, ...], bool, np.dtype, int]:
+        """Parse the .npy header at the start of an open member and cache it"""
+        version = npy_format.read_magic(fp)
+        reader = _HEADER_READERS.get(version)
+        if reader is None:
+            raise ValueError(f"{self.file_path.name}:{name}: unsupported .npy version {version}")
+        shape, fortran_order, dtype = reader(fp)
+        self._headers[name] = (shape, fortran_order, dtype, fp.tell())
+        return self._headers[name]
+    
+    def _header(self, name: str) -> Tuple[Tuple[int, ...], bool, np.dtype, int]:
+        """(shape, fortran_order, dtype, header_length) of a member"""
+        if name not in self._headers:
+            with self._zip.open(self._members[name]) as fp:
+                self._read_header(fp, name)
+        return self._headers[name]
+    
+    def shape(self, name: str) -> Tuple[int, ...]:
+        """Member shape, from the .npy header only."""
+        return self._header(name)[0]
+    
+    def dtype(self, name: str) -> np.dtype:
+        """Member dtype, from the .npy header only."""
+        return self._header(name)[2]
+    
+    def is_pickled(self, name: str) -> bool:
+        """True for object members (only readable by unpickling)."""
+        return self.dtype(name).hasobject
+    
+    def _data_offset(self, name: str) -> Optional[int]:
+        """File offset of a stored member's array data, None if not mappable."""
+        info = self._members[name]
+        if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+            return None
+        with open(self.file_path, 'rb') as f:
+            f.seek(info.header_offset)
+            signature, name_len, extra_len = _LOCAL_HEADER.unpack(f.read(_LOCAL_HEADER.size))
+        if signature != _LOCAL_HEADER_SIGNATURE:
+            return None
+        return info.header_offset + _LOCAL_HEADER.size + name_len + extra_len + self._header(name)[3]
+    
+    def array(self, name: str, mmap: bool = True) -> np.ndarray:
+        """
+        Read a member. Stored members are memory-mapped (copy-on-write)
+        unless mmap=False; compressed ones are decompressed.
+        
+        Raises:
+            KeyError: No such member
+            ValueError: Member holds pickled objects
+        """
+        if name not in self._members:
+            raise KeyError(f"{name} is not a member of {self.file_path.name}")
+        shape, fortran_order, dtype, _ = self._header(name)
+        if dtype.hasobject:
+            raise ValueError(f"{self.file_path.name}:{name} holds pickled objects; not loading")
+        
+        if mmap and shape and dtype.itemsize and int(np.prod(shape)) > 0:
+            offset = self._data_offset(name)
+            if offset is not None:
+                return np.memmap(self.file_path, dtype=dtype, mode='c', offset=offset,
+                                 shape=shape, order='F' if fortran_order else 'C')
+        
+        with self._zip.open(self._members[name]) as fp:
+            return npy_format.read_array(fp, allow_pickle=False)
+    
+    def scalar(self, name: str, cast: Callable[[Any], Any], default: Any = None) -> Any:
+        """
+        Read a 0-d (or 1-element) member and cast it. Missing, pickled or
+        uncastable members give default.
+        """
+        if name not in self._members:
+            return default
+        # One member open: header, then the single element
+        with self._zip.open(self._members[name]) as fp:
+            shape, _, dtype, _ = self._read_header(fp, name)
+            if dtype.hasobject or int(np.prod(shape)) != 1:
+                return default
+            value = np.frombuffer(fp.read(dtype.itemsize), dtype=dtype, count=1)[0]
+        try:
+            return cast(value.item())
+        except (TypeError, ValueError):
+            return default
+    
+    def json_member(self, name: str, trust_pickle: bool = False) -> Optional[Any]:
+        """
+        Decode a member stored as a JSON string.
+        
+        Legacy pickled dict members are unpickled only with trust_pickle=True
+        (files this station wrote itself); otherwise they are dropped (None)
+        with a warning.
+        """
+        if name not in self._members:
+            return None
+        if self.is_pickled(name):
+            if not trust_pickle:
+                _warn_dropped(name, f"{self.file_path.name}: legacy pickled member")
+                return None
+            with self._zip.open(self._members[name]) as fp:
+                value = npy_format.read_array(fp, allow_pickle=True)
+            return decode_json_member(value, trust_pickle=True, name=name)
+        text = self.scalar(name, str)
+        if text is None:
+            return None
+        try:
+            return json.loads(text)
+        except ValueError:
+            _warn_dropped(name, f"{self.file_path.name}: not valid JSON")
+            return None
+    
+    def close(self):
+        self._zip.close()
+    
+    def __enter__(self) -> 'NPZReader':
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _warn_dropped(name: str, reason: str):
+    """Warn once per member name, then log at debug level."""
+    message = f"Metadata member '{name}' dropped ({reason})"
+    if name in _dropped_warned:
+        logger.debug(message)
+        return
+    _dropped_warned.add(name)
+    logger.warning(f"{message}; pass trust_pickle=True for the station's own legacy "
+                   f"archives (further drops of '{name}' are logged at debug level)")
+
+
+def decode_json_member(value: Any, trust_pickle: bool = False, name: str = 'metadata') -> Optional[Any]:
+    """
+    Decode a metadata member's value as loaded from an NPZ (np.load or
+    NPZReader): a JSON string, or a legacy pickled dict when trusted.
+    
+    Args:
+        value: Member value (0-d array, str or already-unpickled dict)
+        trust_pickle: Accept legacy pickled dicts (the station's own files)
+        name: Member name, for the warning when metadata is dropped
+    
+    Returns:
+        The decoded object, or None if absent, undecodable or untrusted
+    """
+    if value is None:
+        return None
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            if not trust_pickle:
+                _warn_dropped(name, "legacy pickled member")
+                return None
+            value = value.item() if value.shape == () else value
+            return value if isinstance(value, dict) else None
+        value = value.item() if value.shape == () else None
+    if isinstance(value, bytes):
+        value = value.decode(errors='replace')
+    if isinstance(value, dict):
+        return value
+    if not isinstance(value, str):
+        return None
+    try:
+        return json.loads(value)
+    except ValueError:
+        _warn_dropped(name, "not valid JSON")
+        return None
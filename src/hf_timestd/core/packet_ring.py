@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Packet Ring - bounded receive-thread -> worker handoff for RTP payloads
+
+A preallocated single-producer/single-consumer ring. The RTP receive
+thread copies each payload into a fixed slot and returns; a per-channel
+worker decodes, resequences and writes. A slow disk flush then delays only
+the worker, and the socket keeps being drained.
+
+Lock-free under the GIL: the producer only advances `_head`, the consumer
+only advances `_tail`, and each does so after its slot access. Only an
+empty-ring wait touches an Event.
+
+When the ring is full the new packet is dropped and counted (the
+resequencer then sees it as a gap, as it would a network loss); the
+receive thread never blocks.
+
+Usage:
+    ring = PacketRing(capacity=500, slot_bytes=6400)
+    
+    # receive thread
+    ring.push(payload, sequence, timestamp, payload_type, wallclock)
+    
+    # worker thread
+    for payload, sequence, timestamp, payload_type, wallclock in ring.drain(timeout=0.5):
+        ...   # payload is a memoryview, valid until the next item
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class PacketRing:
+    """Fixed-capacity SPSC ring of RTP payloads plus header fields."""
+    
+    def __init__(self, capacity: int, slot_bytes: int):
+        """
+        Args:
+            capacity: Number of packets the ring holds
+            slot_bytes: Largest payload accepted (larger ones are dropped)
+        """
+        if capacity < 1 or slot_bytes < 1:
+            raise ValueError(f"Invalid ring size {capacity} x {slot_bytes} bytes")
+        self.capacity = capacity
+        self.slot_bytes = slot_bytes
+        
+        self._data = np.zeros((capacity, slot_bytes), dtype=np.uint8)
+        self._slots = [memoryview(row) for row in self._data]
+        self._lengths = [0] * capacity
+        self._sequences = [0] * capacity
+        self._timestamps = [0] * capacity
+        self._payload_types = [0] * capacity
+        self._wallclocks: list = [None] * capacity
+        
+        self._head = 0  # Written by producer only
+        self._tail = 0  # Written by consumer only
+        self._consumer_waiting = False
+        self._not_empty = threading.Event()
+        
+        # Overflow accounting (producer side)
+        self.overflow_packets = 0
+        self.overflow_bytes = 0
+        self.oversize_packets = 0
+        self.last_overflow_time = 0.0
+        self.high_watermark = 0
+    
+    def __len__(self) -> int:
+        return self._head - self._tail
+    
+    def push(
+        self,
+        payload: bytes,
+        sequence: int,
+        timestamp: int,
+        payload_type: int,
+        wallclock: Optional[float] = None
+    ) -> bool:
+        """
+        Copy a packet into the ring (producer thread only). Never blocks.
+        
+        Returns:
+            False if the packet was dropped (ring full or payload too large)
+        """
+        n = len(payload)
+        if n > self.slot_bytes:
+            self.oversize_packets += 1
+            self.overflow_bytes += n
+            return False
+        
+        head = self._head
+        depth = head - self._tail
+        if depth >= self.capacity:
+            self.overflow_packets += 1
+            self.overflow_bytes += n
+            self.last_overflow_time = time.time()
+            return False
+        
+        i = head % self.capacity
+        self._data[i, :n] = np.frombuffer(payload, dtype=np.uint8)
+        self._lengths[i] = n
+        self._sequences[i] = sequence
+        self._timestamps[i] = timestamp
+        self._payload_types[i] = payload_type
+        self._wallclocks[i] = wallclock
+        self._head = head + 1  # Publish
+        
+        if depth + 1 > self.high_watermark:
+            self.high_watermark = depth + 1
+        if self._consumer_waiting:
+            self._not_empty.set()
+        return True
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the ring is non-empty (consumer thread only)."""
+        if self._head != self._tail:
+            return True
+        self._consumer_waiting = True
+        try:
+            self._not_empty.clear()
+            if self._head != self._tail:  # Pushed between the checks
+                return True
+            self._not_empty.wait(timeout)
+            return self._head != self._tail
+        finally:
+            self._consumer_waiting = False
+    
+    def drain(
+        self,
+        timeout: Optional[float] = None,
+        max_items: Optional[int] = None
+    ) -> Iterator[Tuple[memoryview, int, int, int, Optional[float]]]:
+        """
+        Yield queued packets, oldest first (consumer thread only).
+        
+        Waits up to timeout for the first packet. Each payload view is
+        valid until the iterator is resumed; the slot is released then.
+        """
+        if not self.wait(timeout):
+            return
+        count = 0
+        slots = self._slots
+        while self._tail != self._head and (max_items is None or count < max_items):
+            tail = self._tail
+            i = tail % self.capacity
+            yield (slots[i][:self._lengths[i]], self._sequences[i], self._timestamps[i],
+                   self._payload_types[i], self._wallclocks[i])
+            self._tail = tail + 1  # Release slot
+            count += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Occupancy and overflow counters."""
+        return {
+            'capacity': self.capacity,
+            'slot_bytes': self.slot_bytes,
+            'depth': len(self),
+            'high_watermark': self.high_watermark,
+            'packets_in': self._head,
+            'packets_out': self._tail,
+            'overflow_packets': self.overflow_packets,
+            'oversize_packets': self.oversize_packets,
+            'overflow_bytes': self.overflow_bytes,
+            'last_overflow_time': self.last_overflow_time,
+        }
@@ -145,9 +145,46 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 
+from .archive_reader import ArchiveReader
+from .bounded_cache import RecentSet
+from .checkpoint_service import get_checkpoint_service
+from .minute_notify import MinuteNotifier
+
 logger = logging.getLogger(__name__)
 
 
+def carrier_snr_db(iq_samples: np.ndarray) -> float:
+    """
+    Calculate carrier SNR from IQ samples.
+    
+    This measures the signal-to-noise ratio of the carrier (DC component)
+    which is independent of tone detection. Works for all channels.
+    
+    Method: Compare mean power (signal) to variance (noise fluctuations)
+    
+    Args:
+        iq_samples: Complex IQ samples
+        
+    Returns:
+        SNR in dB
+    """
+    # Calculate carrier power (mean of |IQ|^2)
+    power = np.abs(iq_samples) ** 2
+    carrier_power = np.mean(power)
+    
+    # Estimate noise power from variance of power (fluctuations around mean)
+    noise_power = np.var(power)
+    
+    # Avoid division by zero
+    if noise_power < 1e-20:
+        noise_power = 1e-20
+    
+    # SNR in dB
+    snr_db = 10 * np.log10(carrier_power / noise_power)
+    
+    return float(snr_db)
+
+
 class Phase2AnalyticsService:
     """
     Phase 2 Analytics Service - reads DRF, produces timing analysis.
@@ -189,6 +226,14 @@ class Phase2AnalyticsService:
         self.station_config = station_config or {}
         self.poll_interval = poll_interval
         
+        # Phase 1 minutes (binary raw_buffer, DRF fallback) with read-ahead
+        self.archive_reader = ArchiveReader(sample_rate=sample_rate)
+        self.archive_reader.register_channel(
+            channel_name,
+            binary_dir=self._binary_channel_dir(),
+            drf_dir=self.archive_dir
+        )
+        
         # Create output directories using coordinated path structure
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.status_dir = self.output_dir / 'status'
@@ -287,6 +332,7 @@ class Phase2AnalyticsService:
             precise_lat=precise_lat,
             precise_lon=precise_lon
         )
+        self.engine.stage_timing.service = 'phase2_analytics'
         
         # Initialize Clock Convergence Model
         # "Set, Monitor, Intervention" architecture for GPSDO-disciplined timing
@@ -311,8 +357,13 @@ class Phase2AnalyticsService:
         self.last_carrier_snr_db = None  # Carrier SNR from IQ data
         self.last_carrier_power_db = None  # Carrier power from IQ data
         
-        # Track which minutes we've processed
-        self.processed_minutes = set()
+        # Track which minutes we've processed (only recent minutes can be
+        # offered again, so a day's worth is enough)
+        self.processed_minutes = RecentSet(maxlen=1440)
+        
+        # Minute-complete notifications trigger fusion (output_dir is
+        # {data_root}/phase2/{CHANNEL}); dropped when fusion is not running
+        self.minute_notifier = MinuteNotifier(self.output_dir.parent.parent)
         
         logger.info(f"Phase2AnalyticsService initialized for {channel_name}")
         logger.info(f"  Archive: {archive_dir}")
@@ -859,169 +910,18 @@ class Phase2AnalyticsService:
         Returns:
             Tuple of (iq_samples, system_time, rtp_timestamp) or None if not available
         """
-        # Try binary format first (new format)
-        result = self._read_binary_minute(target_minute)
-        if result is not None:
-            return result
-        
-        # Fall back to DRF (legacy format)
-        return self._read_drf_minute_legacy(target_minute)
+        minute = self.archive_reader.get_minute(self.channel_name, target_minute)
+        return minute.as_tuple() if minute is not None else None
     
-    def _read_binary_minute(self, target_minute: int):
-        """Read from binary archive format."""
-        from datetime import datetime, timezone
-        
-        # Binary files are in raw_buffer directory
-        # Path: {data_root}/raw_buffer/{channel}/YYYYMMDD/{minute}.bin
+    def _binary_channel_dir(self) -> Path:
+        """Binary archive directory for this channel (raw_buffer/{CHANNEL})."""
         # archive_dir can be either:
         #   - raw_buffer/{channel} (new: direct path)
         #   - raw_archive/{channel} (legacy: need to find raw_buffer sibling)
         if 'raw_buffer' in str(self.archive_dir):
-            # Direct path to raw_buffer channel
-            channel_dir = self.archive_dir
-        else:
-            # Legacy: archive_dir is raw_archive/{channel}, find raw_buffer sibling
-            from ..paths import channel_name_to_dir
-            binary_dir = self.archive_dir.parent.parent / 'raw_buffer'
-            channel_dir = binary_dir / channel_name_to_dir(self.channel_name)
-        
-        dt = datetime.fromtimestamp(target_minute, tz=timezone.utc)
-        date_str = dt.strftime('%Y%m%d')
-        
-        base_path = channel_dir / date_str / f"{target_minute}"
-        json_path = channel_dir / date_str / f"{target_minute}.json"
-        
-        # Try to find the binary file (uncompressed or compressed)
-        bin_path = None
-        compression = None
-        for ext in ['.bin', '.bin.zst', '.bin.lz4']:
-            candidate = Path(f"{base_path}{ext}")
-            if candidate.exists():
-                bin_path = candidate
-                if ext == '.bin.zst':
-                    compression = 'zstd'
-                elif ext == '.bin.lz4':
-                    compression = 'lz4'
-                break
-        
-        if bin_path is None:
-            logger.debug(f"Binary file not found: {base_path}.bin[.zst|.lz4]")
-            return None
-        
-        try:
-            # Read metadata
-            metadata = {}
-            if json_path.exists():
-                with open(json_path) as f:
-                    metadata = json.load(f)
-                samples_written = metadata.get('samples_written', 0)
-            else:
-                samples_written = bin_path.stat().st_size // 8  # complex64 = 8 bytes
-            
-            # Read binary file (handle compression)
-            if compression == 'zstd':
-                try:
-                    import zstandard as zstd
-                    with open(bin_path, 'rb') as f:
-                        dctx = zstd.ZstdDecompressor()
-                        decompressed = dctx.decompress(f.read())
-                    iq_samples = np.frombuffer(decompressed, dtype=np.complex64)
-                except ImportError:
-                    logger.warning("zstandard not installed, cannot read .bin.zst files")
-                    return None
-            elif compression == 'lz4':
-                try:
-                    import lz4.frame
-                    with open(bin_path, 'rb') as f:
-                        decompressed = lz4.frame.decompress(f.read())
-                    iq_samples = np.frombuffer(decompressed, dtype=np.complex64)
-                except ImportError:
-                    logger.warning("lz4 not installed, cannot read .bin.lz4 files")
-                    return None
-            else:
-                # Memory-map for zero-copy reading (uncompressed)
-                iq_samples = np.memmap(bin_path, dtype=np.complex64, mode='r')
-            
-            samples_per_minute = self.sample_rate * 60
-            if len(iq_samples) < samples_per_minute * 0.9:  # Need at least 90%
-                logger.debug(f"Incomplete minute: {len(iq_samples)}/{samples_per_minute}")
-                return None
-            
-            # Pad if slightly short
-            if len(iq_samples) < samples_per_minute:
-                padded = np.zeros(samples_per_minute, dtype=np.complex64)
-                padded[:len(iq_samples)] = iq_samples
-                iq_samples = padded
-            
-            system_time = float(target_minute)
-            # Use actual RTP timestamp from metadata, not synthesized from Unix time
-            if json_path.exists() and 'start_rtp_timestamp' in metadata:
-                rtp_timestamp = int(metadata['start_rtp_timestamp'])
-            else:
-                # Fallback: synthesize from Unix time (less accurate)
-                rtp_timestamp = int(target_minute * self.sample_rate)
-                logger.warning(f"No RTP timestamp in metadata, using synthesized value")
-            
-            logger.debug(f"Read {len(iq_samples)} samples from binary for minute {target_minute}")
-            return iq_samples, system_time, rtp_timestamp
-            
-        except Exception as e:
-            logger.debug(f"Error reading binary: {e}")
-            return None
-    
-    def _read_drf_minute_legacy(self, target_minute: int):
-        """Read from legacy DRF format (fallback)."""
-        try:
-            import digital_rf as drf
-        except ImportError:
-            return None
-        
-        if not self.archive_dir.exists():
-            return None
-        
-        try:
-            reader = drf.DigitalRFReader(str(self.archive_dir))
-            channels = reader.get_channels()
-            
-            if not channels:
-                return None
-            
-            target_start_index = int(target_minute * self.sample_rate)
-            samples_per_minute = self.sample_rate * 60
-            
-            channel = None
-            bounds = None
-            for ch in sorted(channels, reverse=True):
-                ch_bounds = reader.get_bounds(ch)
-                if ch_bounds[0] is not None and ch_bounds[1] is not None:
-                    if ch_bounds[0] <= target_start_index < ch_bounds[1]:
-                        channel = ch
-                        bounds = ch_bounds
-                        break
-                    if bounds is None or ch_bounds[1] > bounds[1]:
-                        channel = ch
-                        bounds = ch_bounds
-            
-            if channel is None or bounds is None:
-                return None
-            
-            if target_start_index < bounds[0] or target_start_index >= bounds[1]:
-                return None
-            
-            iq_samples = reader.read_vector(target_start_index, samples_per_minute, channel)
-            
-            if iq_samples is None or len(iq_samples) < samples_per_minute:
-                return None
-            
-            iq_samples = iq_samples.squeeze().astype(np.complex64)
-            system_time = target_start_index / self.sample_rate
-            rtp_timestamp = target_start_index
-            
-            return iq_samples, system_time, rtp_timestamp
-            
-        except Exception as e:
-            logger.debug(f"Error reading DRF: {e}")
-            return None
+            return self.archive_dir
+        from ..paths import channel_name_to_dir
+        return self.archive_dir.parent.parent / 'raw_buffer' / channel_name_to_dir(self.channel_name)
     
     def _get_latest_minute(self) -> int:
         """Get the latest complete minute boundary from available data."""
@@ -1032,9 +932,8 @@ class Phase2AnalyticsService:
         
         # Fall back to DRF
         try:
-            import digital_rf as drf
-            reader = drf.DigitalRFReader(str(self.archive_dir))
-            channels = reader.get_channels()
+            reader = self.archive_reader.get_drf_reader(self.channel_name)
+            channels = reader.get_channels() if reader is not None else []
             
             if channels:
                 latest_sample = None
@@ -1059,13 +958,7 @@ class Phase2AnalyticsService:
         """Get latest minute from binary archive."""
         from datetime import datetime, timezone
         
-        # Determine channel_dir based on archive_dir type
-        if 'raw_buffer' in str(self.archive_dir):
-            channel_dir = self.archive_dir
-        else:
-            from ..paths import channel_name_to_dir
-            binary_dir = self.archive_dir.parent.parent / 'raw_buffer'
-            channel_dir = binary_dir / channel_name_to_dir(self.channel_name)
+        channel_dir = self._binary_channel_dir()
         
         if not channel_dir.exists():
             return None
@@ -1099,35 +992,8 @@ class Phase2AnalyticsService:
         return latest - 120  # 2 minutes behind
     
     def _calculate_carrier_snr(self, iq_samples: np.ndarray) -> float:
-        """
-        Calculate carrier SNR from IQ samples.
-        
-        This measures the signal-to-noise ratio of the carrier (DC component)
-        which is independent of tone detection. Works for all channels.
-        
-        Method: Compare mean power (signal) to variance (noise fluctuations)
-        
-        Args:
-            iq_samples: Complex IQ samples
-            
-        Returns:
-            SNR in dB
-        """
-        # Calculate carrier power (mean of |IQ|^2)
-        power = np.abs(iq_samples) ** 2
-        carrier_power = np.mean(power)
-        
-        # Estimate noise power from variance of power (fluctuations around mean)
-        noise_power = np.var(power)
-        
-        # Avoid division by zero
-        if noise_power < 1e-20:
-            noise_power = 1e-20
-        
-        # SNR in dB
-        snr_db = 10 * np.log10(carrier_power / noise_power)
-        
-        return float(snr_db)
+        """Calculate carrier SNR from IQ samples (see carrier_snr_db)."""
+        return carrier_snr_db(iq_samples)
     
     def _decimate_to_10hz(self, iq_samples: np.ndarray, minute_boundary: int,
                            d_clock_ms: float = 0.0, uncertainty_ms: float = 999.0,
@@ -1274,6 +1140,20 @@ class Phase2AnalyticsService:
                     conv.uncertainty_ms if conv.uncertainty_ms != float('inf') else 100.0
                 )
             
+            # Model state persistence (checkpoint lag)
+            status['checkpoints'] = get_checkpoint_service().get_stats()
+            
+            # Cross-channel correlation stacking (weak-signal rescue)
+            voter_stats = self.engine.voter.get_statistics()
+            status['stacking'] = {
+                key: voter_stats.get(key)
+                for key in ('stacked_detections', 'stack_latency_ms',
+                            'stack_latency_max_ms', 'stack_compute_ms')
+            }
+            
+            # Per-stage latency histograms (served by stage_timing's /metrics)
+            status['stage_timing'] = self.engine.stage_timing.snapshot()
+            
             # Write atomically
             temp_file = self.status_file.with_suffix('.tmp')
             with open(temp_file, 'w') as f:
@@ -1296,8 +1176,12 @@ class Phase2AnalyticsService:
         if minute_boundary in self.processed_minutes:
             return False
         
+        timing = self.engine.stage_timing
+        minute_started = time.perf_counter()
+        
         # Read DRF data for this minute
-        data = self._read_drf_minute(minute_boundary)
+        with timing.span('read_minute', self.channel_name):
+            data = self._read_drf_minute(minute_boundary)
         if data is None:
             logger.debug(f"No data available for minute {minute_boundary}")
             return False
@@ -1327,6 +1211,7 @@ class Phase2AnalyticsService:
             self.minutes_processed += 1
             self.last_processed_minute = minute_boundary
             self.processed_minutes.add(minute_boundary)
+            laps = timing.laps(self.channel_name)
             
             if result:
                 self.last_result = result
@@ -1374,6 +1259,10 @@ class Phase2AnalyticsService:
                     f"Processed minute {minute_boundary}: no timing result, "
                     f"carrier_snr={self.last_carrier_snr_db:.1f}dB"
                 )
+            laps.mark('csv_write')
+            
+            # clock_offset row is on disk: fusion can run for this minute
+            self.minute_notifier.notify(self.output_dir.name, minute_boundary)
             
             # Write test signal for minutes 8 and 44 (channel sounding minutes)
             # Run OUTSIDE of if result: block since test signal detection doesn't need timing lock
@@ -1383,6 +1272,7 @@ class Phase2AnalyticsService:
             
             # Write audio tones (500/600 Hz + intermodulation) for every minute
             self._write_audio_tones(minute_boundary, iq_samples)
+            laps.mark('audio_tones')
             
             # Decimate to 10 Hz and store in binary buffer (for spectrograms and daily upload)
             # Pass Phase 2 results for metadata
@@ -1406,7 +1296,9 @@ class Phase2AnalyticsService:
                     quality_grade='X',
                     gap_samples=gap_samples
                 )
+            laps.mark('decimate_10hz')
             
+            timing.record('process_minute', time.perf_counter() - minute_started, self.channel_name)
             return True
                 
         except Exception as e:
@@ -1437,6 +1329,7 @@ class Phase2AnalyticsService:
                 logger.error(f"Error in main loop: {e}")
                 time.sleep(self.poll_interval)
         
+        get_checkpoint_service().flush()
         logger.info("Phase 2 analytics service stopped")
     
     def stop(self):
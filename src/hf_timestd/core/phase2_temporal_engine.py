@@ -202,6 +202,10 @@ from datetime import datetime, timezone
 from typing import Optional, Dict, List, Tuple, Any, NamedTuple, Callable
 from dataclasses import dataclass, field
 import threading
+import time
+
+from .stage_timing import get_stage_timing
+from .wwv_constants import STACK_DETECTION_SIGMA, STACK_GUIDED_WINDOW_MS
 
 logger = logging.getLogger(__name__)
 
@@ -467,12 +471,18 @@ class Phase2TemporalEngine:
         # Processing state
         self._lock = threading.Lock()
         self.minutes_processed = 0
+        self.stage_timing = get_stage_timing()
         self.last_result: Optional[Phase2Result] = None
         
         # Configurable search window (can be set by timing calibrator)
         # Default is wide (500ms) for bootstrap, narrowed after calibration
         self.config_search_window_ms: Optional[float] = None
         
+        # Stacked rescue from the correlation envelopes other channels have
+        # already shared for the minute (never waits for slower channels)
+        self.enable_stacking = True
+        self._predicted_delays: Dict[Tuple[str, int], float] = {}
+        
         # Station prediction callback (set by pipeline orchestrator)
         # Signature: predict_station(channel_name, rtp_timestamp, detected_station, confidence) -> (station, conf)
         self.station_predictor: Optional[Callable] = None
@@ -668,12 +678,17 @@ class Phase2TemporalEngine:
             self.voter.report_detection_result(self.channel_name, wwvh_det, rtp_timestamp)
         if chu_det:
             self.voter.report_detection_result(self.channel_name, chu_det, rtp_timestamp)
+        
+        # Share this minute's correlation envelopes for stacking - every
+        # minute, so weak channels contribute to the stack too
+        self._report_correlation_envelopes(rtp_timestamp, system_time)
             
         # D. Ambiguity Resolution & Guided Search
         # If we have NO strong signal, or an ambiguous one, ask for help
         anchor_station = 'UNKNOWN'
         anchor_confidence = 0.0
         timing_error_ms = 0.0
+        detection_method = 'matched_filter'
         
         # 1. Try local detection first
         if wwv_det and wwvh_det:
@@ -699,7 +714,18 @@ class Phase2TemporalEngine:
              anchor_confidence = wwvh_det.confidence
              timing_error_ms = wwvh_det.timing_error_ms or 0.0 # Ensure float
              
-        # 2. If weak/none, check for Global Anchor
+        # 2. If weak/none, stack the correlation envelopes of all channels
+        #    (aligned by predicted path delay): confirms a weak local
+        #    detection or replaces a missing/wrong one
+        if anchor_confidence < 0.7 and self.enable_stacking:
+            stacked = self._stacked_rescue(
+                iq_samples, buffer_mid_time, system_time, rtp_timestamp,
+                anchor_station, anchor_confidence, timing_error_ms
+            )
+            if stacked:
+                anchor_station, anchor_confidence, timing_error_ms, detection_method = stacked
+        
+        # 3. If weak/none, check for Global Anchor
         if anchor_confidence < 0.7:
              # Look for "Unambiguous Anchors" first (CHU, WWV 20/25)
              # The voter logic prefers these
@@ -740,7 +766,8 @@ class Phase2TemporalEngine:
             chu_timing_ms=chu_det.timing_error_ms if chu_det else None,
             anchor_station=anchor_station,
             anchor_confidence=anchor_confidence,
-            search_window_ms=self.config_search_window_ms or 500.0  # Use calibrated window if available
+            search_window_ms=self.config_search_window_ms or 500.0,  # Use calibrated window if available
+            detection_method=detection_method
         )
         
         logger.debug(
@@ -750,6 +777,115 @@ class Phase2TemporalEngine:
         
         return result
     
+    def _predicted_delay_ms(self, station: str, system_time: float) -> float:
+        """A-priori path delay for this channel (cached per hour)."""
+        key = (station, int(system_time // 3600))
+        if key not in self._predicted_delays:
+            delay = None
+            try:
+                delay = self.solver.predict_delay_ms(
+                    station, self.frequency_mhz,
+                    timestamp=datetime.fromtimestamp(system_time, tz=timezone.utc)
+                )
+            except Exception as e:
+                logger.debug(f"Delay prediction failed for {station}: {e}")
+            self._predicted_delays = {
+                k: v for k, v in self._predicted_delays.items() if k[1] == key[1]
+            }
+            self._predicted_delays[key] = delay if delay is not None else 0.0
+        return self._predicted_delays[key]
+    
+    def _report_correlation_envelopes(self, rtp_timestamp: int, system_time: float):
+        """Share the tone detector's correlation envelopes with the voter."""
+        envelopes = getattr(self.tone_detector, 'last_correlation_envelopes', {})
+        for station_type, (envelope, start_offset_ms, bin_ms) in envelopes.items():
+            station = station_type.value
+            self.voter.report_correlation(
+                channel=self.channel_name,
+                rtp_timestamp=rtp_timestamp,
+                station=station,
+                envelope=envelope,
+                start_offset_ms=start_offset_ms,
+                bin_ms=bin_ms,
+                predicted_delay_ms=self._predicted_delay_ms(station, system_time)
+            )
+    
+    def _stacked_rescue(
+        self,
+        iq_samples: np.ndarray,
+        buffer_mid_time: float,
+        system_time: float,
+        rtp_timestamp: int,
+        local_station: str,
+        local_confidence: float,
+        local_timing_ms: float
+    ) -> Optional[Tuple[str, float, float, str]]:
+        """
+        Weak-signal rescue from the multi-channel correlation stack.
+        
+        The stacked peak tells us THAT the tone is there and roughly where
+        (the 0.8 s matched filter peak is flat to a few ms). A weak local
+        detection within STACK_GUIDED_WINDOW_MS of that is confirmed and
+        keeps its own timing. Otherwise the timing comes from a guided pass
+        of our own detector in a narrow window at the predicted arrival,
+        which adds the onset refinement; if that pass finds nothing the
+        stacked estimate is used.
+        
+        Only envelopes already shared for this minute are stacked: a
+        channel that finishes before the others gets no rescue this minute
+        rather than stalling its minute loop waiting for them.
+        
+        Returns:
+            (station, confidence, timing_error_ms, detection_method) if the
+            stacked peak of a station this channel receives clears
+            STACK_DETECTION_SIGMA
+        """
+        envelopes = getattr(self.tone_detector, 'last_correlation_envelopes', {})
+        # Check the locally detected station first, so a weak WWVH
+        # detection is confirmed by the WWVH stack rather than replaced
+        stations = [
+            station for station in sorted(('WWV', 'CHU', 'WWVH'), key=lambda st: st != local_station)
+            if any(st.value == station for st in envelopes)
+        ]
+        
+        for station in stations:
+            stack = self.voter.get_stacked_correlation(
+                rtp_timestamp, station, channel=self.channel_name
+            )
+            if stack is None or stack['peak_sigma'] < STACK_DETECTION_SIGMA:
+                continue
+            
+            # Stack peak is the emission offset; add our own path delay
+            timing_error_ms = stack['peak_offset_ms'] + self._predicted_delay_ms(station, system_time)
+            confidence = min(0.6, 0.3 + 0.15 * stack['peak_sigma'] / STACK_DETECTION_SIGMA)
+            
+            if local_station == station and abs(local_timing_ms - timing_error_ms) <= STACK_GUIDED_WINDOW_MS:
+                return station, max(local_confidence, confidence), local_timing_ms, 'matched_filter'
+            
+            guided = self.tone_detector.process_samples(
+                timestamp=buffer_mid_time,
+                samples=iq_samples,
+                rtp_timestamp=rtp_timestamp,
+                original_sample_rate=self.sample_rate,
+                buffer_rtp_start=rtp_timestamp,
+                search_window_ms=STACK_GUIDED_WINDOW_MS,
+                expected_offset_ms=timing_error_ms,
+                repeat=True
+            )
+            refined = [det for det in guided or [] if det.station.value == station]
+            if refined:
+                timing_error_ms = refined[0].timing_error_ms
+            
+            logger.info(
+                f"⚓ Stacked rescue: {station} from {stack['n_channels']} channels, "
+                f"peak={stack['peak_sigma']:.1f}σ, timing={timing_error_ms:+.2f}ms "
+                f"({'guided' if refined else 'stacked'}), "
+                f"latency={stack.get('latency_ms', 0.0):.0f}ms"
+            )
+            return station, confidence, timing_error_ms, 'stacked_correlation'
+        
+        return None
+    
     def _step2_channel_characterization(
         self,
         iq_samples: np.ndarray,
@@ -780,6 +916,7 @@ class Phase2TemporalEngine:
         result = ChannelCharacterization()
         agreements = []
         disagreements = []
+        laps = self.stage_timing.laps(self.channel_name)
         
         # === Step 2A: BCD Correlation & Dual-Peak Delay ===
         # The time snap from Step 1 provides the expected minute boundary,
@@ -829,6 +966,7 @@ class Phase2TemporalEngine:
                 )
         except Exception as e:
             logger.warning(f"Step 2A BCD correlation failed: {e}")
+        laps.mark('step2_bcd')
         
         # === Step 2B: Doppler and Coherence Estimation ===
         # Measure ionospheric stability from per-tick phase tracking
@@ -876,6 +1014,7 @@ class Phase2TemporalEngine:
                 )
         except Exception as e:
             logger.warning(f"Step 2B Doppler estimation failed: {e}")
+        laps.mark('step2_doppler')
         
         # === Step 2C: Station Identity & Ground Truth ===
         # Check for exclusive broadcast minutes (500/600 Hz tones)
@@ -906,6 +1045,7 @@ class Phase2TemporalEngine:
                 )
         except Exception as e:
             logger.debug(f"Step 2C ground truth detection: {e}")
+        laps.mark('step2_500_600hz')
         
         # Check 440 Hz tone for minutes 1 and 2
         if minute_number in [1, 2]:
@@ -931,6 +1071,7 @@ class Phase2TemporalEngine:
                     )
             except Exception as e:
                 logger.debug(f"440 Hz detection: {e}")
+            laps.mark('step2_440hz')
         
         # Detect test signal for minutes 8 and 44 (channel sounding)
         # This provides FSS, delay spread, and high-precision ToA for timing improvement
@@ -971,6 +1112,7 @@ class Phase2TemporalEngine:
                     )
             except Exception as e:
                 logger.debug(f"Test signal detection: {e}")
+            laps.mark('step2_test_signal')
         
         # CHU FSK detection (all minutes for CHU channels)
         # CHU transmits FSK time code at seconds 31-39 with precise 500ms boundaries
@@ -1015,6 +1157,7 @@ class Phase2TemporalEngine:
                     )
             except Exception as e:
                 logger.debug(f"CHU FSK detection: {e}")
+            laps.mark('step2_chu_fsk')
         
         # Determine dominant station from weighted voting
         # Use finalize_discrimination for complete voting
@@ -1058,6 +1201,7 @@ class Phase2TemporalEngine:
                 
         except Exception as e:
             logger.warning(f"Station discrimination failed: {e}")
+        laps.mark('step2_discrimination')
             
         # === SHADOW MODE: Probabilistic Discriminator ===
         # Run the new ML/probabilistic discriminator in parallel and log comparison
@@ -1542,28 +1686,34 @@ class Phase2TemporalEngine:
             logger.warning(f"Input amplitude warning - proceeding with caution")
         
         try:
+            minute_started = time.perf_counter()
+            timing = self.stage_timing
+            
             # === STEP 1: Fundamental Tone Detection ===
-            time_snap = self._step1_tone_detection(
-                iq_samples=iq_samples,
-                system_time=system_time,
-                rtp_timestamp=rtp_timestamp
-            )
+            with timing.span('step1_tone_detection', self.channel_name):
+                time_snap = self._step1_tone_detection(
+                    iq_samples=iq_samples,
+                    system_time=system_time,
+                    rtp_timestamp=rtp_timestamp
+                )
             
             # === STEP 2: Ionospheric Channel Characterization ===
-            channel = self._step2_channel_characterization(
-                iq_samples=iq_samples,
-                time_snap=time_snap,
-                system_time=system_time,
-                minute_number=minute_number
-            )
+            with timing.span('step2_channel_characterization', self.channel_name):
+                channel = self._step2_channel_characterization(
+                    iq_samples=iq_samples,
+                    time_snap=time_snap,
+                    system_time=system_time,
+                    minute_number=minute_number
+                )
             
             # === STEP 3: Transmission Time Solution ===
-            solution = self._step3_transmission_time_solution(
-                time_snap=time_snap,
-                channel=channel,
-                system_time=system_time,
-                rtp_timestamp=rtp_timestamp
-            )
+            with timing.span('step3_transmission_time', self.channel_name):
+                solution = self._step3_transmission_time_solution(
+                    time_snap=time_snap,
+                    channel=channel,
+                    system_time=system_time,
+                    rtp_timestamp=rtp_timestamp
+                )
             
             # Calculate final UTC time
             utc_time = system_time - (solution.d_clock_ms / 1000.0)
@@ -1591,6 +1741,7 @@ class Phase2TemporalEngine:
             with self._lock:
                 self.minutes_processed += 1
                 self.last_result = result
+            timing.record('engine_minute', time.perf_counter() - minute_started, self.channel_name)
             
             logger.info(
                 f"Phase 2 complete: D_clock={solution.d_clock_ms:+.2f}ms, "
@@ -1615,7 +1766,10 @@ class Phase2TemporalEngine:
                 'receiver_grid': self.receiver_grid,
                 'last_d_clock_ms': self.last_result.d_clock_ms if self.last_result else None,
                 'last_uncertainty_ms': self.last_result.uncertainty_ms if self.last_result else None,
-                'last_confidence': self.last_result.confidence if self.last_result else None
+                'last_confidence': self.last_result.confidence if self.last_result else None,
+                'stack_latency_ms': self.voter.stats.get('stack_latency_ms'),
+                'stack_latency_max_ms': self.voter.stats.get('stack_latency_max_ms'),
+                'stack_compute_ms': self.voter.stats.get('stack_compute_ms')
             }
 
 
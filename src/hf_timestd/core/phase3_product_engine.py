@@ -276,23 +276,23 @@ class Phase3ProductEngine:
         logger.info(f"  Output: {self.decimated_dir}")
     
     def _init_phase1_reader(self):
-        """Initialize Phase 1 raw archive reader."""
+        """Initialize Phase 1 archive reader (binary raw_buffer, DRF fallback)."""
+        from ..paths import channel_name_to_dir
+        from .archive_reader import ArchiveReader
+        
+        raw_buffer_dir = self.paths.data_root / 'raw_buffer' / channel_name_to_dir(self.config.channel_name)
         raw_archive_dir = self.paths.get_raw_archive_dir(self.config.channel_name)
         
-        if not raw_archive_dir.exists():
-            logger.warning(f"Phase 1 raw archive not found: {raw_archive_dir}")
+        if not raw_buffer_dir.exists() and not raw_archive_dir.exists():
+            logger.warning(f"Phase 1 archive not found: {raw_buffer_dir}, {raw_archive_dir}")
             self.phase1_reader = None
             return
         
-        try:
-            # Use Digital RF reader for Phase 1 data
-            self.phase1_reader = drf.DigitalRFReader(str(raw_archive_dir))
-            bounds = self.phase1_reader.get_bounds()
-            if bounds[0] is not None:
-                logger.info(f"  Phase 1 archive: {bounds[1] - bounds[0]} samples available")
-        except Exception as e:
-            logger.warning(f"Could not open Phase 1 archive: {e}")
-            self.phase1_reader = None
+        self.phase1_reader = ArchiveReader(
+            self.paths.data_root,
+            sample_rate=self.config.input_sample_rate
+        )
+        logger.info(f"  Phase 1 archive: {raw_buffer_dir if raw_buffer_dir.exists() else raw_archive_dir}")
     
     def _init_decimator(self):
         """Initialize decimation filter."""
@@ -395,19 +395,11 @@ class Phase3ProductEngine:
             return None, gap_analysis
         
         try:
-            # Get channel name for DRF reader
-            channels = self.phase1_reader.get_channels()
-            if not channels:
-                logger.warning("No channels in Phase 1 archive")
-                return None, self._create_empty_gap_analysis(minute_boundary, samples_per_minute)
-            
-            channel = channels[0]
-            
-            # Read samples (DRF uses start_index, num_samples, channel)
-            samples = self.phase1_reader.read_vector(
+            # Missing spans are zero-filled and show up as gaps below
+            samples = self.phase1_reader.read_samples(
+                self.config.channel_name,
                 start_index,
-                samples_per_minute,
-                channel
+                samples_per_minute
             )
             
             if samples is None or len(samples) == 0:
@@ -420,7 +412,7 @@ class Phase3ProductEngine:
                 expected_samples=samples_per_minute
             )
             
-            return samples.astype(np.complex64), gap_analysis
+            return samples, gap_analysis
             
         except Exception as e:
             logger.warning(f"Error reading Phase 1 archive at {system_time}: {e}")
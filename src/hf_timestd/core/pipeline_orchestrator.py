@@ -172,6 +172,7 @@ class PipelineOrchestrator:
             station_config=config.station_config,
             compression=config.compression,
             compression_level=config.compression_level,
+            size_ledger_dir=config.data_dir / 'state',  # Quota accounting without rescans
         )
         self.raw_archive_writer = BinaryArchiveWriter(raw_config)
         
@@ -682,13 +683,15 @@ class BatchReprocessor:
         versioned_output = self.clock_offset_dir / output_version
         versioned_output.mkdir(parents=True, exist_ok=True)
         
-        # Initialize engine with versioned output
+        # Initialize engine with versioned output (unbounded series:
+        # save_series() below writes the whole reprocessed range)
         engine = ClockOffsetEngine(
             raw_archive_dir=self.raw_archive_dir,
             output_dir=versioned_output,
             channel_name=self.channel_name,
             frequency_hz=self.frequency_hz,
-            receiver_grid=self.receiver_grid
+            receiver_grid=self.receiver_grid,
+            max_series_measurements=None
         )
         
         # Initialize reader
@@ -31,6 +31,7 @@ Usage:
 
 import numpy as np
 import logging
+import math
 import time
 import threading
 from pathlib import Path
@@ -43,6 +44,7 @@ from ka9q import ChannelInfo, RTPHeader
 
 from ..core.rtp_receiver import RTPReceiver
 from ..core.packet_resequencer import PacketResequencer, RTPPacket, GapInfo
+from ..core.packet_ring import PacketRing
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +86,11 @@ class PipelineRecorderConfig:
     max_gap_seconds: float = 60.0
     encoding: str = 'float'  # 'float' (complex64) or 'int16' (complex int16)
     
+    # Receive -> processing handoff. The RTP thread only copies packets into
+    # a ring this deep; a worker decodes, resequences and writes. 0 processes
+    # inline on the RTP thread (a slow write then stalls socket reads).
+    handoff_ring_seconds: float = 10.0
+    
     # Phase 1 settings
     raw_archive_compression: str = 'gzip'
     raw_archive_file_duration_sec: int = 3600
@@ -107,6 +114,11 @@ class PipelineRecorderConfig:
         """Calculate maximum gap samples"""
         return int(self.sample_rate * self.max_gap_seconds)
     
+    @property
+    def handoff_ring_packets(self) -> int:
+        """Handoff ring capacity in packets"""
+        return math.ceil(self.handoff_ring_seconds * 1000 / self.blocktime_ms)
+    
     def __post_init__(self):
         self.output_dir = Path(self.output_dir)
         
@@ -182,6 +194,18 @@ class PipelineRecorder:
         
         self.orchestrator = PipelineOrchestrator(pipeline_config)
         
+        # Receive -> worker handoff (slots fit float IQ with 2x headroom)
+        self.packet_ring: Optional[PacketRing] = None
+        if config.handoff_ring_seconds > 0:
+            self.packet_ring = PacketRing(
+                capacity=config.handoff_ring_packets,
+                slot_bytes=max(2 * config.samples_per_packet * 8, 1472)
+            )
+        self._worker: Optional[threading.Thread] = None
+        self._worker_running = False
+        self._last_overflow_warning = 0.0
+        self._overflow_reported = 0
+        
         # Statistics
         self.packets_received = 0
         self.samples_written = 0
@@ -209,6 +233,16 @@ class PipelineRecorder:
         # Start the orchestrator
         self.orchestrator.start()
         
+        # Start the processing worker before packets can arrive
+        if self.packet_ring is not None:
+            self._worker_running = True
+            self._worker = threading.Thread(
+                target=self._process_loop,
+                name=f"pipeline-{self.config.description}",
+                daemon=True
+            )
+            self._worker.start()
+        
         # Register RTP callback with expected payload configuration
         self.rtp_receiver.register_callback(
             ssrc=self.config.ssrc,
@@ -237,6 +271,14 @@ class PipelineRecorder:
         # Unregister callback
         self.rtp_receiver.unregister_callback(self.config.ssrc)
         
+        # Let the worker drain what was already received
+        if self._worker is not None:
+            self._worker_running = False
+            self._worker.join(timeout=10.0)
+            if self._worker.is_alive():
+                logger.warning(f"{self.config.description}: Processing worker did not exit")
+            self._worker = None
+        
         # Stop the orchestrator (flushes all phases)
         self.orchestrator.stop()
         
@@ -246,6 +288,8 @@ class PipelineRecorder:
         logger.info(f"{self.config.description}: Pipeline recorder stopped")
         logger.info(f"  Packets received: {self.packets_received}")
         logger.info(f"  Samples written: {self.samples_written}")
+        if self.packet_ring is not None and self.packet_ring.overflow_packets:
+            logger.warning(f"  Handoff overflow drops: {self.packet_ring.overflow_packets}")
     
     def flush(self):
         """Flush any buffered data."""
@@ -259,31 +303,74 @@ class PipelineRecorder:
         wallclock: Optional[float] = None
     ):
         """
-        Handle incoming RTP packet.
+        Handle incoming RTP packet (RTP receive thread).
+        
+        With a handoff ring the packet is only copied into it; everything
+        else happens on the worker thread.
         
         Args:
             header: Parsed RTP header
             payload: Raw payload bytes
             wallclock: Transport timing from radiod
         """
-        try:
-            with self._lock:
-                if self.state != PipelineRecorderState.RECORDING:
-                    return
-                
-                self.packets_received += 1
-                self.last_packet_time = time.time()
+        with self._lock:
+            if self.state != PipelineRecorderState.RECORDING:
+                return
             
+            self.packets_received += 1
+            self.last_packet_time = time.time()
+        
+        if self.packet_ring is None:
+            self._process_packet(payload, header.sequence, header.timestamp,
+                                 header.payload_type, wallclock)
+            return
+        
+        if not self.packet_ring.push(payload, header.sequence, header.timestamp,
+                                     header.payload_type, wallclock):
+            self._warn_overflow()
+    
+    def _warn_overflow(self):
+        """Rate-limited warning for packets dropped at the handoff."""
+        now = time.time()
+        if now - self._last_overflow_warning < 10.0:
+            return
+        ring = self.packet_ring
+        dropped = ring.overflow_packets + ring.oversize_packets
+        logger.warning(
+            f"{self.config.description}: Handoff ring full, dropped "
+            f"{dropped - self._overflow_reported} packets "
+            f"({dropped} total, capacity {ring.capacity})"
+        )
+        self._overflow_reported = dropped
+        self._last_overflow_warning = now
+    
+    def _process_loop(self):
+        """Worker thread: drain the handoff ring until stopped and empty."""
+        ring = self.packet_ring
+        while self._worker_running or len(ring):
+            for payload, sequence, timestamp, payload_type, wallclock in ring.drain(timeout=0.5):
+                self._process_packet(payload, sequence, timestamp, payload_type, wallclock)
+    
+    def _process_packet(
+        self,
+        payload,
+        sequence: int,
+        timestamp: int,
+        payload_type: int,
+        wallclock: Optional[float]
+    ):
+        """Decode, resequence and feed one packet to the orchestrator."""
+        try:
             # Decode payload to IQ samples
-            iq_samples = self._decode_payload(header.payload_type, payload)
+            iq_samples = self._decode_payload(payload_type, payload)
             if iq_samples is None:
                 return
             
             # Resequence
             rtp_pkt = RTPPacket(
-                sequence=header.sequence,
-                timestamp=header.timestamp,
-                ssrc=header.ssrc,
+                sequence=sequence,
+                timestamp=timestamp,
+                ssrc=self.config.ssrc,
                 samples=iq_samples
             )
             
@@ -299,7 +386,7 @@ class PipelineRecorder:
             # This writes to Phase 1 and queues for Phase 2/3
             self.orchestrator.process_samples(
                 samples=output_samples,
-                rtp_timestamp=header.timestamp,
+                rtp_timestamp=timestamp,
                 system_time=system_time
             )
             
@@ -315,7 +402,7 @@ class PipelineRecorder:
         except Exception as e:
             logger.error(f"{self.config.description}: Packet processing error: {e}", exc_info=True)
     
-    def _decode_payload(self, payload_type: int, payload: bytes) -> Optional[np.ndarray]:
+    def _decode_payload(self, payload_type: int, payload) -> Optional[np.ndarray]:
         """Decode RTP payload to complex IQ samples."""
         try:
             if payload_type in (120, 97):
@@ -365,6 +452,8 @@ class PipelineRecorder:
                 'phase1_samples': pipeline_stats.get('samples_archived', 0),
                 'phase2_minutes': pipeline_stats.get('minutes_analyzed', 0),
                 'phase3_products': pipeline_stats.get('products_generated', 0),
+                # Receive -> worker handoff (None when processing inline)
+                'handoff': self.packet_ring.get_stats() if self.packet_ring is not None else None,
                 # Detailed stats
                 'pipeline': pipeline_stats
             }
@@ -388,6 +477,7 @@ class PipelineRecorder:
             'samples_written': self.samples_written,
             'last_packet_time': last_packet_iso,
             'pipeline_state': stats.get('pipeline', {}).get('state', 'unknown'),
+            'handoff': stats.get('handoff'),
             'architecture': 'three_phase_pipeline',
             # Compatibility fields
             'time_snap_source': 'phase2_analysis',  # D_clock from Phase 2
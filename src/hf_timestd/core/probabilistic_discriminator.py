@@ -105,7 +105,6 @@ REVISION HISTORY
 2025-12-07: Initial implementation addressing Issues 2.1, 2.2, 2.3
 """
 
-import json
 import logging
 import math
 from dataclasses import dataclass, field, asdict
@@ -116,6 +115,8 @@ from collections import deque
 
 import numpy as np
 
+from .checkpoint_service import get_checkpoint_service, load_checkpoint
+
 logger = logging.getLogger(__name__)
 
 
@@ -298,7 +299,7 @@ class LogisticRegressionModel:
         # Training history
         self.is_trained = False
         self.training_samples = 0
-        self.training_loss_history: List[float] = []
+        self.training_loss_history: deque = deque(maxlen=100)
     
     @staticmethod
     def sigmoid(z: np.ndarray) -> np.ndarray:
@@ -480,6 +481,7 @@ class ProbabilisticDiscriminator:
         self.model_path = model_path
         self.min_confidence_threshold = min_confidence_threshold
         self.auto_train = auto_train
+        self._checkpoints = get_checkpoint_service()
         
         # Initialize model
         self.model = LogisticRegressionModel(n_features=7)
@@ -498,7 +500,7 @@ class ProbabilisticDiscriminator:
         self.total_ground_truth = 0
         
         # Load saved model if available
-        if model_path and model_path.exists():
+        if model_path:
             self._load_model()
         
         logger.info("Probabilistic discriminator initialized")
@@ -760,13 +762,11 @@ class ProbabilisticDiscriminator:
         ))
     
     def _save_model(self) -> None:
-        """Save model state to file."""
+        """Queue a model state snapshot with the checkpoint service."""
         if not self.model_path:
             return
         
         try:
-            self.model_path.parent.mkdir(parents=True, exist_ok=True)
-            
             state = {
                 'model': self.model.to_dict(),
                 'predictions_count': self.predictions_count,
@@ -775,22 +775,20 @@ class ProbabilisticDiscriminator:
                 'timestamp': datetime.now(timezone.utc).isoformat()
             }
             
-            with open(self.model_path, 'w') as f:
-                json.dump(state, f, indent=2)
-            
-            logger.debug(f"Saved discriminator model to {self.model_path}")
+            self._checkpoints.mark_dirty(self.model_path, state)
             
         except Exception as e:
             logger.warning(f"Failed to save discriminator model: {e}")
     
     def _load_model(self) -> None:
         """Load model state from file."""
-        if not self.model_path or not self.model_path.exists():
+        if not self.model_path:
             return
         
         try:
-            with open(self.model_path, 'r') as f:
-                state = json.load(f)
+            state = load_checkpoint(self.model_path)
+            if state is None:
+                return
             
             self.model = LogisticRegressionModel.from_dict(state['model'])
             self.predictions_count = state.get('predictions_count', 0)
@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Product Service - Long-lived product server for the web UI
+
+The monitoring server used to start a fresh `python3 -c` interpreter for
+every spectrogram regeneration (and every 10 minutes for auto-regeneration),
+paying for numpy/scipy/matplotlib imports each time. This service stays up
+and answers newline-delimited JSON-RPC 2.0 requests on a Unix socket:
+
+    spectrogram.regenerate  {channel?, date?, hours?}
+                            Render daily (date) or rolling (hours) spectrograms
+                            for one channel or all channels
+    timeseries.slice        {channel, start, end, max_points?, raw?}
+                            10 Hz decimated data for a time range of up to
+                            2 days (power in dB, reduced to max_points; raw
+                            I/Q for ranges up to 1 hour)
+    channels.list           {}
+    status                  {}
+
+Warm state:
+- Render pool: worker processes that import matplotlib once and cache one
+  CarrierSpectrogramGenerator per channel (pyplot is not thread-safe, so
+  renders run in processes rather than threads)
+- DecimatedBuffer handles and memory-mapped day files, reopened only when
+  the day file changes size
+
+Usage:
+------
+    python -m hf_timestd.core.product_service --data-root /var/lib/timestd --grid EM38ww
+    
+    # One request from a shell
+    echo '{"jsonrpc":"2.0","id":1,"method":"status"}' | \\
+        socat - UNIX-CONNECT:/var/lib/timestd/state/product-service.sock
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import math
+import os
+import signal
+import socketserver
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .decimated_buffer import DecimatedBuffer, SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+SOCKET_NAME = 'product-service.sock'
+
+# Raw I/Q is only returned for ranges up to this many samples (1 hour at 10 Hz)
+MAX_RAW_SAMPLES = 36000
+# Longest range a slice may cover (2 days at 10 Hz, ~15 MB while assembling)
+MAX_SLICE_SAMPLES = 2 * 86400 * SAMPLE_RATE
+DEFAULT_MAX_POINTS = 2000
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+def default_socket_path(data_root: Path) -> Path:
+    """Socket location shared with the web UI: {data_root}/state/product-service.sock"""
+    return Path(data_root) / 'state' / SOCKET_NAME
+
+
+# =============================================================================
+# Render pool worker (runs in child processes)
+# =============================================================================
+
+_worker_generators: Dict[Tuple[str, str], Any] = {}
+
+
+def _warm_worker():
+    """Import the plotting stack once per worker process."""
+    importlib.import_module('.carrier_spectrogram', __package__)  # matplotlib/scipy
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Parent handles shutdown
+
+
+def _render_spectrogram(
+    data_root: str,
+    channel: str,
+    receiver_grid: str,
+    date_str: Optional[str],
+    hours: int
+) -> Optional[str]:
+    """Render one channel's spectrogram with a cached generator."""
+    from .carrier_spectrogram import CarrierSpectrogramGenerator
+    
+    key = (channel, receiver_grid)
+    gen = _worker_generators.get(key)
+    if gen is None:
+        gen = CarrierSpectrogramGenerator(Path(data_root), channel, receiver_grid=receiver_grid)
+        _worker_generators[key] = gen
+    
+    path = gen.generate_daily(date_str) if date_str else gen.generate_rolling(hours)
+    return str(path) if path else None
+
+
+# =============================================================================
+# Service
+# =============================================================================
+
+class RPCError(Exception):
+    """Error returned to the client as a JSON-RPC error object."""
+    
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class ProductService:
+    """
+    JSON-RPC product server on a Unix socket.
+    
+    Each connection may send any number of requests, one JSON object per
+    line; each gets one response line. Connections are served on threads,
+    renders on the process pool.
+    """
+    
+    def __init__(
+        self,
+        data_root: Path,
+        socket_path: Optional[Path] = None,
+        receiver_grid: str = '',
+        render_workers: int = 2
+    ):
+        """
+        Initialize product service.
+        
+        Args:
+            data_root: Root data directory
+            socket_path: Unix socket path (default: {data_root}/state/product-service.sock)
+            receiver_grid: Maidenhead grid square for solar zenith overlays
+            render_workers: Spectrogram render processes
+        """
+        self.data_root = Path(data_root)
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path(self.data_root)
+        self.receiver_grid = receiver_grid
+        self.render_workers = render_workers
+        
+        self._buffers: Dict[str, DecimatedBuffer] = {}
+        self._day_maps: Dict[Tuple[str, str], Tuple[int, np.memmap]] = {}
+        self._cache_lock = threading.Lock()
+        
+        self._render_pool: Optional[ProcessPoolExecutor] = None
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+        
+        self.methods: Dict[str, Callable[[Dict], Any]] = {
+            'spectrogram.regenerate': self.rpc_regenerate_spectrograms,
+            'timeseries.slice': self.rpc_timeseries_slice,
+            'channels.list': self.rpc_list_channels,
+            'status': self.rpc_status,
+        }
+        
+        # Statistics
+        self.started_at = time.time()
+        self._stats_lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.latency_ms_total: Dict[str, float] = {}
+        self.renders_in_flight = 0
+    
+    # -------------------------------------------------------------------------
+    # Caches
+    # -------------------------------------------------------------------------
+    
+    def _get_buffer(self, channel: str) -> DecimatedBuffer:
+        with self._cache_lock:
+            buffer = self._buffers.get(channel)
+            if buffer is None:
+                buffer = DecimatedBuffer(self.data_root, channel)
+                self._buffers[channel] = buffer
+            return buffer
+    
+    def _get_day_map(self, channel: str, date_str: str) -> Optional[np.memmap]:
+        """Memory-mapped day file, remapped if the file has changed size."""
+        buffer = self._get_buffer(channel)
+        bin_path, _ = buffer._get_paths(date_str)
+        try:
+            size = bin_path.stat().st_size
+        except OSError:
+            return None
+        
+        key = (channel, date_str)
+        with self._cache_lock:
+            cached = self._day_maps.get(key)
+            if cached and cached[0] == size:
+                return cached[1]
+            day_map = np.memmap(bin_path, dtype=np.complex64, mode='r')
+            self._day_maps[key] = (size, day_map)
+            
+            # Keep only a few days mapped per channel
+            channel_days = sorted(k for k in self._day_maps if k[0] == channel)
+            for old in channel_days[:-3]:
+                del self._day_maps[old]
+            return day_map
+    
+    def discover_channels(self) -> List[str]:
+        """Channels with a decimated buffer under products/."""
+        products_dir = self.data_root / 'products'
+        channels = []
+        if products_dir.exists():
+            for d in sorted(products_dir.iterdir()):
+                if d.is_dir() and (d / 'decimated').exists():
+                    channels.append(d.name.replace('_', ' '))
+        return channels
+    
+    # -------------------------------------------------------------------------
+    # RPC methods
+    # -------------------------------------------------------------------------
+    
+    def rpc_regenerate_spectrograms(self, params: Dict) -> Dict:
+        channel = params.get('channel') or None
+        date_str = params.get('date') or None
+        hours = int(params.get('hours', 6))
+        if date_str:
+            date_str = date_str.replace('-', '')
+        
+        # Accept directory-style names (WWV_10_MHz) as well as channel names
+        channels = [channel.replace('_', ' ')] if channel else self.discover_channels()
+        
+        with self._stats_lock:
+            self.renders_in_flight += len(channels)
+        try:
+            futures = {
+                ch: self._render_pool.submit(
+                    _render_spectrogram, str(self.data_root), ch,
+                    self.receiver_grid, date_str, hours
+                )
+                for ch in channels
+            }
+            results = {}
+            for ch, future in futures.items():
+                try:
+                    results[ch] = future.result()
+                except Exception as e:
+                    logger.error(f"Spectrogram render failed for {ch}: {e}")
+                    results[ch] = None
+        finally:
+            with self._stats_lock:
+                self.renders_in_flight -= len(channels)
+        
+        paths = [p for p in results.values() if p]
+        return {
+            'status': 'ok',
+            'count': len(paths),
+            'paths': paths,
+            'failed': [ch for ch, p in results.items() if p is None],
+        }
+    
+    def rpc_timeseries_slice(self, params: Dict) -> Dict:
+        channel = params.get('channel')
+        if not channel:
+            raise RPCError(INVALID_PARAMS, "channel is required")
+        try:
+            start = float(params['start'])
+            end = float(params['end'])
+        except (KeyError, TypeError, ValueError):
+            raise RPCError(INVALID_PARAMS, "start and end (unix seconds) are required")
+        if not (math.isfinite(start) and math.isfinite(end)):
+            raise RPCError(INVALID_PARAMS, "start and end must be finite")
+        if end <= start:
+            raise RPCError(INVALID_PARAMS, "end must be after start")
+        try:
+            max_points = max(1, int(params.get('max_points', DEFAULT_MAX_POINTS)))
+        except (TypeError, ValueError):
+            raise RPCError(INVALID_PARAMS, "max_points must be an integer")
+        
+        n_total = int(round((end - start) * SAMPLE_RATE))
+        if n_total > MAX_SLICE_SAMPLES:
+            raise RPCError(
+                INVALID_PARAMS,
+                f"range limited to {MAX_SLICE_SAMPLES // SAMPLE_RATE} seconds "
+                f"({MAX_SLICE_SAMPLES} samples)"
+            )
+        if params.get('raw') and n_total > MAX_RAW_SAMPLES:
+            raise RPCError(INVALID_PARAMS, f"raw I/Q limited to {MAX_RAW_SAMPLES} samples")
+        
+        # Assemble from per-day memmaps (ranges may cross midnight)
+        iq = np.zeros(n_total, dtype=np.complex64)
+        valid = np.zeros(n_total, dtype=bool)
+        t = start
+        while t < end:
+            dt = datetime.fromtimestamp(t, tz=timezone.utc)
+            day_start = datetime(dt.year, dt.month, dt.day, tzinfo=timezone.utc)
+            day_end = (day_start + timedelta(days=1)).timestamp()
+            seg_end = min(end, day_end)
+            
+            day_map = self._get_day_map(channel, dt.strftime('%Y%m%d'))
+            i0 = int(round((t - day_start.timestamp()) * SAMPLE_RATE))
+            i1 = int(round((seg_end - day_start.timestamp()) * SAMPLE_RATE))
+            o0 = int(round((t - start) * SAMPLE_RATE))
+            if day_map is not None:
+                chunk = day_map[i0:min(i1, len(day_map))]
+                iq[o0:o0 + len(chunk)] = chunk
+                valid[o0:o0 + len(chunk)] = True
+            t = seg_end
+        
+        result = {
+            'channel': channel,
+            'start': start,
+            'sample_rate': SAMPLE_RATE,
+            'samples': n_total,
+        }
+        
+        # Power in dB, block-averaged to at most max_points
+        block = max(1, -(-n_total // max_points))
+        n_blocks = n_total // block
+        if n_blocks:
+            power = np.abs(iq[:n_blocks * block]) ** 2
+            power = power.reshape(n_blocks, block).mean(axis=1)
+            mask = valid[:n_blocks * block].reshape(n_blocks, block).any(axis=1) & (power > 0)
+            power_db = np.full(n_blocks, np.nan)
+            power_db[mask] = 10 * np.log10(power[mask])
+            result['power_db'] = [None if np.isnan(v) else round(float(v), 2) for v in power_db]
+            result['point_interval_sec'] = block / SAMPLE_RATE
+        
+        if params.get('raw'):
+            result['i'] = iq.real.tolist()
+            result['q'] = iq.imag.tolist()
+        
+        return result
+    
+    def rpc_list_channels(self, params: Dict) -> Dict:
+        return {'channels': self.discover_channels()}
+    
+    def rpc_status(self, params: Dict) -> Dict:
+        with self._stats_lock:
+            methods = {
+                name: {
+                    'requests': count,
+                    'errors': self.errors.get(name, 0),
+                    'mean_latency_ms': round(self.latency_ms_total.get(name, 0.0) / count, 2),
+                }
+                for name, count in self.requests.items()
+            }
+        return {
+            'service': 'product-service',
+            'pid': os.getpid(),
+            'uptime_sec': round(time.time() - self.started_at, 1),
+            'socket': str(self.socket_path),
+            'data_root': str(self.data_root),
+            'render_workers': self.render_workers,
+            'renders_in_flight': self.renders_in_flight,
+            'cached_buffers': len(self._buffers),
+            'mapped_days': len(self._day_maps),
+            'methods': methods,
+        }
+    
+    # -------------------------------------------------------------------------
+    # JSON-RPC dispatch
+    # -------------------------------------------------------------------------
+    
+    def handle_request(self, line: bytes) -> Optional[Dict]:
+        """Handle one request line; returns the response (None for notifications)."""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {'jsonrpc': '2.0', 'id': None,
+                    'error': {'code': PARSE_ERROR, 'message': 'Parse error'}}
+        
+        if not isinstance(request, dict) or 'method' not in request:
+            return {'jsonrpc': '2.0', 'id': None,
+                    'error': {'code': INVALID_REQUEST, 'message': 'Invalid request'}}
+        
+        request_id = request.get('id')
+        method = request['method']
+        params = request.get('params') or {}
+        handler = self.methods.get(method)
+        
+        started = time.perf_counter()
+        try:
+            if handler is None:
+                raise RPCError(METHOD_NOT_FOUND, f"Unknown method: {method}")
+            if not isinstance(params, dict):
+                raise RPCError(INVALID_PARAMS, "params must be an object")
+            response = {'jsonrpc': '2.0', 'id': request_id, 'result': handler(params)}
+        except RPCError as e:
+            response = {'jsonrpc': '2.0', 'id': request_id,
+                        'error': {'code': e.code, 'message': e.message}}
+        except Exception as e:
+            logger.error(f"RPC {method} failed: {e}", exc_info=True)
+            response = {'jsonrpc': '2.0', 'id': request_id,
+                        'error': {'code': INTERNAL_ERROR, 'message': str(e)}}
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            self.requests[method] = self.requests.get(method, 0) + 1
+            self.latency_ms_total[method] = self.latency_ms_total.get(method, 0.0) + elapsed_ms
+            if 'error' in response:
+                self.errors[method] = self.errors.get(method, 0) + 1
+        
+        return response if 'id' in request else None
+    
+    # -------------------------------------------------------------------------
+    # Server lifecycle
+    # -------------------------------------------------------------------------
+    
+    def start(self):
+        """Create the render pool and bind the socket."""
+        self._render_pool = ProcessPoolExecutor(
+            max_workers=self.render_workers, initializer=_warm_worker
+        )
+        
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            self.socket_path.unlink()  # Stale socket from a previous run
+        
+        service = self
+        
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    response = service.handle_request(line)
+                    if response is not None:
+                        self.wfile.write(json.dumps(response).encode() + b'\n')
+                        self.wfile.flush()
+        
+        class _Server(socketserver.ThreadingUnixStreamServer):
+            daemon_threads = True
+        
+        self._server = _Server(str(self.socket_path), _Handler)
+        os.chmod(self.socket_path, 0o660)
+        logger.info(f"✅ Product service listening on {self.socket_path}")
+    
+    def serve_forever(self):
+        """Serve until stop() or KeyboardInterrupt."""
+        if self._server is None:
+            self.start()
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Product service interrupted")
+        finally:
+            self.close()
+    
+    def stop(self):
+        """Stop serve_forever() (safe to call from another thread)."""
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+    
+    def close(self):
+        """Release socket and render pool."""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        if self._render_pool is not None:
+            self._render_pool.shutdown(wait=False, cancel_futures=True)
+            self._render_pool = None
+        logger.info("Product service stopped")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Long-lived product service (spectrograms, time series) for the web UI'
+    )
+    parser.add_argument('--data-root', type=Path, required=True,
+                        help='Root data directory')
+    parser.add_argument('--socket', type=Path,
+                        help=f'Unix socket path (default: DATA_ROOT/state/{SOCKET_NAME})')
+    parser.add_argument('--grid', type=str, default='',
+                        help='Receiver grid square for solar zenith overlay (e.g., EM38ww)')
+    parser.add_argument('--render-workers', type=int, default=2,
+                        help='Spectrogram render processes (default: 2)')
+    parser.add_argument('--log-level', default='INFO',
+                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
+    args = parser.parse_args()
+    
+    logging.basicConfig(
+        level=getattr(logging, args.log_level),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    service = ProductService(
+        data_root=args.data_root,
+        socket_path=args.socket,
+        receiver_grid=args.grid,
+        render_workers=args.render_workers
+    )
+    signal.signal(signal.SIGTERM, lambda signum, frame: service.stop())
+    service.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -56,6 +56,8 @@ import json
 import threading
 import os
 
+from ..size_ledger import SizeLedger, DirUsage, RECONCILE_INTERVAL_SEC, scan_directory_usage
+
 logger = logging.getLogger(__name__)
 
 # Data quality constants
@@ -108,6 +110,10 @@ class RawArchiveConfig:
         max_file_size_bytes: Maximum file size (default 1GB)
         compression: Compression algorithm ('zstd', 'lz4', 'gzip', 'none')
         use_shuffle: Use HDF5 shuffle filter (improves compression)
+        size_ledger_dir: State directory of the SizeLedger to update as files
+            close (None = don't report; quota manager rescans instead)
+        sliding_monitor: Feed the process-wide StreamingMonitorBank for
+            10-second signal quality status (default off)
     """
     output_dir: Path
     channel_name: str
@@ -127,9 +133,15 @@ class RawArchiveConfig:
     subdir_cadence_secs: int = 86400  # Daily subdirectories
     file_cadence_millisecs: int = 60000  # 60 second file cadence for real-time access
     # Note: Storage quota is managed at top-level by StorageQuotaManager
+    size_ledger_dir: Optional[Path] = None
+    
+    # Real-time monitoring (streaming, batched across channels)
+    sliding_monitor: bool = False
     
     def __post_init__(self):
         self.output_dir = Path(self.output_dir)
+        if self.size_ledger_dir is not None:
+            self.size_ledger_dir = Path(self.size_ledger_dir)
 
 
 @dataclass
@@ -334,17 +346,28 @@ class StorageQuotaManager:
     The manager looks at ALL channel directories under the archive root
     and removes the oldest date directories across all channels.
     
+    Usage is read from a SizeLedger that writers update as they close
+    files, so a quota check costs O(number of date directories) instead
+    of a stat() of every file. The tree is rescanned (reconciled) on first
+    use and then every reconcile_interval seconds on a background thread.
+    
     Usage:
         manager = StorageQuotaManager(archive_root, quota="80%")
         manager = StorageQuotaManager(archive_root, quota="500GB")
         manager.enforce_quota()  # Called periodically
     """
     
+    # Ledger categories owned by this manager
+    LEDGER_CATEGORIES = ('raw', 'raw_meta')
+    
     def __init__(
         self,
         archive_root: Path,
         quota: Optional[str] = None,
-        headroom_ratio: float = QUOTA_HEADROOM_RATIO
+        headroom_ratio: float = QUOTA_HEADROOM_RATIO,
+        ledger: Optional[SizeLedger] = None,
+        archive_subdirs: Tuple[str, ...] = ('raw_archive',),
+        reconcile_interval: float = RECONCILE_INTERVAL_SEC
     ):
         """
         Initialize storage quota manager.
@@ -353,6 +376,9 @@ class StorageQuotaManager:
             archive_root: Root directory containing all channel archives
             quota: Quota specification ("500GB", "80%", "unlimited")
             headroom_ratio: Extra space to free when cleaning (default 5%)
+            ledger: Size ledger (default: archive_root/state)
+            archive_subdirs: Archive trees to manage, e.g. ('raw_archive', 'raw_buffer')
+            reconcile_interval: Seconds between background rescans of the tree
         """
         self.archive_root = Path(archive_root)
         self.archive_root.mkdir(parents=True, exist_ok=True)
@@ -360,6 +386,10 @@ class StorageQuotaManager:
         self.quota_bytes = parse_quota_string(quota, self.archive_root) if quota else None
         self.headroom_ratio = headroom_ratio
         
+        self.ledger = ledger or SizeLedger(self.archive_root / 'state', self.archive_root)
+        self.archive_subdirs = tuple(archive_subdirs)
+        self.reconcile_interval = reconcile_interval
+        
         # Statistics
         self.bytes_removed: int = 0
         self.dirs_removed: int = 0
@@ -373,7 +403,7 @@ class StorageQuotaManager:
     
     def get_storage_usage(self) -> Tuple[int, List[Tuple[Path, str, int]]]:
         """
-        Calculate current storage usage across ALL channels.
+        Get current storage usage across ALL channels from the size ledger.
         
         Returns:
             Tuple of (total_bytes, list of (dir_path, date_str, size_bytes) sorted oldest first)
@@ -381,46 +411,60 @@ class StorageQuotaManager:
         if not self.archive_root.exists():
             return 0, []
         
+        self._ensure_reconciled()
+        
         date_dirs = []  # List of (full_path, date_str, size_bytes)
         total_bytes = 0
         
-        # Scan all channel directories under archive_root
-        # Structure: archive_root/raw_archive/CHANNEL_NAME/YYYYMMDD/
-        raw_archive = self.archive_root / 'raw_archive'
-        if not raw_archive.exists():
-            return 0, []
-        
-        for channel_dir in raw_archive.iterdir():
-            if not channel_dir.is_dir():
+        prefixes = tuple(f"{subdir}/" for subdir in self.archive_subdirs)
+        for entry in self.ledger.usage(self.LEDGER_CATEGORIES):
+            if not entry.path.startswith(prefixes):
                 continue
-            
-            # Find date directories in each channel
-            for item in channel_dir.iterdir():
-                if item.is_dir() and len(item.name) == 8 and item.name.isdigit():
-                    dir_size = self._get_dir_size(item)
-                    date_dirs.append((item, item.name, dir_size))
-                    total_bytes += dir_size
-            
-            # Include metadata directory in total
-            metadata_dir = channel_dir / 'metadata'
-            if metadata_dir.exists():
-                total_bytes += self._get_dir_size(metadata_dir)
+            total_bytes += entry.bytes
+            if entry.category == 'raw':
+                date_dirs.append((self.ledger.absolute(entry), entry.name, entry.bytes))
         
         # Sort by date (oldest first for FIFO removal)
         date_dirs.sort(key=lambda x: x[1])
         
         return total_bytes, date_dirs
     
-    def _get_dir_size(self, path: Path) -> int:
-        """Calculate total size of directory recursively."""
-        total = 0
-        try:
-            for item in path.rglob('*'):
-                if item.is_file():
-                    total += item.stat().st_size
-        except (PermissionError, OSError) as e:
-            logger.warning(f"Error calculating size of {path}: {e}")
-        return total
+    def _ensure_reconciled(self):
+        """Rescan synchronously on first use, in the background when stale."""
+        last = self.ledger.last_reconciled('raw')
+        if last is None:
+            logger.info("StorageQuotaManager: initial size scan of archive")
+            self.ledger.reconcile(self._scan_usage, self.LEDGER_CATEGORIES)
+        elif time.time() - last > self.reconcile_interval:
+            self.ledger.reconcile_in_background(self._scan_usage, self.LEDGER_CATEGORIES)
+    
+    def _scan_usage(self) -> List[DirUsage]:
+        """
+        Walk the archive trees (reconciliation only - this is the slow path).
+        
+        Structure: archive_root/{raw_archive,raw_buffer}/CHANNEL_NAME/YYYYMMDD/
+        """
+        entries = []
+        for subdir in self.archive_subdirs:
+            archive = self.archive_root / subdir
+            if not archive.exists():
+                continue
+            
+            for channel_dir in archive.iterdir():
+                if not channel_dir.is_dir():
+                    continue
+                
+                # Find date directories in each channel
+                for item in channel_dir.iterdir():
+                    if item.is_dir() and len(item.name) == 8 and item.name.isdigit():
+                        entries.append(scan_directory_usage(item, 'raw'))
+                
+                # Include metadata directory in total
+                metadata_dir = channel_dir / 'metadata'
+                if metadata_dir.exists():
+                    entries.append(scan_directory_usage(metadata_dir, 'raw_meta'))
+        
+        return entries
     
     def enforce_quota(self, force: bool = False) -> Dict[str, Any]:
         """
@@ -538,6 +582,7 @@ class StorageQuotaManager:
         
         # Remove
         shutil.rmtree(path)
+        self.ledger.remove(path, 'raw')
     
     def get_stats(self) -> Dict[str, Any]:
         """Get quota manager statistics."""
@@ -637,6 +682,13 @@ class RawArchiveWriter:
         # Monotonic sample index for DRF
         self.next_sample_index: Optional[int] = None
         
+        # Size ledger (ledger root is the data root above raw_archive/)
+        self.size_ledger: Optional[SizeLedger] = None
+        self._ledger_reported: set = set()  # DRF files already recorded today
+        self._ledger_day = None
+        if config.size_ledger_dir is not None:
+            self.size_ledger = SizeLedger(config.size_ledger_dir, config.output_dir.parent)
+        
         # Statistics
         self.samples_written: int = 0
         self.files_written: int = 0
@@ -682,15 +734,12 @@ class RawArchiveWriter:
         self.segment_counter: int = 0
         
         # Sliding window monitor (10-second real-time quality tracking)
-        # DISABLED: All analytics should be post-processing in Phase 2
-        # Real-time analysis was causing 244% CPU usage for 1.44 MB/sec data
+        # Off by default: analytics belong to Phase 2. When on, samples go
+        # to the shared StreamingMonitorBank, which batches the FFTs of all
+        # channels (real-time per-channel analysis once cost 244% CPU)
         self.sliding_monitor = None
-        self.sliding_monitor_enabled = False  # Disabled for performance
-        self.window_sample_buffer: List[np.ndarray] = []  # Accumulate for 10s windows
-        self.window_sample_count = 0
-        self.window_gap_count = 0
-        self.window_gap_samples = 0
-        self.samples_per_window = config.sample_rate * 10  # 10 seconds
+        self.sliding_monitor_bank = None
+        self.sliding_monitor_enabled = config.sliding_monitor
         self._init_sliding_monitor()
         
         logger.info(f"RawArchiveWriter initialized for {config.channel_name}")
@@ -705,19 +754,15 @@ class RawArchiveWriter:
             return
         
         try:
-            from .sliding_window_monitor import SlidingWindowMonitor
+            from .sliding_window_monitor import get_monitor_bank
             
             # Output to status directory alongside raw archive
             status_dir = self.config.output_dir / 'status'
             status_dir.mkdir(parents=True, exist_ok=True)
             
-            self.sliding_monitor = SlidingWindowMonitor(
-                channel_name=self.config.channel_name,
-                sample_rate=self.config.sample_rate,
-                output_dir=status_dir,
-                enabled=True
-            )
-            logger.info(f"  Sliding window monitor: ENABLED (10s windows)")
+            self.sliding_monitor_bank = get_monitor_bank(self.config.sample_rate, status_dir)
+            self.sliding_monitor = self.sliding_monitor_bank.add_channel(self.config.channel_name)
+            logger.info(f"  Sliding window monitor: ENABLED (10s windows, streaming)")
         except ImportError as e:
             logger.warning(f"  Sliding window monitor: DISABLED ({e})")
             self.sliding_monitor = None
@@ -725,67 +770,21 @@ class RawArchiveWriter:
             logger.warning(f"  Sliding window monitor initialization failed: {e}")
             self.sliding_monitor = None
     
-    def _process_sliding_window(self, system_time: float):
-        """
-        Process accumulated samples through the 10-second sliding window monitor.
-        
-        Called when we've accumulated enough samples for a complete window.
-        """
-        if self.sliding_monitor is None or not self.sliding_monitor_enabled:
-            return
-        
-        if self.window_sample_count < self.samples_per_window:
-            return
-        
+    def _feed_sliding_window(self, samples: np.ndarray, system_time: float, gap_samples: int):
+        """Feed a packet's samples to the streaming monitor bank."""
         try:
-            # Concatenate buffered samples
-            if self.window_sample_buffer:
-                window_samples = np.concatenate(self.window_sample_buffer)
-                
-                # Trim to exact window size
-                window_samples = window_samples[:self.samples_per_window]
-                
-                # Calculate timestamp for window start (10 seconds ago)
-                window_timestamp = system_time - 10.0
-                
-                # Process through monitor
-                gap_info = {
-                    'gap_count': self.window_gap_count,
-                    'gap_samples': self.window_gap_samples
-                }
-                
-                metrics = self.sliding_monitor.process_chunk(
-                    samples=window_samples,
-                    timestamp=window_timestamp,
-                    gap_info=gap_info
-                )
-                
-                if metrics and metrics.signal_present:
+            timestamp = system_time - len(samples) / self.config.sample_rate
+            for channel_name, metrics in self.sliding_monitor_bank.feed(
+                self.config.channel_name, samples, timestamp, gap_samples
+            ):
+                if metrics.signal_present:
                     logger.debug(
-                        f"{self.config.channel_name} 10s monitor: "
+                        f"{channel_name} 10s monitor: "
                         f"SNR={metrics.dominant_snr_db:.1f}dB, "
                         f"quality={metrics.quality.value}"
                     )
-            
-            # Reset window buffer, keeping overflow for next window
-            overflow_samples = self.window_sample_count - self.samples_per_window
-            if overflow_samples > 0 and self.window_sample_buffer:
-                # Keep the overflow portion
-                all_samples = np.concatenate(self.window_sample_buffer)
-                self.window_sample_buffer = [all_samples[self.samples_per_window:]]
-                self.window_sample_count = overflow_samples
-            else:
-                self.window_sample_buffer = []
-                self.window_sample_count = 0
-            
-            self.window_gap_count = 0
-            self.window_gap_samples = 0
-            
         except Exception as e:
             logger.warning(f"Sliding window processing error: {e}")
-            # Reset on error
-            self.window_sample_buffer = []
-            self.window_sample_count = 0
     
     def _check_ntp_on_init(self):
         """Check NTP status at initialization and log warnings."""
@@ -1029,6 +1028,44 @@ class RawArchiveWriter:
             self.drf_writer = None
             self.metadata_writer = None
             logger.info("DRF writer closed")
+            self._report_closed_files()
+    
+    def _report_closed_files(self):
+        """
+        Record newly closed DRF files in the size ledger.
+        
+        A closed writer's files are final (DRF never reopens them), so each
+        file is recorded exactly once. Only today's directory is listed.
+        """
+        if self.size_ledger is None or self.current_day is None:
+            return
+        
+        day_dir = self.archive_dir / self.current_day.strftime('%Y%m%d')
+        if self.current_day != self._ledger_day:
+            self._ledger_reported = set()
+            self._ledger_day = self.current_day
+        
+        nbytes = nfiles = 0
+        newest = oldest = 0.0
+        try:
+            for subdir in os.scandir(day_dir):
+                if not subdir.is_dir() or subdir.name == 'metadata':
+                    continue
+                for entry in os.scandir(subdir.path):
+                    if entry.path in self._ledger_reported or not entry.name.endswith('.h5'):
+                        continue
+                    st = entry.stat()
+                    self._ledger_reported.add(entry.path)
+                    nbytes += st.st_size
+                    nfiles += 1
+                    newest = max(newest, st.st_mtime)
+                    oldest = min(oldest or st.st_mtime, st.st_mtime)
+        except OSError as e:
+            logger.debug(f"Size ledger scan of {day_dir} failed: {e}")
+            return
+        
+        if nfiles:
+            self.size_ledger.record(day_dir, 'raw', nbytes, nfiles, newest, oldest)
     
     def _cleanup_conflicting_files(self):
         """
@@ -1299,17 +1336,9 @@ class RawArchiveWriter:
                         self.current_segment.gap_count += 1
                         self.current_segment.gap_samples += gap_samples
                 
-                # Accumulate samples for 10-second sliding window monitor
-                if self.sliding_monitor_enabled and self.sliding_monitor is not None:
-                    self.window_sample_buffer.append(samples.copy())
-                    self.window_sample_count += len(samples)
-                    if gap_samples > 0:
-                        self.window_gap_count += 1
-                        self.window_gap_samples += gap_samples
-                    
-                    # Process when we have a complete 10-second window
-                    if self.window_sample_count >= self.samples_per_window:
-                        self._process_sliding_window(system_time)
+                # Stream samples to the 10-second sliding window monitor
+                if self.sliding_monitor_enabled and self.sliding_monitor_bank is not None:
+                    self._feed_sliding_window(samples, system_time, gap_samples)
                 
                 return len(samples)
                 
@@ -1524,6 +1553,7 @@ class RawArchiveReader:
         
         # Create DRF reader
         self.drf_reader: Optional[drf.DigitalRFReader] = None
+        self._drf_lock = None
         self._init_reader()
     
     def _init_reader(self):
@@ -1532,13 +1562,13 @@ class RawArchiveReader:
             logger.warning(f"Archive directory not found: {self.archive_dir}")
             return
         
-        try:
-            self.drf_reader = drf.DigitalRFReader(str(self.archive_dir))
-            channels = self.drf_reader.get_channels()
-            logger.info(f"RawArchiveReader initialized, channels: {channels}")
-        except Exception as e:
-            logger.debug(f"DRF reader init (expected on first run): {e}")
-            self.drf_reader = None
+        # Shared with the other readers of this archive (see archive_reader)
+        from .archive_reader import get_drf_reader
+        self.drf_reader, self._drf_lock = get_drf_reader(self.archive_dir)
+        if self.drf_reader is None:
+            logger.debug(f"DRF reader init (expected on first run): {self.archive_dir}")
+            return
+        logger.info(f"RawArchiveReader initialized, channels: {self.drf_reader.get_channels()}")
     
     def read_samples(
         self,
@@ -1567,11 +1597,12 @@ class RawArchiveReader:
             channel = channels[0]  # Use first channel
             
             # Read data
-            data = self.drf_reader.read(
-                start_index,
-                num_samples,
-                channel
-            )
+            with self._drf_lock:
+                data = self.drf_reader.read_vector(
+                    start_index,
+                    num_samples,
+                    channel
+                )
             
             if data is None or len(data) == 0:
                 return None
@@ -1598,7 +1629,8 @@ class RawArchiveReader:
                 return None
             
             channel = channels[0]
-            bounds = self.drf_reader.get_bounds(channel)
+            with self._drf_lock:
+                bounds = self.drf_reader.get_bounds(channel)
             return bounds
         except Exception as e:
             logger.error(f"Error getting archive bounds: {e}")
@@ -1623,7 +1655,8 @@ def create_raw_archive_writer(
     frequency_hz: float,
     sample_rate: int = 20000,
     station_config: Optional[Dict] = None,
-    compression: str = 'gzip'
+    compression: str = 'gzip',
+    size_ledger_dir: Optional[Path] = None
 ) -> RawArchiveWriter:
     """
     Create a raw archive writer with default settings.
@@ -1635,6 +1668,7 @@ def create_raw_archive_writer(
         sample_rate: Sample rate (default 20000)
         station_config: Station metadata
         compression: Compression algorithm
+        size_ledger_dir: SizeLedger state directory to report closed files to
         
     Returns:
         Configured RawArchiveWriter
@@ -1645,6 +1679,7 @@ def create_raw_archive_writer(
         frequency_hz=frequency_hz,
         sample_rate=sample_rate,
         station_config=station_config or {},
-        compression=compression
+        compression=compression,
+        size_ledger_dir=size_ledger_dir
     )
     return RawArchiveWriter(config)
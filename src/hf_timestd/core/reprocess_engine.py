@@ -0,0 +1,777 @@
+#!/usr/bin/env python3
+"""
+Reprocess Engine - Parallel Phase 2 reprocessing of archived minutes
+
+Reruns the Phase 2 temporal analysis over a (channel, time range) space read
+from the Phase 1 binary archive (raw_buffer) or the Digital RF archive
+(raw_archive), spread across worker processes.
+
+Two passes keep the output independent of how shards were scheduled:
+
+1. Analysis (parallel): the range is cut into shards of `shard_minutes` per
+   channel. Each worker process imports the analysis stack once, then runs
+   every shard on a freshly constructed Phase2TemporalEngine (cheap once the
+   modules are warm) with an in-memory station voter, so results never
+   depend on which shards a worker happened to see before, and never touch
+   the live /dev/shm voter.
+   
+   The flip side: the engine's minute-to-minute state (the discriminator's
+   station history, the voter) starts cold at every shard boundary, so the
+   first minutes of a shard can come out differently than in one continuous
+   pass. Results depend on `shard_minutes` - which is why it is part of the
+   run_id - but never on the worker count or scheduling. Use the default
+   hour (or longer) shards when comparing against the live pipeline.
+2. Merge (sequential): per-minute records from all shards are replayed in
+   time order through the stateful models - TimingCalibrator across all
+   channels and one ClockConvergenceModel per channel - and the Phase 2
+   CSV series are written from the merged result. Daily carrier power files
+   are closed as soon as the merge has moved past their day.
+
+Checkpoint/resume: every finished shard is written atomically to
+{data_root}/state/reprocess/{run_id}/shards/. Rerunning the same job (same
+channels, range, source, version) skips finished shards; the merge always
+rebuilds the outputs from the shard files.
+
+Output: {data_root}/phase2/{CHANNEL}/reprocess/{version}/
+    clock_offset/clock_offset_series.csv
+    carrier_power/carrier_power_{date}.csv
+
+Usage:
+------
+    hf-timestd reprocess --config config/timestd-config.toml \\
+        --start 2025-12-01 --end 2025-12-03 --workers 8
+    
+    python -m hf_timestd.core.reprocess_engine --data-root /var/lib/hf-timestd \\
+        --channel "WWV 10 MHz" --frequency-hz 10e6 --start 2025-12-01 --end 2025-12-02
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..paths import GRAPEPaths, channel_name_to_dir
+from .checkpoint_service import checkpoint_path, get_checkpoint_service
+from .archive_reader import ArchiveReader, SOURCES
+from .phase2_analytics_service import carrier_snr_db
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARD_MINUTES = 60
+
+CLOCK_OFFSET_COLUMNS = [
+    'system_time', 'utc_time', 'minute_boundary_utc',
+    'clock_offset_ms', 'station', 'frequency_mhz',
+    'propagation_delay_ms', 'propagation_mode', 'n_hops',
+    'confidence', 'uncertainty_ms', 'quality_grade',
+    'snr_db', 'raw_clock_offset_ms', 'residual_ms', 'is_anomaly',
+    'utc_verified', 'rtp_timestamp', 'processed_at'
+]
+
+CARRIER_POWER_COLUMNS = [
+    'timestamp', 'utc_time', 'power_db', 'snr_db',
+    'wwv_tone_db', 'wwvh_tone_db', 'station', 'quality_grade'
+]
+
+
+@dataclass
+class ReprocessChannel:
+    """Channel to reprocess"""
+    name: str
+    frequency_hz: float
+
+
+@dataclass
+class ReprocessJob:
+    """A reprocessing request: channels × [start, end) minutes"""
+    data_root: Path
+    channels: List[ReprocessChannel]
+    start: int                      # Unix time, minute-aligned (inclusive)
+    end: int                        # Unix time, minute-aligned (exclusive)
+    source: str = 'auto'
+    sample_rate: int = 20000
+    receiver_grid: str = ''
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    output_version: str = 'v2'
+    shard_minutes: int = DEFAULT_SHARD_MINUTES   # Engine state restarts at every shard
+    
+    def __post_init__(self):
+        self.data_root = Path(self.data_root)
+        self.start = (int(self.start) // 60) * 60
+        self.end = -(-int(self.end) // 60) * 60
+        if self.source not in SOURCES:
+            raise ValueError(f"source must be one of {SOURCES}, got {self.source!r}")
+        if self.end <= self.start:
+            raise ValueError("end must be after start")
+    
+    @property
+    def run_id(self) -> str:
+        """Stable identifier: the same job always maps to the same checkpoint."""
+        key = json.dumps({
+            'channels': sorted(c.name for c in self.channels),
+            'start': self.start,
+            'end': self.end,
+            'source': self.source,
+            'version': self.output_version,
+            'shard_minutes': self.shard_minutes,
+        }, sort_keys=True)
+        return hashlib.sha1(key.encode()).hexdigest()[:12]
+    
+    @property
+    def total_minutes(self) -> int:
+        return (self.end - self.start) // 60 * len(self.channels)
+    
+    def output_dir(self, channel_name: str) -> Path:
+        return GRAPEPaths(self.data_root).get_phase2_dir(channel_name) / 'reprocess' / self.output_version
+    
+    def to_dict(self) -> Dict[str, Any]:
+        d = asdict(self)
+        d['data_root'] = str(self.data_root)
+        return d
+
+
+@dataclass
+class Shard:
+    """One unit of parallel work: a channel over [start, end)"""
+    channel: str
+    frequency_hz: float
+    start: int
+    end: int
+    
+    @property
+    def shard_id(self) -> str:
+        return f"{channel_name_to_dir(self.channel)}_{self.start}"
+    
+    @property
+    def minutes(self) -> int:
+        return (self.end - self.start) // 60
+
+
+@dataclass
+class ReprocessReport:
+    """Throughput and outcome of one reprocessing run"""
+    run_id: str
+    workers: int
+    shards_total: int
+    shards_resumed: int = 0
+    shards_processed: int = 0
+    shards_failed: int = 0
+    minutes_total: int = 0
+    minutes_processed: int = 0      # Minutes with data that went through the engine
+    minutes_analyzed: int = 0       # ... of which analyzed in this run (not resumed)
+    minutes_missing: int = 0        # Minutes with no archived data
+    measurements: int = 0           # Minutes that produced a D_clock result
+    analysis_wall_sec: float = 0.0
+    worker_cpu_sec: float = 0.0
+    merge_sec: float = 0.0
+    errors: List[str] = field(default_factory=list)
+    
+    @property
+    def minutes_per_sec(self) -> float:
+        return self.minutes_analyzed / self.analysis_wall_sec if self.analysis_wall_sec > 0 else 0.0
+    
+    @property
+    def minutes_per_sec_per_core(self) -> float:
+        """Wall-clock throughput divided by the number of worker processes"""
+        return self.minutes_per_sec / self.workers if self.workers else 0.0
+    
+    @property
+    def minutes_per_cpu_sec(self) -> float:
+        """Throughput per second of worker CPU time (scheduling-independent)"""
+        return self.minutes_analyzed / self.worker_cpu_sec if self.worker_cpu_sec > 0 else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        d = asdict(self)
+        d['minutes_per_sec'] = round(self.minutes_per_sec, 3)
+        d['minutes_per_sec_per_core'] = round(self.minutes_per_sec_per_core, 4)
+        d['minutes_per_cpu_sec'] = round(self.minutes_per_cpu_sec, 4)
+        return d
+    
+    def summary(self) -> str:
+        return (
+            f"{self.minutes_processed}/{self.minutes_total} minutes "
+            f"({self.minutes_missing} missing, {self.measurements} measurements), "
+            f"{self.shards_processed} shards processed, {self.shards_resumed} resumed, "
+            f"{self.shards_failed} failed; "
+            f"{self.minutes_per_sec:.2f} min/s on {self.workers} workers = "
+            f"{self.minutes_per_sec_per_core:.3f} min/s/core "
+            f"({self.minutes_per_cpu_sec:.3f} min per CPU-second)"
+        )
+
+
+def make_shards(job: ReprocessJob) -> List[Shard]:
+    """Cut the job into shards, ordered by time then channel."""
+    step = job.shard_minutes * 60
+    shards = []
+    for t in range(job.start, job.end, step):
+        for ch in job.channels:
+            shards.append(Shard(ch.name, ch.frequency_hz, t, min(t + step, job.end)))
+    return shards
+
+
+# =============================================================================
+# Pass 1: analysis (worker processes)
+# =============================================================================
+
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(job_dict: Dict[str, Any], log_level: int):
+    """Warm a worker: import the analysis stack and build one throwaway engine."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Parent handles Ctrl-C
+    logging.getLogger('hf_timestd').setLevel(log_level)
+    
+    _worker['job'] = job_dict
+    # One reader per worker: shared DRF readers, pooled decompression buffers
+    # and read-ahead of the next minutes of the shard being processed
+    _worker['archive'] = ArchiveReader(
+        Path(job_dict['data_root']),
+        sample_rate=job_dict['sample_rate'],
+        source=job_dict['source']
+    )
+    
+    # Phase2TemporalEngine imports its components lazily on first construction
+    # (~1 s); later constructions take milliseconds.
+    if job_dict['channels']:
+        ch = job_dict['channels'][0]
+        _build_engine(ch['name'], ch['frequency_hz'])
+
+
+def _build_engine(channel_name: str, frequency_hz: float):
+    from .phase2_temporal_engine import Phase2TemporalEngine
+    from .global_station_voter import GlobalStationVoter
+    
+    job = _worker['job']
+    data_root = Path(job['data_root'])
+    output_dir = GRAPEPaths(data_root).get_phase2_dir(channel_name) / 'reprocess' / job['output_version']
+    engine = Phase2TemporalEngine(
+        raw_archive_dir=data_root / 'raw_archive',
+        output_dir=output_dir,
+        channel_name=channel_name,
+        frequency_hz=frequency_hz,
+        receiver_grid=job['receiver_grid'],
+        sample_rate=job['sample_rate'],
+        precise_lat=job['latitude'],
+        precise_lon=job['longitude']
+    )
+    # Keep reprocessing out of the live cross-channel voter in /dev/shm
+    engine.voter = GlobalStationVoter(
+        channels=list(engine.voter.channels),
+        sample_rate=job['sample_rate'],
+        use_ipc=False
+    )
+    return engine
+
+
+def _read_minute(channel_name: str, minute: int) -> Optional[Tuple[np.ndarray, float, int]]:
+    data = _worker['archive'].get_minute(channel_name, minute)
+    return data.as_tuple() if data is not None else None
+
+
+def _minute_record(minute: int, data: Tuple[np.ndarray, float, int], result) -> Dict[str, Any]:
+    """Compact, JSON-serializable per-minute output of pass 1."""
+    iq_samples, _, rtp_timestamp = data
+    power_linear = float(np.mean(np.abs(iq_samples) ** 2))
+    zero_mask = (iq_samples.real == 0) & (iq_samples.imag == 0)
+    
+    record: Dict[str, Any] = {
+        'minute': minute,
+        'rtp_timestamp': int(rtp_timestamp),
+        'power_db': round(10 * np.log10(power_linear + 1e-12), 3),
+        'snr_db': round(carrier_snr_db(iq_samples), 3),
+        'gap_samples': int(np.sum(zero_mask)),
+        'result': None,
+    }
+    if result is not None:
+        solution = result.solution
+        time_snap = result.time_snap
+        record['result'] = {
+            'd_clock_ms': float(result.d_clock_ms),
+            'uncertainty_ms': float(result.uncertainty_ms),
+            'confidence': float(result.confidence),
+            'station': solution.station if solution else 'UNKNOWN',
+            'propagation_delay_ms': float(solution.t_propagation_ms) if solution else 0.0,
+            'propagation_mode': solution.propagation_mode if solution else '',
+            'n_hops': int(solution.n_hops) if solution else 0,
+            'solution_confidence': float(solution.confidence) if solution else 0.0,
+            'wwv_tone_db': time_snap.wwv_snr_db if time_snap else None,
+            'wwvh_tone_db': time_snap.wwvh_snr_db if time_snap else None,
+        }
+    return record
+
+
+def _process_shard(shard: Shard) -> Dict[str, Any]:
+    """Run one shard through a fresh engine (runs in a worker process)."""
+    cpu_start = time.process_time()
+    engine = _build_engine(shard.channel, shard.frequency_hz)
+    
+    records = []
+    missing = 0
+    for minute in range(shard.start, shard.end, 60):
+        data = _read_minute(shard.channel, minute)
+        if data is None:
+            missing += 1
+            continue
+        iq_samples, system_time, rtp_timestamp = data
+        result = engine.process_minute(
+            iq_samples=iq_samples,
+            system_time=system_time,
+            rtp_timestamp=rtp_timestamp
+        )
+        records.append(_minute_record(minute, data, result))
+    
+    return {
+        'shard_id': shard.shard_id,
+        'channel': shard.channel,
+        'start': shard.start,
+        'end': shard.end,
+        'minutes_missing': missing,
+        'cpu_sec': time.process_time() - cpu_start,
+        'records': records,
+    }
+
+
+# =============================================================================
+# Engine
+# =============================================================================
+
+class ReprocessEngine:
+    """
+    Parallel Phase 2 reprocessing with checkpoint/resume and a sequential
+    merge stage for the stateful models.
+    """
+    
+    def __init__(self, job: ReprocessJob, workers: Optional[int] = None):
+        """
+        Initialize reprocess engine.
+        
+        Args:
+            job: What to reprocess
+            workers: Worker processes (default: CPU count)
+        """
+        self.job = job
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        
+        self.run_dir = GRAPEPaths(job.data_root).get_state_dir() / 'reprocess' / job.run_id
+        self.shard_dir = self.run_dir / 'shards'
+        self.report_file = self.run_dir / 'report.json'
+    
+    # -------------------------------------------------------------------------
+    # Checkpoints
+    # -------------------------------------------------------------------------
+    
+    def _shard_file(self, shard: Shard) -> Path:
+        return self.shard_dir / f"{shard.shard_id}.json"
+    
+    def _save_shard(self, shard: Shard, output: Dict[str, Any]):
+        path = self._shard_file(shard)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(output, f, separators=(',', ':'))
+        tmp.replace(path)
+    
+    def _load_shard(self, shard: Shard) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._shard_file(shard)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def pending_shards(self) -> List[Shard]:
+        """Shards without a checkpoint."""
+        return [s for s in make_shards(self.job) if not self._shard_file(s).exists()]
+    
+    def reset(self):
+        """Discard checkpoints so the next run starts from scratch."""
+        if self.shard_dir.exists():
+            for f in self.shard_dir.iterdir():
+                f.unlink()
+    
+    # -------------------------------------------------------------------------
+    # Run
+    # -------------------------------------------------------------------------
+    
+    def run(self) -> ReprocessReport:
+        """Analyze pending shards in parallel, then merge. Safe to interrupt and rerun."""
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.run_dir / 'job.json', 'w') as f:
+            json.dump(self.job.to_dict(), f, indent=2)
+        
+        shards = make_shards(self.job)
+        pending = self.pending_shards()
+        report = ReprocessReport(
+            run_id=self.job.run_id,
+            workers=self.workers,
+            shards_total=len(shards),
+            shards_resumed=len(shards) - len(pending),
+            minutes_total=self.job.total_minutes
+        )
+        
+        logger.info(
+            f"Reprocess {self.job.run_id}: {len(self.job.channels)} channels, "
+            f"{self.job.total_minutes} minutes in {len(shards)} shards "
+            f"({report.shards_resumed} already done), {self.workers} workers"
+        )
+        
+        if pending:
+            self._analyze(pending, report)
+        
+        if report.shards_failed == 0:
+            self._merge(shards, report)
+        else:
+            logger.warning(f"{report.shards_failed} shards failed; rerun to retry before merging")
+        
+        with open(self.report_file, 'w') as f:
+            json.dump(report.to_dict(), f, indent=2)
+        logger.info(f"Reprocess {self.job.run_id}: {report.summary()}")
+        return report
+    
+    def _analyze(self, pending: List[Shard], report: ReprocessReport):
+        started = time.time()
+        executor = ProcessPoolExecutor(
+            max_workers=min(self.workers, len(pending)),
+            initializer=_init_worker,
+            initargs=(self.job.to_dict(), logging.getLogger('hf_timestd').getEffectiveLevel())
+        )
+        try:
+            futures = {executor.submit(_process_shard, s): s for s in pending}
+            for done, future in enumerate(as_completed(futures), 1):
+                shard = futures[future]
+                try:
+                    output = future.result()
+                except Exception as e:
+                    report.shards_failed += 1
+                    report.errors.append(f"{shard.shard_id}: {e}")
+                    logger.error(f"Shard {shard.shard_id} failed: {e}")
+                    continue
+                
+                self._save_shard(shard, output)
+                report.shards_processed += 1
+                report.worker_cpu_sec += output['cpu_sec']
+                report.minutes_analyzed += len(output['records'])
+                
+                elapsed = time.time() - started
+                logger.info(
+                    f"  [{done}/{len(pending)}] {shard.shard_id}: "
+                    f"{len(output['records'])} minutes, {output['minutes_missing']} missing "
+                    f"({elapsed:.0f}s elapsed)"
+                )
+        except KeyboardInterrupt:
+            logger.warning("Interrupted - finished shards are checkpointed, rerun to resume")
+            raise
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            report.analysis_wall_sec = time.time() - started
+    
+    # -------------------------------------------------------------------------
+    # Pass 2: sequential merge through stateful models
+    # -------------------------------------------------------------------------
+    
+    def _iter_records(self, shards: List[Shard]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """All checkpointed minute records in (minute, channel) order."""
+        per_channel: Dict[str, List[Dict[str, Any]]] = {}
+        for shard in shards:
+            output = self._load_shard(shard)
+            if output is None:
+                continue
+            per_channel.setdefault(shard.channel, []).extend(output['records'])
+        
+        merged = [
+            (record['minute'], channel, record)
+            for channel, records in per_channel.items()
+            for record in records
+        ]
+        merged.sort(key=lambda item: (item[0], item[1]))
+        for _, channel, record in merged:
+            yield channel, record
+    
+    def _merge(self, shards: List[Shard], report: ReprocessReport):
+        from .clock_convergence import ClockConvergenceModel
+        from .timing_calibrator import TimingCalibrator
+        
+        started = time.time()
+        
+        # Fresh state in the run directory: never read or write the live state
+        calibration_file = self.run_dir / 'timing_calibration.json'
+        for stale in (calibration_file, checkpoint_path(calibration_file)):
+            if stale.exists():
+                stale.unlink()
+        calibrator = TimingCalibrator(
+            self.job.data_root, sample_rate=self.job.sample_rate, state_file=calibration_file
+        )
+        models = {
+            ch.name: ClockConvergenceModel(
+                lock_uncertainty_ms=1.0,
+                min_samples_for_lock=30,
+                anomaly_sigma=3.0,
+                max_consecutive_anomalies=5
+            )
+            for ch in self.job.channels
+        }
+        frequencies = {ch.name: ch.frequency_hz for ch in self.job.channels}
+        
+        writers = _SeriesWriters(self.job)
+        try:
+            for channel, record in self._iter_records(shards):
+                report.minutes_processed += 1
+                result = record['result']
+                if result is None:
+                    writers.carrier_power(channel, record, None, None)
+                    continue
+                
+                report.measurements += 1
+                frequency_mhz = frequencies[channel] / 1e6
+                unc = result['uncertainty_ms']
+                input_grade = 'A' if unc < 1.0 else 'B' if unc < 3.0 else 'C' if unc < 10.0 else 'D'
+                
+                convergence = models[channel].process_measurement(
+                    station=result['station'],
+                    frequency_mhz=frequency_mhz,
+                    d_clock_ms=result['d_clock_ms'],
+                    timestamp=float(record['minute']),
+                    snr_db=record['snr_db'],
+                    quality_grade=input_grade
+                )
+                
+                try:
+                    calibrator.update_from_detection(
+                        station=result['station'],
+                        frequency_mhz=frequency_mhz,
+                        channel_name=channel,
+                        d_clock_ms=result['d_clock_ms'],
+                        propagation_delay_ms=result['propagation_delay_ms'],
+                        snr_db=record['snr_db'],
+                        confidence=result['confidence'],
+                        rtp_timestamp=record['rtp_timestamp'],
+                        minute_boundary=record['minute']
+                    )
+                except Exception as e:
+                    logger.debug(f"Calibrator update error: {e}")
+                
+                writers.clock_offset(channel, frequency_mhz, record, convergence)
+                writers.carrier_power(channel, record, result, input_grade)
+        finally:
+            writers.close()
+            get_checkpoint_service().flush()
+        
+        report.minutes_missing = report.minutes_total - report.minutes_processed
+        report.merge_sec = time.time() - started
+        
+        with open(self.run_dir / 'calibration_status.json', 'w') as f:
+            json.dump(calibrator.get_status(), f, indent=2, default=str)
+
+
+class _SeriesWriters:
+    """
+    CSV outputs of the merge stage, rewritten from scratch on every merge.
+    
+    Records arrive in time order, so once a record of a later day shows up
+    the daily carrier power files of every earlier day are complete and get
+    closed: a run over months keeps one day of files open, not all of them.
+    """
+    
+    def __init__(self, job: ReprocessJob):
+        self.job = job
+        self._files: Dict[Path, Any] = {}
+        self._writers: Dict[Path, Any] = {}
+        self._day = ''
+        self._day_paths: List[Path] = []
+    
+    def _writer(self, path: Path, header: List[str]):
+        writer = self._writers.get(path)
+        if writer is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(path, 'w', newline='')
+            writer = csv.writer(f)
+            writer.writerow(header)
+            self._files[path] = f
+            self._writers[path] = writer
+        return writer
+    
+    def clock_offset(self, channel: str, frequency_mhz: float, record: Dict, convergence):
+        result = record['result']
+        if convergence.is_locked:
+            quality_grade = 'A' if convergence.uncertainty_ms < 0.5 else 'B'
+        else:
+            progress = convergence.convergence_progress
+            quality_grade = 'B' if progress >= 0.9 else 'C' if progress >= 0.5 else 'D'
+        
+        path = self.job.output_dir(channel) / 'clock_offset' / 'clock_offset_series.csv'
+        self._writer(path, CLOCK_OFFSET_COLUMNS).writerow([
+            record['minute'],
+            record['minute'] + convergence.d_clock_ms / 1000.0,
+            record['minute'],
+            convergence.d_clock_ms,
+            result['station'],
+            frequency_mhz,
+            result['propagation_delay_ms'],
+            result['propagation_mode'],
+            result['n_hops'],
+            result['solution_confidence'],
+            convergence.uncertainty_ms,
+            quality_grade,
+            record['snr_db'],
+            result['d_clock_ms'],
+            convergence.residual_ms,
+            convergence.is_anomaly,
+            convergence.is_locked,
+            record['rtp_timestamp'],
+            datetime.now(timezone.utc).timestamp()
+        ])
+    
+    def carrier_power(self, channel: str, record: Dict, result: Optional[Dict], grade: Optional[str]):
+        dt = datetime.fromtimestamp(record['minute'], timezone.utc)
+        day = dt.strftime('%Y%m%d')
+        if day != self._day:
+            self._close_day()
+            self._day = day
+        path = self.job.output_dir(channel) / 'carrier_power' / f"carrier_power_{day}.csv"
+        if path not in self._writers:
+            self._day_paths.append(path)
+        wwv_db = result['wwv_tone_db'] if result else None
+        wwvh_db = result['wwvh_tone_db'] if result else None
+        self._writer(path, CARRIER_POWER_COLUMNS).writerow([
+            record['minute'],
+            dt.isoformat(),
+            record['power_db'],
+            record['snr_db'],
+            round(wwv_db, 2) if wwv_db is not None else '',
+            round(wwvh_db, 2) if wwvh_db is not None else '',
+            result['station'] if result else '',
+            grade or 'X'
+        ])
+    
+    def _close_day(self):
+        for path in self._day_paths:
+            self._files.pop(path).close()
+            del self._writers[path]
+        self._day_paths = []
+    
+    def open_files(self) -> int:
+        return len(self._files)
+    
+    def close(self):
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+        self._writers.clear()
+        self._day_paths = []
+
+
+# =============================================================================
+# Job construction
+# =============================================================================
+
+def parse_time(value: str) -> int:
+    """Parse 'YYYYMMDD', 'YYYY-MM-DD', 'YYYY-MM-DDTHH:MM' (UTC) or a Unix timestamp."""
+    if value.isdigit() and len(value) != 8:
+        return int(value)
+    for fmt in ('%Y%m%d', '%Y-%m-%d', '%Y-%m-%dT%H:%M', '%Y-%m-%dT%H:%M:%S'):
+        try:
+            return int(datetime.strptime(value, fmt).replace(tzinfo=timezone.utc).timestamp())
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognized time: {value!r}")
+
+
+def job_from_config(
+    config: Dict[str, Any],
+    start: int,
+    end: int,
+    channel_names: Optional[List[str]] = None,
+    **kwargs
+) -> ReprocessJob:
+    """
+    Build a job from a timestd-config.toml dict.
+    
+    Args:
+        config: Parsed configuration
+        start: Start time (Unix, inclusive)
+        end: End time (Unix, exclusive)
+        channel_names: Channels to reprocess (default: all configured channels)
+        **kwargs: Extra ReprocessJob fields (source, output_version, shard_minutes)
+    """
+    recorder = config.get('recorder', {})
+    station = config.get('station', {})
+    mode = recorder.get('mode', 'test')
+    data_root = recorder.get('production_data_root' if mode == 'production' else 'test_data_root',
+                             '/tmp/timestd-test')
+    
+    configured = {ch['description']: ch['frequency_hz']
+                  for ch in recorder.get('channels', []) if ch.get('enabled', True)}
+    names = channel_names or list(configured)
+    unknown = [n for n in names if n not in configured]
+    if unknown:
+        raise ValueError(f"Channels not in configuration: {', '.join(unknown)}")
+    
+    return ReprocessJob(
+        data_root=Path(data_root),
+        channels=[ReprocessChannel(n, configured[n]) for n in names],
+        start=start,
+        end=end,
+        sample_rate=recorder.get('channel_defaults', {}).get('sample_rate', 20000),
+        receiver_grid=station.get('grid_square', ''),
+        latitude=station.get('latitude'),
+        longitude=station.get('longitude'),
+        **kwargs
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Parallel Phase 2 reprocessing of archived minutes'
+    )
+    parser.add_argument('--data-root', type=Path, required=True, help='Root data directory')
+    parser.add_argument('--channel', required=True, help='Channel name (e.g., "WWV 10 MHz")')
+    parser.add_argument('--frequency-hz', type=float, required=True, help='Center frequency')
+    parser.add_argument('--start', required=True, help='Start (YYYY-MM-DD[THH:MM] UTC)')
+    parser.add_argument('--end', required=True, help='End, exclusive (YYYY-MM-DD[THH:MM] UTC)')
+    parser.add_argument('--grid', default='', help='Receiver grid square')
+    parser.add_argument('--sample-rate', type=int, default=20000, help='Archive sample rate')
+    parser.add_argument('--source', choices=SOURCES, default='auto', help='Archive to read')
+    parser.add_argument('--version', default='v2', help='Output version directory')
+    parser.add_argument('--shard-minutes', type=int, default=DEFAULT_SHARD_MINUTES,
+                        help='Minutes per shard; analysis state restarts at every shard')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--fresh', action='store_true', help='Ignore existing checkpoints')
+    parser.add_argument('--log-level', default='INFO',
+                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
+    args = parser.parse_args()
+    
+    logging.basicConfig(
+        level=getattr(logging, args.log_level),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    job = ReprocessJob(
+        data_root=args.data_root,
+        channels=[ReprocessChannel(args.channel, args.frequency_hz)],
+        start=parse_time(args.start),
+        end=parse_time(args.end),
+        source=args.source,
+        sample_rate=args.sample_rate,
+        receiver_grid=args.grid,
+        output_version=args.version,
+        shard_minutes=args.shard_minutes
+    )
+    engine = ReprocessEngine(job, workers=args.workers)
+    if args.fresh:
+        engine.reset()
+    report = engine.run()
+    print(json.dumps(report.to_dict(), indent=2))
+
+
+if __name__ == '__main__':
+    main()
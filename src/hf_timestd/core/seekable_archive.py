@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Seekable Archive - chunked, randomly accessible compressed IQ minutes
+
+A monolithic .bin.zst/.bin.lz4 minute is one compression frame: reading
+seconds 0-2 for tone detection decompresses all 9.6 MB. A .bin.seek minute
+is a sequence of independently compressed chunks (1 s by default) behind a
+small offset table, so a reader decompresses only the chunks it needs, and
+whole-minute reads decompress the chunks in parallel.
+
+File layout (little-endian):
+
+    header   32 bytes
+        magic          4s   b'HFSK'
+        version        u1   1
+        codec          u1   1 = zstd, 2 = lz4 (frame), 3 = iq (iq_codec blocks)
+        reserved       u2
+        dtype          8s   b'complex6' (complex64)
+        sample_rate    u4
+        chunk_samples  u4
+        total_samples  u4
+        num_chunks     u4
+    offsets  u8[num_chunks + 1]   chunk i = bytes offsets[i]:offsets[i+1]
+    chunks   compressed complex64 samples, chunk_samples each (last may be short)
+
+Usage:
+    write_seekable_minute(path, samples, codec='zstd', chunk_samples=20000)
+    
+    with SeekableMinuteFile(path) as f:
+        tone_window = f.read_range(0, 2 * 20000)
+        minute = f.read_all()
+"""
+
+import logging
+import os
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SEEKABLE_EXTENSION = '.bin.seek'
+MAGIC = b'HFSK'
+VERSION = 1
+CODECS = {'zstd': 1, 'lz4': 2, 'iq': 3}
+CODEC_NAMES = {v: k for k, v in CODECS.items()}
+
+_HEADER = struct.Struct('<4sBBH8sIIII')
+_DTYPE_TAG = b'complex6'
+BYTES_PER_SAMPLE = 8  # complex64
+
+# Fewer chunks than this are (de)compressed on the calling thread
+_PARALLEL_MIN_CHUNKS = 4
+_WORKERS = min(8, os.cpu_count() or 1)
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+_local = threading.local()
+
+
+def _decode_pool() -> ThreadPoolExecutor:
+    """Process-wide decompression threads (zstd and lz4 release the GIL)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=_WORKERS,
+                thread_name_prefix='seekable-decode'
+            )
+        return _pool
+
+
+def _compress_chunk(data: bytes, codec: str, level: int) -> bytes:
+    if codec == 'iq':
+        from .iq_codec import encode_iq
+        return encode_iq(np.frombuffer(data, dtype=np.complex64), level=level)
+    if codec == 'zstd':
+        import zstandard as zstd
+        return zstd.ZstdCompressor(level=level).compress(data)
+    import lz4.frame
+    return lz4.frame.compress(data, compression_level=level)
+
+
+def _decompress_chunk(data: bytes, codec: str, out: np.ndarray):
+    """Decompress one chunk into out (a complex64 view of the chunk's samples)."""
+    if codec == 'iq':
+        from .iq_codec import decode_iq_into
+        if decode_iq_into(data, out) != len(out):
+            raise ValueError(f"Chunk decoded to fewer than {len(out)} samples")
+        return
+    if codec == 'zstd':
+        dctx = getattr(_local, 'zstd', None)
+        if dctx is None:
+            import zstandard as zstd
+            dctx = _local.zstd = zstd.ZstdDecompressor()
+        raw = dctx.decompress(data, max_output_size=out.nbytes)
+    else:
+        import lz4.frame
+        raw = lz4.frame.decompress(data)
+    if len(raw) != out.nbytes:
+        raise ValueError(f"Chunk decompressed to {len(raw)} bytes, expected {out.nbytes}")
+    out[:] = np.frombuffer(raw, dtype=np.complex64)
+
+
+def write_seekable_minute(
+    path: Path,
+    samples: np.ndarray,
+    codec: str = 'zstd',
+    level: int = 3,
+    chunk_samples: int = 20000,
+    sample_rate: int = 20000
+) -> int:
+    """
+    Write complex64 samples as a seekable chunked file.
+    
+    Chunks are compressed in parallel. The file is written to a temporary
+    name and renamed, so readers never see a partial offset table.
+    
+    Args:
+        path: Output path (conventionally {minute}.bin.seek)
+        samples: complex64 samples
+        codec: 'zstd', 'lz4' or 'iq'
+        level: Compression level (zstd: 1-22, lz4: 1-12)
+        chunk_samples: Samples per chunk (1 s at the archive rate by default)
+        sample_rate: Recorded in the header
+    
+    Returns:
+        Bytes written
+    """
+    if codec not in CODECS:
+        raise ValueError(f"codec must be one of {list(CODECS)}, got {codec!r}")
+    if chunk_samples <= 0:
+        raise ValueError(f"chunk_samples must be positive, got {chunk_samples}")
+    
+    samples = np.ascontiguousarray(samples, dtype=np.complex64)
+    raw = memoryview(samples.view(np.uint8))
+    chunk_bytes = chunk_samples * BYTES_PER_SAMPLE
+    pieces = [raw[i:i + chunk_bytes] for i in range(0, len(raw), chunk_bytes)]
+    
+    if _WORKERS > 1 and len(pieces) >= _PARALLEL_MIN_CHUNKS:
+        chunks = list(_decode_pool().map(lambda p: _compress_chunk(p, codec, level), pieces))
+    else:
+        chunks = [_compress_chunk(p, codec, level) for p in pieces]
+    
+    table_size = 8 * (len(chunks) + 1)
+    offsets = np.empty(len(chunks) + 1, dtype='<u8')
+    offsets[0] = _HEADER.size + table_size
+    offsets[1:] = offsets[0] + np.cumsum([len(c) for c in chunks], dtype=np.uint64)
+    
+    header = _HEADER.pack(
+        MAGIC, VERSION, CODECS[codec], 0, _DTYPE_TAG,
+        sample_rate, chunk_samples, len(samples), len(chunks)
+    )
+    
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(offsets.tobytes())
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+    return int(offsets[-1])
+
+
+class SeekableMinuteFile:
+    """
+    Random-access reader for a .bin.seek file.
+    
+    Only the header and offset table are read on open; read_range() reads
+    and decompresses just the chunks overlapping the requested samples.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            header = self._file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f"Truncated seekable file: {self.path}")
+            (magic, version, codec, _, dtype_tag, self.sample_rate,
+             self.chunk_samples, self.total_samples, self.num_chunks) = _HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"Not a seekable archive file: {self.path}")
+            if version != VERSION or dtype_tag != _DTYPE_TAG or codec not in CODEC_NAMES:
+                raise ValueError(f"Unsupported seekable file (version {version}, codec {codec}): {self.path}")
+            self.codec = CODEC_NAMES[codec]
+            
+            table = self._file.read(8 * (self.num_chunks + 1))
+            if len(table) < 8 * (self.num_chunks + 1):
+                raise ValueError(f"Truncated offset table: {self.path}")
+            self.offsets = np.frombuffer(table, dtype='<u8').astype(np.int64)
+        except Exception:
+            self._file.close()
+            raise
+        self._lock = threading.Lock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def close(self):
+        self._file.close()
+    
+    @property
+    def compressed_bytes(self) -> int:
+        return int(self.offsets[-1])
+    
+    def _read_chunks(self, first: int, last: int) -> bytes:
+        """Compressed bytes of chunks first..last (inclusive), in one read."""
+        with self._lock:
+            self._file.seek(self.offsets[first])
+            return self._file.read(self.offsets[last + 1] - self.offsets[first])
+    
+    def read_range(
+        self,
+        start_sample: int,
+        num_samples: int,
+        out: Optional[np.ndarray] = None,
+        parallel: bool = True
+    ) -> np.ndarray:
+        """
+        Read samples [start_sample, start_sample + num_samples).
+        
+        The range is clipped to the file; the returned array is shorter if
+        it extends past the end.
+        
+        Args:
+            start_sample: First sample (0 = minute boundary)
+            num_samples: Number of samples
+            out: Optional complex64 buffer (>= returned length) to fill
+            parallel: Decompress chunks on the shared thread pool
+        
+        Returns:
+            complex64 samples (a view of out if given)
+        """
+        start = max(0, start_sample)
+        end = min(self.total_samples, start_sample + num_samples)
+        if end <= start:
+            return np.empty(0, dtype=np.complex64) if out is None else out[:0]
+        
+        first = start // self.chunk_samples
+        last = (end - 1) // self.chunk_samples
+        base = first * self.chunk_samples
+        span_end = min(self.total_samples, (last + 1) * self.chunk_samples)
+        
+        # Decompress whole chunks into a scratch span unless the request is
+        # chunk-aligned and can be decoded straight into the output
+        aligned = start == base and end == span_end
+        if aligned and out is not None:
+            span = out[:end - start]
+        elif aligned:
+            span = np.empty(end - start, dtype=np.complex64)
+        else:
+            span = np.empty(span_end - base, dtype=np.complex64)
+        
+        data = memoryview(self._read_chunks(first, last))
+        origin = self.offsets[first]
+        jobs = []
+        for i in range(first, last + 1):
+            lo = i * self.chunk_samples - base
+            hi = min(lo + self.chunk_samples, span_end - base)
+            blob = data[self.offsets[i] - origin:self.offsets[i + 1] - origin]
+            jobs.append((blob, span[lo:hi]))
+        
+        if parallel and _WORKERS > 1 and len(jobs) >= _PARALLEL_MIN_CHUNKS:
+            pool = _decode_pool()
+            for future in [pool.submit(_decompress_chunk, blob, self.codec, view) for blob, view in jobs]:
+                future.result()
+        else:
+            for blob, view in jobs:
+                _decompress_chunk(blob, self.codec, view)
+        
+        if aligned:
+            return span
+        result = span[start - base:end - base]
+        if out is None:
+            return result
+        out[:len(result)] = result
+        return out[:len(result)]
+    
+    def read_all(self, out: Optional[np.ndarray] = None, parallel: bool = True) -> np.ndarray:
+        """Read the whole minute."""
+        return self.read_range(0, self.total_samples, out=out, parallel=parallel)
+
+
+def read_seekable_range(path: Path, start_sample: int, num_samples: int) -> np.ndarray:
+    """Read samples [start_sample, start_sample + num_samples) of a .bin.seek file."""
+    with SeekableMinuteFile(path) as f:
+        return f.read_range(start_sample, num_samples)
+
+
+def seekable_chunk_sizes(path: Path) -> List[int]:
+    """Compressed size of each chunk (for diagnostics and benchmarks)."""
+    with SeekableMinuteFile(path) as f:
+        return [int(b - a) for a, b in zip(f.offsets[:-1], f.offsets[1:])]
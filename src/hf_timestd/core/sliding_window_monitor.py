@@ -21,7 +21,8 @@ Metrics Tracked:
 
 Output:
 =======
-- JSON status file updated every 10 seconds
+- JSON status file, rewritten when a window differs meaningfully from the
+  last one written (SNR, Doppler, detection, quality, gaps) or is stale
 - Metrics accumulated for per-minute summary
 - Can be disabled if monitoring overhead > benefit
 
@@ -78,6 +79,16 @@ DOPPLER_STABLE_HZ = 0.1         # < 0.1 Hz = very stable
 DOPPLER_MODERATE_HZ = 0.5       # < 0.5 Hz = normal
 DOPPLER_UNSTABLE_HZ = 2.0       # > 2 Hz = disturbed
 
+# Status file is rewritten only on a meaningful change (or when stale)
+STATUS_SNR_DELTA_DB = 1.0
+STATUS_DOPPLER_DELTA_HZ = 2.5     # About one bin of an 8192-point FFT at 20 kHz
+STATUS_COMPLETENESS_DELTA_PCT = 1.0
+STATUS_MAX_AGE_SEC = 60.0
+
+# Streaming spectra (StreamingMonitorBank)
+STREAM_FFT_SIZE = 8192
+STREAM_HOP = 4096               # 50% overlap
+
 
 class SignalQuality(Enum):
     """Overall signal quality classification."""
@@ -212,7 +223,10 @@ class SlidingWindowMonitor:
         sample_rate: int = SAMPLE_RATE,
         output_dir: Optional[Path] = None,
         history_size: int = 60,  # Keep last 60 windows (10 minutes)
-        enabled: bool = True
+        enabled: bool = True,
+        status_snr_delta_db: float = STATUS_SNR_DELTA_DB,
+        status_doppler_delta_hz: float = STATUS_DOPPLER_DELTA_HZ,
+        status_max_age_sec: float = STATUS_MAX_AGE_SEC
     ):
         """
         Initialize sliding window monitor.
@@ -223,12 +237,18 @@ class SlidingWindowMonitor:
             output_dir: Directory for status JSON output
             history_size: Number of windows to keep in history
             enabled: Whether monitoring is active
+            status_snr_delta_db: SNR change that triggers a status write
+            status_doppler_delta_hz: Doppler change that triggers a status write
+            status_max_age_sec: Rewrite the status at least this often
         """
         self.channel_name = channel_name
         self.sample_rate = sample_rate
         self.output_dir = Path(output_dir) if output_dir else None
         self.history_size = history_size
         self.enabled = enabled
+        self.status_snr_delta_db = status_snr_delta_db
+        self.status_doppler_delta_hz = status_doppler_delta_hz
+        self.status_max_age_sec = status_max_age_sec
         
         # State
         self.window_number = 0
@@ -244,6 +264,12 @@ class SlidingWindowMonitor:
         self.anomalies_detected = 0  # Cases where 10s monitoring caught issue before 60s
         self.start_time = time.time()
         
+        # Status file writes: last written window and when
+        self._last_status: Optional[WindowMetrics] = None
+        self._last_status_time = 0.0
+        self.status_writes = 0
+        self.status_writes_skipped = 0
+        
         # Thread safety
         self._lock = threading.Lock()
         
@@ -277,43 +303,91 @@ class SlidingWindowMonitor:
             return None
         
         with self._lock:
-            self.window_number += 1
-            self.total_windows_processed += 1
-            
-            # Create metrics object
-            metrics = WindowMetrics(
-                timestamp=timestamp,
-                window_number=self.window_number,
-                samples_received=len(samples),
-                samples_expected=int(WINDOW_DURATION_SEC * self.sample_rate)
-            )
-            
-            # Calculate completeness
-            if metrics.samples_expected > 0:
-                metrics.completeness_pct = (metrics.samples_received / metrics.samples_expected) * 100
-            
-            # Apply gap info if provided
-            if gap_info:
-                metrics.gap_count = gap_info.get('gap_count', 0)
-                metrics.gap_samples = gap_info.get('gap_samples', 0)
+            metrics = self._start_window(timestamp, len(samples), gap_info)
             
             # Analyze signal
             if len(samples) > 0:
                 self._analyze_signal(samples, metrics)
             
-            # Classify quality
-            metrics.quality = self._classify_quality(metrics)
-            
-            # Add to history
-            self.window_history.append(metrics)
-            
-            # Accumulate for minute summary
-            self._accumulate_for_minute(metrics)
+            return self._finish_window(metrics)
+    
+    def process_spectrum(
+        self,
+        freqs: np.ndarray,
+        power_spectrum: np.ndarray,
+        timestamp: float,
+        samples_received: int,
+        gap_info: Optional[Dict] = None
+    ) -> Optional[WindowMetrics]:
+        """
+        Process a window whose power spectrum was computed elsewhere
+        (StreamingMonitorBank averages overlapping frames of the window).
+        
+        Args:
+            freqs: Bin frequencies (Hz, non-negative)
+            power_spectrum: Power per bin
+            timestamp: Unix timestamp of window start
+            samples_received: Samples that arrived in the window
+            gap_info: Optional dict with gap_count and gap_samples
             
-            # Write status file
+        Returns:
+            WindowMetrics for this window, or None if disabled
+        """
+        if not self.enabled:
+            return None
+        
+        with self._lock:
+            metrics = self._start_window(timestamp, samples_received, gap_info)
+            if samples_received > 0:
+                self._analyze_spectrum(freqs, power_spectrum, metrics)
+            return self._finish_window(metrics)
+    
+    def _start_window(
+        self,
+        timestamp: float,
+        samples_received: int,
+        gap_info: Optional[Dict]
+    ) -> WindowMetrics:
+        """Create the metrics object for a new window."""
+        self.window_number += 1
+        self.total_windows_processed += 1
+        
+        metrics = WindowMetrics(
+            timestamp=timestamp,
+            window_number=self.window_number,
+            samples_received=samples_received,
+            samples_expected=int(WINDOW_DURATION_SEC * self.sample_rate)
+        )
+        
+        # Calculate completeness
+        if metrics.samples_expected > 0:
+            metrics.completeness_pct = (metrics.samples_received / metrics.samples_expected) * 100
+        
+        # Apply gap info if provided
+        if gap_info:
+            metrics.gap_count = gap_info.get('gap_count', 0)
+            metrics.gap_samples = gap_info.get('gap_samples', 0)
+        
+        return metrics
+    
+    def _finish_window(self, metrics: WindowMetrics) -> WindowMetrics:
+        """Classify, record and publish an analyzed window."""
+        # Classify quality
+        metrics.quality = self._classify_quality(metrics)
+        
+        # Add to history
+        self.window_history.append(metrics)
+        
+        # Accumulate for minute summary
+        self._accumulate_for_minute(metrics)
+        
+        # Write status file (only when something changed meaningfully)
+        if self._status_changed(metrics):
             self._write_status(metrics)
-            
-            return metrics
+        else:
+            self.status_writes_skipped += 1
+        
+        return metrics
     
     def _analyze_signal(self, samples: np.ndarray, metrics: WindowMetrics):
         """Analyze signal for SNR and Doppler."""
@@ -330,9 +404,14 @@ class SlidingWindowMonitor:
             
             # Only look at positive frequencies
             pos_mask = freqs >= 0
-            freqs = freqs[pos_mask]
-            power_spectrum = power_spectrum[pos_mask]
+            self._analyze_spectrum(freqs[pos_mask], power_spectrum[pos_mask], metrics)
             
+        except Exception as e:
+            logger.warning(f"Signal analysis error: {e}")
+    
+    def _analyze_spectrum(self, freqs: np.ndarray, power_spectrum: np.ndarray, metrics: WindowMetrics):
+        """Tone SNR and Doppler from a non-negative-frequency power spectrum."""
+        try:
             # Estimate noise floor (median of spectrum, excluding DC)
             noise_floor = np.median(power_spectrum[10:])  # Skip DC region
             
@@ -512,6 +591,37 @@ class SlidingWindowMonitor:
             f"presence={summary.signal_presence_rate*100:.0f}%"
         )
     
+    def _status_changed(self, metrics: WindowMetrics) -> bool:
+        """Whether the status file is stale or the window differs meaningfully from it."""
+        if self.output_dir is None:
+            return False
+        last = self._last_status
+        if last is None or time.time() - self._last_status_time >= self.status_max_age_sec:
+            return True
+        
+        if (metrics.quality != last.quality
+                or metrics.signal_present != last.signal_present
+                or metrics.wwv_detected != last.wwv_detected
+                or metrics.wwvh_detected != last.wwvh_detected
+                or (metrics.gap_count > 0) != (last.gap_count > 0)):
+            return True
+        if abs(metrics.completeness_pct - last.completeness_pct) >= STATUS_COMPLETENESS_DELTA_PCT:
+            return True
+        
+        def moved(new: Optional[float], old: Optional[float], delta: float) -> bool:
+            if new is None or old is None:
+                return (new is None) != (old is None)
+            return abs(new - old) >= delta
+        
+        # Doppler of the dominant tone only: the weaker bin is often a noise peak
+        def dominant_doppler(w: WindowMetrics) -> Optional[float]:
+            if w.wwvh_snr_db is not None and w.wwvh_snr_db == w.dominant_snr_db:
+                return w.wwvh_doppler_hz
+            return w.wwv_doppler_hz
+        
+        return (moved(metrics.dominant_snr_db, last.dominant_snr_db, self.status_snr_delta_db)
+                or moved(dominant_doppler(metrics), dominant_doppler(last), self.status_doppler_delta_hz))
+    
     def _write_status(self, metrics: WindowMetrics):
         """Write current status to JSON file."""
         if self.output_dir is None:
@@ -549,6 +659,9 @@ class SlidingWindowMonitor:
                 json.dump(status, f, indent=2)
             
             temp_file.rename(status_file)
+            self._last_status = metrics
+            self._last_status_time = time.time()
+            self.status_writes += 1
             
         except Exception as e:
             logger.warning(f"Failed to write monitor status: {e}")
@@ -644,5 +757,244 @@ class SlidingWindowMonitor:
                 'anomalies_detected': self.anomalies_detected,
                 'uptime_seconds': time.time() - self.start_time,
                 'history_size': len(self.window_history),
-                'minute_summaries': len(self.minute_summaries)
+                'minute_summaries': len(self.minute_summaries),
+                'status_writes': self.status_writes,
+                'status_writes_skipped': self.status_writes_skipped
             }
+
+
+@dataclass
+class _ChannelStream:
+    """Streaming STFT state of one channel in a StreamingMonitorBank."""
+    monitor: SlidingWindowMonitor
+    buffer: np.ndarray                  # Samples not yet consumed by a frame
+    fill: int = 0
+    next_frame: int = 0                 # Stream sample index of buffer[0]
+    window_index: int = 0
+    stream_start: Optional[float] = None
+    power_sum: Optional[np.ndarray] = None
+    frames: int = 0
+    samples_fed: int = 0
+    gap_count: int = 0
+    gap_samples: int = 0
+
+
+class StreamingMonitorBank:
+    """
+    Sliding window monitoring for many channels with streaming spectra.
+    
+    Instead of one fresh FFT per channel per window, every channel keeps
+    overlapping STFT state (Hann-windowed frames of STREAM_FFT_SIZE
+    samples every STREAM_HOP samples). Frames that became complete in any
+    channel are stacked and transformed in one FFT call per tick; each
+    channel accumulates its frames' power. When a channel's 10-second
+    window is covered, the averaged spectrum goes to that channel's
+    SlidingWindowMonitor (history, minute summaries, status file).
+    
+    feed() only copies samples into the channel's buffer and ticks once
+    that channel holds tick_frames complete frames, so the FFT cost is
+    batched across channels and independent of packet size.
+    
+    Usage:
+        bank = StreamingMonitorBank(sample_rate=20000, output_dir=status_dir)
+        bank.add_channel('WWV 10 MHz')
+        bank.add_channel('CHU 7.85 MHz')
+        
+        # Per packet, from each channel's receive path
+        bank.feed('WWV 10 MHz', samples, timestamp, gap_samples=0)
+    """
+    
+    def __init__(
+        self,
+        sample_rate: int = SAMPLE_RATE,
+        output_dir: Optional[Path] = None,
+        n_fft: int = STREAM_FFT_SIZE,
+        hop: int = STREAM_HOP,
+        window_sec: float = WINDOW_DURATION_SEC,
+        tick_frames: int = 4,
+        **monitor_kwargs
+    ):
+        """
+        Args:
+            sample_rate: Input sample rate (Hz), shared by all channels
+            output_dir: Directory for the per-channel status JSON files
+            n_fft: STFT frame length (samples)
+            hop: Samples between frame starts
+            window_sec: Monitoring window (seconds)
+            tick_frames: Complete frames a channel buffers before a tick
+            **monitor_kwargs: Passed to each channel's SlidingWindowMonitor
+        """
+        if hop <= 0 or hop > n_fft:
+            raise ValueError(f"hop must be in 1..{n_fft}, got {hop}")
+        self.sample_rate = sample_rate
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.n_fft = n_fft
+        self.hop = hop
+        self.samples_per_window = int(window_sec * sample_rate)
+        self.tick_frames = max(1, tick_frames)
+        self.monitor_kwargs = monitor_kwargs
+        
+        self.n_bins = n_fft // 2
+        self.freqs = np.fft.fftfreq(n_fft, 1.0 / sample_rate)[:self.n_bins]
+        self.taper = np.hanning(n_fft).astype(np.float32)
+        self._buffer_size = n_fft + (self.tick_frames + 1) * hop
+        
+        self.channels: Dict[str, _ChannelStream] = {}
+        self._lock = threading.Lock()
+        
+        # Statistics
+        self.ticks = 0
+        self.frames_transformed = 0
+        self.windows_completed = 0
+    
+    def add_channel(self, channel_name: str) -> SlidingWindowMonitor:
+        """Register a channel; returns its monitor (metrics, summaries, stats)."""
+        with self._lock:
+            if channel_name not in self.channels:
+                monitor = SlidingWindowMonitor(
+                    channel_name=channel_name,
+                    sample_rate=self.sample_rate,
+                    output_dir=self.output_dir,
+                    **self.monitor_kwargs
+                )
+                self.channels[channel_name] = _ChannelStream(
+                    monitor=monitor,
+                    buffer=np.zeros(self._buffer_size, dtype=np.complex64),
+                    power_sum=np.zeros(self.n_bins)
+                )
+            return self.channels[channel_name].monitor
+    
+    def feed(
+        self,
+        channel_name: str,
+        samples: np.ndarray,
+        timestamp: float,
+        gap_samples: int = 0
+    ) -> List[Tuple[str, WindowMetrics]]:
+        """
+        Append a channel's next samples (gap fill included).
+        
+        Args:
+            channel_name: Channel registered with add_channel()
+            samples: Complex IQ samples, contiguous with the previous feed
+            timestamp: Unix timestamp of the first sample
+            gap_samples: Of these, samples that are gap fill
+        
+        Returns:
+            (channel_name, metrics) of windows completed by a tick, if one ran
+        """
+        completed = []
+        with self._lock:
+            stream = self.channels[channel_name]
+            if not stream.monitor.enabled:
+                return completed
+            if stream.stream_start is None:
+                stream.stream_start = timestamp
+            if gap_samples > 0:
+                stream.gap_count += 1
+                stream.gap_samples += gap_samples
+            stream.samples_fed += len(samples)
+            
+            pos = 0
+            while pos < len(samples):
+                n = min(len(samples) - pos, len(stream.buffer) - stream.fill)
+                stream.buffer[stream.fill:stream.fill + n] = samples[pos:pos + n]
+                stream.fill += n
+                pos += n
+                if self._ready_frames(stream) >= self.tick_frames:
+                    completed.extend(self._tick())
+        return completed
+    
+    def tick(self) -> List[Tuple[str, WindowMetrics]]:
+        """Transform every complete frame of every channel (e.g. on a timer)."""
+        with self._lock:
+            return self._tick()
+    
+    def _ready_frames(self, stream: _ChannelStream) -> int:
+        if stream.fill < self.n_fft:
+            return 0
+        return (stream.fill - self.n_fft) // self.hop + 1
+    
+    def _tick(self) -> List[Tuple[str, WindowMetrics]]:
+        completed = []
+        while True:
+            # Frames per channel, none past the end of the channel's window
+            batch = []
+            for name, stream in self.channels.items():
+                k = self._ready_frames(stream)
+                if k == 0:
+                    continue
+                window_end = (stream.window_index + 1) * self.samples_per_window
+                k = min(k, -(-(window_end - stream.next_frame) // self.hop))
+                batch.append((name, stream, k))
+            if not batch:
+                return completed
+            
+            frames = np.concatenate([
+                np.lib.stride_tricks.sliding_window_view(stream.buffer[:stream.fill], self.n_fft)[::self.hop][:k]
+                for _, stream, k in batch
+            ])
+            frames *= self.taper
+            spectra = np.fft.fft(frames, axis=-1)[:, :self.n_bins]
+            power = spectra.real ** 2 + spectra.imag ** 2
+            offsets = np.cumsum([0] + [k for _, _, k in batch[:-1]])
+            sums = np.add.reduceat(power, offsets, axis=0)
+            self.ticks += 1
+            self.frames_transformed += len(frames)
+            
+            for (name, stream, k), power_sum in zip(batch, sums):
+                stream.power_sum += power_sum
+                stream.frames += k
+                consumed = k * self.hop
+                stream.buffer[:stream.fill - consumed] = stream.buffer[consumed:stream.fill]
+                stream.fill -= consumed
+                stream.next_frame += consumed
+                if stream.next_frame >= (stream.window_index + 1) * self.samples_per_window:
+                    metrics = self._finish_window(stream)
+                    if metrics is not None:
+                        completed.append((name, metrics))
+    
+    def _finish_window(self, stream: _ChannelStream) -> Optional[WindowMetrics]:
+        """Hand the averaged window spectrum to the channel's monitor."""
+        window_start = stream.window_index * self.samples_per_window
+        received = min(stream.samples_fed - window_start, self.samples_per_window) - stream.gap_samples
+        metrics = stream.monitor.process_spectrum(
+            self.freqs,
+            stream.power_sum / max(stream.frames, 1),
+            timestamp=stream.stream_start + window_start / self.sample_rate,
+            samples_received=max(received, 0),
+            gap_info={'gap_count': stream.gap_count, 'gap_samples': stream.gap_samples}
+        )
+        stream.window_index += 1
+        stream.power_sum[:] = 0.0
+        stream.frames = 0
+        stream.gap_count = 0
+        stream.gap_samples = 0
+        self.windows_completed += 1
+        return metrics
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bank statistics."""
+        with self._lock:
+            return {
+                'channels': len(self.channels),
+                'ticks': self.ticks,
+                'frames_transformed': self.frames_transformed,
+                'frames_per_tick': self.frames_transformed / max(self.ticks, 1),
+                'windows_completed': self.windows_completed,
+                'status_writes': sum(s.monitor.status_writes for s in self.channels.values()),
+                'status_writes_skipped': sum(s.monitor.status_writes_skipped for s in self.channels.values())
+            }
+
+
+_banks: Dict[Tuple[int, Optional[Path]], StreamingMonitorBank] = {}
+_banks_lock = threading.Lock()
+
+
+def get_monitor_bank(sample_rate: int = SAMPLE_RATE, output_dir: Optional[Path] = None) -> StreamingMonitorBank:
+    """Process-wide bank per (sample rate, status directory), shared by channel writers."""
+    key = (sample_rate, Path(output_dir) if output_dir else None)
+    with _banks_lock:
+        if key not in _banks:
+            _banks[key] = StreamingMonitorBank(sample_rate=sample_rate, output_dir=output_dir)
+        return _banks[key]
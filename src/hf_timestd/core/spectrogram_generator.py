@@ -40,6 +40,7 @@ warnings.warn(
     stacklevel=2
 )
 
+import importlib.util
 import numpy as np
 import logging
 from pathlib import Path
@@ -48,6 +49,8 @@ from typing import Optional, List, Tuple, Dict, Any
 from dataclasses import dataclass
 import json
 
+from .archive_reader import get_drf_reader
+
 logger = logging.getLogger(__name__)
 
 # Check for matplotlib
@@ -70,12 +73,9 @@ except ImportError:
     SCIPY_AVAILABLE = False
     logger.warning("scipy not available - spectrogram generation disabled")
 
-# Check for Digital RF
-try:
-    import digital_rf as drf
-    DRF_AVAILABLE = True
-except ImportError:
-    DRF_AVAILABLE = False
+# Check for Digital RF (read through archive_reader's shared readers)
+DRF_AVAILABLE = importlib.util.find_spec('digital_rf') is not None
+if not DRF_AVAILABLE:
     logger.warning("digital_rf not available - cannot read Phase 3 DRF data")
 
 
@@ -266,24 +266,29 @@ class SpectrogramGenerator:
             # Use the first ch0 found
             ch0_dir = ch0_dirs[0]
             
-            # Open DRF reader
-            reader = drf.DigitalRFReader(str(ch0_dir.parent))
-            channels = reader.get_channels()
-            
-            if not channels:
-                logger.warning("No channels in DRF reader")
+            # Shared DRF reader (regenerating a day's plots reopens the same archive)
+            reader, lock = get_drf_reader(ch0_dir.parent)
+            if reader is None:
+                logger.warning(f"Could not open DRF archive: {ch0_dir.parent}")
                 return None
             
-            channel = channels[0]
-            bounds = reader.get_bounds(channel)
-            
-            if bounds[0] is None:
-                logger.warning("No data bounds in DRF")
-                return None
-            
-            # Read all samples
-            start_idx, end_idx = bounds
-            samples = reader.read_vector(start_idx, end_idx - start_idx, channel)
+            with lock:
+                channels = reader.get_channels()
+                
+                if not channels:
+                    logger.warning("No channels in DRF reader")
+                    return None
+                
+                channel = channels[0]
+                bounds = reader.get_bounds(channel)
+                
+                if bounds[0] is None:
+                    logger.warning("No data bounds in DRF")
+                    return None
+                
+                # Read all samples
+                start_idx, end_idx = bounds
+                samples = reader.read_vector(start_idx, end_idx - start_idx, channel)
             
             # Convert from float32 (N, 2) to complex64
             if samples.dtype != np.complex64:
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Stage Timing - per-stage latency histograms for the minute pipeline
+
+A process-wide registry of latency histograms keyed by (stage, channel):
+
+    timing = get_stage_timing()
+    with timing.span('step1_tone_detection', channel_name):
+        ...
+    
+    laps = timing.laps(channel_name)     # consecutive sections of one block
+    ...BCD...
+    laps.mark('step2_bcd')
+    ...Doppler...
+    laps.mark('step2_doppler')
+
+Recording costs one perf_counter_ns() pair, a bisect into fixed log-spaced
+buckets and a few integer updates under a lock (a few us), so spans can stay
+on in production.
+
+Publishing:
+- snapshot() is a JSON-serializable, mergeable summary (count, mean, max,
+  p50/p99 and bucket counts per stage and channel). Phase 2 puts it under
+  'stage_timing' in analytics-service-status.json, the core recorder in
+  core-recorder-status.json and fusion (minute end -> Chrony SHM) in
+  fusion-status.json.
+- prometheus_text() renders snapshots in the Prometheus text format.
+  Every channel runs in its own process, so one endpoint serves all of them
+  from their status files:
+      
+      python -m hf_timestd.core.stage_timing --data-root /var/lib/hf-timestd --port 9108
+      curl localhost:9108/metrics
+
+Quantiles are interpolated within buckets; with 10 buckets per decade they
+are within ~12% of the true value.
+"""
+
+import argparse
+import bisect
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bucket upper bounds in ms: 10 per decade from 10 us to 100 s, then +Inf
+BUCKET_BOUNDS_MS: List[float] = [round(10 ** (e / 10.0), 6) for e in range(-20, 51)]
+_BUCKET_BOUNDS_NS = [b * 1e6 for b in BUCKET_BOUNDS_MS]
+_NUM_BUCKETS = len(BUCKET_BOUNDS_MS) + 1  # Last bucket = +Inf
+
+ALL_CHANNELS = ''  # Channel label of process-wide stages (no channel)
+
+METRIC_NAME = 'hf_timestd_stage_duration_seconds'
+
+
+@dataclass
+class StageHistogram:
+    """Latency histogram of one (stage, channel) series."""
+    counts: List[int] = field(default_factory=lambda: [0] * _NUM_BUCKETS)
+    count: int = 0
+    sum_ns: int = 0
+    max_ns: int = 0
+    last_ns: int = 0
+    
+    def record(self, duration_ns: int):
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS_NS, duration_ns)] += 1
+        self.count += 1
+        self.sum_ns += duration_ns
+        self.last_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+
+def bucket_quantile(counts: List[int], q: float, max_ms: Optional[float] = None) -> Optional[float]:
+    """
+    Quantile (ms) from non-cumulative bucket counts (BUCKET_BOUNDS_MS + Inf).
+    
+    Interpolates log-linearly within the bucket; the +Inf bucket and the top
+    of the range are capped at max_ms when given.
+    """
+    total = sum(counts)
+    if total == 0:
+        return None
+    rank = q * total
+    seen = 0
+    for i, c in enumerate(counts):
+        if c and seen + c >= rank:
+            upper = BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else (max_ms or BUCKET_BOUNDS_MS[-1])
+            lower = BUCKET_BOUNDS_MS[i - 1] if i > 0 else upper / 10 ** 0.1
+            if max_ms is not None:
+                upper = min(upper, max_ms)
+                lower = min(lower, upper)
+            frac = (rank - seen) / c
+            if lower <= 0:
+                return upper * frac
+            return lower * (upper / lower) ** frac
+        seen += c
+    return max_ms
+
+
+class LapTimer:
+    """Times consecutive sections: mark(stage) records the time since the last mark."""
+    
+    def __init__(self, registry: 'StageTimingRegistry', channel: str):
+        self._registry = registry
+        self._channel = channel
+        self._last = time.perf_counter_ns()
+    
+    def mark(self, stage: str):
+        now = time.perf_counter_ns()
+        self._registry.record_ns(stage, now - self._last, self._channel)
+        self._last = now
+    
+    def skip(self):
+        """Restart the lap without recording (section not run)."""
+        self._last = time.perf_counter_ns()
+
+
+class StageTimingRegistry:
+    """Thread-safe registry of stage latency histograms."""
+    
+    def __init__(self, service: str = ''):
+        self.service = service
+        self._series: Dict[str, Dict[str, StageHistogram]] = {}
+        self._lock = threading.Lock()
+        self._started = time.time()
+    
+    def record_ns(self, stage: str, duration_ns: int, channel: Optional[str] = None):
+        """Record one duration in nanoseconds."""
+        channel = channel or ALL_CHANNELS
+        with self._lock:
+            by_channel = self._series.get(stage)
+            if by_channel is None:
+                by_channel = self._series[stage] = {}
+            hist = by_channel.get(channel)
+            if hist is None:
+                hist = by_channel[channel] = StageHistogram()
+            hist.record(duration_ns)
+    
+    def record(self, stage: str, seconds: float, channel: Optional[str] = None):
+        """Record one duration in seconds."""
+        self.record_ns(stage, int(seconds * 1e9), channel)
+    
+    @contextmanager
+    def span(self, stage: str, channel: Optional[str] = None) -> Iterator[None]:
+        """Time the enclosed block (also when it raises)."""
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record_ns(stage, time.perf_counter_ns() - started, channel)
+    
+    def laps(self, channel: Optional[str] = None) -> LapTimer:
+        return LapTimer(self, channel or ALL_CHANNELS)
+    
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+            self._started = time.time()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        JSON-serializable summary.
+        
+        Returns:
+            {'service', 'since', 'uptime_sec',
+             'stages': {stage: {channel: {count, rate_per_min, mean_ms, p50_ms,
+                                          p99_ms, max_ms, last_ms, sum_ms,
+                                          buckets: {le_ms: count}}}}}
+        """
+        with self._lock:
+            series = {
+                stage: {ch: (list(h.counts), h.count, h.sum_ns, h.max_ns, h.last_ns)
+                        for ch, h in by_channel.items()}
+                for stage, by_channel in self._series.items()
+            }
+            started = self._started
+        uptime = max(1e-9, time.time() - started)
+        
+        stages = {}
+        for stage, by_channel in sorted(series.items()):
+            stages[stage] = {}
+            for channel, (counts, count, sum_ns, max_ns, last_ns) in sorted(by_channel.items()):
+                max_ms = max_ns / 1e6
+                stages[stage][channel] = {
+                    'count': count,
+                    'rate_per_min': round(count * 60.0 / uptime, 3),
+                    'mean_ms': round(sum_ns / count / 1e6, 3),
+                    'p50_ms': round(bucket_quantile(counts, 0.50, max_ms), 3),
+                    'p99_ms': round(bucket_quantile(counts, 0.99, max_ms), 3),
+                    'max_ms': round(max_ms, 3),
+                    'last_ms': round(last_ns / 1e6, 3),
+                    'sum_ms': round(sum_ns / 1e6, 3),
+                    'buckets': {_bucket_label(i): c for i, c in enumerate(counts) if c},
+                }
+        return {
+            'service': self.service,
+            'since': started,
+            'uptime_sec': round(uptime, 1),
+            'stages': stages,
+        }
+    
+    def prometheus_text(self) -> str:
+        return prometheus_text([self.snapshot()])
+
+
+def _bucket_label(i: int) -> str:
+    return f"{BUCKET_BOUNDS_MS[i]:g}" if i < len(BUCKET_BOUNDS_MS) else '+Inf'
+
+
+_BUCKET_INDEX = {_bucket_label(i): i for i in range(_NUM_BUCKETS)}
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(snapshots: Iterable[Dict[str, Any]]) -> str:
+    """
+    Render snapshots (from one or many processes) as Prometheus text.
+    
+    Emits a histogram (le in seconds) plus p50/p99 gauges per stage and
+    channel. Series that appear in several snapshots are merged.
+    """
+    merged: Dict[tuple, Dict[str, Any]] = {}
+    for snap in snapshots:
+        service = snap.get('service', '')
+        for stage, by_channel in snap.get('stages', {}).items():
+            for channel, s in by_channel.items():
+                key = (stage, channel, service)
+                m = merged.setdefault(key, {'counts': [0] * _NUM_BUCKETS, 'count': 0, 'sum_ms': 0.0, 'max_ms': 0.0})
+                for label, c in s.get('buckets', {}).items():
+                    if label in _BUCKET_INDEX:
+                        m['counts'][_BUCKET_INDEX[label]] += c
+                m['count'] += s.get('count', 0)
+                m['sum_ms'] += s.get('sum_ms', 0.0)
+                m['max_ms'] = max(m['max_ms'], s.get('max_ms', 0.0))
+    
+    lines = [
+        f"# HELP {METRIC_NAME} Minute pipeline stage latency.",
+        f"# TYPE {METRIC_NAME} histogram",
+    ]
+    quantile_lines = []
+    for (stage, channel, service), m in sorted(merged.items()):
+        labels = f'stage="{_escape(stage)}",channel="{_escape(channel)}",service="{_escape(service)}"'
+        cumulative = 0
+        for i, c in enumerate(m['counts']):
+            cumulative += c
+            if c or i == _NUM_BUCKETS - 1:
+                le = '+Inf' if i == _NUM_BUCKETS - 1 else f"{BUCKET_BOUNDS_MS[i] / 1000:g}"
+                lines.append(f'{METRIC_NAME}_bucket{{{labels},le="{le}"}} {cumulative}')
+        lines.append(f'{METRIC_NAME}_sum{{{labels}}} {m["sum_ms"] / 1000:.6f}')
+        lines.append(f'{METRIC_NAME}_count{{{labels}}} {m["count"]}')
+        for q in (0.5, 0.99):
+            value = bucket_quantile(m['counts'], q, m['max_ms'])
+            if value is not None:
+                quantile_lines.append(f'{METRIC_NAME}_quantile{{{labels},quantile="{q:g}"}} {value / 1000:.6f}')
+    
+    lines.append(f"# HELP {METRIC_NAME}_quantile Stage latency quantiles (bucket-interpolated).")
+    lines.append(f"# TYPE {METRIC_NAME}_quantile gauge")
+    lines.extend(quantile_lines)
+    return '\n'.join(lines) + '\n'
+
+
+_default_registry: Optional[StageTimingRegistry] = None
+_default_lock = threading.Lock()
+
+
+def get_stage_timing() -> StageTimingRegistry:
+    """Process-wide stage timing registry."""
+    global _default_registry
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = StageTimingRegistry()
+        return _default_registry
+
+
+# =============================================================================
+# Metrics endpoint
+# =============================================================================
+
+STATUS_FILE_PATTERNS = (
+    'phase2/*/status/analytics-service-status.json',
+    'status/core-recorder-status.json',
+    'status/fusion-status.json',
+)
+
+
+def collect_status_snapshots(data_root: Path) -> List[Dict[str, Any]]:
+    """stage_timing snapshots from the status files under data_root."""
+    snapshots = []
+    for pattern in STATUS_FILE_PATTERNS:
+        for path in sorted(Path(data_root).glob(pattern)):
+            try:
+                with open(path) as f:
+                    snap = json.load(f).get('stage_timing')
+            except (OSError, ValueError) as e:
+                logger.debug(f"Skipping {path}: {e}")
+                continue
+            if snap:
+                snapshots.append(snap)
+    return snapshots
+
+
+def start_metrics_server(
+    port: int,
+    data_root: Optional[Path] = None,
+    registry: Optional[StageTimingRegistry] = None,
+    host: str = '127.0.0.1'
+) -> ThreadingHTTPServer:
+    """
+    Serve /metrics (Prometheus text) and /metrics.json on a daemon thread.
+    
+    Serves the status-file snapshots under data_root when given, else the
+    in-process registry.
+    """
+    def snapshots() -> List[Dict[str, Any]]:
+        if data_root is not None:
+            return collect_status_snapshots(data_root)
+        return [(registry or get_stage_timing()).snapshot()]
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] == '/metrics':
+                body = prometheus_text(snapshots()).encode()
+                content_type = 'text/plain; version=0.0.4; charset=utf-8'
+            elif self.path.split('?')[0] == '/metrics.json':
+                body = json.dumps(snapshots(), indent=2).encode()
+                content_type = 'application/json'
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+    
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='stage-metrics', daemon=True).start()
+    logger.info(f"Stage metrics on http://{host}:{server.server_address[1]}/metrics")
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve minute pipeline stage timing as Prometheus metrics')
+    parser.add_argument('--data-root', type=Path, required=True, help='Data root with phase2/ and status/')
+    parser.add_argument('--port', type=int, default=9108)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--once', action='store_true', help='Print metrics once and exit')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    if args.once:
+        print(prometheus_text(collect_status_snapshots(args.data_root)), end='')
+        return
+    
+    server = start_metrics_server(args.port, data_root=args.data_root, host=args.host)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
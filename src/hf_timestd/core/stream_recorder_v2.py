@@ -30,6 +30,8 @@ from enum import Enum
 
 from ka9q import RadiodStream, ChannelInfo, StreamQuality
 
+from .supervisor import Supervisor
+
 logger = logging.getLogger(__name__)
 
 
@@ -103,7 +105,8 @@ class StreamRecorderV2:
         self,
         config: StreamRecorderConfig,
         channel_info: ChannelInfo,
-        get_ntp_status: Optional[Callable[[], Dict[str, Any]]] = None
+        get_ntp_status: Optional[Callable[[], Dict[str, Any]]] = None,
+        supervisor: Optional[Supervisor] = None
     ):
         """
         Initialize stream recorder.
@@ -112,10 +115,13 @@ class StreamRecorderV2:
             config: StreamRecorderConfig
             channel_info: ChannelInfo from ka9q.discover_channels()
             get_ntp_status: Optional callable for NTP status
+            supervisor: Optional Supervisor fed on every batch (stall
+                watchdog) and posted 'writer_error' events
         """
         self.config = config
         self.channel_info = channel_info
         self.get_ntp_status = get_ntp_status
+        self.supervisor = supervisor
         
         # State
         self.state = StreamRecorderState.IDLE
@@ -152,6 +158,8 @@ class StreamRecorderV2:
         self.last_sample_time: float = 0.0
         self.session_start_time: Optional[float] = None
         self.last_quality: Optional[StreamQuality] = None
+        self.write_errors = 0
+        self._error_posted = False  # One 'writer_error' per run of failures
         
         logger.info(f"StreamRecorderV2 initialized: {config.description}")
         logger.info(f"  SSRC: {config.ssrc}")
@@ -192,6 +200,8 @@ class StreamRecorderV2:
             logger.error(f"{self.config.description}: Failed to start: {e}", exc_info=True)
             with self._lock:
                 self.state = StreamRecorderState.ERROR
+            if self.supervisor:
+                self.supervisor.post('writer_error', self.config.ssrc, e)
     
     def stop(self) -> Optional[StreamQuality]:
         """
@@ -253,6 +263,9 @@ class StreamRecorderV2:
                 self.last_sample_time = time.time()
                 self.last_quality = quality
             
+            if self.supervisor:
+                self.supervisor.feed(self.config.ssrc)
+            
             # Get system time from quality metrics (GPS-derived from ka9q-python)
             if quality.last_packet_utc:
                 try:
@@ -276,6 +289,7 @@ class StreamRecorderV2:
             )
             
             self.samples_written += len(samples)
+            self._error_posted = False
             
             # Log gaps if present
             if quality.has_gaps:
@@ -287,6 +301,10 @@ class StreamRecorderV2:
                 
         except Exception as e:
             logger.error(f"{self.config.description}: Sample processing error: {e}", exc_info=True)
+            self.write_errors += 1
+            if self.supervisor and not self._error_posted:
+                self._error_posted = True
+                self.supervisor.post('writer_error', self.config.ssrc, e)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get current statistics."""
@@ -304,6 +322,7 @@ class StreamRecorderV2:
                 'batches_received': self.batches_received,
                 'uptime_seconds': uptime,
                 'last_sample_time': self.last_sample_time,
+                'write_errors': self.write_errors,
                 # Pipeline phase stats
                 'phase1_samples': pipeline_stats.get('samples_archived', 0),
                 'phase2_minutes': pipeline_stats.get('minutes_analyzed', 0),
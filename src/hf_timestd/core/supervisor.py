@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Supervisor - event-driven main loop for the core recorder
+
+Replaces a fixed once-per-second poll loop. The supervisor thread blocks
+in a selector until one of:
+
+- an event is posted from another thread (channel stall, writer error,
+  shutdown) - posting writes an eventfd (a pipe where eventfd is missing),
+  so the loop wakes immediately;
+- the earliest deadline in a heap comes due - periodic housekeeping
+  (status file, NTP, quota) and per-channel stall watchdogs share it.
+
+An idle recorder therefore wakes only when housekeeping is due, and a
+dead stream is reported stall_timeout seconds after its last data,
+rather than at the next health poll.
+
+Stall watchdogs do not touch the heap per packet: feed() just stamps the
+channel's last-seen time, and the watchdog deadline, when it fires,
+re-arms itself at last_seen + timeout. A steady stream costs one wakeup
+per timeout period; a stalled one posts 'stall' once and 'recovered' on
+its next feed().
+
+Usage:
+    supervisor = Supervisor()
+    supervisor.every('status', 10.0, write_status)
+    supervisor.watch(ssrc, timeout=5.0)
+    supervisor.on('stall', lambda ssrc, data: ...)
+    
+    # data threads
+    supervisor.feed(ssrc)
+    supervisor.post('writer_error', ssrc, exc)
+    
+    supervisor.run()            # Until stop() (signal-safe)
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import selectors
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EVENTFD_AVAILABLE = hasattr(os, 'eventfd')
+
+EventHandler = Callable[[Optional[Hashable], Any], None]
+
+
+class _Wakeup:
+    """Cross-thread wakeup: an eventfd, or a non-blocking pipe."""
+    
+    def __init__(self):
+        if EVENTFD_AVAILABLE:
+            self._read_fd = self._write_fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+        else:
+            self._read_fd, self._write_fd = os.pipe()
+            os.set_blocking(self._read_fd, False)
+            os.set_blocking(self._write_fd, False)
+    
+    def fileno(self) -> int:
+        return self._read_fd
+    
+    def set(self):
+        try:
+            if EVENTFD_AVAILABLE:
+                os.eventfd_write(self._write_fd, 1)
+            else:
+                os.write(self._write_fd, b'\0')
+        except (BlockingIOError, OSError):
+            pass  # Already signalled (counter/pipe full) or closed
+    
+    def clear(self):
+        try:
+            if EVENTFD_AVAILABLE:
+                os.eventfd_read(self._read_fd)
+            else:
+                while os.read(self._read_fd, 4096):
+                    pass
+        except (BlockingIOError, OSError):
+            pass
+    
+    def close(self):
+        os.close(self._read_fd)
+        if self._write_fd != self._read_fd:
+            os.close(self._write_fd)
+
+
+class Supervisor:
+    """Selector loop dispatching posted events and deadline-scheduled tasks."""
+    
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._wakeup = _Wakeup()
+        self._selector.register(self._wakeup, selectors.EVENT_READ)
+        
+        # Posted events; deque append/popleft are atomic, so post() is safe
+        # from any thread and from signal handlers (no lock to deadlock on)
+        self._events: deque = deque()
+        self._handlers: Dict[str, List[EventHandler]] = {}
+        
+        # Deadline heap of (due, seq, name); seq breaks ties
+        self._deadlines: List[Tuple[float, int, Hashable]] = []
+        self._seq = itertools.count()
+        self._tasks: Dict[str, Tuple[float, Callable[[], None]]] = {}
+        
+        # Stall watchdogs
+        self._timeouts: Dict[Hashable, float] = {}
+        self._watch_seq: Dict[Hashable, int] = {}  # Live heap entry per key
+        self._last_seen: Dict[Hashable, float] = {}
+        self._stalled: set = set()
+        
+        self.running = False
+        
+        # Statistics
+        self.wakeups = 0
+        self.events_dispatched = 0
+        self.tasks_run = 0
+        self.stalls = 0
+    
+    # ------------------------------------------------------------------
+    # Registration (before or during run)
+    # ------------------------------------------------------------------
+    
+    def on(self, kind: str, handler: EventHandler):
+        """Call handler(key, data) for each posted event of this kind."""
+        self._handlers.setdefault(kind, []).append(handler)
+    
+    def every(self, name: str, interval: float, callback: Callable[[], None],
+              first_delay: Optional[float] = None):
+        """
+        Run callback every interval seconds on the supervisor thread.
+        
+        The next run is scheduled from the previous deadline (not from when
+        the callback finished), so a slow callback does not drift the schedule.
+        """
+        self._tasks[name] = (interval, callback)
+        delay = interval if first_delay is None else first_delay
+        self._schedule(time.monotonic() + delay, ('task', name))
+    
+    def watch(self, key: Hashable, timeout: float):
+        """Post ('stall', key) when feed(key) is not called for timeout seconds."""
+        now = time.monotonic()
+        self._timeouts[key] = timeout
+        self._last_seen[key] = now
+        self._stalled.discard(key)
+        self._watch_seq[key] = self._schedule(now + timeout, ('watch', key))
+    
+    def unwatch(self, key: Hashable):
+        """Stop the stall watchdog for key (its heap entry lapses on its own)."""
+        self._timeouts.pop(key, None)
+        self._watch_seq.pop(key, None)
+        self._last_seen.pop(key, None)
+        self._stalled.discard(key)
+    
+    # ------------------------------------------------------------------
+    # Producer side (any thread)
+    # ------------------------------------------------------------------
+    
+    def feed(self, key: Hashable):
+        """Record activity on a watched key; called per delivered batch."""
+        self._last_seen[key] = time.monotonic()
+        if key in self._stalled:
+            self._stalled.discard(key)
+            self.post('recovered', key)
+    
+    def post(self, kind: str, key: Optional[Hashable] = None, data: Any = None):
+        """Queue an event and wake the supervisor."""
+        self._events.append((kind, key, data))
+        self._wakeup.set()
+    
+    def stop(self):
+        """Make run() return after the current dispatch. Signal-safe."""
+        self.post('shutdown')
+    
+    # ------------------------------------------------------------------
+    # Loop
+    # ------------------------------------------------------------------
+    
+    def _schedule(self, due: float, item: Tuple[str, Hashable]) -> int:
+        seq = next(self._seq)
+        heapq.heappush(self._deadlines, (due, seq, item))
+        # Registration while run() sleeps: let it recompute its timeout
+        self._wakeup.set()
+        return seq
+    
+    def run(self):
+        """Dispatch events and deadlines until stop() or a 'shutdown' event."""
+        self.running = True
+        try:
+            while self.running:
+                timeout = None
+                if self._deadlines:
+                    timeout = max(0.0, self._deadlines[0][0] - time.monotonic())
+                
+                if self._selector.select(timeout):
+                    self._wakeup.clear()
+                self.wakeups += 1
+                
+                self._dispatch_events()
+                if self.running:
+                    self._run_due(time.monotonic())
+        finally:
+            self.running = False
+    
+    def _dispatch_events(self):
+        while self._events:
+            kind, key, data = self._events.popleft()
+            if kind == 'shutdown':
+                self.running = False
+            self.events_dispatched += 1
+            for handler in self._handlers.get(kind, ()):
+                try:
+                    handler(key, data)
+                except Exception as e:
+                    logger.error(f"Supervisor: {kind} handler failed: {e}", exc_info=True)
+    
+    def _run_due(self, now: float):
+        while self._deadlines and self._deadlines[0][0] <= now:
+            due, seq, (what, name) = heapq.heappop(self._deadlines)
+            if what == 'task':
+                self._run_task(name, due, now)
+            elif self._watch_seq.get(name) == seq:
+                self._check_watch(name, now)
+    
+    def _run_task(self, name: str, due: float, now: float):
+        if name not in self._tasks:
+            return
+        interval, callback = self._tasks[name]
+        self.tasks_run += 1
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Supervisor: task {name} failed: {e}", exc_info=True)
+        # Keep the grid; skip missed slots rather than bursting to catch up
+        next_due = due + interval
+        if next_due <= now:
+            next_due = now + interval
+        heapq.heappush(self._deadlines, (next_due, next(self._seq), ('task', name)))
+    
+    def _check_watch(self, key: Hashable, now: float):
+        timeout = self._timeouts[key]
+        last_seen = self._last_seen.get(key, now)
+        expires = last_seen + timeout
+        if expires <= now:
+            if key not in self._stalled:
+                self._stalled.add(key)
+                self.stalls += 1
+                self._events.append(('stall', key, now - last_seen))
+                self._dispatch_events()
+            # Keep checking: feed() posts 'recovered', and the next stall
+            # after that must be caught
+            expires = now + timeout
+        seq = next(self._seq)
+        self._watch_seq[key] = seq
+        heapq.heappush(self._deadlines, (expires, seq, ('watch', key)))
+    
+    def close(self):
+        """Release the selector and wakeup descriptors."""
+        self._selector.close()
+        self._wakeup.close()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'wakeups': self.wakeups,
+            'events_dispatched': self.events_dispatched,
+            'tasks_run': self.tasks_run,
+            'stalls': self.stalls,
+            'stalled': sorted(str(k) for k in self._stalled),
+            'eventfd': EVENTFD_AVAILABLE,
+        }
@@ -36,9 +36,11 @@ Author: Cascade AI
 Date: 2025-12-13
 """
 
-import json
+import fcntl
 import logging
+import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -46,6 +48,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 
+from .checkpoint_service import get_checkpoint_service, load_checkpoint, write_checkpoint
+
 logger = logging.getLogger(__name__)
 
 
@@ -177,6 +181,9 @@ class TimingCalibrator:
     NARROW_WINDOW_MS = 5.0                # Default narrow search window
     INTRA_STATION_THRESHOLD_MS = 5.0      # Max allowed intra-station std dev
     
+    # Phases only move forward: a merge keeps the later of file and memory
+    PHASE_ORDER = [CalibrationPhase.BOOTSTRAP, CalibrationPhase.CALIBRATED, CalibrationPhase.VERIFIED]
+    
     def __init__(
         self,
         data_root: Path,
@@ -191,6 +198,15 @@ class TimingCalibrator:
         self.state_file = state_file or (self.data_root / 'state' / 'timing_calibration.json')
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
         
+        # The state file is shared by every recorder process. Detections are
+        # applied in memory and queued; the checkpoint writer thread merges
+        # them into the file under a file lock (_merge_and_write), so the
+        # minute loop never waits on the lock, the reload or fsync
+        self.lock_file = self.state_file.with_suffix('.lock')
+        self._checkpoints = get_checkpoint_service()
+        self._thread_lock = threading.RLock()
+        self._unsaved: List[Dict] = []   # Detections not yet merged into the file
+        
         # Current phase
         self.phase = CalibrationPhase.BOOTSTRAP
         
@@ -216,6 +232,7 @@ class TimingCalibrator:
         
         # Load existing state
         self._load_state()
+        self._stats_merged = dict(self.stats)  # Stats as last merged with the file
         
         logger.info(f"TimingCalibrator initialized in {self.phase.value} phase")
         if self.station_calibration:
@@ -226,14 +243,22 @@ class TimingCalibrator:
                     f"(n={cal.n_samples})"
                 )
     
+    @contextmanager
+    def _state_file_lock(self):
+        """Exclusive lock on the shared state file across processes."""
+        with open(self.lock_file, 'a') as lf:
+            fcntl.flock(lf.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lf.fileno(), fcntl.LOCK_UN)
+    
     def _load_state(self):
         """Load calibration state from disk."""
-        if not self.state_file.exists():
-            return
-            
         try:
-            with open(self.state_file) as f:
-                state = json.load(f)
+            state = load_checkpoint(self.state_file)
+            if state is None:
+                return
             
             # Restore phase
             phase_str = state.get('phase', 'bootstrap')
@@ -274,44 +299,86 @@ class TimingCalibrator:
         except Exception as e:
             logger.warning(f"Failed to load timing calibration: {e}")
     
+    def _state_dict(self) -> Dict:
+        """Snapshot of the calibration state as written to the state file."""
+        return {
+            'phase': self.phase.value,
+            'station_calibration': {
+                station: {
+                    'propagation_delay_ms': cal.propagation_delay_ms,
+                    'propagation_delay_std_ms': cal.propagation_delay_std_ms,
+                    'n_samples': cal.n_samples,
+                    'last_updated': cal.last_updated,
+                    'frequencies_contributing': list(cal.frequencies_contributing)
+                }
+                for station, cal in self.station_calibration.items()
+            },
+            'rtp_calibration': {
+                channel: {
+                    'frequency_hz': rtp.frequency_hz,
+                    'sample_rate': rtp.sample_rate,
+                    'reference_minute_utc': rtp.reference_minute_utc,
+                    'reference_rtp_timestamp': rtp.reference_rtp_timestamp,
+                    'rtp_offset_samples': rtp.rtp_offset_samples,
+                    'calibration_snr_db': rtp.calibration_snr_db,
+                    'calibration_confidence': rtp.calibration_confidence,
+                    'n_confirmations': rtp.n_confirmations,
+                    'last_confirmed': rtp.last_confirmed
+                }
+                for channel, rtp in self.rtp_calibration.items()
+            },
+            'stats': dict(self.stats),
+            'saved_at': datetime.now(timezone.utc).isoformat()
+        }
+    
     def _save_state(self):
-        """Save calibration state to disk."""
-        try:
-            state = {
-                'phase': self.phase.value,
-                'station_calibration': {
-                    station: {
-                        'propagation_delay_ms': cal.propagation_delay_ms,
-                        'propagation_delay_std_ms': cal.propagation_delay_std_ms,
-                        'n_samples': cal.n_samples,
-                        'last_updated': cal.last_updated,
-                        'frequencies_contributing': cal.frequencies_contributing
-                    }
-                    for station, cal in self.station_calibration.items()
-                },
-                'rtp_calibration': {
-                    channel: {
-                        'frequency_hz': rtp.frequency_hz,
-                        'sample_rate': rtp.sample_rate,
-                        'reference_minute_utc': rtp.reference_minute_utc,
-                        'reference_rtp_timestamp': rtp.reference_rtp_timestamp,
-                        'rtp_offset_samples': rtp.rtp_offset_samples,
-                        'calibration_snr_db': rtp.calibration_snr_db,
-                        'calibration_confidence': rtp.calibration_confidence,
-                        'n_confirmations': rtp.n_confirmations,
-                        'last_confirmed': rtp.last_confirmed
-                    }
-                    for channel, rtp in self.rtp_calibration.items()
-                },
-                'stats': self.stats,
-                'saved_at': datetime.now(timezone.utc).isoformat()
-            }
-            
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+        """Queue a merge of this process's updates into the shared state file."""
+        self._checkpoints.mark_dirty(self.state_file, self._merge_and_write)
+    
+    def _merge_and_write(self) -> int:
+        """
+        Merge unsaved updates into the shared state file; returns bytes written.
+        
+        Runs on the checkpoint writer thread. Under the file lock the file is
+        reloaded, this process's queued detections and stats increments are
+        replayed on top of it and the result is written back, so no recorder
+        process's updates are lost.
+        """
+        with self._state_file_lock():
+            with self._thread_lock:
+                detections, self._unsaved = self._unsaved, []
+                stats_delta = {
+                    key: value - self._stats_merged.get(key, 0)
+                    for key, value in self.stats.items()
+                }
+                phase = self.phase
                 
-        except Exception as e:
-            logger.error(f"Failed to save timing calibration: {e}")
+                # Rebuild from the file; whatever it lacks comes from the replay
+                self.station_calibration = {}
+                self.rtp_calibration = {}
+                self.stats = dict(self._stats_merged)
+                self._load_state()
+                stats_on_disk = dict(self.stats)
+                
+                for detection in detections:
+                    self._apply_detection(**detection)
+                for key, delta in stats_delta.items():
+                    if delta:
+                        self.stats[key] = self.stats.get(key, 0) + delta
+                if self.PHASE_ORDER.index(phase) > self.PHASE_ORDER.index(self.phase):
+                    self.phase = phase
+                
+                self._stats_merged = dict(self.stats)
+                state = self._state_dict()
+            
+            try:
+                return write_checkpoint(self.state_file, state)
+            except Exception:
+                # Keep the updates for the next merge
+                with self._thread_lock:
+                    self._unsaved = detections + self._unsaved
+                    self._stats_merged = stats_on_disk
+                raise
     
     def predict_station(
         self,
@@ -431,47 +498,65 @@ class TimingCalibrator:
         During bootstrap, high-quality detections contribute to calibration.
         After bootstrap, detections confirm/refine the calibration.
         """
-        # Reload state from disk to merge with other processes' updates
-        # This is necessary because multiple channel recorder processes share the state file
-        self._load_state()
-        
-        # Track for bootstrap
-        if self.phase == CalibrationPhase.BOOTSTRAP:
-            if snr_db >= self.BOOTSTRAP_SNR_THRESHOLD and confidence >= self.BOOTSTRAP_CONFIDENCE_THRESHOLD:
-                self.bootstrap_detections.append({
-                    'station': station,
-                    'frequency_mhz': frequency_mhz,
-                    'channel_name': channel_name,
-                    'd_clock_ms': d_clock_ms,
-                    'propagation_delay_ms': propagation_delay_ms,
-                    'snr_db': snr_db,
-                    'confidence': confidence,
-                    'rtp_timestamp': rtp_timestamp,
-                    'minute_boundary': minute_boundary,
-                    'timestamp': time.time()
-                })
-                self.stats['bootstrap_detections'] += 1
-                
-                # Check if we can exit bootstrap
-                self._check_bootstrap_complete()
-        else:
-            self.stats['calibrated_detections'] += 1
+        with self._thread_lock:
+            # Track for bootstrap
+            if self.phase == CalibrationPhase.BOOTSTRAP:
+                if snr_db >= self.BOOTSTRAP_SNR_THRESHOLD and confidence >= self.BOOTSTRAP_CONFIDENCE_THRESHOLD:
+                    self.bootstrap_detections.append({
+                        'station': station,
+                        'frequency_mhz': frequency_mhz,
+                        'channel_name': channel_name,
+                        'd_clock_ms': d_clock_ms,
+                        'propagation_delay_ms': propagation_delay_ms,
+                        'snr_db': snr_db,
+                        'confidence': confidence,
+                        'rtp_timestamp': rtp_timestamp,
+                        'minute_boundary': minute_boundary,
+                        'timestamp': time.time()
+                    })
+                    self.stats['bootstrap_detections'] += 1
+                    
+                    # Check if we can exit bootstrap
+                    self._check_bootstrap_complete()
+            else:
+                self.stats['calibrated_detections'] += 1
+            
+            detection = {
+                'station': station,
+                'frequency_mhz': frequency_mhz,
+                'channel_name': channel_name,
+                'propagation_delay_ms': propagation_delay_ms,
+                'snr_db': snr_db,
+                'confidence': confidence,
+                'rtp_timestamp': rtp_timestamp,
+                'minute_boundary': minute_boundary,
+            }
+            self._apply_detection(**detection)
+            
+            # Other recorder processes update the same file: the merge
+            # replays the detection on top of what they have written
+            self._unsaved.append(detection)
         
-        # Update station calibration
+        self._save_state()
+    
+    def _apply_detection(
+        self,
+        station: str,
+        frequency_mhz: float,
+        channel_name: str,
+        propagation_delay_ms: float,
+        snr_db: float,
+        confidence: float,
+        rtp_timestamp: int,
+        minute_boundary: int
+    ):
+        """Update station and RTP calibration from one detection."""
         self._update_station_calibration(
             station, frequency_mhz, propagation_delay_ms, snr_db, confidence
         )
-        
-        # Update RTP calibration with the detected station
         self._update_rtp_calibration(
             channel_name, frequency_mhz, rtp_timestamp, minute_boundary, snr_db, confidence, station
         )
-        
-        # Save state after every detection during bootstrap (multi-process coordination)
-        # After bootstrap, save every 5 detections to reduce I/O
-        total_detections = self.stats['bootstrap_detections'] + self.stats['calibrated_detections']
-        if self.phase == CalibrationPhase.BOOTSTRAP or total_detections % 5 == 0:
-            self._save_state()
     
     def _update_station_calibration(
         self,
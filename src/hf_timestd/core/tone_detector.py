@@ -255,7 +255,9 @@ from .wwv_constants import (
     WWV_ONLY_TONE_MINUTES,
     WWVH_ONLY_TONE_MINUTES,
     PROPAGATION_BOUNDS_MS,
-    DEFAULT_PROPAGATION_BOUNDS_MS
+    DEFAULT_PROPAGATION_BOUNDS_MS,
+    STACK_ENVELOPE_HALF_WIDTH_MS,
+    STACK_ENVELOPE_BIN_MS
 )
 
 logger = logging.getLogger(__name__)
@@ -314,6 +316,10 @@ class MultiStationToneDetector(IMultiStationToneDetector):
         
         # State tracking
         self.last_detections_by_minute: Dict[int, List[ToneDetectionResult]] = {}
+        
+        # Correlation envelopes of the last processed buffer, for
+        # cross-channel stacking: station -> (envelope, start_offset_ms, bin_ms)
+        self.last_correlation_envelopes: Dict[StationType, Tuple[np.ndarray, float, float]] = {}
         self.detection_count = 0
         self.last_detection_time: Optional[float] = None
         
@@ -636,7 +642,8 @@ class MultiStationToneDetector(IMultiStationToneDetector):
         original_sample_rate: Optional[int] = None,
         buffer_rtp_start: Optional[int] = None,
         search_window_ms: Optional[float] = None,
-        expected_offset_ms: Optional[float] = None
+        expected_offset_ms: Optional[float] = None,
+        repeat: bool = False
     ) -> Optional[List[ToneDetectionResult]]:
         """
         Process samples and detect tones (ToneDetector interface).
@@ -654,6 +661,8 @@ class MultiStationToneDetector(IMultiStationToneDetector):
                 Pass 0: Use 0 (search around minute boundary)
                 Pass 1+: Use expected propagation delay (e.g., +20ms for CHU)
                 This centers the search window at minute_boundary + expected_offset
+            repeat: Search again even if this minute already has detections
+                (guided second pass on the same buffer)
             
         Returns:
             List of ToneDetectionResult objects (may contain WWV + WWVH),
@@ -662,7 +671,7 @@ class MultiStationToneDetector(IMultiStationToneDetector):
         self.total_attempts += 1
         detections = self._detect_tones_internal(
             samples, timestamp, original_sample_rate, buffer_rtp_start, 
-            search_window_ms, expected_offset_ms
+            search_window_ms, expected_offset_ms, repeat
         )
         
         if detections:
@@ -692,7 +701,8 @@ class MultiStationToneDetector(IMultiStationToneDetector):
         original_sample_rate: Optional[int] = None,
         buffer_rtp_start: Optional[int] = None,
         search_window_ms: Optional[float] = None,
-        expected_offset_ms: Optional[float] = None
+        expected_offset_ms: Optional[float] = None,
+        repeat: bool = False
     ) -> List[ToneDetectionResult]:
         """
         Internal tone detection implementation
@@ -714,8 +724,10 @@ class MultiStationToneDetector(IMultiStationToneDetector):
         # Without this, 1764932339.9999999 would floor to 1764932280 instead of 1764932340
         minute_boundary = int((buffer_start_time + 0.5) / 60) * 60
         
+        self.last_correlation_envelopes = {}
+        
         # Check if we already detected this minute (prevent duplicates)
-        if minute_boundary in self.last_detections_by_minute:
+        if minute_boundary in self.last_detections_by_minute and not repeat:
             return []
         
         # Step 1: AM demodulation (extract envelope)
@@ -1002,6 +1014,12 @@ class MultiStationToneDetector(IMultiStationToneDetector):
             noise_std = np.std(correlation)
             noise_floor = noise_mean + 2.0 * noise_std
         
+        # Keep the envelope around the minute boundary for cross-channel
+        # stacking - whether or not this channel detects the tone itself
+        self.last_correlation_envelopes[station_type] = self._correlation_envelope(
+            correlation, noise_samples, buffer_start_time, reference_time
+        )
+        
         # =====================================================================
         # STAGE 2: PRECISE ONSET DETECTION (2025-12-07 Improvement)
         # =====================================================================
@@ -1186,6 +1204,52 @@ class MultiStationToneDetector(IMultiStationToneDetector):
         
         return result
     
+    def _correlation_envelope(
+        self,
+        correlation: np.ndarray,
+        noise_samples: np.ndarray,
+        buffer_start_time: float,
+        reference_time: float
+    ) -> Tuple[np.ndarray, float, float]:
+        """
+        Decimated, noise-normalized correlation envelope for stacking.
+        
+        Covers reference_time ± STACK_ENVELOPE_HALF_WIDTH_MS, boxcar-averaged
+        into STACK_ENVELOPE_BIN_MS bins and expressed in units of noise sigma
+        (noise from outside the search window, averaged the same way), so
+        envelopes from channels with different gains can be summed directly.
+        Bins outside the buffer are 0 (noise mean).
+        
+        Returns:
+            (envelope, start_offset_ms, bin_ms): start_offset_ms is the
+            arrival offset of bin 0 from reference_time
+        """
+        bin_samples = max(1, int(round(STACK_ENVELOPE_BIN_MS * self.sample_rate / 1000)))
+        bin_ms = bin_samples * 1000.0 / self.sample_rate
+        n_bins = int(round(2 * STACK_ENVELOPE_HALF_WIDTH_MS / bin_ms))
+        
+        first = int(round(
+            (reference_time - buffer_start_time - STACK_ENVELOPE_HALF_WIDTH_MS / 1000)
+            * self.sample_rate
+        ))
+        start_offset_ms = (buffer_start_time + first / self.sample_rate - reference_time) * 1000
+        
+        # Noise statistics at the envelope's resolution
+        noise = noise_samples if len(noise_samples) >= 100 * bin_samples else correlation
+        n_noise = (len(noise) // bin_samples) * bin_samples
+        pooled_noise = noise[:n_noise].reshape(-1, bin_samples).mean(axis=1)
+        noise_mean = float(np.mean(pooled_noise))
+        noise_sigma = float(np.std(pooled_noise)) or 1.0
+        
+        segment = np.full(n_bins * bin_samples, noise_mean)
+        lo = max(0, first)
+        hi = min(len(correlation), first + len(segment))
+        if hi > lo:
+            segment[lo - first:hi - first] = correlation[lo:hi]
+        
+        envelope = (segment.reshape(n_bins, bin_samples).mean(axis=1) - noise_mean) / noise_sigma
+        return envelope.astype(np.float32), start_offset_ms, bin_ms
+    
     def _update_differential_delay(
         self,
         detections: List[ToneDetectionResult],
@@ -1064,6 +1064,47 @@ class TransmissionTimeSolver:
             utc_nist_verified=utc_verified
         )
     
+    def predict_delay_ms(
+        self,
+        station: str,
+        frequency_mhz: float,
+        timestamp: Optional[datetime] = None
+    ) -> Optional[float]:
+        """
+        A-priori propagation delay for a station and frequency.
+        
+        Uses the most plausible mode (fewest hops on ties), without any
+        observation. Good enough to align channels for correlation stacking,
+        where the spread between frequencies (MAX_DISPERSION_MS) matters,
+        not the absolute accuracy.
+        
+        Returns:
+            Predicted delay in ms, or None for unknown stations
+        """
+        if station not in self.station_distances:
+            return None
+        
+        station_info = STATIONS.get(station, {})
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+        
+        best = None
+        for mode in PropagationMode:
+            if mode == PropagationMode.UNKNOWN:
+                continue
+            candidate = self._calculate_mode_delay(
+                mode, self.station_distances[station], frequency_mhz,
+                timestamp=timestamp,
+                station_lat=station_info.get('lat'),
+                station_lon=station_info.get('lon')
+            )
+            if candidate is None:
+                continue
+            if best is None or (candidate.plausibility, -candidate.n_hops) > (best.plausibility, -best.n_hops):
+                best = candidate
+        
+        return best.total_delay_ms if best else None
+    
     def _no_solution(self, arrival_rtp: int) -> SolverResult:
         """Return a result indicating no valid solution."""
         return SolverResult(
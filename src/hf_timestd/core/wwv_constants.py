@@ -351,6 +351,21 @@ GUIDED_SEARCH_SAFETY_MARGIN_MS = 5.0
 # Minimum WWV-WWVH time separation (ms) (Path difference ~4000km)
 STATION_SEPARATION_MS = 15.0
 
+# =============================================================================
+# MULTI-CHANNEL CORRELATION STACKING
+# =============================================================================
+#
+# Each channel shares its tone correlation envelope (noise-normalized, i.e.
+# in units of noise sigma) around the minute boundary. Envelopes are shifted
+# by their predicted path delay and summed; the stack is divided by sqrt(N)
+# so it stays in sigma units and the detection threshold is channel-count
+# independent.
+
+STACK_ENVELOPE_HALF_WIDTH_MS = 500.0   # Envelope covers minute boundary ±500 ms
+STACK_ENVELOPE_BIN_MS = 0.25           # Decimated envelope resolution
+STACK_DETECTION_SIGMA = 4.0            # Stacked peak needed for a rescue
+STACK_GUIDED_WINDOW_MS = 50.0          # Stacked peak is flat to tens of ms at low SNR
+
 # =============================================================================
 # PROPAGATION PLAUSIBILITY BOUNDS (ms)
 # =============================================================================
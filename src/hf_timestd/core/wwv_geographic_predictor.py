@@ -149,11 +149,11 @@ import logging
 from typing import Optional, Tuple, Dict, List
 from datetime import datetime, timedelta
 from collections import deque
-import json
 from pathlib import Path
 
 # Issue 4.1 Fix (2025-12-07): Import coordinates from single source of truth
 from .wwv_constants import WWV_LAT, WWV_LON, WWVH_LAT, WWVH_LON
+from .checkpoint_service import get_checkpoint_service, load_checkpoint
 
 logger = logging.getLogger(__name__)
 
@@ -187,13 +187,14 @@ class WWVGeographicPredictor:
         self.receiver_lat, self.receiver_lon = self.grid_to_latlon(receiver_grid)
         self.history_file = history_file
         self.max_history = max_history
+        self._checkpoints = get_checkpoint_service()
         
         # Historical ToA measurements for empirical refinement
         # Structure: {frequency_mhz: deque([{time, peak_delay_ms, station}, ...])}
         self.toa_history: Dict[float, Dict[str, deque]] = {}
         
         # Load history if available
-        if history_file and history_file.exists():
+        if history_file:
             self._load_history()
         
         logger.info(f"Geographic predictor initialized: {receiver_grid} "
@@ -602,12 +603,12 @@ class WWVGeographicPredictor:
         self._update_history(frequency_mhz, 'WWVH', wwvh_delay_ms, wwv_amplitude)
     
     def _save_history(self):
-        """Persist ToA history to file"""
+        """Queue a ToA history snapshot with the checkpoint service"""
         if not self.history_file:
             return
         
         try:
-            # Convert deques to lists for JSON serialization
+            # Convert deques to lists for serialization
             history_data = {}
             for freq, stations in self.toa_history.items():
                 history_data[str(freq)] = {
@@ -621,9 +622,7 @@ class WWVGeographicPredictor:
                 'history': history_data
             }
             
-            self.history_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.history_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._checkpoints.mark_dirty(self.history_file, data)
                 
         except Exception as e:
             logger.error(f"Failed to save ToA history: {e}")
@@ -631,8 +630,9 @@ class WWVGeographicPredictor:
     def _load_history(self):
         """Load ToA history from file"""
         try:
-            with open(self.history_file, 'r') as f:
-                data = json.load(f)
+            data = load_checkpoint(self.history_file)
+            if data is None:
+                return
             
             # Verify grid square matches
             if data.get('receiver_grid') != self.receiver_grid:
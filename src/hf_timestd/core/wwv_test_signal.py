@@ -30,8 +30,11 @@ This implementation focuses on the most distinctive features for discrimination:
 
 import numpy as np
 import logging
-from typing import Tuple, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from math import gcd
+from typing import Tuple, Optional, Dict, Iterable
 from scipy import signal
+from scipy.fft import rfft as _rfft, irfft as _irfft, next_fast_len
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -368,6 +371,14 @@ class WWVTestSignalDetector:
     NOISE2_START = 37.0
     NOISE2_END = 39.0
     
+    # Only the first ANALYSIS_END seconds of the minute are demodulated and
+    # resampled: every stage (including the 0-8s voice noise reference)
+    # reads before the end of noise #2, plus a margin for resampler edges.
+    ANALYSIS_END = 40.0
+    
+    # Multi-tone template is slid only this far either side of MULTITONE_START
+    MULTITONE_SEARCH_SEC = 1.0
+    
     # Tone frequencies for multi-tone segment
     TONE_FREQUENCIES = [2000, 3000, 4000, 5000]  # Hz
     
@@ -409,6 +420,31 @@ class WWVTestSignalDetector:
         self.short_chirp_up = signal.chirp(t_short, 0, 0.05, 5000, method='linear')
         self.short_chirp_down = signal.chirp(t_short, 5000, 0.05, 0, method='linear')
         
+        # Single-cycle burst templates (2.5 kHz and 5 kHz)
+        t_25 = np.arange(0, 1/2500, 1/sample_rate)
+        self.burst_template_25 = np.sin(2 * np.pi * 2500 * t_25)
+        t_50 = np.arange(0, 1/5000, 1/sample_rate)
+        self.burst_template_50 = np.sin(2 * np.pi * 5000 * t_50)
+        
+        # Matched-filter templates by name; their spectra are computed once per
+        # FFT size and reused every minute 8/44 (see _matched_filter)
+        self._templates = {
+            'multitone': self.multitone_template - np.mean(self.multitone_template),
+            'long_up': self.long_chirp_up,
+            'long_down': self.long_chirp_down,
+            'short_up': self.short_chirp_up,
+            'short_down': self.short_chirp_down,
+        }
+        self._template_spectra: Dict[Tuple[str, int], np.ndarray] = {}
+        
+        # Warm the cache for the nominal search segment lengths
+        multitone_len = (len(self.multitone_template)
+                         + int(2 * self.MULTITONE_SEARCH_SEC * sample_rate))
+        chirp_len = int((self.CHIRP_END - self.CHIRP_START + 1.0) * sample_rate)
+        self._template_spectrum('multitone', next_fast_len(multitone_len, real=True))
+        for name in ('long_up', 'long_down', 'short_up', 'short_down'):
+            self._template_spectrum(name, next_fast_len(chirp_len, real=True))
+        
         # Detection thresholds
         self.multitone_threshold = 0.15
         self.chirp_threshold = 0.15  # Lowered - chirps are harder to detect through ionosphere
@@ -452,46 +488,32 @@ class WWVTestSignalDetector:
         # Determine expected station from schedule
         expected_station = 'WWV' if minute_number == 8 else 'WWVH'
         
-        # Convert IQ to demodulated audio using AM envelope detection
-        if np.iscomplexobj(iq_samples):
-            envelope = np.abs(iq_samples)
-            audio_signal = envelope - np.mean(envelope)
-        else:
-            audio_signal = iq_samples
-        
-        # Resample if necessary
-        if sample_rate != self.sample_rate:
-            num_samples = int(len(audio_signal) * self.sample_rate / sample_rate)
-            audio_signal = signal.resample(audio_signal, num_samples)
-        
-        # Normalize
-        max_val = np.max(np.abs(audio_signal))
-        if max_val > 0:
-            audio_signal = audio_signal / max_val
+        # Demodulate and resample only the span the stages read
+        audio_signal = self._extract_analysis_audio(iq_samples, sample_rate)
         
         # === STAGE 1: Detection (is test signal present?) ===
         
-        # Multi-tone detection (most robust for presence detection)
-        multitone_score_template, multitone_start = self._detect_multitone(audio_signal)
-        multitone_score_simple = self._detect_multitone_simple(audio_signal)
-        multitone_score = max(multitone_score_template, multitone_score_simple)
-        
-        # If simple method wins but template method gave no start time,
-        # use expected segment start as coarse estimate
-        if multitone_score_simple > multitone_score_template and multitone_start is None:
-            if multitone_score_simple > self.multitone_threshold:
-                multitone_start = self.MULTITONE_START  # Coarse: signal present at expected time
+        # Multi-tone, noise and chirp stages are independent and spend their
+        # time in FFTs that release the GIL, so run them concurrently
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix='test-signal') as pool:
+            multitone_future = pool.submit(self._detect_multitone_combined, audio_signal)
+            noise_future = pool.submit(self._detect_both_noise_segments, audio_signal)
+            chirp_future = pool.submit(self._detect_chirp_matched, audio_signal)
+            
+            # Single-cycle burst detection (highest precision timing) - cheap,
+            # runs on this thread meanwhile
+            burst_score, burst_toa_offset_ms = self._detect_single_cycle_bursts(audio_signal)
+            
+            multitone_score, multitone_start = multitone_future.result()
+            
+            # White noise analysis (both segments for transient detection)
+            noise1_score, noise2_score, noise_coherence_diff = noise_future.result()
+            
+            # Chirp matched filter detection
+            chirp_score, chirp_toa_sec, delay_spread_ms = chirp_future.result()
         
-        # White noise analysis (both segments for transient detection)
-        noise1_score, noise2_score, noise_coherence_diff = self._detect_both_noise_segments(audio_signal)
         noise_score = (noise1_score + noise2_score) / 2.0  # Average for overall detection
         
-        # Chirp matched filter detection
-        chirp_score, chirp_toa_sec, delay_spread_ms = self._detect_chirp_matched(audio_signal)
-        
-        # Single-cycle burst detection (highest precision timing)
-        burst_score, burst_toa_offset_ms = self._detect_single_cycle_bursts(audio_signal)
-        
         # Combined confidence: multi-tone is most reliable, noise confirms timing
         confidence = 0.5 * multitone_score + 0.3 * noise_score + 0.2 * chirp_score
         detected = confidence >= self.combined_threshold
@@ -577,12 +599,101 @@ class WWVTestSignalDetector:
             noise_coherence_diff=noise_coherence_diff
         )
     
+    def _extract_analysis_audio(self, iq_samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        """
+        AM-demodulate, resample and normalize the first ANALYSIS_END seconds
+        
+        The remaining ~20s of the minute carry no test-signal content, so they
+        are never demodulated. Resampling uses a polyphase filter
+        (resample_poly) on the extracted span instead of an FFT resample of
+        the whole minute.
+        
+        Returns:
+            Audio at self.sample_rate starting at the minute boundary
+        """
+        segment = iq_samples[:int(self.ANALYSIS_END * sample_rate)]
+        
+        # Convert IQ to demodulated audio using AM envelope detection
+        if np.iscomplexobj(segment):
+            envelope = np.abs(segment)
+            audio_signal = envelope - np.mean(envelope)
+        else:
+            audio_signal = np.asarray(segment, dtype=np.float64)
+        
+        # Resample if necessary
+        if sample_rate != self.sample_rate:
+            common = gcd(int(self.sample_rate), int(sample_rate))
+            audio_signal = signal.resample_poly(
+                audio_signal, int(self.sample_rate) // common, int(sample_rate) // common
+            )
+        
+        # Normalize
+        max_val = np.max(np.abs(audio_signal)) if len(audio_signal) else 0.0
+        if max_val > 0:
+            audio_signal = audio_signal / max_val
+        
+        return audio_signal
+    
+    def _template_spectrum(self, name: str, nfft: int) -> np.ndarray:
+        """Conjugate spectrum of a named template at FFT size nfft (cached)"""
+        key = (name, nfft)
+        spectrum = self._template_spectra.get(key)
+        if spectrum is None:
+            spectrum = np.conj(_rfft(self._templates[name], nfft))
+            self._template_spectra[key] = spectrum
+        return spectrum
+    
+    def _matched_filter(self, segment: np.ndarray, names: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Valid-mode cross-correlation of one segment against named templates
+        
+        The segment is transformed once and multiplied by each cached
+        template spectrum. Only the valid lags (0 .. len(segment) - len(template))
+        are returned; those never wrap, so the FFT only needs len(segment) points.
+        
+        Returns:
+            {template_name: correlation} - same as
+            signal.correlate(segment, template, mode='valid')
+        """
+        nfft = next_fast_len(len(segment), real=True)
+        segment_spectrum = _rfft(segment, nfft)
+        
+        correlations = {}
+        for name in names:
+            num_lags = len(segment) - len(self._templates[name]) + 1
+            if num_lags <= 0:
+                correlations[name] = np.zeros(0)
+                continue
+            correlation = _irfft(segment_spectrum * self._template_spectrum(name, nfft), nfft)
+            correlations[name] = correlation[:num_lags]
+        return correlations
+    
+    def _detect_multitone_combined(self, audio_signal: np.ndarray) -> Tuple[float, Optional[float]]:
+        """
+        Multi-tone score from template correlation and per-second tone check
+        
+        Returns:
+            (multitone_score, start_time_sec)
+        """
+        multitone_score_template, multitone_start = self._detect_multitone(audio_signal)
+        multitone_score_simple = self._detect_multitone_simple(audio_signal)
+        multitone_score = max(multitone_score_template, multitone_score_simple)
+        
+        # If simple method wins but template method gave no start time,
+        # use expected segment start as coarse estimate
+        if multitone_score_simple > multitone_score_template and multitone_start is None:
+            if multitone_score_simple > self.multitone_threshold:
+                multitone_start = self.MULTITONE_START  # Coarse: signal present at expected time
+        
+        return multitone_score, multitone_start
+    
     def _detect_multitone(self, audio_signal: np.ndarray) -> Tuple[float, Optional[float]]:
         """
         Detect multi-tone sequence using normalized cross-correlation
         
         Uses a sliding window approach with proper normalization to compute
-        correlation coefficient at each position.
+        correlation coefficient at each position. The template is slid only
+        MULTITONE_SEARCH_SEC either side of MULTITONE_START.
         
         Returns:
             (correlation_score, start_time_sec)
@@ -598,38 +709,41 @@ class WWVTestSignalDetector:
         if template_std < 1e-10 or template_energy < 1e-10:
             return 0.0, None
         
-        # Compute local means and stds using convolution (efficient)
-        ones = np.ones(template_len)
-        signal_len = len(audio_signal)
+        # Search segment around the expected multi-tone position
+        search_start = max(0, int((self.MULTITONE_START - self.MULTITONE_SEARCH_SEC) * self.sample_rate))
+        search_end = min(len(audio_signal),
+                         int((self.MULTITONE_START + self.MULTITONE_SEARCH_SEC) * self.sample_rate)
+                         + template_len)
+        segment = audio_signal[search_start:search_end]
         
-        # Local sums
-        local_sum = signal.correlate(audio_signal, ones, mode='valid')
-        local_mean = local_sum / template_len
+        if len(segment) < template_len:
+            return 0.0, None
         
-        # Local squared sums for std calculation
-        local_sum_sq = signal.correlate(audio_signal**2, ones, mode='valid')
+        # Local sums over each template-length window (running sums)
+        cumsum = np.concatenate(([0.0], np.cumsum(segment)))
+        cumsum_sq = np.concatenate(([0.0], np.cumsum(segment**2)))
+        local_sum = cumsum[template_len:] - cumsum[:-template_len]
+        local_sum_sq = cumsum_sq[template_len:] - cumsum_sq[:-template_len]
+        local_mean = local_sum / template_len
         local_var = (local_sum_sq / template_len) - local_mean**2
         local_var = np.maximum(local_var, 0.0)  # Avoid negative variance from numerical errors
         local_std = np.sqrt(local_var)
         
-        # Cross-correlation
-        template_centered = template - template_mean
-        correlation = signal.correlate(audio_signal, template_centered, mode='valid')
+        # Cross-correlation with the centered template (cached spectrum)
+        correlation = self._matched_filter(segment, ('multitone',))['multitone']
         
-        # Normalize: corr_coef = correlation / (template_std * local_std * template_len)
-        # But template is already centered, so we use template_energy instead
+        # Pearson correlation coefficient: template is already centered, so
+        # normalize by template_energy and the local window energy
+        local_energy = local_var * template_len
         normalized_corr = np.zeros(len(correlation))
-        for i in range(len(correlation)):
-            if local_std[i] > 1e-10:
-                # Pearson correlation coefficient
-                local_energy = local_std[i]**2 * template_len
-                normalized_corr[i] = correlation[i] / np.sqrt(template_energy * local_energy)
+        valid = local_std > 1e-10
+        normalized_corr[valid] = correlation[valid] / np.sqrt(template_energy * local_energy[valid])
         
         # Find peak correlation
         peak_idx = np.argmax(np.abs(normalized_corr))
         score = np.clip(abs(normalized_corr[peak_idx]), 0.0, 1.0)
         
-        start_time = peak_idx / self.sample_rate if score > self.multitone_threshold else None
+        start_time = (search_start + peak_idx) / self.sample_rate if score > self.multitone_threshold else None
         
         return score, start_time
     
@@ -885,14 +999,20 @@ class WWVTestSignalDetector:
         if len(search_segment) < len(self.long_chirp_up):
             return 0.0, None, None
         
+        # Matched filters share one FFT of the search segment and the cached
+        # template spectra
+        correlations = self._matched_filter(
+            search_segment, ('short_up', 'short_down', 'long_up', 'long_down')
+        )
+        
         # Matched filter with SHORT chirp templates (50ms)
         # These come first in the sequence and are easier to detect
-        short_corr_up = signal.correlate(search_segment, self.short_chirp_up, mode='valid')
-        short_corr_down = signal.correlate(search_segment, self.short_chirp_down, mode='valid')
+        short_corr_up = correlations['short_up']
+        short_corr_down = correlations['short_down']
         
         # Matched filter with LONG chirp templates (1s)
-        long_corr_up = signal.correlate(search_segment, self.long_chirp_up, mode='valid')
-        long_corr_down = signal.correlate(search_segment, self.long_chirp_down, mode='valid')
+        long_corr_up = correlations['long_up']
+        long_corr_down = correlations['long_down']
         
         # Normalize correlations
         short_energy = np.sum(self.short_chirp_up**2)
@@ -1165,12 +1285,9 @@ class WWVTestSignalDetector:
         # The bursts are single-cycle, so look for impulsive energy
         # at 2.5 kHz (first second) and 5 kHz (second second)
         
-        # Generate single-cycle templates
-        t_25 = np.arange(0, 1/2500, 1/self.sample_rate)
-        burst_template_25 = np.sin(2 * np.pi * 2500 * t_25)
-        
-        t_50 = np.arange(0, 1/5000, 1/self.sample_rate)
-        burst_template_50 = np.sin(2 * np.pi * 5000 * t_50)
+        # Single-cycle templates are a handful of taps: direct correlation
+        burst_template_25 = self.burst_template_25
+        burst_template_50 = self.burst_template_50
         
         # Correlate with templates
         # First half: 2.5 kHz bursts (5 bursts over 1 second, ~200ms apart)
@@ -9,18 +9,29 @@ Default behavior:
 - Threshold: 75% disk usage
 - Removes oldest NPZ files first, then spectrograms, then DRF data
 - Logs all deletions for audit trail
+
+Candidate directories come from a per-directory SizeLedger (data_root/state)
+rather than a full rglob of the data tree on every run; only directories
+holding a file older than min_days_to_keep are listed, and files are then
+deleted individually, oldest first. The ledger is filled by rescans, run
+when it is older than RECONCILE_INTERVAL_SEC (or with --reconcile): files
+only become deletable after min_days_to_keep, so a few hours of staleness
+never hides one for long.
 """
 
 import os
 import sys
 import shutil
+import time
 import logging
 import argparse
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 from dataclasses import dataclass
 
+from .size_ledger import SizeLedger, DirUsage, RECONCILE_INTERVAL_SEC
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -49,12 +60,22 @@ class QuotaManager:
         'drf': 4,          # DRF raw data last (hardest to recover)
     }
     
+    # File pattern for each category (listed per ledger directory, non-recursively)
+    CATEGORY_PATTERNS = {
+        'spectrogram': '*.png',
+        'npz': '*.npz',
+        'csv': '*.csv',
+        'drf': '*.h5',
+    }
+    
     def __init__(
         self,
         data_root: Path,
         threshold_percent: float = 75.0,
         min_days_to_keep: int = 7,
-        dry_run: bool = False
+        dry_run: bool = False,
+        ledger: Optional[SizeLedger] = None,
+        background_reconcile: bool = True
     ):
         """
         Initialize quota manager.
@@ -64,6 +85,9 @@ class QuotaManager:
             threshold_percent: Disk usage threshold (0-100)
             min_days_to_keep: Never delete files newer than this
             dry_run: If True, only log what would be deleted
+            ledger: Size ledger (default: data_root/state)
+            background_reconcile: Rescan a stale ledger on a background thread
+                (False for one-shot runs such as the CLI, which rescan inline)
         """
         self.data_root = Path(data_root)
         self.threshold_percent = threshold_percent
@@ -75,6 +99,9 @@ class QuotaManager:
         self.spectrograms_dir = self.data_root / 'spectrograms'
         self.drf_dir = self.data_root / 'drf'
         
+        self.ledger = ledger or SizeLedger(self.data_root / 'state', self.data_root)
+        self.background_reconcile = background_reconcile
+        
     def get_disk_usage(self) -> Tuple[int, int, float]:
         """
         Get disk usage for the partition containing data_root.
@@ -86,65 +113,43 @@ class QuotaManager:
         percent_used = (stat.used / stat.total) * 100
         return stat.used, stat.total, percent_used
     
+    def _iter_managed_files(self) -> Iterator[Tuple[Path, os.stat_result, str]]:
+        """Walk all managed data files, yielding (path, stat, category)."""
+        # NPZ and CSV files in analytics directories
+        if self.analytics_dir.exists():
+            for channel_dir in self.analytics_dir.iterdir():
+                if channel_dir.is_dir():
+                    for category in ('npz', 'csv'):
+                        for path in channel_dir.glob('**/' + self.CATEGORY_PATTERNS[category]):
+                            yield path, path.stat(), category
+        
+        # Spectrograms
+        if self.spectrograms_dir.exists():
+            for path in self.spectrograms_dir.glob('**/*.png'):
+                yield path, path.stat(), 'spectrogram'
+        
+        # DRF data (be careful - this is raw data)
+        if self.drf_dir.exists():
+            for path in self.drf_dir.glob('**/*.h5'):
+                yield path, path.stat(), 'drf'
+    
     def scan_files(self) -> List[FileInfo]:
         """
         Scan all managed data files.
         
+        This walks the whole tree; enforce_quota() uses the size ledger
+        instead and only touches directories it deletes from.
+        
         Returns:
             List of FileInfo objects sorted by priority then age (oldest first)
         """
-        files = []
         cutoff_time = datetime.now().timestamp() - (self.min_days_to_keep * 86400)
         
-        # Scan NPZ files in analytics directories
-        if self.analytics_dir.exists():
-            for channel_dir in self.analytics_dir.iterdir():
-                if channel_dir.is_dir():
-                    # NPZ files
-                    for npz_file in channel_dir.glob('**/*.npz'):
-                        stat = npz_file.stat()
-                        if stat.st_mtime < cutoff_time:
-                            files.append(FileInfo(
-                                path=npz_file,
-                                size_bytes=stat.st_size,
-                                mtime=stat.st_mtime,
-                                category='npz'
-                            ))
-                    
-                    # CSV files
-                    for csv_file in channel_dir.glob('**/*.csv'):
-                        stat = csv_file.stat()
-                        if stat.st_mtime < cutoff_time:
-                            files.append(FileInfo(
-                                path=csv_file,
-                                size_bytes=stat.st_size,
-                                mtime=stat.st_mtime,
-                                category='csv'
-                            ))
-        
-        # Scan spectrograms
-        if self.spectrograms_dir.exists():
-            for png_file in self.spectrograms_dir.glob('**/*.png'):
-                stat = png_file.stat()
-                if stat.st_mtime < cutoff_time:
-                    files.append(FileInfo(
-                        path=png_file,
-                        size_bytes=stat.st_size,
-                        mtime=stat.st_mtime,
-                        category='spectrogram'
-                    ))
-        
-        # Scan DRF data (be careful - this is raw data)
-        if self.drf_dir.exists():
-            for h5_file in self.drf_dir.glob('**/*.h5'):
-                stat = h5_file.stat()
-                if stat.st_mtime < cutoff_time:
-                    files.append(FileInfo(
-                        path=h5_file,
-                        size_bytes=stat.st_size,
-                        mtime=stat.st_mtime,
-                        category='drf'
-                    ))
+        files = [
+            FileInfo(path=path, size_bytes=stat.st_size, mtime=stat.st_mtime, category=category)
+            for path, stat, category in self._iter_managed_files()
+            if stat.st_mtime < cutoff_time
+        ]
         
         # Sort by priority (low first), then by age (oldest first)
         files.sort(key=lambda f: (
@@ -154,6 +159,86 @@ class QuotaManager:
         
         return files
     
+    def _scan_usage(self) -> List[DirUsage]:
+        """Aggregate managed files per (category, directory) for the ledger."""
+        usage: Dict[Tuple[str, Path], DirUsage] = {}
+        for path, stat, category in self._iter_managed_files():
+            key = (category, path.parent)
+            entry = usage.get(key)
+            if entry is None:
+                entry = usage[key] = DirUsage(path=str(path.parent), category=category)
+            entry.bytes += stat.st_size
+            entry.files += 1
+            entry.mtime = max(entry.mtime, stat.st_mtime)
+            entry.oldest = min(entry.oldest or stat.st_mtime, stat.st_mtime)
+        return list(usage.values())
+    
+    def reconcile(self):
+        """Rescan the data tree and replace the ledger's entries (slow)."""
+        self.ledger.reconcile(self._scan_usage, self.CATEGORY_PRIORITY)
+    
+    def deletion_candidates(self) -> List[DirUsage]:
+        """
+        Directories holding a managed file older than min_days_to_keep.
+        
+        Returns:
+            Ledger entries sorted by priority then oldest file
+        """
+        last = self.ledger.last_reconciled('npz')
+        if last is None or not self.background_reconcile:
+            if last is None or time.time() - last > RECONCILE_INTERVAL_SEC:
+                self.reconcile()
+        elif time.time() - last > RECONCILE_INTERVAL_SEC:
+            self.ledger.reconcile_in_background(self._scan_usage, self.CATEGORY_PRIORITY)
+        
+        cutoff_time = datetime.now().timestamp() - (self.min_days_to_keep * 86400)
+        candidates = [
+            e for e in self.ledger.usage(self.CATEGORY_PRIORITY)
+            if e.files > 0 and e.oldest < cutoff_time  # oldest == 0: unknown, list it
+        ]
+        candidates.sort(key=lambda e: (self.CATEGORY_PRIORITY.get(e.category, 99), e.oldest))
+        return candidates
+    
+    def _list_directory(self, entry: DirUsage) -> List[FileInfo]:
+        """One ledger entry's files (its category only, non-recursive)."""
+        files = []
+        for path in self.ledger.absolute(entry).glob(self.CATEGORY_PATTERNS[entry.category]):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append(FileInfo(path=path, size_bytes=stat.st_size,
+                                  mtime=stat.st_mtime, category=entry.category))
+        return files
+    
+    def list_candidates(self) -> Dict[Tuple[str, Path], List[FileInfo]]:
+        """
+        List the candidate directories (new files included, so the ledger
+        can be corrected after deletions).
+        
+        Returns:
+            {(category, directory): files}, in candidate order
+        """
+        return {(e.category, self.ledger.absolute(e)): self._list_directory(e)
+                for e in self.deletion_candidates()}
+    
+    def is_deletable(self, file_info: FileInfo) -> bool:
+        """True if the file is older than min_days_to_keep."""
+        cutoff_time = datetime.now().timestamp() - (self.min_days_to_keep * 86400)
+        return file_info.mtime < cutoff_time
+    
+    def _update_ledger(self, directory: Path, category: str, remaining: List[FileInfo]):
+        """Replace a directory's entry with what is left after deletions."""
+        self.ledger.remove(directory, category)
+        if remaining:
+            self.ledger.record(
+                directory, category,
+                nbytes=sum(f.size_bytes for f in remaining),
+                nfiles=len(remaining),
+                mtime=max(f.mtime for f in remaining),
+                oldest=min(f.mtime for f in remaining)
+            )
+    
     def delete_file(self, file_info: FileInfo) -> bool:
         """
         Delete a file and log the action.
@@ -208,18 +293,21 @@ class QuotaManager:
         logger.info(f"Need to free {bytes_to_free / 1024 / 1024 / 1024:.2f} GB "
                    f"to reach {target_percent:.1f}%")
         
-        # Get files sorted by deletion priority
-        files = self.scan_files()
+        # Old files in the candidate directories, by priority then age (oldest first)
+        listed = self.list_candidates()
+        files = [f for dir_files in listed.values() for f in dir_files if self.is_deletable(f)]
+        files.sort(key=lambda f: (self.CATEGORY_PRIORITY.get(f.category, 99), f.mtime))
         
         if not files:
             logger.warning(f"No files older than {self.min_days_to_keep} days to delete")
             return result
         
-        logger.info(f"Found {len(files)} files eligible for deletion")
+        logger.info(f"Found {len(files)} files eligible for deletion in {len(listed)} directories")
         
-        # Delete files until we're under target
+        # Delete oldest files until we're under target
         bytes_freed = 0
         files_deleted = 0
+        deleted = set()
         
         for file_info in files:
             if bytes_freed >= bytes_to_free:
@@ -228,6 +316,13 @@ class QuotaManager:
             if self.delete_file(file_info):
                 bytes_freed += file_info.size_bytes
                 files_deleted += 1
+                deleted.add(file_info.path)
+        
+        if not self.dry_run:
+            for (category, directory), dir_files in listed.items():
+                if any(f.path in deleted for f in dir_files):
+                    self._update_ledger(directory, category,
+                                        [f for f in dir_files if f.path not in deleted])
         
         # Get final usage
         if not self.dry_run:
@@ -249,7 +344,8 @@ class QuotaManager:
     def get_status(self) -> dict:
         """Get current quota status without making changes."""
         used, total, percent = self.get_disk_usage()
-        files = self.scan_files()
+        files = [f for dir_files in self.list_candidates().values() for f in dir_files
+                 if self.is_deletable(f)]
         
         # Categorize files
         by_category = {}
@@ -304,6 +400,11 @@ def main():
         action='store_true',
         help='Just show current status, no deletions'
     )
+    parser.add_argument(
+        '--reconcile',
+        action='store_true',
+        help='Rescan the data tree into the size ledger first'
+    )
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -319,9 +420,13 @@ def main():
         data_root=args.data_root,
         threshold_percent=args.threshold,
         min_days_to_keep=args.min_days,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        background_reconcile=False
     )
     
+    if args.reconcile:
+        manager.reconcile()
+    
     if args.status:
         import json
         status = manager.get_status()
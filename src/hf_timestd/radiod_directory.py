@@ -0,0 +1,396 @@
+"""
+Radiod Channel Directory - shared, continuously updated view of radiod channels
+
+ka9q's discover_channels() opens a socket, polls radiod and then blocks for
+a full listen period (2 s by default) on every call. Channel setup, stream
+subscription and health checks each did that on their own, once per
+channel.
+
+This module keeps one background status listener per radiod status
+address. It polls radiod periodically, decodes every STATUS broadcast into
+a ChannelInfo, and serves lookups from dicts:
+
+    directory = get_channel_directory("radiod.local")
+    info = directory.get(ssrc)                      # None if unknown
+    channels = directory.channels()                 # like discover_channels()
+    matches = directory.find(10e6, "iq", 20000)     # frequency index
+    found = directory.wait_for([ssrc], timeout=5)   # after create_channel
+
+Only the first query blocks, for one warm-up period while the initial poll
+is answered. Channels radiod stops reporting expire after expire_after
+seconds.
+"""
+
+import ipaddress
+import logging
+import random
+import select
+import socket
+import struct
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ka9q import ChannelInfo
+from ka9q.control import decode_status_dict
+from ka9q.utils import resolve_multicast_address
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATUS_PORT = 5006
+
+# TLV tags of the poll command (as in ka9q discover_channels / control.c)
+_CMD_PACKET = 1
+_TAG_COMMAND_TAG = 1
+_TAG_OUTPUT_SSRC = 18
+_POLL_ALL_SSRC = 0xffffffff
+
+
+def build_poll_command(ssrc: int = _POLL_ALL_SSRC) -> bytes:
+    """radiod command asking for STATUS of one SSRC (default: all channels)."""
+    cmd = bytearray([_CMD_PACKET])
+    cmd += bytes([_TAG_COMMAND_TAG, 4]) + random.getrandbits(32).to_bytes(4, 'big')
+    cmd += bytes([_TAG_OUTPUT_SSRC, 4]) + (ssrc & 0xffffffff).to_bytes(4, 'big')
+    cmd += bytes([0, 0])  # EOL
+    return bytes(cmd)
+
+
+def channel_info_from_status(status: Dict) -> Optional[ChannelInfo]:
+    """ChannelInfo from a decoded STATUS packet (same fields as discover_channels)."""
+    ssrc = status.get('ssrc')
+    if not ssrc:
+        return None
+    dest = status.get('destination', {})
+    return ChannelInfo(
+        ssrc=ssrc,
+        preset=status.get('preset', 'unknown'),
+        sample_rate=status.get('sample_rate', 0),
+        frequency=status.get('frequency', 0.0),
+        snr=status.get('snr', float('-inf')),
+        multicast_address=dest.get('address', '') if isinstance(dest, dict) else '',
+        port=dest.get('port', 0) if isinstance(dest, dict) else 0,
+        gps_time=status.get('gps_time'),
+        rtp_timesnap=status.get('rtp_timesnap'),
+        encoding=status.get('encoding', 0),
+    )
+
+
+class RadiodChannelDirectory:
+    """
+    Channels of one radiod instance, kept current by a status listener thread.
+    
+    Thread-safe. The listener starts on the first query (or start()).
+    """
+    
+    def __init__(
+        self,
+        status_address: str,
+        interface: Optional[str] = None,
+        status_port: int = DEFAULT_STATUS_PORT,
+        poll_interval: float = 5.0,
+        expire_after: float = 30.0,
+        warmup: float = 1.0
+    ):
+        """
+        Initialize channel directory.
+        
+        Args:
+            status_address: mDNS name or multicast address of radiod status
+            interface: Local interface address for the multicast join
+                (required on multi-homed systems, None = INADDR_ANY)
+            status_port: radiod status port
+            poll_interval: Seconds between polls for all channels
+            expire_after: Drop channels not reported for this long
+            warmup: How long the first query waits for poll replies
+        """
+        self.status_address = status_address
+        self.interface = interface
+        self.status_port = status_port
+        self.poll_interval = poll_interval
+        self.expire_after = expire_after
+        self.warmup = warmup
+        
+        self._channels: Dict[int, ChannelInfo] = {}
+        self._last_seen: Dict[int, float] = {}
+        self._by_frequency: Dict[int, Set[int]] = {}
+        self._changed = threading.Condition()
+        
+        self._sock: Optional[socket.socket] = None
+        self._dest: Optional[Tuple[str, int]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._running = False
+        self._ready = threading.Event()
+        self._started_at = 0.0
+        self._last_packet = 0.0
+        
+        self.packets_received = 0
+        self.decode_errors = 0
+        self.polls_sent = 0
+    
+    # === Lifecycle ===
+    
+    def start(self):
+        """Open the status socket, send the first poll and start listening."""
+        with self._start_lock:
+            if self._running:
+                return
+            group = resolve_multicast_address(self.status_address, timeout=2.0)
+            self._sock = self._open_socket(group)
+            self._dest = (group, self.status_port)
+            self._ready.clear()
+            self._running = True
+            self._started_at = time.monotonic()
+            self._thread = threading.Thread(
+                target=self._listen_loop, daemon=True,
+                name=f"radiod-directory-{self.status_address}"
+            )
+            self._thread.start()
+            logger.info(f"Channel directory listening on {group}:{self.status_port}")
+    
+    def close(self):
+        """Stop the listener and close the socket."""
+        with self._start_lock:
+            self._running = False
+            thread, self._thread = self._thread, None
+        if thread:
+            thread.join(timeout=2.0)
+        if self._sock:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+    
+    @property
+    def running(self) -> bool:
+        return self._running
+    
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Start if needed and wait for the warm-up period to pass."""
+        if not self._running:
+            self.start()
+        return self._ready.wait(timeout if timeout is not None else self.warmup + 1.0)
+    
+    # === Queries ===
+    
+    def get(self, ssrc: int) -> Optional[ChannelInfo]:
+        """Latest ChannelInfo for an SSRC, or None."""
+        self.wait_ready()
+        return self._channels.get(ssrc)
+    
+    def __contains__(self, ssrc: int) -> bool:
+        return self.get(ssrc) is not None
+    
+    def channels(self) -> Dict[int, ChannelInfo]:
+        """All current channels, {ssrc: ChannelInfo} (a copy)."""
+        self.wait_ready()
+        with self._changed:
+            return dict(self._channels)
+    
+    def find(
+        self,
+        frequency_hz: float,
+        preset: Optional[str] = None,
+        sample_rate: Optional[int] = None,
+        frequency_tolerance_hz: float = 1.0
+    ) -> List[ChannelInfo]:
+        """
+        Channels at a frequency, optionally with a given preset and rate.
+        
+        Uses the 1 Hz frequency index for tolerances up to a few Hz and
+        falls back to a scan for wide tolerances.
+        """
+        self.wait_ready()
+        with self._changed:
+            if frequency_tolerance_hz <= 16:
+                lo = int(round(frequency_hz - frequency_tolerance_hz))
+                hi = int(round(frequency_hz + frequency_tolerance_hz))
+                ssrcs = [s for f in range(lo, hi + 1) for s in self._by_frequency.get(f, ())]
+                candidates = [self._channels[s] for s in ssrcs]
+            else:
+                candidates = list(self._channels.values())
+        return [
+            ch for ch in candidates
+            if abs(ch.frequency - frequency_hz) < frequency_tolerance_hz
+            and (preset is None or ch.preset.lower() == preset.lower())
+            and (sample_rate is None or ch.sample_rate == sample_rate)
+        ]
+    
+    def wait_for(self, ssrcs: Iterable[int], timeout: float = 5.0) -> Dict[int, ChannelInfo]:
+        """
+        Wait until all SSRCs are reported (e.g. after create_channel).
+        
+        Polls radiod immediately instead of waiting for the next poll.
+        
+        Returns:
+            {ssrc: ChannelInfo} of the SSRCs found before the timeout
+        """
+        wanted = set(ssrcs)
+        if not self._running:
+            self.start()
+        self.poll()
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while True:
+                missing = wanted - self._channels.keys()
+                remaining = deadline - time.monotonic()
+                if not missing or remaining <= 0:
+                    return {s: self._channels[s] for s in wanted if s in self._channels}
+                self._changed.wait(min(remaining, 0.5))
+    
+    def status_age(self) -> Optional[float]:
+        """Seconds since the last STATUS packet, None if none yet."""
+        if not self._last_packet:
+            return None
+        return time.monotonic() - self._last_packet
+    
+    def is_alive(self, max_age: Optional[float] = None) -> bool:
+        """True if radiod sent STATUS within max_age (default 2 poll intervals)."""
+        self.wait_ready()
+        age = self.status_age()
+        return age is not None and age <= (max_age or 2 * self.poll_interval)
+    
+    def get_stats(self) -> Dict:
+        return {
+            'status_address': self.status_address,
+            'channels': len(self._channels),
+            'packets_received': self.packets_received,
+            'decode_errors': self.decode_errors,
+            'polls_sent': self.polls_sent,
+            'status_age_sec': self.status_age(),
+        }
+    
+    # === Listener ===
+    
+    def poll(self, ssrc: int = _POLL_ALL_SSRC):
+        """Ask radiod to broadcast STATUS now."""
+        sock, dest = self._sock, self._dest
+        if sock is None or dest is None:
+            return
+        try:
+            sock.sendto(build_poll_command(ssrc), dest)
+            self.polls_sent += 1
+        except OSError as e:
+            logger.debug(f"Poll to {dest} failed: {e}")
+    
+    def _open_socket(self, group: str) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, 'SO_REUSEPORT'):
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError:
+                pass
+        sock.bind(('0.0.0.0', self.status_port))
+        if ipaddress.ip_address(group).is_multicast:
+            interface = self.interface or '0.0.0.0'
+            mreq = struct.pack('=4s4s', socket.inet_aton(group), socket.inet_aton(interface))
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+            if self.interface:
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(self.interface))
+        return sock
+    
+    def _listen_loop(self):
+        next_poll = 0.0
+        next_expire = time.monotonic() + self.expire_after
+        
+        while self._running:
+            now = time.monotonic()
+            if now >= next_poll:
+                self.poll()
+                next_poll = now + self.poll_interval
+            if not self._ready.is_set() and now - self._started_at >= self.warmup:
+                self._ready.set()
+            if now >= next_expire:
+                self._expire(now)
+                next_expire = now + min(self.expire_after, self.poll_interval)
+            
+            try:
+                ready, _, _ = select.select([self._sock], [], [], 0.1)
+                if not ready:
+                    continue
+                buffer, _ = self._sock.recvfrom(8192)
+            except (OSError, ValueError) as e:
+                if self._running:
+                    logger.warning(f"Channel directory socket error: {e}")
+                    time.sleep(1.0)
+                continue
+            
+            # Commands (ours included) are type 1, STATUS is type 0
+            if not buffer or buffer[0] != 0:
+                continue
+            self.packets_received += 1
+            self._last_packet = time.monotonic()
+            try:
+                info = channel_info_from_status(decode_status_dict(buffer))
+            except Exception as e:
+                self.decode_errors += 1
+                logger.debug(f"Undecodable STATUS packet: {e}")
+                continue
+            if info is not None:
+                self._update(info)
+        
+        self._ready.set()
+    
+    def _update(self, info: ChannelInfo):
+        ssrc = info.ssrc
+        freq_key = int(round(info.frequency))
+        with self._changed:
+            previous = self._channels.get(ssrc)
+            if previous is None:
+                logger.debug(f"radiod channel {ssrc}: {info.frequency / 1e6:.3f} MHz {info.preset}")
+            elif int(round(previous.frequency)) != freq_key:
+                self._unindex(ssrc, previous)
+            self._channels[ssrc] = info
+            self._last_seen[ssrc] = time.monotonic()
+            self._by_frequency.setdefault(freq_key, set()).add(ssrc)
+            self._changed.notify_all()
+    
+    def _unindex(self, ssrc: int, info: ChannelInfo):
+        key = int(round(info.frequency))
+        bucket = self._by_frequency.get(key)
+        if bucket:
+            bucket.discard(ssrc)
+            if not bucket:
+                del self._by_frequency[key]
+    
+    def _expire(self, now: float):
+        with self._changed:
+            stale = [s for s, seen in self._last_seen.items() if now - seen > self.expire_after]
+            for ssrc in stale:
+                logger.info(f"radiod channel {ssrc} no longer reported, dropping")
+                self._unindex(ssrc, self._channels.pop(ssrc))
+                del self._last_seen[ssrc]
+            if stale:
+                self._changed.notify_all()
+
+
+# Shared directories (one listener per radiod status address)
+_directories: Dict[Tuple[str, Optional[str], int], RadiodChannelDirectory] = {}
+_directories_lock = threading.Lock()
+
+
+def get_channel_directory(
+    status_address: str,
+    interface: Optional[str] = None,
+    status_port: int = DEFAULT_STATUS_PORT
+) -> RadiodChannelDirectory:
+    """Process-wide channel directory for a radiod status address."""
+    key = (status_address, interface, status_port)
+    with _directories_lock:
+        directory = _directories.get(key)
+        if directory is None:
+            directory = _directories[key] = RadiodChannelDirectory(
+                status_address, interface=interface, status_port=status_port
+            )
+        return directory
+
+
+def close_channel_directories():
+    """Stop all shared directories (shutdown, tests)."""
+    with _directories_lock:
+        directories = list(_directories.values())
+        _directories.clear()
+    for directory in directories:
+        directory.close()
@@ -9,7 +9,8 @@ import logging
 import time
 from typing import Optional, Dict
 from datetime import datetime
-from ka9q import discover_channels
+
+from .radiod_directory import get_channel_directory
 
 logger = logging.getLogger(__name__)
 
@@ -33,24 +34,26 @@ class RadiodHealthChecker:
         """
         self.status_address = status_address
         self.status_port = status_port
+        self.directory = get_channel_directory(status_address, status_port=status_port)
         self.logger = logging.getLogger(f"{__name__}.{status_address}")
     
     def is_radiod_alive(self, timeout_sec: float = 5.0) -> bool:
         """
-        Check if radiod is responsive by attempting to discover channels.
+        Check if radiod is responsive (sent STATUS recently).
         
         Args:
-            timeout_sec: How long to wait for discovery
+            timeout_sec: Maximum age of the last STATUS packet
             
         Returns:
             True if radiod is responding, False otherwise
         """
         try:
-            # Use ka9q discover_channels - works with mDNS hostnames and multicast addresses
-            channels = discover_channels(self.status_address)
+            # Shared channel directory - its listener polls radiod continuously
+            if not self.directory.is_alive(max_age=max(timeout_sec, 2 * self.directory.poll_interval)):
+                self.logger.warning(f"No radiod STATUS for {self.directory.status_age()} s")
+                return False
             
-            # If we got any response (even empty channel list), radiod is alive
-            self.logger.debug(f"Radiod alive - discovered {len(channels)} channels")
+            self.logger.debug(f"Radiod alive - {len(self.directory.channels())} channels")
             return True
             
         except Exception as e:
@@ -59,25 +62,22 @@ class RadiodHealthChecker:
     
     def verify_channel_exists(self, ssrc: int, timeout_sec: float = 5.0) -> bool:
         """
-        Verify a specific channel exists in radiod by discovering channels.
+        Verify a specific channel exists in radiod.
         
         Args:
             ssrc: RTP SSRC identifier for the channel
-            timeout_sec: Timeout for discovery
+            timeout_sec: Timeout for the first directory fill
             
         Returns:
             True if channel exists, False otherwise
         """
         try:
-            # Use ka9q discover_channels to get all channels
-            channels = discover_channels(self.status_address)
-            
-            # Check if our SSRC is in the discovered channels
-            if ssrc in channels:
+            self.directory.wait_ready(timeout_sec)
+            if ssrc in self.directory:
                 self.logger.debug(f"Channel {ssrc:x} found in radiod")
                 return True
             else:
-                self.logger.warning(f"Channel {ssrc:x} not found in radiod (have {len(channels)} channels)")
+                self.logger.warning(f"Channel {ssrc:x} not found in radiod (have {len(self.directory.channels())} channels)")
                 return False
             
         except Exception as e:
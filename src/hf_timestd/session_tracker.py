@@ -9,11 +9,11 @@ import os
 import json
 import glob
 import logging
-import numpy as np
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, List
 from .interfaces.data_models import Discontinuity, DiscontinuityType
+from .core.npz_reader import NPZReader
 
 logger = logging.getLogger(__name__)
 
@@ -129,11 +129,12 @@ class SessionBoundaryTracker:
         last_file = npz_files[-1]
         
         try:
-            data = np.load(last_file, allow_pickle=True)
-            
-            # Get timestamp and calculate end time
-            start_timestamp = float(data['timestamp'])
-            num_samples = len(data['samples'])
+            # Sample count comes from the header; samples are not read
+            with NPZReader(last_file) as data:
+                start_timestamp = data.scalar('timestamp', float)
+                num_samples = data.shape('samples')[0]
+            if start_timestamp is None:
+                raise KeyError('timestamp')
             end_timestamp = start_timestamp + (num_samples / self.sample_rate)
             
             self.logger.debug(
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Storage Size Ledger - Incrementally maintained per-directory disk usage
+
+Quota enforcement used to walk the whole archive (rglob + stat of every
+file) on each check, which costs minutes of metadata I/O on a multi-TB
+archive. The ledger keeps a running byte count per managed directory
+instead:
+
+- Writers call record() as they close a file (one small journal append)
+- Quota managers read totals and the directory index from the ledger,
+  so a quota decision is O(number of directories), and record what they
+  delete
+- reconcile() rescans the tree occasionally (normally on a background
+  thread) to correct drift from crashes, manual deletions or writers
+  that don't report
+
+On-disk layout (in the state directory):
+    size_ledger.json      - snapshot of all entries + generation number
+    size_ledger.journal   - JSON lines appended since the snapshot
+    size_ledger.lock      - flock: shared for appends, exclusive for compaction
+
+Entries are keyed by (category, directory). Categories are chosen by the
+caller, e.g. 'raw' for raw_archive/raw_buffer day directories or 'npz'
+for analytics files, so several quota managers can share one ledger and
+reconcile only their own categories.
+
+Usage:
+------
+    ledger = SizeLedger(data_root / 'state', data_root)
+
+    # Writer, after closing a file
+    ledger.record(day_dir, 'raw', nbytes=bin_path.stat().st_size)
+
+    # Quota manager
+    entries = ledger.usage(['raw'])
+    total = sum(e.bytes for e in entries)
+"""
+
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LEDGER_SNAPSHOT = 'size_ledger.json'
+LEDGER_JOURNAL = 'size_ledger.journal'
+LEDGER_LOCK = 'size_ledger.lock'
+
+# Fold the journal into the snapshot once it grows past this size
+JOURNAL_COMPACT_BYTES = 1024 * 1024
+
+# Rescan managed trees at most this often (seconds)
+RECONCILE_INTERVAL_SEC = 6 * 3600
+
+
+@dataclass
+class DirUsage:
+    """Usage of one (category, directory) ledger entry."""
+    path: str          # Directory relative to the ledger root (POSIX form)
+    category: str      # Caller-defined category ('raw', 'npz', ...)
+    bytes: int = 0
+    files: int = 0
+    mtime: float = 0.0  # Newest file modification time seen
+    oldest: float = 0.0  # Oldest file modification time seen (0 = unknown)
+
+    @property
+    def name(self) -> str:
+        """Last path component (e.g. the YYYYMMDD of a day directory)."""
+        return self.path.rsplit('/', 1)[-1]
+
+
+class SizeLedger:
+    """
+    Persistent per-directory size ledger shared by writers and quota managers.
+
+    Safe to use from several processes at once: appends are single
+    O_APPEND writes under a shared flock, and compaction/reconciliation
+    take the lock exclusively.
+    """
+
+    def __init__(self, state_dir: Path, root: Path):
+        """
+        Initialize ledger.
+
+        Args:
+            state_dir: Directory holding the ledger files
+            root: Directory that ledger paths are relative to (data root)
+        """
+        self.state_dir = Path(state_dir)
+        self.root = Path(root)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+
+        self.snapshot_file = self.state_dir / LEDGER_SNAPSHOT
+        self.journal_file = self.state_dir / LEDGER_JOURNAL
+        self.lock_file = self.state_dir / LEDGER_LOCK
+
+        self._lock = threading.Lock()
+        self._reconcile_thread: Optional[threading.Thread] = None
+
+        # In-memory view: snapshot + journal replayed up to _journal_pos
+        self._entries: Dict[Tuple[str, str], DirUsage] = {}
+        self._reconciled_at: Dict[str, float] = {}
+        self._generation: Optional[int] = None
+        self._journal_pos = 0
+
+    # -------------------------------------------------------------------------
+    # Locking / paths
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        with open(self.lock_file, 'a') as lf:
+            fcntl.flock(lf.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lf.fileno(), fcntl.LOCK_UN)
+
+    def _relative(self, directory: Path) -> str:
+        """Ledger key for a directory (relative to root when possible)."""
+        directory = Path(directory)
+        try:
+            return directory.relative_to(self.root).as_posix()
+        except ValueError:
+            return directory.as_posix()
+
+    def absolute(self, entry: DirUsage) -> Path:
+        """Absolute path of a ledger entry's directory."""
+        return self.root / entry.path
+
+    # -------------------------------------------------------------------------
+    # Writer API
+    # -------------------------------------------------------------------------
+
+    def record(
+        self,
+        directory: Path,
+        category: str,
+        nbytes: int,
+        nfiles: int = 1,
+        mtime: Optional[float] = None,
+        oldest: Optional[float] = None
+    ):
+        """
+        Add a closed file's size to a directory's entry.
+
+        Args:
+            directory: Managed directory the file belongs to (e.g. day dir)
+            category: Entry category
+            nbytes: Bytes added (may be negative for in-place shrinking)
+            nfiles: Files added
+            mtime: File modification time (default: now)
+            oldest: Oldest modification time among the files (default: mtime)
+        """
+        mtime = mtime if mtime is not None else time.time()
+        self._append({
+            'k': self._relative(directory),
+            'c': category,
+            'b': int(nbytes),
+            'n': int(nfiles),
+            'm': mtime,
+            'o': oldest if oldest is not None else mtime,
+        })
+
+    def remove(self, directory: Path, category: str):
+        """Drop a directory's entry (after the quota manager deletes it)."""
+        self._append({'k': self._relative(directory), 'c': category, 'rm': 1})
+
+    def _append(self, record: Dict):
+        line = (json.dumps(record, separators=(',', ':')) + '\n').encode()
+        try:
+            with self._file_lock(exclusive=False):
+                fd = os.open(self.journal_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, line)
+                finally:
+                    os.close(fd)
+        except OSError as e:
+            # Never fail a data write because of bookkeeping; reconcile fixes drift
+            logger.warning(f"Size ledger append failed: {e}")
+
+    # -------------------------------------------------------------------------
+    # Reader API
+    # -------------------------------------------------------------------------
+
+    def usage(self, categories: Optional[Iterable[str]] = None) -> List[DirUsage]:
+        """
+        Get current entries, optionally restricted to some categories.
+
+        Cost is proportional to the number of entries plus any journal
+        lines appended since the last call.
+        """
+        wanted = set(categories) if categories is not None else None
+        with self._lock:
+            self._refresh()
+            entries = [
+                DirUsage(e.path, e.category, e.bytes, e.files, e.mtime, e.oldest)
+                for e in self._entries.values()
+                if wanted is None or e.category in wanted
+            ]
+            compact = self._journal_pos > JOURNAL_COMPACT_BYTES
+
+        if compact:
+            self.compact()
+        return entries
+
+    def total_bytes(self, categories: Optional[Iterable[str]] = None) -> int:
+        """Total bytes across entries of the given categories."""
+        return sum(e.bytes for e in self.usage(categories))
+
+    def last_reconciled(self, category: str) -> Optional[float]:
+        """Timestamp of the last full rescan of a category (None if never)."""
+        with self._lock:
+            self._refresh()
+            return self._reconciled_at.get(category)
+
+    def _refresh(self):
+        """Bring the in-memory view up to date (caller holds self._lock)."""
+        with self._file_lock(exclusive=False):
+            generation = self._read_snapshot_generation()
+            if generation != self._generation:
+                self._load_snapshot()
+            self._replay_journal()
+
+    def _read_snapshot_generation(self) -> int:
+        if not self.snapshot_file.exists():
+            return 0
+        try:
+            with open(self.snapshot_file, 'r') as f:
+                # Generation is written first, so the header is enough
+                head = f.read(64)
+            return int(head.split('"generation":', 1)[1].split(',', 1)[0])
+        except (OSError, IndexError, ValueError):
+            return -1
+
+    def _load_snapshot(self):
+        self._entries = {}
+        self._reconciled_at = {}
+        self._generation = 0
+        self._journal_pos = 0
+
+        if not self.snapshot_file.exists():
+            return
+        try:
+            with open(self.snapshot_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Size ledger snapshot unreadable ({e}) - will reconcile")
+            return
+
+        self._generation = data.get('generation', 0)
+        self._reconciled_at = data.get('reconciled_at', {})
+        for category, path, nbytes, nfiles, mtime, *oldest in data.get('entries', []):
+            self._entries[(category, path)] = DirUsage(path, category, nbytes, nfiles, mtime, *oldest)
+
+    def _replay_journal(self):
+        if not self.journal_file.exists():
+            return
+        with open(self.journal_file, 'rb') as f:
+            f.seek(self._journal_pos)
+            data = f.read()
+        # Only consume complete lines; a partial trailing line is read next time
+        end = data.rfind(b'\n') + 1
+        for raw in data[:end].splitlines():
+            try:
+                self._apply(json.loads(raw))
+            except ValueError:
+                continue
+        self._journal_pos += end
+
+    def _apply(self, record: Dict):
+        key = (record['c'], record['k'])
+        if record.get('rm'):
+            self._entries.pop(key, None)
+            return
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = DirUsage(record['k'], record['c'])
+        entry.bytes += record.get('b', 0)
+        entry.files += record.get('n', 0)
+        entry.mtime = max(entry.mtime, record.get('m', 0.0))
+        oldest = record.get('o', record.get('m', 0.0))
+        if oldest and (not entry.oldest or oldest < entry.oldest):
+            entry.oldest = oldest
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def compact(self):
+        """Fold the journal into a new snapshot and truncate it."""
+        with self._lock:
+            with self._file_lock(exclusive=True):
+                self._load_snapshot()
+                self._replay_journal()
+                self._write_snapshot()
+
+    def reconcile(
+        self,
+        scan: Callable[[], Iterable[DirUsage]],
+        categories: Iterable[str]
+    ):
+        """
+        Replace all entries of some categories with a fresh scan.
+
+        The scan runs without holding the lock. Journal records appended
+        while it runs are replayed on top of the scan result; a file closed
+        during the scan may be counted twice, which over-estimates usage
+        (the safe direction for quotas) until the next reconcile.
+
+        Args:
+            scan: Callable returning DirUsage entries (paths may be absolute)
+            categories: Categories the scan is authoritative for
+        """
+        categories = set(categories)
+
+        with self._lock:
+            with self._file_lock(exclusive=False):
+                start_generation = self._read_snapshot_generation()
+                start_pos = self.journal_file.stat().st_size if self.journal_file.exists() else 0
+
+        started = time.time()
+        scanned = list(scan())
+
+        with self._lock:
+            with self._file_lock(exclusive=True):
+                self._load_snapshot()
+                # Snapshot + whole journal = current state for other categories
+                self._replay_journal()
+
+                for key in [k for k in self._entries if k[0] in categories]:
+                    del self._entries[key]
+                for entry in scanned:
+                    entry.path = self._relative(Path(entry.path))
+                    self._entries[(entry.category, entry.path)] = entry
+
+                # Re-apply our categories' journal records written during the scan
+                # (if the journal was compacted meanwhile, all of it is newer)
+                replay_from = start_pos if self._generation == start_generation else 0
+                if self.journal_file.exists():
+                    with open(self.journal_file, 'rb') as f:
+                        f.seek(replay_from)
+                        data = f.read()
+                    for raw in data.splitlines():
+                        try:
+                            record = json.loads(raw)
+                        except ValueError:
+                            continue
+                        if record.get('c') in categories:
+                            self._apply(record)
+
+                for category in categories:
+                    self._reconciled_at[category] = started
+                self._write_snapshot()
+
+        logger.info(
+            f"Size ledger reconciled {sorted(categories)}: {len(scanned)} directories "
+            f"in {time.time() - started:.1f}s"
+        )
+
+    def reconcile_in_background(
+        self,
+        scan: Callable[[], Iterable[DirUsage]],
+        categories: Iterable[str]
+    ) -> bool:
+        """
+        Start reconcile() on a daemon thread unless one is already running.
+
+        Returns:
+            True if a reconcile was started
+        """
+        if self._reconcile_thread is not None and self._reconcile_thread.is_alive():
+            return False
+
+        def _run():
+            try:
+                self.reconcile(scan, categories)
+            except Exception as e:
+                logger.error(f"Size ledger reconcile failed: {e}")
+
+        self._reconcile_thread = threading.Thread(
+            target=_run, name='SizeLedgerReconcile', daemon=True
+        )
+        self._reconcile_thread.start()
+        return True
+
+    def _write_snapshot(self):
+        """Write snapshot and truncate journal (caller holds exclusive lock)."""
+        self._generation = (self._generation or 0) + 1
+        data = {
+            'generation': self._generation,
+            'written_at': time.time(),
+            'reconciled_at': self._reconciled_at,
+            'entries': [
+                [e.category, e.path, e.bytes, e.files, e.mtime, e.oldest]
+                for e in self._entries.values()
+            ],
+        }
+        temp_file = self.snapshot_file.with_suffix('.tmp')
+        with open(temp_file, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        temp_file.replace(self.snapshot_file)
+
+        with open(self.journal_file, 'wb'):
+            pass
+        self._journal_pos = 0
+
+
+def scan_directory_usage(
+    directory: Path,
+    category: str,
+    pattern: str = '*'
+) -> DirUsage:
+    """
+    Walk one directory recursively and total matching files.
+
+    Used by reconcile scans; this is the expensive operation the ledger
+    exists to avoid on the quota-check path.
+    """
+    usage = DirUsage(path=str(directory), category=category)
+    try:
+        for item in Path(directory).rglob(pattern):
+            try:
+                st = item.stat()
+            except OSError:
+                continue
+            if item.is_file():
+                usage.bytes += st.st_size
+                usage.files += 1
+                usage.mtime = max(usage.mtime, st.st_mtime)
+                usage.oldest = min(usage.oldest or st.st_mtime, st.st_mtime)
+    except (PermissionError, OSError) as e:
+        logger.warning(f"Error scanning {directory}: {e}")
+    return usage
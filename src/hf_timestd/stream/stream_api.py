@@ -313,7 +313,7 @@ def subscribe_batch(
         preset: Demodulation mode (same for all)
         sample_rate: Sample rate (same for all)
         destination: Multicast destination (same for all)
-        **kwargs: Additional arguments passed to subscribe_stream
+        **kwargs: agc, gain, description (as for subscribe_stream)
         
     Returns:
         List of StreamHandles
@@ -329,17 +329,19 @@ def subscribe_batch(
             destination="239.1.2.101:5004"
         )
     """
-    handles = []
-    for freq in frequencies:
-        handle = subscribe_stream(
-            radiod=radiod,
+    requests = [
+        StreamRequest.create(
             frequency_hz=freq,
             preset=preset,
             sample_rate=sample_rate,
             destination=destination,
             **kwargs
         )
-        handles.append(handle)
+        for freq in frequencies
+    ]
+    
+    # One pass: adopt existing streams, create the rest together
+    handles = _get_manager(radiod).subscribe_batch(requests)
     
     logger.info(f"Subscribed to {len(handles)} streams")
     return handles
@@ -8,12 +8,12 @@ Handles SSRC allocation internally - applications never see SSRCs.
 
 import logging
 import threading
-import time
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass
 
-from ka9q import discover_channels, RadiodControl, ChannelInfo
+from ka9q import RadiodControl, ChannelInfo
 
+from ..radiod_directory import RadiodChannelDirectory, get_channel_directory
 from .stream_spec import StreamSpec, StreamRequest
 from .stream_handle import StreamHandle, StreamInfo
 
@@ -36,7 +36,7 @@ class StreamManager:
     Manages streams on a radiod instance.
     
     This class:
-    - Discovers existing streams
+    - Discovers existing streams (shared radiod channel directory)
     - Allocates SSRCs internally (apps don't see them)
     - Creates new streams when needed
     - Shares streams when specs match
@@ -65,7 +65,8 @@ class StreamManager:
         self,
         radiod_address: str,
         default_destination: Optional[str] = None,
-        auto_cleanup: bool = True
+        auto_cleanup: bool = True,
+        channel_directory: Optional[RadiodChannelDirectory] = None
     ):
         """
         Initialize stream manager.
@@ -74,6 +75,8 @@ class StreamManager:
             radiod_address: mDNS name or address of radiod status stream
             default_destination: Default multicast destination for new streams
             auto_cleanup: If True, remove streams when ref_count hits 0
+            channel_directory: Channel directory to query (default: the
+                shared one for radiod_address)
         """
         self.radiod_address = radiod_address
         self.default_destination = default_destination
@@ -88,6 +91,9 @@ class StreamManager:
         # Control connection (lazy init)
         self._control: Optional[RadiodControl] = None
         
+        # Shared, continuously updated view of radiod's channels
+        self._directory = channel_directory or get_channel_directory(radiod_address)
+        
         logger.info(f"StreamManager initialized for {radiod_address}")
     
     # === Public API ===
@@ -153,6 +159,82 @@ class StreamManager:
         """
         return self._subscribe(request)
     
+    def subscribe_batch(
+        self,
+        requests: List[StreamRequest],
+        timeout: float = 5.0
+    ) -> List[StreamHandle]:
+        """
+        Subscribe to several streams, creating all missing ones in one pass.
+        
+        Streams we already manage are shared and streams radiod already has
+        are adopted; the rest are created back to back and confirmed with a
+        single wait on the channel directory instead of one create/discover
+        round trip per stream.
+        
+        Args:
+            requests: StreamRequests, in the order handles are returned
+            timeout: Seconds to wait for radiod to report created channels
+        
+        Returns:
+            StreamHandles, one per request
+        
+        Raises:
+            RuntimeError: If any stream could not be created (handles
+                obtained by this call are released first)
+        """
+        handles: List[Optional[StreamHandle]] = [None] * len(requests)
+        to_create: List[int] = []
+        
+        for i, request in enumerate(requests):
+            with self._lock:
+                known = request.spec in self._streams
+            if known:
+                handles[i] = self._subscribe(request)
+                continue
+            if any(requests[j].spec == request.spec for j in to_create):
+                continue  # Duplicate of a stream created below
+            existing = self._find_existing_in_radiod(request.spec)
+            if existing:
+                handles[i] = self._adopt_existing(request.spec, existing, request)
+            else:
+                to_create.append(i)
+        
+        created: Dict[int, StreamHandle] = {}
+        failed: List[str] = []
+        if to_create:
+            ssrcs = {}
+            for i in to_create:
+                try:
+                    ssrcs[i] = self._send_create(requests[i])
+                except Exception as e:
+                    failed.append(f"{requests[i].spec}: {e}")
+            
+            found = self._directory.wait_for(ssrcs.values(), timeout=timeout)
+            for i, ssrc in ssrcs.items():
+                if ssrc in found:
+                    created[i] = self._register_created(requests[i].spec, ssrc, found[ssrc])
+                else:
+                    with self._lock:
+                        self._used_ssrcs.discard(ssrc)
+                    failed.append(f"{requests[i].spec}: SSRC {ssrc} not reported by radiod")
+            logger.info(f"Batch: created {len(created)}/{len(to_create)} streams")
+        
+        # Duplicates within the batch share the stream just created
+        for i, request in enumerate(requests):
+            if handles[i] is None and i in created:
+                handles[i] = created[i]
+            elif handles[i] is None and not failed:
+                handles[i] = self._subscribe(request)
+        
+        if failed:
+            for handle in handles:
+                if handle is not None:
+                    handle.release()
+            raise RuntimeError(f"Failed to create {len(failed)} stream(s): {'; '.join(failed)}")
+        
+        return handles
+    
     def discover(self) -> List[StreamInfo]:
         """
         Discover all existing streams on radiod.
@@ -161,7 +243,7 @@ class StreamManager:
             List of StreamInfo for each discovered stream
         """
         try:
-            channels = discover_channels(self.radiod_address)
+            channels = self._directory.channels()
             
             with self._lock:
                 # Update our knowledge of used SSRCs
@@ -266,9 +348,8 @@ class StreamManager:
     def _find_existing_in_radiod(self, spec: StreamSpec) -> Optional[ChannelInfo]:
         """Check radiod for an existing compatible stream."""
         try:
-            channels = discover_channels(self.radiod_address)
-            
-            for ssrc, info in channels.items():
+            for info in self._directory.find(spec.frequency_hz, spec.preset, spec.sample_rate):
+                ssrc = info.ssrc
                 existing_spec = StreamSpec(
                     frequency_hz=info.frequency,
                     preset=info.preset,
@@ -321,6 +402,20 @@ class StreamManager:
     def _create_new(self, request: StreamRequest) -> StreamHandle:
         """Create a new stream in radiod."""
         spec = request.spec
+        ssrc = self._send_create(request)
+        
+        # Wait for radiod to report the channel (its multicast info)
+        channel_info = self._directory.wait_for([ssrc], timeout=5.0).get(ssrc)
+        if channel_info is None:
+            with self._lock:
+                self._used_ssrcs.discard(ssrc)
+            raise RuntimeError(f"Failed to create stream: SSRC {ssrc} not found")
+        
+        return self._register_created(spec, ssrc, channel_info)
+    
+    def _send_create(self, request: StreamRequest) -> int:
+        """Allocate an SSRC and send the create command (does not wait)."""
+        spec = request.spec
         
         # Allocate SSRC
         ssrc = self._allocate_ssrc(spec)
@@ -342,41 +437,7 @@ class StreamManager:
                 gain=spec.gain,
                 destination=request.destination
             )
-            
-            # Wait for radiod to process
-            time.sleep(0.3)
-            
-            # Discover the created channel to get its multicast info
-            channels = discover_channels(self.radiod_address)
-            
-            if ssrc not in channels:
-                raise RuntimeError(f"Channel creation failed: SSRC {ssrc} not found")
-            
-            channel_info = channels[ssrc]
-            
-            with self._lock:
-                managed = ManagedStream(
-                    spec=spec,
-                    ssrc=ssrc,
-                    multicast_address=channel_info.multicast_address,
-                    port=channel_info.port,
-                    ref_count=1,
-                    created_by_us=True
-                )
-                
-                self._streams[spec] = managed
-                self._ssrc_to_spec[ssrc] = spec
-                
-                logger.info(f"Created stream: {spec} → {channel_info.multicast_address}:{channel_info.port}")
-                
-                return StreamHandle(
-                    spec=spec,
-                    multicast_address=channel_info.multicast_address,
-                    port=channel_info.port,
-                    _ssrc=ssrc,
-                    _manager=self,
-                    _ref_count=1
-                )
+            return ssrc
                 
         except Exception as e:
             # Release the SSRC on failure
@@ -384,6 +445,37 @@ class StreamManager:
                 self._used_ssrcs.discard(ssrc)
             raise RuntimeError(f"Failed to create stream: {e}") from e
     
+    def _register_created(
+        self,
+        spec: StreamSpec,
+        ssrc: int,
+        channel_info: ChannelInfo
+    ) -> StreamHandle:
+        """Record a stream we created once radiod reports it."""
+        with self._lock:
+            managed = ManagedStream(
+                spec=spec,
+                ssrc=ssrc,
+                multicast_address=channel_info.multicast_address,
+                port=channel_info.port,
+                ref_count=1,
+                created_by_us=True
+            )
+            
+            self._streams[spec] = managed
+            self._ssrc_to_spec[ssrc] = spec
+            
+            logger.info(f"Created stream: {spec} → {channel_info.multicast_address}:{channel_info.port}")
+            
+            return StreamHandle(
+                spec=spec,
+                multicast_address=channel_info.multicast_address,
+                port=channel_info.port,
+                _ssrc=ssrc,
+                _manager=self,
+                _ref_count=1
+            )
+    
     def _allocate_ssrc(self, spec: StreamSpec) -> int:
         """
         Allocate an SSRC for a new stream.
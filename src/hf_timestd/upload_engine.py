@@ -0,0 +1,735 @@
+"""
+Upload engine module
+
+Concurrent, resumable file-level transfer of datasets for UploadManager.
+
+A dataset (e.g. a daily OBS directory) is described by a checksummed
+manifest. Files are sent through a bounded pool of transfers, and each
+file that lands (and verifies) is written to an append-only journal, so
+an interrupted day resumes with the files that are still missing instead
+of re-sending the whole dataset.
+
+Transports:
+    LocalTransport  - copy into a local directory (NFS mount, tests)
+    SFTPTransport   - paramiko SFTP if installed, else the sftp command
+    RsyncTransport  - rsync over SSH, one file per invocation
+
+Journal records (JSON lines):
+    {"op": "enqueue", "id": ..., "task": {...}}
+    {"op": "attempt", "id": ..., "t": ...}
+    {"op": "file",    "id": ..., "f": relpath, "sha": ...}
+    {"op": "done",    "id": ..., "t": ...}
+    {"op": "error",   "id": ..., "err": ..., "status": ...}
+    {"op": "remove",  "id": ...}
+"""
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Optional imports
+try:
+    import paramiko
+    HAS_PARAMIKO = True
+except ImportError:
+    HAS_PARAMIKO = False
+
+logger = logging.getLogger(__name__)
+
+# Checksum read size
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# Rewrite the journal once it exceeds this many records
+JOURNAL_COMPACT_RECORDS = 10000
+
+
+# =============================================================================
+# Manifests
+# =============================================================================
+
+@dataclass
+class ManifestEntry:
+    """One file of a dataset"""
+    path: str      # Relative to the dataset directory (POSIX form)
+    size: int
+    mtime: float
+    sha256: str
+
+
+@dataclass
+class DatasetManifest:
+    """Checksummed file list of a dataset"""
+    dataset_path: str
+    files: List[ManifestEntry] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+    
+    @property
+    def total_bytes(self) -> int:
+        return sum(f.size for f in self.files)
+    
+    def to_dict(self) -> Dict:
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'DatasetManifest':
+        files = [ManifestEntry(**f) for f in data.get('files', [])]
+        return cls(data['dataset_path'], files, data.get('created_at', 0.0))
+    
+    def save(self, path: Path):
+        """Write manifest atomically"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = path.with_suffix('.tmp')
+        with open(temp_file, 'w') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+        temp_file.replace(path)
+    
+    @classmethod
+    def load(cls, path: Path) -> Optional['DatasetManifest']:
+        try:
+            with open(path) as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_manifest(
+    dataset_path: Path,
+    previous: Optional[DatasetManifest] = None
+) -> DatasetManifest:
+    """
+    Build a manifest of all (non-hidden) files under a dataset directory.
+    
+    Checksums from a previous manifest are reused for files whose size
+    and mtime are unchanged, so rebuilding after a restart is cheap.
+    
+    Args:
+        dataset_path: Dataset directory (e.g. OBS2025-10-27T00-00)
+        previous: Earlier manifest of the same dataset
+    
+    Returns:
+        DatasetManifest sorted by relative path
+    """
+    dataset_path = Path(dataset_path)
+    known = {f.path: f for f in previous.files} if previous else {}
+    
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(dataset_path):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        for name in sorted(filenames):
+            if name.startswith('.'):
+                continue
+            full = Path(dirpath) / name
+            st = full.stat()
+            rel = full.relative_to(dataset_path).as_posix()
+            
+            old = known.get(rel)
+            if old and old.size == st.st_size and old.mtime == st.st_mtime:
+                entries.append(old)
+            else:
+                entries.append(ManifestEntry(rel, st.st_size, st.st_mtime, file_sha256(full)))
+    
+    return DatasetManifest(str(dataset_path), entries)
+
+
+# =============================================================================
+# Journal
+# =============================================================================
+
+@dataclass
+class JournalTask:
+    """Replayed state of one queued dataset"""
+    task: Dict
+    files_done: Dict[str, str] = field(default_factory=dict)  # relpath -> sha256
+
+
+class UploadJournal:
+    """
+    Append-only upload queue journal.
+    
+    Each state change is one JSON line; the queue is rebuilt by replaying
+    the file. compact() rewrites it with only the live state. Values JSON
+    cannot hold (e.g. a datetime.date in task metadata) are written as str.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.records = 0
+    
+    def append(self, op: str, task_id: str, **fields):
+        """Append one record (flushed and fsynced)"""
+        record = {'op': op, 'id': task_id}
+        record.update(fields)
+        line = json.dumps(record, separators=(',', ':'), default=str) + '\n'
+        with self._lock:
+            with open(self.path, 'a') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self.records += 1
+    
+    def replay(self) -> Dict[str, JournalTask]:
+        """Rebuild queue state from the journal"""
+        tasks: Dict[str, JournalTask] = {}
+        self.records = 0
+        if not self.path.exists():
+            return tasks
+        
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Torn final line after a crash
+                self.records += 1
+                self._apply(tasks, record)
+        return tasks
+    
+    @staticmethod
+    def _apply(tasks: Dict[str, JournalTask], record: Dict):
+        op = record.get('op')
+        task_id = record.get('id')
+        
+        if op == 'enqueue':
+            tasks[task_id] = JournalTask(task=record['task'],
+                                         files_done=dict(record.get('files', {})))
+            return
+        
+        state = tasks.get(task_id)
+        if state is None:
+            return
+        task = state.task
+        
+        if op == 'attempt':
+            task['status'] = 'uploading'
+            task['attempts'] = task.get('attempts', 0) + 1
+            task['last_attempt'] = record.get('t')
+        elif op == 'file':
+            state.files_done[record['f']] = record.get('sha', '')
+        elif op == 'done':
+            task['status'] = 'completed'
+            task['completed_at'] = record.get('t')
+            task['error_message'] = None
+        elif op == 'error':
+            task['status'] = record.get('status', 'pending')
+            task['error_message'] = record.get('err')
+        elif op == 'remove':
+            del tasks[task_id]
+    
+    def compact(self, tasks: Dict[str, JournalTask]):
+        """Rewrite the journal as one enqueue record per live task"""
+        with self._lock:
+            temp_file = self.path.with_suffix('.tmp')
+            with open(temp_file, 'w') as f:
+                for task_id, state in tasks.items():
+                    record = {'op': 'enqueue', 'id': task_id, 'task': state.task}
+                    if state.files_done and state.task.get('status') != 'completed':
+                        record['files'] = state.files_done
+                    f.write(json.dumps(record, separators=(',', ':'), default=str) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            temp_file.replace(self.path)
+            self.records = len(tasks)
+
+
+# =============================================================================
+# Transports
+# =============================================================================
+
+class RateLimiter:
+    """Token bucket shared by all transfers (bytes per second)"""
+    
+    def __init__(self, bytes_per_sec: Optional[float]):
+        self.rate = bytes_per_sec if bytes_per_sec and bytes_per_sec > 0 else None
+        self._lock = threading.Lock()
+        self._allowance = 0.0
+        self._last = time.monotonic()
+    
+    def consume(self, nbytes: int):
+        """Block until nbytes may be sent"""
+        if self.rate is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(self.rate, self._allowance + (now - self._last) * self.rate)
+            self._last = now
+            self._allowance -= nbytes
+            wait = -self._allowance / self.rate if self._allowance < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+class UploadTransport(ABC):
+    """
+    File-level transfer backend used by UploadEngine.
+    
+    put() is called concurrently from pool threads; implementations keep
+    any per-connection state thread-local.
+    """
+    
+    @abstractmethod
+    def put(self, local_path: Path, remote_path: str):
+        """
+        Upload one file, replacing any partial copy.
+        
+        Raises:
+            OSError / RuntimeError on failure
+        """
+        pass
+    
+    @abstractmethod
+    def remote_size(self, remote_path: str) -> Optional[int]:
+        """Size of a remote file, None if it doesn't exist"""
+        pass
+    
+    @abstractmethod
+    def mkdir(self, remote_path: str):
+        """Create a remote directory (and parents); existing is not an error"""
+        pass
+    
+    def remote_sha256(self, remote_path: str) -> Optional[str]:
+        """Checksum of a remote file if the backend can compute it cheaply"""
+        return None
+    
+    def close(self):
+        """Release connections"""
+        pass
+
+
+class LocalTransport(UploadTransport):
+    """
+    Copy files into a local directory tree.
+    
+    Used for NFS/removable-media targets and as the loopback stand-in for
+    SFTP in tests (same put/rename/stat semantics, plus checksums).
+    """
+    
+    def __init__(self, root: Path, rate_limiter: Optional[RateLimiter] = None):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.rate_limiter = rate_limiter or RateLimiter(None)
+    
+    def _resolve(self, remote_path: str) -> Path:
+        return self.root / remote_path.lstrip('/')
+    
+    def put(self, local_path: Path, remote_path: str):
+        dest = self._resolve(remote_path)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        partial = dest.with_name(dest.name + '.part')
+        with open(local_path, 'rb') as src, open(partial, 'wb') as dst:
+            for chunk in iter(lambda: src.read(HASH_CHUNK_BYTES), b''):
+                self.rate_limiter.consume(len(chunk))
+                dst.write(chunk)
+        partial.replace(dest)
+    
+    def remote_size(self, remote_path: str) -> Optional[int]:
+        try:
+            return self._resolve(remote_path).stat().st_size
+        except OSError:
+            return None
+    
+    def mkdir(self, remote_path: str):
+        self._resolve(remote_path).mkdir(parents=True, exist_ok=True)
+    
+    def remote_sha256(self, remote_path: str) -> Optional[str]:
+        try:
+            return file_sha256(self._resolve(remote_path))
+        except OSError:
+            return None
+
+
+class SFTPTransport(UploadTransport):
+    """
+    Upload over SFTP.
+    
+    With paramiko installed each pool thread keeps its own SSH connection;
+    otherwise every operation runs the sftp command in batch mode. Files
+    are written as name.part and renamed when complete.
+    """
+    
+    def __init__(self, config: Dict, rate_limiter: Optional[RateLimiter] = None):
+        """
+        Args:
+            config: Upload configuration (host/psws_server_url, user, ssh.key_file,
+                    base_path, bandwidth_limit_kbps, max_concurrent_uploads)
+        """
+        self.host = config.get('psws_server_url', config['host'])
+        self.user = config['user']
+        self.ssh_key = config.get('ssh', {}).get('key_file')
+        self.base_path = config.get('base_path', '').rstrip('/')
+        self.timeout = config.get('timeout', 3600)
+        self.rate_limiter = rate_limiter or RateLimiter(None)
+        
+        # sftp -l applies per process; split the total across workers
+        kbps = config.get('bandwidth_limit_kbps')
+        workers = max(1, config.get('max_concurrent_uploads', 1))
+        self.per_process_kbps = max(1, int(kbps) // workers) if kbps else None
+        
+        self._local = threading.local()
+        self._clients: List = []
+        self._clients_lock = threading.Lock()
+    
+    def _full(self, remote_path: str) -> str:
+        return f"{self.base_path}/{remote_path}" if self.base_path else remote_path
+    
+    # --- paramiko -------------------------------------------------------------
+    
+    def _sftp(self):
+        client = getattr(self._local, 'sftp', None)
+        if client is None:
+            ssh = paramiko.SSHClient()
+            ssh.load_system_host_keys()
+            ssh.set_missing_host_key_policy(paramiko.RejectPolicy())
+            ssh.connect(self.host, username=self.user,
+                        key_filename=self.ssh_key or None, timeout=30)
+            client = ssh.open_sftp()
+            self._local.sftp = client
+            with self._clients_lock:
+                self._clients.append(ssh)
+        return client
+    
+    def _makedirs(self, sftp, path: str):
+        current = ''
+        for part in [p for p in path.split('/') if p]:
+            current = f"{current}/{part}" if current or path.startswith('/') else part
+            try:
+                sftp.stat(current)
+            except IOError:
+                try:
+                    sftp.mkdir(current)
+                except IOError:
+                    pass  # Created concurrently by another worker
+    
+    # --- sftp command ---------------------------------------------------------
+    
+    def _run_batch(self, commands: List[str], cwd: Optional[Path] = None):
+        cmd = ["sftp", "-b", "-"]
+        if self.ssh_key:
+            cmd.extend(["-i", str(self.ssh_key)])
+        if self.per_process_kbps:
+            cmd.extend(["-l", str(self.per_process_kbps)])
+        cmd.append(f"{self.user}@{self.host}")
+        result = subprocess.run(
+            cmd, input='\n'.join(commands) + '\nquit\n', cwd=cwd,
+            capture_output=True, text=True, timeout=self.timeout
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"sftp failed: {result.stderr.strip()}")
+        return result.stdout
+    
+    # --- UploadTransport ------------------------------------------------------
+    
+    def put(self, local_path: Path, remote_path: str):
+        full = self._full(remote_path)
+        parent = full.rsplit('/', 1)[0] if '/' in full else ''
+        partial = full + '.part'
+        
+        if HAS_PARAMIKO:
+            sftp = self._sftp()
+            if parent:
+                self._makedirs(sftp, parent)
+            sent = [0]
+            
+            def _throttle(done: int, total: int):
+                self.rate_limiter.consume(done - sent[0])
+                sent[0] = done
+            
+            sftp.put(str(local_path), partial, callback=_throttle)
+            sftp.posix_rename(partial, full)
+            return
+        
+        commands = []
+        if parent:
+            # '-' prefix: ignore "already exists"
+            path = ''
+            for part in [p for p in parent.split('/') if p]:
+                path = f"{path}/{part}" if path or parent.startswith('/') else part
+                commands.append(f'-mkdir "{path}"')
+        commands.append(f'put "{local_path}" "{partial}"')
+        commands.append(f'-rm "{full}"')
+        commands.append(f'rename "{partial}" "{full}"')
+        self._run_batch(commands)
+    
+    def remote_size(self, remote_path: str) -> Optional[int]:
+        full = self._full(remote_path)
+        if HAS_PARAMIKO:
+            try:
+                return self._sftp().stat(full).st_size
+            except IOError:
+                return None
+        try:
+            output = self._run_batch([f'ls -ln "{full}"'])
+        except RuntimeError:
+            return None
+        for line in output.splitlines():
+            parts = line.split()
+            if len(parts) >= 9 and not line.startswith('sftp>'):
+                try:
+                    return int(parts[4])
+                except ValueError:
+                    continue
+        return None
+    
+    def mkdir(self, remote_path: str):
+        full = self._full(remote_path)
+        if HAS_PARAMIKO:
+            self._makedirs(self._sftp(), full)
+        else:
+            self._run_batch([f'-mkdir "{full}"'])
+    
+    def close(self):
+        with self._clients_lock:
+            for ssh in self._clients:
+                try:
+                    ssh.close()
+                except Exception:
+                    pass
+            self._clients.clear()
+
+
+class RsyncTransport(UploadTransport):
+    """Upload single files with rsync over SSH (--partial keeps big files resumable)"""
+    
+    def __init__(self, config: Dict, rate_limiter: Optional[RateLimiter] = None):
+        self.host = config['host']
+        self.user = config['user']
+        self.base_path = config.get('base_path', '/data/uploads').rstrip('/')
+        self.ssh_key = config.get('ssh', {}).get('key_file')
+        self.timeout = config.get('timeout', 3600)
+        
+        # --bwlimit applies per process; split the total across workers
+        kbps = config.get('bandwidth_limit')
+        workers = max(1, config.get('max_concurrent_uploads', 1))
+        self.per_process_kbps = max(1, int(kbps) // workers) if kbps else None
+    
+    def _ssh_cmd(self) -> List[str]:
+        cmd = ["ssh"]
+        if self.ssh_key:
+            cmd.extend(["-i", self.ssh_key])
+        cmd.append(f"{self.user}@{self.host}")
+        return cmd
+    
+    def put(self, local_path: Path, remote_path: str):
+        full = f"{self.base_path}/{remote_path}"
+        cmd = ["rsync", "-t", "--partial", "--mkpath", "--timeout", str(self.timeout)]
+        if self.ssh_key:
+            cmd.extend(["-e", f"ssh -i {self.ssh_key}"])
+        if self.per_process_kbps:
+            cmd.extend(["--bwlimit", str(self.per_process_kbps)])
+        cmd.extend([str(local_path), f"{self.user}@{self.host}:{full}"])
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=self.timeout)
+        if result.returncode != 0:
+            raise RuntimeError(f"rsync failed: {result.stderr.strip()}")
+    
+    def remote_size(self, remote_path: str) -> Optional[int]:
+        full = f"{self.base_path}/{remote_path}"
+        result = subprocess.run(self._ssh_cmd() + ["stat", "-c", "%s", full],
+                                capture_output=True, text=True, timeout=30)
+        if result.returncode != 0:
+            return None
+        try:
+            return int(result.stdout.strip())
+        except ValueError:
+            return None
+    
+    def mkdir(self, remote_path: str):
+        full = f"{self.base_path}/{remote_path}"
+        subprocess.run(self._ssh_cmd() + ["mkdir", "-p", full],
+                       capture_output=True, timeout=30, check=True)
+
+
+# =============================================================================
+# Engine
+# =============================================================================
+
+@dataclass
+class DatasetJob:
+    """One dataset to send in an UploadEngine.run() pass"""
+    task_id: str
+    dataset_path: Path
+    remote_root: str
+    manifest: DatasetManifest
+    files_done: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class DatasetResult:
+    """Outcome of one dataset in an UploadEngine.run() pass"""
+    task_id: str
+    files_sent: int = 0
+    files_skipped: int = 0
+    bytes_sent: int = 0
+    errors: List[str] = field(default_factory=list)
+    
+    @property
+    def complete(self) -> bool:
+        return not self.errors
+
+
+class UploadEngine:
+    """
+    Send dataset files through a bounded pool of concurrent transfers.
+    
+    Files already recorded as done are skipped; every verified file is
+    reported through on_file_done (normally an UploadJournal append)
+    before the next one is counted, which is what makes resume safe.
+    """
+    
+    def __init__(self, transport: UploadTransport, max_workers: int = 4,
+                 verify_checksums: bool = True):
+        """
+        Args:
+            transport: File-level transfer backend
+            max_workers: Maximum concurrent file transfers
+            verify_checksums: Compare remote SHA-256 when the transport supports it
+        """
+        self.transport = transport
+        self.max_workers = max(1, max_workers)
+        self.verify_checksums = verify_checksums
+        
+        # Statistics
+        self._stats_lock = threading.Lock()
+        self.bytes_sent = 0
+        self.files_sent = 0
+        self.files_failed = 0
+        self.busy_seconds = 0.0
+        self.last_run_mbps = 0.0
+    
+    def _send_file(self, job: DatasetJob, entry: ManifestEntry) -> Tuple[str, str]:
+        """Upload and verify one file (runs on a pool thread)"""
+        local = job.dataset_path / entry.path
+        remote = f"{job.remote_root}/{entry.path}"
+        
+        st = local.stat()
+        sha = entry.sha256
+        if st.st_size != entry.size or st.st_mtime != entry.mtime:
+            # Changed since the manifest was built - checksum what we actually send
+            logger.warning(f"{local} changed since manifest was built; re-hashing")
+            sha = file_sha256(local)
+        
+        self.transport.put(local, remote)
+        
+        remote_size = self.transport.remote_size(remote)
+        if remote_size != st.st_size:
+            raise RuntimeError(f"size mismatch for {remote}: local {st.st_size}, remote {remote_size}")
+        if self.verify_checksums:
+            remote_sha = self.transport.remote_sha256(remote)
+            if remote_sha is not None and remote_sha != sha:
+                raise RuntimeError(f"checksum mismatch for {remote}")
+        
+        return sha, st.st_size
+    
+    def run(
+        self,
+        jobs: List[DatasetJob],
+        on_file_done: Optional[Callable[[str, str, str], None]] = None
+    ) -> Dict[str, DatasetResult]:
+        """
+        Send all missing files of all jobs, at most max_workers at a time.
+        
+        Args:
+            jobs: Datasets to send
+            on_file_done: Called as (task_id, relpath, sha256) after each verified file
+        
+        Returns:
+            Dict of task_id -> DatasetResult
+        """
+        results = {job.task_id: DatasetResult(job.task_id) for job in jobs}
+        started = time.monotonic()
+        run_bytes = 0
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix='upload') as pool:
+            futures = {}
+            for job in jobs:
+                for entry in job.manifest.files:
+                    if job.files_done.get(entry.path) == entry.sha256:
+                        results[job.task_id].files_skipped += 1
+                        continue
+                    future = pool.submit(self._send_file, job, entry)
+                    futures[future] = (job, entry)
+            
+            for future in as_completed(futures):
+                job, entry = futures[future]
+                result = results[job.task_id]
+                try:
+                    sha, size = future.result()
+                except Exception as e:
+                    result.errors.append(f"{entry.path}: {e}")
+                    with self._stats_lock:
+                        self.files_failed += 1
+                    logger.error(f"Upload failed: {job.dataset_path / entry.path}: {e}")
+                    continue
+                
+                job.files_done[entry.path] = sha
+                if on_file_done:
+                    on_file_done(job.task_id, entry.path, sha)
+                result.files_sent += 1
+                result.bytes_sent += size
+                run_bytes += size
+                with self._stats_lock:
+                    self.files_sent += 1
+                    self.bytes_sent += size
+        
+        elapsed = time.monotonic() - started
+        with self._stats_lock:
+            self.busy_seconds += elapsed
+            if run_bytes and elapsed > 0:
+                self.last_run_mbps = run_bytes * 8 / elapsed / 1e6
+        
+        if run_bytes:
+            logger.info(f"Upload pass: {run_bytes / 1024**2:.1f} MB in {elapsed:.1f}s "
+                        f"({self.last_run_mbps:.2f} Mbit/s, {self.max_workers} workers)")
+        return results
+    
+    def get_stats(self) -> Dict:
+        """Get transfer statistics"""
+        with self._stats_lock:
+            avg_mbps = self.bytes_sent * 8 / self.busy_seconds / 1e6 if self.busy_seconds else 0.0
+            return {
+                'bytes_sent': self.bytes_sent,
+                'files_sent': self.files_sent,
+                'files_failed': self.files_failed,
+                'throughput_mbps': round(avg_mbps, 3),
+                'last_run_mbps': round(self.last_run_mbps, 3),
+                'max_workers': self.max_workers,
+            }
+
+
+def create_transport(config: Dict) -> UploadTransport:
+    """
+    Create transport for an upload configuration.
+    
+    Protocols: 'sftp' (default), 'ssh_rsync', 'local' (config['local_root'])
+    """
+    protocol = config.get('protocol', 'sftp')
+    kbps = config.get('bandwidth_limit_kbps')
+    limiter = RateLimiter(kbps * 1000 / 8 if kbps else None)
+    
+    if protocol == 'sftp':
+        return SFTPTransport(config, limiter)
+    elif protocol == 'ssh_rsync':
+        return RsyncTransport(config, limiter)
+    elif protocol == 'local':
+        return LocalTransport(Path(config['local_root']), limiter)
+    else:
+        raise ValueError(f"Unknown upload protocol: {protocol}")
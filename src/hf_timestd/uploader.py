@@ -2,8 +2,13 @@
 Upload manager module
 
 Handles reliable upload of processed datasets to remote repositories.
+
+UploadManager sends datasets file-by-file through upload_engine.UploadEngine
+(bounded concurrent transfers, checksummed manifests, per-file resume) and
+keeps its queue in an append-only journal next to the configured queue file.
 """
 
+import hashlib
 import subprocess
 import logging
 import time
@@ -15,6 +20,17 @@ from dataclasses import dataclass, asdict
 from datetime import datetime, timezone, timedelta
 import json
 
+from .upload_engine import (
+    DatasetJob,
+    DatasetManifest,
+    JournalTask,
+    UploadEngine,
+    UploadJournal,
+    JOURNAL_COMPACT_RECORDS,
+    build_manifest,
+    create_transport,
+)
+
 # Optional imports
 try:
     import digital_rf as drf
@@ -77,6 +93,7 @@ def load_upload_config_from_toml(toml_config: Dict, path_resolver=None) -> Dict:
                                                  proto_config.get('bandwidth_limit', 100)),
         'max_retries': uploader.get('max_retries', 5),
         'retry_backoff_base': 2 if uploader.get('exponential_backoff', True) else 1,
+        'max_concurrent_uploads': uploader.get('max_concurrent_uploads', 4),
         'queue_file': queue_file
     }
     
@@ -95,10 +112,13 @@ class UploadTask:
     created_at: str = None
     completed_at: Optional[str] = None
     error_message: Optional[str] = None
+    task_id: Optional[str] = None
     
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now(timezone.utc).isoformat()
+        if self.task_id is None:
+            self.task_id = hashlib.sha1(self.dataset_path.encode()).hexdigest()[:16]
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
@@ -110,6 +130,18 @@ class UploadTask:
         return cls(**data)
 
 
+def psws_trigger_directory(dataset_name: str, instrument_id: str) -> str:
+    """
+    Trigger directory name that tells PSWS a dataset is complete (wsprdaemon format).
+    
+    Args:
+        dataset_name: OBS directory name (e.g. OBS2025-10-27T00-00)
+        instrument_id: PSWS instrument ID
+    """
+    timestamp = datetime.now(timezone.utc).strftime('%Y-%m%dT%H-%M')
+    return f"c{dataset_name}_#{instrument_id}_#{timestamp}"
+
+
 class UploadProtocol(ABC):
     """Base class for upload protocols"""
     
@@ -303,8 +335,7 @@ class SFTPUpload(UploadProtocol):
         instrument_id = metadata.get('instrument_id', '172')
         
         # Create trigger directory name (wsprdaemon format)
-        timestamp = datetime.now(timezone.utc).strftime('%Y-%m%dT%H-%M')
-        trigger_dir = f"c{dataset_name}_#{instrument_id}_#{timestamp}"
+        trigger_dir = psws_trigger_directory(dataset_name, instrument_id)
         
         logger.info(f"Trigger directory: {trigger_dir}")
         
@@ -384,7 +415,14 @@ class SFTPUpload(UploadProtocol):
 
 
 class UploadManager:
-    """Manages upload queue and retry logic"""
+    """
+    Manages upload queue and retry logic
+    
+    Queue state lives in an append-only journal (queue_file with a
+    .journal suffix). Each dataset gets a checksummed manifest, and
+    process_queue() sends the files still missing from every eligible
+    dataset through one bounded pool of concurrent transfers.
+    """
     
     def __init__(self, config: Dict, storage_manager):
         """
@@ -396,26 +434,25 @@ class UploadManager:
         """
         self.config = config
         self.storage_manager = storage_manager
-        self.protocol = self._create_protocol()
         self.max_retries = config.get('max_retries', 5)
         self.retry_backoff_base = config.get('retry_backoff_base', 2)
+        self.deep_validate = config.get('deep_validate', False)
+        self.create_trigger = config.get('create_trigger', config.get('protocol', 'sftp') == 'sftp')
         self.queue_file = Path(config.get('queue_file', '/var/lib/signal-recorder/upload_queue.json'))
+        self.journal = UploadJournal(self.queue_file.with_suffix('.journal'))
+        self.manifest_dir = self.queue_file.parent / 'manifests'
         self.queue: List[UploadTask] = []
+        self._files_done: Dict[str, Dict[str, str]] = {}  # task_id -> {relpath: sha256}
+        
+        self.engine = UploadEngine(
+            create_transport(config),
+            max_workers=config.get('max_concurrent_uploads', 4),
+            verify_checksums=config.get('verify_checksums', True)
+        )
         
         # Load queue from disk
         self._load_queue()
     
-    def _create_protocol(self) -> UploadProtocol:
-        """Create upload protocol instance"""
-        protocol_type = self.config.get('protocol', 'sftp')  # Default to SFTP for PSWS
-        
-        if protocol_type == 'ssh_rsync':
-            return SSHRsyncUpload(self.config)
-        elif protocol_type == 'sftp':
-            return SFTPUpload(self.config)
-        else:
-            raise ValueError(f"Unknown upload protocol: {protocol_type}")
-    
     def _should_upload_date(self, date: datetime.date) -> bool:
         """
         Check if date is ready for upload (wsprdaemon-compatible).
@@ -423,7 +460,7 @@ class UploadManager:
         
         Args:
             date: Date to check
-            
+        
         Returns:
             True if date is ready for upload
         """
@@ -437,7 +474,7 @@ class UploadManager:
         
         Args:
             dataset_path: Path to dataset directory
-            
+        
         Returns:
             True if already uploaded
         """
@@ -461,12 +498,13 @@ class UploadManager:
     
     def _validate_digital_rf(self, dataset_path: Path) -> bool:
         """
-        Validate Digital RF dataset before upload.
-        Checks if dataset is readable and has valid structure.
+        Validate Digital RF dataset by opening every channel with DigitalRFReader.
+        
+        Expensive for a full day; only used when config['deep_validate'] is set.
         
         Args:
             dataset_path: Path to dataset directory
-            
+        
         Returns:
             True if valid
         """
@@ -476,7 +514,7 @@ class UploadManager:
         
         try:
             # Find channel directories
-            channels = [d for d in dataset_path.iterdir() 
+            channels = [d for d in dataset_path.iterdir()
                        if d.is_dir() and not d.name.startswith('.')]
             
             if not channels:
@@ -497,41 +535,111 @@ class UploadManager:
                     
                     sample_count = bounds[1] - bounds[0]
                     logger.info(f"Channel {channel_dir.name}: {sample_count} samples valid")
-                    
+                
                 except Exception as e:
                     logger.error(f"Channel {channel_dir.name}: Validation failed - {e}")
                     return False
             
             logger.info(f"✅ Digital RF validation passed for {dataset_path}")
             return True
-            
+        
         except Exception as e:
             logger.error(f"Digital RF validation error: {e}")
             return False
     
+    def _validate_manifest(self, manifest: DatasetManifest) -> bool:
+        """
+        Cheap structural check of a Digital RF dataset from its manifest.
+        
+        Every channel directory must have drf_properties.h5 and at least
+        one rf@*.h5 data file.
+        
+        Args:
+            manifest: Dataset manifest
+        
+        Returns:
+            True if valid
+        """
+        channels: Dict[str, set] = {}
+        for entry in manifest.files:
+            parts = entry.path.split('/')
+            if len(parts) < 2:
+                continue
+            names = channels.setdefault(parts[0], set())
+            if parts[-1] == 'drf_properties.h5':
+                names.add('properties')
+            elif parts[-1].startswith('rf@') and parts[-1].endswith('.h5') and entry.size > 0:
+                names.add('data')
+        
+        if not channels:
+            logger.error(f"No channels found in {manifest.dataset_path}")
+            return False
+        
+        valid = True
+        for channel, found in channels.items():
+            if channel == 'metadata' or channel.endswith('metadata'):
+                continue
+            if found != {'properties', 'data'}:
+                logger.error(f"Channel {channel}: missing {sorted({'properties', 'data'} - found)}")
+                valid = False
+        return valid
+    
+    def _manifest_path(self, task: UploadTask) -> Path:
+        return self.manifest_dir / f"{task.task_id}.json"
+    
+    def _load_manifest(self, task: UploadTask) -> DatasetManifest:
+        """Load a task's manifest, rebuilding it if missing or stale"""
+        path = self._manifest_path(task)
+        previous = DatasetManifest.load(path)
+        manifest = build_manifest(Path(task.dataset_path), previous)
+        if previous is None or previous.files != manifest.files:
+            manifest.save(path)
+        return manifest
+    
     def _load_queue(self):
-        """Load upload queue from disk"""
-        if self.queue_file.exists():
-            try:
-                with open(self.queue_file, 'r') as f:
-                    data = json.load(f)
-                self.queue = [UploadTask.from_dict(item) for item in data]
-                logger.info(f"Loaded {len(self.queue)} tasks from queue")
-            except Exception as e:
-                logger.error(f"Error loading queue: {e}")
-                self.queue = []
-        else:
-            self.queue = []
+        """Load upload queue by replaying the journal"""
+        if not self.journal.path.exists() and self.queue_file.exists():
+            self._migrate_json_queue()
+        
+        try:
+            replayed = self.journal.replay()
+        except Exception as e:
+            logger.error(f"Error loading queue journal: {e}")
+            replayed = {}
+        
+        self.queue = []
+        self._files_done = {}
+        for task_id, state in replayed.items():
+            task = UploadTask.from_dict(state.task)
+            if task.status == "uploading":
+                # Interrupted mid-transfer; completed files are in files_done
+                task.status = "pending"
+            self.queue.append(task)
+            self._files_done[task_id] = state.files_done
+        
+        if self.queue:
+            resumable = sum(1 for files in self._files_done.values() if files)
+            logger.info(f"Loaded {len(self.queue)} tasks from queue journal "
+                        f"({resumable} partially uploaded)")
     
-    def _save_queue(self):
-        """Save upload queue to disk"""
+    def _migrate_json_queue(self):
+        """Convert a queue file written by older versions into journal records"""
         try:
-            self.queue_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.queue_file, 'w') as f:
-                data = [task.to_dict() for task in self.queue]
-                json.dump(data, f, indent=2)
+            with open(self.queue_file, 'r') as f:
+                data = json.load(f)
+            for item in data:
+                task = UploadTask.from_dict(item)
+                self.journal.append('enqueue', task.task_id, task=task.to_dict())
+            logger.info(f"Migrated {len(data)} tasks from {self.queue_file} to journal")
         except Exception as e:
-            logger.error(f"Error saving queue: {e}")
+            logger.error(f"Error migrating queue: {e}")
+    
+    def _compact_journal(self):
+        """Rewrite the journal with only live queue state"""
+        self.journal.compact({
+            task.task_id: JournalTask(task.to_dict(), self._files_done.get(task.task_id, {}))
+            for task in self.queue
+        })
     
     def enqueue(self, dataset_path: Path, metadata: Dict):
         """
@@ -540,7 +648,7 @@ class UploadManager:
         Performs validation before enqueuing:
         1. Check date is from previous day or earlier
         2. Check if already uploaded (.upload_complete marker)
-        3. Validate Digital RF structure
+        3. Build checksummed manifest and check Digital RF structure
         
         Args:
             dataset_path: Path to dataset (OBS directory)
@@ -576,130 +684,190 @@ class UploadManager:
             logger.info(f"Skipping {dataset_path}: already uploaded (.upload_complete marker exists)")
             return
         
-        # Check 3: Validate Digital RF
-        if not self._validate_digital_rf(dataset_path):
-            logger.error(f"Skipping {dataset_path}: Digital RF validation failed")
-            return
-        
         # Construct remote path (SFTP uploads to home dir, so just use dataset name)
         remote_path = dataset_path.name  # e.g., OBS2025-10-27T00-00
         
-        # Create task
+        # Create task: the caller's metadata is kept as given (the storage
+        # manager is called back with its own 'date'); the parsed date for
+        # the journal and backlog goes under a key of its own
         task = UploadTask(
             dataset_path=str(dataset_path),
             remote_path=remote_path,
-            metadata=metadata
+            metadata={**metadata, 'upload_date': str(date)}
         )
         
         # Check if already in queue
         for existing in self.queue:
-            if existing.dataset_path == task.dataset_path:
+            if existing.task_id == task.task_id:
                 logger.warning(f"Dataset already in queue: {dataset_path}")
                 return
         
+        # Check 3: Manifest + structure (full DigitalRFReader pass only if configured)
+        try:
+            manifest = build_manifest(dataset_path)
+        except OSError as e:
+            logger.error(f"Skipping {dataset_path}: cannot build manifest - {e}")
+            return
+        if not self._validate_manifest(manifest):
+            logger.error(f"Skipping {dataset_path}: Digital RF structure check failed")
+            return
+        if self.deep_validate and not self._validate_digital_rf(dataset_path):
+            logger.error(f"Skipping {dataset_path}: Digital RF validation failed")
+            return
+        manifest.save(self._manifest_path(task))
+        
         self.queue.append(task)
-        self._save_queue()
+        self._files_done[task.task_id] = {}
+        self.journal.append('enqueue', task.task_id, task=task.to_dict())
         
         logger.info(f"✅ Enqueued upload: {dataset_path}")
         logger.info(f"   Date: {date}")
         logger.info(f"   Remote: {remote_path}")
+        logger.info(f"   Files: {len(manifest.files)} ({manifest.total_bytes / 1024**2:.1f} MB)")
+    
+    def _ready_for_attempt(self, task: UploadTask) -> bool:
+        """Check retry limit and exponential backoff"""
+        if task.attempts >= self.max_retries:
+            logger.error(f"Max retries exceeded for {task.dataset_path}")
+            task.status = "failed"
+            self.journal.append('error', task.task_id, err=task.error_message, status='failed')
+            return False
+        
+        # Exponential backoff
+        if task.last_attempt:
+            last_attempt_time = datetime.fromisoformat(task.last_attempt)
+            wait_time = self.retry_backoff_base ** task.attempts * 60  # minutes
+            elapsed = (datetime.now(timezone.utc) - last_attempt_time).total_seconds()
+            
+            if elapsed < wait_time:
+                logger.debug(f"Waiting {wait_time - elapsed:.0f}s before retry for {task.dataset_path}")
+                return False
+        
+        return True
     
     def process_queue(self):
-        """Process upload queue with retry logic"""
+        """Upload all eligible tasks concurrently, resuming partial datasets"""
         if not self.queue:
             logger.debug("Upload queue is empty")
             return
         
         logger.info(f"Processing upload queue ({len(self.queue)} tasks)")
         
-        for task in self.queue[:]:  # Iterate over copy
-            if task.status == "completed":
+        jobs = []
+        tasks_by_id = {}
+        for task in self.queue:
+            if task.status in ("completed", "failed"):
                 continue
-            
-            # Check if we should retry
-            if task.attempts >= self.max_retries:
-                logger.error(f"Max retries exceeded for {task.dataset_path}")
-                task.status = "failed"
-                self._save_queue()
+            if not self._ready_for_attempt(task):
                 continue
             
-            # Exponential backoff
-            if task.last_attempt:
-                last_attempt_time = datetime.fromisoformat(task.last_attempt)
-                wait_time = self.retry_backoff_base ** task.attempts * 60  # minutes
-                elapsed = (datetime.now(timezone.utc) - last_attempt_time).total_seconds()
-                
-                if elapsed < wait_time:
-                    logger.debug(f"Waiting {wait_time - elapsed:.0f}s before retry for {task.dataset_path}")
-                    continue
-            
-            # Attempt upload
-            self._attempt_upload(task)
-            self._save_queue()
-    
-    def _attempt_upload(self, task: UploadTask):
-        """
-        Attempt to upload a task
-        
-        Args:
-            task: UploadTask to upload
-        """
-        task.status = "uploading"
-        task.attempts += 1
-        task.last_attempt = datetime.now(timezone.utc).isoformat()
-        
-        logger.info(f"Upload attempt {task.attempts}/{self.max_retries}: {task.dataset_path}")
-        
-        try:
             dataset_path = Path(task.dataset_path)
-            
             if not dataset_path.exists():
                 logger.error(f"Dataset not found: {dataset_path}")
                 task.status = "failed"
                 task.error_message = "Dataset not found"
-                return
+                self.journal.append('error', task.task_id, err=task.error_message, status='failed')
+                continue
             
-            # Perform upload
-            success = self.protocol.upload(dataset_path, task.remote_path, task.metadata)
+            task.status = "uploading"
+            task.attempts += 1
+            task.last_attempt = datetime.now(timezone.utc).isoformat()
+            self.journal.append('attempt', task.task_id, t=task.last_attempt)
             
-            if success:
-                # Verify upload
-                if self.protocol.verify(task.remote_path):
-                    logger.info(f"✅ Upload verified: {task.dataset_path}")
-                    task.status = "completed"
-                    task.completed_at = datetime.now(timezone.utc).isoformat()
-                    
-                    # Create .upload_complete marker (wsprdaemon-compatible)
-                    self._mark_upload_complete(dataset_path)
-                    
-                    # Mark in storage manager (if available)
-                    if hasattr(self.storage_manager, 'mark_upload_complete'):
-                        if 'date' in task.metadata and 'band' in task.metadata:
-                            self.storage_manager.mark_upload_complete(
-                                task.metadata['date'],
-                                task.metadata['band']
-                            )
-                else:
-                    logger.warning(f"Upload verification failed: {task.dataset_path}")
-                    task.status = "pending"
-                    task.error_message = "Verification failed"
-            else:
-                logger.error(f"Upload failed: {task.dataset_path}")
-                task.status = "pending"
-                task.error_message = "Upload failed"
+            manifest = self._load_manifest(task)
+            files_done = self._files_done.setdefault(task.task_id, {})
+            logger.info(f"Upload attempt {task.attempts}/{self.max_retries}: {task.dataset_path} "
+                        f"({len(files_done)}/{len(manifest.files)} files already sent)")
             
-            # Mark upload attempt in storage manager (if available)
-            if hasattr(self.storage_manager, 'mark_upload_attempted'):
-                if 'date' in task.metadata and 'band' in task.metadata:
-                    self.storage_manager.mark_upload_attempted(
-                        task.metadata['date'],
-                        task.metadata['band']
-                    )
+            jobs.append(DatasetJob(task.task_id, dataset_path, task.remote_path,
+                                   manifest, files_done))
+            tasks_by_id[task.task_id] = task
         
-        except Exception as e:
-            logger.error(f"Upload error: {e}", exc_info=True)
+        if not jobs:
+            return
+        
+        def _file_done(task_id: str, relpath: str, sha: str):
+            self.journal.append('file', task_id, f=relpath, sha=sha)
+        
+        results = self.engine.run(jobs, on_file_done=_file_done)
+        
+        for task_id, result in results.items():
+            self._finish_task(tasks_by_id[task_id], result)
+        
+        if self.journal.records > JOURNAL_COMPACT_RECORDS:
+            self._compact_journal()
+    
+    def _finish_task(self, task: UploadTask, result):
+        """
+        Finalize a task after an engine pass
+        
+        Args:
+            task: UploadTask that was sent
+            result: DatasetResult from the engine
+        """
+        dataset_path = Path(task.dataset_path)
+        
+        if not result.complete:
             task.status = "pending"
-            task.error_message = str(e)
+            task.error_message = f"{len(result.errors)} files failed: {result.errors[0]}"
+            self.journal.append('error', task.task_id, err=task.error_message, status='pending')
+            logger.error(f"Upload incomplete: {task.dataset_path} "
+                         f"({result.files_sent} sent, {len(result.errors)} failed)")
+        else:
+            try:
+                # Signal PSWS that the dataset is complete
+                if self.create_trigger:
+                    instrument_id = task.metadata.get('instrument_id', '172')
+                    self.engine.transport.mkdir(
+                        psws_trigger_directory(dataset_path.name, instrument_id)
+                    )
+                
+                logger.info(f"✅ Upload verified: {task.dataset_path} "
+                            f"({result.files_sent} sent, {result.files_skipped} resumed)")
+                task.status = "completed"
+                task.completed_at = datetime.now(timezone.utc).isoformat()
+                task.error_message = None
+                self.journal.append('done', task.task_id, t=task.completed_at)
+                self._files_done.pop(task.task_id, None)
+                
+                # Create .upload_complete marker (wsprdaemon-compatible)
+                self._mark_upload_complete(dataset_path)
+                
+                # Mark in storage manager (if available)
+                if hasattr(self.storage_manager, 'mark_upload_complete'):
+                    if 'date' in task.metadata and 'band' in task.metadata:
+                        self.storage_manager.mark_upload_complete(
+                            task.metadata['date'],
+                            task.metadata['band']
+                        )
+            except Exception as e:
+                logger.error(f"Upload finalization error: {e}", exc_info=True)
+                task.status = "pending"
+                task.error_message = str(e)
+                self.journal.append('error', task.task_id, err=task.error_message, status='pending')
+        
+        # Mark upload attempt in storage manager (if available)
+        if hasattr(self.storage_manager, 'mark_upload_attempted'):
+            if 'date' in task.metadata and 'band' in task.metadata:
+                self.storage_manager.mark_upload_attempted(
+                    task.metadata['date'],
+                    task.metadata['band']
+                )
+    
+    @staticmethod
+    def _task_date(task: UploadTask) -> Optional[str]:
+        """Dataset date (YYYY-MM-DD); tasks journaled before upload_date carry only 'date'"""
+        date = task.metadata.get('upload_date') or task.metadata.get('date')
+        return str(date) if date else None
+    
+    def get_backlog_days(self) -> int:
+        """Number of distinct dates still waiting to be uploaded"""
+        dates = {
+            self._task_date(task)
+            for task in self.queue
+            if task.status in ("pending", "uploading")
+        }
+        return len([d for d in dates if d])
     
     def get_status(self) -> Dict:
         """Get upload queue status"""
@@ -714,6 +882,15 @@ class UploadManager:
         for task in self.queue:
             status[task.status] += 1
         
+        pending_dates = sorted(
+            self._task_date(task) for task in self.queue
+            if task.status in ("pending", "uploading") and self._task_date(task)
+        )
+        status['backlog_days'] = self.get_backlog_days()
+        status['oldest_pending_date'] = pending_dates[0] if pending_dates else None
+        status['partial_tasks'] = sum(1 for files in self._files_done.values() if files)
+        status.update(self.engine.get_stats())
+        
         return status
     
     def clear_completed(self):
@@ -724,5 +901,8 @@ class UploadManager:
         
         if removed > 0:
             logger.info(f"Removed {removed} completed tasks from queue")
-            self._save_queue()
-
+            self._compact_journal()
+    
+    def close(self):
+        """Release transport connections"""
+        self.engine.transport.close()
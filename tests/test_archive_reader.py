@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Tests for the archive reader's pooled minute buffers under read-ahead.
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.archive_reader import ArchiveReader, _BufferPool
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+SAMPLE_RATE = 100
+SAMPLES_PER_MINUTE = SAMPLE_RATE * 60
+MINUTE0 = 1768435200  # 2026-01-15 00:00 UTC
+CHANNEL = 'WWV 10 MHz'
+
+
+def minute_samples(index: int) -> np.ndarray:
+    """Distinct content per minute: real part counts samples, imaginary is the index."""
+    return (np.arange(SAMPLES_PER_MINUTE) + 1j * index).astype(np.complex64)
+
+
+class TestBufferPool(unittest.TestCase):
+
+    def test_buffer_reused_only_after_last_view_dropped(self):
+        pool = _BufferPool(10, max_buffers=2)
+        first = pool.acquire()
+        view = first[2:5]
+        del first
+        self.assertEqual(pool.in_use(), 1)
+        
+        # A slice keeps the whole buffer busy
+        second = pool.acquire()
+        self.assertFalse(np.shares_memory(second, view))
+        self.assertEqual(pool.in_use(), 2)
+        
+        del view
+        self.assertEqual(pool.in_use(), 1)
+        third = pool.acquire()
+        self.assertIs(third, pool._buffers[0])
+        self.assertEqual(pool.allocations, 0)
+    
+    def test_exhausted_pool_allocates(self):
+        pool = _BufferPool(10, max_buffers=1)
+        held = pool.acquire()
+        extra = pool.acquire()
+        self.assertFalse(np.shares_memory(held, extra))
+        self.assertEqual(len(pool._buffers), 1)
+        self.assertEqual(pool.allocations, 1)
+        
+        # Buffers allocated outside the pool are never handed out again
+        del extra
+        self.assertEqual(pool.in_use(), 1)
+        del held
+        self.assertEqual(pool.in_use(), 0)
+
+
+@unittest.skipUnless(ZSTD_AVAILABLE, "zstandard not installed")
+class TestPrefetchBuffers(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.day_dir = Path(self._tmp.name) / '20260115'
+        self.day_dir.mkdir()
+        for index in range(10):
+            self.write_minute(index)
+        self.reader = self.make_reader(prefetch_minutes=2)
+    
+    def tearDown(self):
+        self.reader.close()
+        self._tmp.cleanup()
+    
+    def make_reader(self, **kwargs) -> ArchiveReader:
+        reader = ArchiveReader(sample_rate=SAMPLE_RATE, source='raw_buffer', **kwargs)
+        reader.register_channel(CHANNEL, binary_dir=Path(self._tmp.name))
+        return reader
+    
+    def write_minute(self, index: int, sidecar: bool = True):
+        minute = MINUTE0 + 60 * index
+        compressed = zstandard.ZstdCompressor().compress(minute_samples(index).tobytes())
+        (self.day_dir / f"{minute}.bin.zst").write_bytes(compressed)
+        if sidecar:
+            self.write_sidecar(index)
+    
+    def write_sidecar(self, index: int):
+        minute = MINUTE0 + 60 * index
+        (self.day_dir / f"{minute}.json").write_text(
+            json.dumps({'start_rtp_timestamp': minute * SAMPLE_RATE + 7})
+        )
+    
+    def wait_for_prefetch(self, reader: ArchiveReader):
+        with reader._lock:
+            pending = list(reader._pending.values())
+        for future in pending:
+            future.result()
+    
+    def get(self, index: int, reader: ArchiveReader = None):
+        reader = reader or self.reader
+        data = reader.get_minute(CHANNEL, MINUTE0 + 60 * index)
+        self.wait_for_prefetch(reader)
+        return data
+    
+    def test_sequential_reads_recycle_buffers(self):
+        for index in range(10):
+            data = self.get(index)
+            np.testing.assert_array_equal(data.samples, minute_samples(index))
+            self.assertEqual(data.rtp_timestamp, (MINUTE0 + 60 * index) * SAMPLE_RATE + 7)
+            self.assertEqual(data.source, 'zstd')
+            self.assertFalse(data.samples.flags.writeable)
+            del data
+        
+        stats = self.reader.get_stats()
+        self.assertEqual(stats['prefetch_hits'], 9)
+        self.assertEqual(stats['pool_allocations'], 0)
+        # The minute being analysed plus the two read ahead
+        self.assertLessEqual(len(self.reader._pool._buffers), 3)
+        # Nothing left after the last minute: prefetches of 10 and 11 found no file
+        self.assertEqual(stats['pool_buffers_in_use'], 0)
+    
+    def test_held_minutes_are_never_overwritten(self):
+        held = []
+        for index in range(10):
+            held.append(self.get(index))
+        
+        # Pool of prefetch + 3 = 5 buffers: the rest were allocated
+        stats = self.reader.get_stats()
+        self.assertEqual(len(self.reader._pool._buffers), 5)
+        self.assertEqual(stats['pool_buffers_in_use'], 5)
+        self.assertEqual(stats['pool_allocations'], 5)
+        for index, data in enumerate(held):
+            np.testing.assert_array_equal(data.samples, minute_samples(index))
+        
+        # Dropping the minutes frees the pool for the next pass
+        held.clear()
+        self.assertEqual(self.reader.get_stats()['pool_buffers_in_use'], 0)
+        for index in range(10):
+            np.testing.assert_array_equal(self.get(index).samples, minute_samples(index))
+        self.assertEqual(self.reader.get_stats()['pool_allocations'], 5)
+    
+    def test_slices_keep_buffer_busy(self):
+        data = self.get(0)
+        tail = data.samples[-100:]
+        del data
+        self.assertEqual(self.reader.get_stats()['pool_buffers_in_use'], 3)
+        
+        for index in range(1, 10):
+            self.get(index)
+        np.testing.assert_array_equal(tail, minute_samples(0)[-100:])
+        del tail
+        self.assertEqual(self.reader.get_stats()['pool_buffers_in_use'], 0)
+    
+    def test_skipped_prefetches_release_buffers(self):
+        self.get(0)
+        self.assertEqual(self.reader.get_stats()['pool_buffers_in_use'], 2)
+        
+        # Jumping ahead drops the read-ahead of minutes 1 and 2
+        data = self.get(5)
+        with self.reader._lock:
+            pending = sorted(minute for _, minute in self.reader._pending)
+        self.assertEqual(pending, [MINUTE0 + 360, MINUTE0 + 420])
+        self.assertEqual(self.reader.get_stats()['pool_buffers_in_use'], 3)
+        
+        del data
+        self.reader.close()
+        self.assertEqual(self.reader.get_stats()['pool_buffers_in_use'], 0)
+    
+    def test_minute_without_sidecar_is_not_prefetched(self):
+        self.write_minute(10, sidecar=False)
+        self.get(9)
+        stats = self.reader.get_stats()
+        self.assertEqual(stats['pool_buffers_in_use'], 0)
+        
+        # Once the writer has finished the sidecar the minute reads normally
+        self.write_sidecar(10)
+        data = self.get(10)
+        np.testing.assert_array_equal(data.samples, minute_samples(10))
+        self.assertEqual(self.reader.get_stats()['prefetch_hits'], stats['prefetch_hits'])
+    
+    def test_short_minute_is_padded_from_pool(self):
+        samples = minute_samples(3)[:int(SAMPLES_PER_MINUTE * 0.95)]
+        (self.day_dir / f"{MINUTE0 + 180}.bin.zst").write_bytes(
+            zstandard.ZstdCompressor().compress(samples.tobytes())
+        )
+        reader = self.make_reader(prefetch_minutes=0)
+        try:
+            data = self.get(3, reader)
+            self.assertEqual(len(data.samples), SAMPLES_PER_MINUTE)
+            np.testing.assert_array_equal(data.samples[:len(samples)], samples)
+            self.assertFalse(data.samples[len(samples):].any())
+            # Only the padded copy stays busy; the decompressed one is free again
+            self.assertEqual(reader.get_stats()['pool_buffers_in_use'], 1)
+            self.assertEqual(reader.get_stats()['pool_allocations'], 0)
+        finally:
+            reader.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
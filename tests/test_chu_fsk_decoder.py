@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Synthetic-frame regression tests for the CHU FSK decoder.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.chu_fsk_decoder import (
+    BIT_DURATION_MS, BITS_PER_FRAME, CHUFSKDecoder, DATA_END_MS, DATA_START_MS,
+    FSK_SECONDS, MARK_FREQ, SPACE_FREQ
+)
+
+SAMPLE_RATE = 20000
+DAY, HOUR, MINUTE = 45, 12, 34
+YEAR, DUT1, TAI_UTC = 2026, -2, 37
+
+
+def frame_bytes(second: int) -> list:
+    """The 10 bytes CHU sends in a second: 5 data bytes, then 5 redundant."""
+    if second == 31:
+        digits = [1 if DUT1 < 0 else 0, abs(DUT1)] + [int(c) for c in f"{YEAR:04d}{TAI_UTC:02d}00"]
+    else:
+        digits = [6] + [int(c) for c in f"{DAY:03d}{HOUR:02d}{MINUTE:02d}{second:02d}"]
+    # Low nibble is sent first
+    data = [digits[2 * k] | (digits[2 * k + 1] << 4) for k in range(5)]
+    # Frame B repeats its bytes inverted
+    return data + ([~b & 0xFF for b in data] if second == 31 else data)
+
+
+def frame_bits(second: int) -> np.ndarray:
+    """1 start (space) + 8 data bits LSB first + 2 stop (mark) per byte."""
+    bits = []
+    for byte in frame_bytes(second):
+        bits += [0] + [(byte >> i) & 1 for i in range(8)] + [1, 1]
+    return np.array(bits)
+
+
+def fsk_second(second: int, continuous_phase: bool, rng) -> np.ndarray:
+    """Audio of one FSK second: tick, mark sync, then the data bits."""
+    t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+    ms = t * 1000
+    bit = np.clip(((ms - DATA_START_MS) // BIT_DURATION_MS).astype(int), 0, BITS_PER_FRAME - 1)
+    data = (ms >= DATA_START_MS) & (ms < DATA_END_MS)
+    freq = np.where(data & (frame_bits(second)[bit] == 0), SPACE_FREQ, MARK_FREQ)
+    
+    if continuous_phase:
+        phase = 2 * np.pi * np.cumsum(freq) / SAMPLE_RATE
+    else:
+        # Every bit starts at a random tone phase
+        phase = 2 * np.pi * freq * t + np.where(data, rng.uniform(0, 2 * np.pi, BITS_PER_FRAME)[bit], 0)
+    
+    audio = np.where((ms >= 10) & (ms < DATA_END_MS), np.sin(phase), 0.0)
+    tick = ms < 10
+    audio[tick] = np.sin(2 * np.pi * 1000 * t[tick])
+    return audio
+
+
+def chu_minute(continuous_phase: bool = True, noise: float = 0.0, seed: int = 0) -> np.ndarray:
+    """AM-modulated IQ for a whole minute with FSK in seconds 31-39."""
+    rng = np.random.default_rng(seed)
+    audio = np.zeros(60 * SAMPLE_RATE)
+    for second in FSK_SECONDS:
+        audio[second * SAMPLE_RATE:(second + 1) * SAMPLE_RATE] = fsk_second(second, continuous_phase, rng)
+    iq = 1.0 + 0.5 * audio
+    iq = iq + noise * (rng.normal(size=len(iq)) + 1j * rng.normal(size=len(iq)))
+    return iq.astype(np.complex64)
+
+
+class TestCHUFSKSyntheticFrames(unittest.TestCase):
+
+    def setUp(self):
+        self.decoder = CHUFSKDecoder(SAMPLE_RATE)
+    
+    def assertFullMinute(self, result):
+        self.assertEqual(result.frames_decoded, 9)
+        self.assertTrue(result.detected)
+        self.assertEqual(
+            (result.decoded_day, result.decoded_hour, result.decoded_minute), (DAY, HOUR, MINUTE)
+        )
+        self.assertEqual(result.year, YEAR)
+        self.assertEqual(result.dut1_seconds, DUT1 / 10)
+        self.assertEqual(result.tai_utc, TAI_UTC)
+    
+    def test_continuous_phase_frame(self):
+        result = self.decoder.decode_minute(chu_minute(continuous_phase=True), 0.0)
+        self.assertFullMinute(result)
+        # The last stop bit ends on the 500ms mark
+        self.assertLess(abs(result.timing_offset_ms), 1.0)
+    
+    def test_phase_discontinuous_frame(self):
+        result = self.decoder.decode_minute(chu_minute(continuous_phase=False), 0.0)
+        self.assertFullMinute(result)
+    
+    def test_noisy_frames(self):
+        for continuous_phase in (True, False):
+            with self.subTest(continuous_phase=continuous_phase):
+                result = self.decoder.decode_minute(
+                    chu_minute(continuous_phase, noise=0.2, seed=1), 0.0
+                )
+                self.assertFullMinute(result)
+    
+    def test_single_second(self):
+        # The analysis segment reaches into the neighbouring seconds
+        audio = np.concatenate([np.zeros(SAMPLE_RATE), fsk_second(35, True, None), np.zeros(SAMPLE_RATE)])
+        frame, timing_offset_ms, confidence = self.decoder.decode_second(audio, SAMPLE_RATE, 35)
+        self.assertIsNotNone(frame)
+        self.assertEqual((frame.day_of_year, frame.hour, frame.minute, frame.second),
+                         (DAY, HOUR, MINUTE, 35))
+        self.assertGreater(confidence, 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-memory bound on the ClockOffsetEngine series.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.clock_offset_series import ClockOffsetEngine
+
+
+def phase2_result(minute: int):
+    """Minimal Phase 2 result for one minute."""
+    return SimpleNamespace(
+        system_time=float(minute), utc_time=float(minute), minute_boundary_utc=float(minute),
+        rtp_timestamp=minute * 1_200_000, uncertainty_ms=0.5,
+        processed_at=None, processing_version='test',
+        solution=SimpleNamespace(
+            d_clock_ms=1.0, station='WWV', frequency_mhz=10.0, t_propagation_ms=8.0,
+            propagation_mode='1F', n_hops=1, confidence=0.9, uncertainty_ms=0.5,
+            utc_verified=True, dual_station_verified=False
+        ),
+        channel=SimpleNamespace(
+            delay_spread_ms=0.5, doppler_wwv_std_hz=0.1, doppler_wwvh_std_hz=None,
+            station_confidence='high'
+        ),
+        time_snap=SimpleNamespace(wwv_snr_db=20.0, wwvh_snr_db=None, chu_snr_db=None)
+    )
+
+
+class TestSeriesBound(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def run_minutes(self, n: int, **kwargs) -> ClockOffsetEngine:
+        engine = ClockOffsetEngine(
+            raw_archive_dir=self.root / 'raw_archive',
+            output_dir=self.root / 'clock_offset',
+            channel_name='WWV 10 MHz',
+            frequency_hz=10e6,
+            receiver_grid='EM38ww',
+            **kwargs
+        )
+        engine.phase2_engine = MagicMock()
+        engine.phase2_engine.process_minute.side_effect = [phase2_result(60 * k) for k in range(n)]
+        for k in range(n):
+            self.assertIsNotNone(engine.process_minute(None, 60.0 * k, 0))
+        return engine
+    
+    def test_live_series_is_bounded(self):
+        engine = self.run_minutes(12, max_series_measurements=5)
+        series = engine.get_current_series()
+        self.assertEqual(len(series.measurements), 5)
+        self.assertEqual(series.start_time, 60.0 * 7)
+        self.assertEqual(engine.measurements_processed, 12)
+    
+    def test_unbounded_series_keeps_everything(self):
+        """Reprocessing saves the whole in-memory series at the end."""
+        engine = self.run_minutes(12, max_series_measurements=None)
+        series = engine.get_current_series()
+        self.assertEqual(len(series.measurements), 12)
+        self.assertEqual(series.start_time, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental DRF packager and the decimated buffer metadata cache.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core import decimated_buffer
+from hf_timestd.core.decimated_buffer import DecimatedBuffer, SAMPLES_PER_MINUTE
+from hf_timestd.core.daily_drf_packager import DRF_AVAILABLE, StationConfig
+
+if DRF_AVAILABLE:
+    import digital_rf as drf
+    from hf_timestd.core.daily_drf_packager import IncrementalDRFPackager
+
+DAY = '20260115'
+DAY_START = datetime(2026, 1, 15, tzinfo=timezone.utc).timestamp()
+CHANNELS = [('WWV 5 MHz', 5e6), ('WWV 10 MHz', 10e6)]
+
+
+def minute_iq(minute: int, channel_index: int) -> np.ndarray:
+    """Constant, recognisable samples for one channel-minute."""
+    return np.full(SAMPLES_PER_MINUTE, minute + 1j * (channel_index + 1), dtype=np.complex64)
+
+
+@unittest.skipUnless(DRF_AVAILABLE, "digital_rf not installed")
+class TestLateMinuteRewrite(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.buffers = [DecimatedBuffer(self.root, name) for name, _ in CHANNELS]
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def write(self, channel_index: int, minute: int):
+        self.buffers[channel_index].write_minute(
+            DAY_START + minute * 60, minute_iq(minute, channel_index)
+        )
+    
+    def test_late_minute_rewrites_only_its_hour(self):
+        for minute in range(180):
+            self.write(0, minute)
+            if minute != 70:
+                self.write(1, minute)
+        
+        packager = IncrementalDRFPackager(
+            self.root, StationConfig('AC0G', 'EM38ww'), channels=CHANNELS
+        )
+        packager.start_day(DAY, now=DAY_START + 180 * 60 + 60)
+        self.assertEqual(packager.get_stats()['next_minute'], 180)
+        
+        # Backdate the closed hour files so a rewrite shows up in st_mtime
+        for hour in (0, 1):
+            os.utime(packager._hour_file(hour), (DAY_START, DAY_START))
+        
+        # Minute 70 arrives for the second channel after its slot was written
+        self.write(1, 70)
+        output = packager.finalize_day()
+        self.assertIsNotNone(output)
+        
+        self.assertEqual(packager._hour_file(0).stat().st_mtime, DAY_START)
+        self.assertGreater(packager._hour_file(1).stat().st_mtime, DAY_START)
+        
+        stats = packager.get_stats()
+        self.assertEqual(stats['minutes_written'], 180)
+        self.assertEqual(stats['gap_minutes'], 1440 - 180)
+        self.assertEqual(stats['late_channel_minutes'], 0)
+        
+        reader = drf.DigitalRFReader(str(packager._output_dir.parent))
+        start_index = int(DAY_START * 10)
+        for minute in (0, 69, 70, 71, 150):
+            data = reader.read_vector(start_index + minute * SAMPLES_PER_MINUTE, SAMPLES_PER_MINUTE, 'ch0')
+            self.assertEqual(data.shape, (SAMPLES_PER_MINUTE, 2))
+            np.testing.assert_array_equal(data[:, 0], minute_iq(minute, 0))
+            np.testing.assert_array_equal(data[:, 1], minute_iq(minute, 1))
+
+
+class TestMetadataCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def test_read_minute_parses_metadata_once(self):
+        writer = DecimatedBuffer(self.root, 'WWV 10 MHz')
+        for minute in range(5):
+            writer.write_minute(DAY_START + minute * 60, minute_iq(minute, 0), d_clock_ms=minute)
+        
+        reader = DecimatedBuffer(self.root, 'WWV 10 MHz')
+        with patch.object(decimated_buffer.json, 'load', wraps=json.load) as load:
+            for _ in range(3):
+                for minute in range(5):
+                    iq, meta = reader.read_minute(DAY_START + minute * 60)
+                    np.testing.assert_array_equal(iq, minute_iq(minute, 0))
+                    self.assertEqual(meta['d_clock_ms'], minute)
+            self.assertEqual(reader.get_valid_minutes(DAY), set(range(5)))
+        self.assertEqual(load.call_count, 1)
+    
+    def test_cache_sees_other_writers(self):
+        writer = DecimatedBuffer(self.root, 'WWV 10 MHz')
+        reader = DecimatedBuffer(self.root, 'WWV 10 MHz')
+        writer.write_minute(DAY_START, minute_iq(0, 0))
+        self.assertEqual(reader.get_valid_minutes(DAY), {0})
+        
+        writer.write_minute(DAY_START + 60, minute_iq(1, 0))
+        self.assertEqual(reader.get_valid_minutes(DAY), {0, 1})
+        _, meta = reader.read_minute(DAY_START + 60)
+        self.assertTrue(meta['valid'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming decimated NPZ minutes into the multi-subchannel DRF
+batch writer: slice order, incomplete and missing minutes, sample indices.
+"""
+
+import random
+import sys
+import tempfile
+import unittest
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.drf_batch_writer import DRF_AVAILABLE, ChannelConfig, DRFBatchWriter
+
+if DRF_AVAILABLE:
+    import digital_rf as drf
+
+MINUTE0 = 1768435200  # 2026-01-15 00:00 UTC
+SAMPLES_PER_MINUTE = 600  # 10 Hz
+STATION = {
+    'callsign': 'AC0G',
+    'grid_square': 'EM38ww',
+    'receiver_name': 'T1',
+    'psws_station_id': 'S000001',
+    'psws_instrument_id': '1',
+}
+
+
+def minute_iq(channel_index: int, minute_index: int) -> np.ndarray:
+    """Distinct, float32-exact IQ per channel and minute."""
+    return (minute_index * 1000 + np.arange(SAMPLES_PER_MINUTE)
+            + 1j * (channel_index + 1)).astype(np.complex64)
+
+
+class TestStreamedDRFDataset(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.channels = [
+            ChannelConfig(name, freq, root / name.replace(' ', '_'), root / 'unused.json')
+            for name, freq in (('WWV 10 MHz', 10e6), ('WWV 5 MHz', 5e6))
+        ]
+        self.writer = DRFBatchWriter(self.channels, root / 'upload', STATION)
+        
+        # Minutes 0, 1, 3 and 4 in every channel; minute 2 only in 10 MHz,
+        # minute 5 in neither
+        self.files_by_channel = {}
+        for channel in self.channels:
+            channel.decimated_dir.mkdir()
+            index = self.writer.channels.index(channel)  # Subchannel (by frequency)
+            minutes = [0, 1, 2, 3, 4] if channel.frequency_hz == 10e6 else [0, 1, 3, 4]
+            files = [self.write_minute(channel, index, m) for m in minutes]
+            # Listed out of order: the loader must not rely on it
+            random.Random(index).shuffle(files)
+            self.files_by_channel[channel.name] = files
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def write_minute(self, channel: ChannelConfig, channel_index: int, minute_index: int) -> Path:
+        minute = MINUTE0 + 60 * minute_index
+        stamp = datetime.fromtimestamp(minute, timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        path = channel.decimated_dir / f"{stamp}_{int(channel.frequency_hz)}_iq_10hz.npz"
+        np.savez(
+            path,
+            iq=minute_iq(channel_index, minute_index),
+            rtp_timestamp=minute * 20000,
+            # The recorder's file time jitters by a few tens of ms
+            created_timestamp=minute + 0.04 * (minute_index % 2),
+        )
+        return path
+    
+    def test_slices_in_time_order_complete_minutes_only(self):
+        slices = list(self.writer.iter_aligned_time_slices(self.files_by_channel, prefetch=2))
+        
+        self.assertEqual([int(ts.timestamp) - MINUTE0 for ts in slices], [0, 60, 180, 240])
+        for ts, minute_index in zip(slices, (0, 1, 3, 4)):
+            self.assertEqual(ts.rtp_timestamp, (MINUTE0 + 60 * minute_index) * 20000)
+            self.assertEqual(ts.samples_per_channel, SAMPLES_PER_MINUTE)
+            for index, channel in enumerate(self.writer.channels):
+                np.testing.assert_array_equal(ts.channel_data[channel.name], minute_iq(index, minute_index))
+    
+    @unittest.skipUnless(DRF_AVAILABLE, "digital_rf not installed")
+    def test_samples_land_at_their_minute_index(self):
+        slices = self.writer.iter_aligned_time_slices(self.files_by_channel, prefetch=2)
+        drf_base = self.writer.write_drf_dataset(date(2026, 1, 15), slices)
+        self.assertIsNotNone(drf_base)
+        
+        reader = drf.DigitalRFReader(str(drf_base))
+        start, _ = reader.get_bounds('ch0')
+        self.assertEqual(start, MINUTE0 * 10)
+        properties = reader.get_properties('ch0')
+        self.assertEqual(properties['num_subchannels'], 2)
+        
+        for minute_index in (0, 1, 3, 4):
+            for index in range(2):
+                with self.subTest(minute=minute_index, subchannel=index):
+                    data = reader.read_vector(
+                        start + minute_index * SAMPLES_PER_MINUTE, SAMPLES_PER_MINUTE, 'ch0', index
+                    )
+                    np.testing.assert_array_equal(data, minute_iq(index, minute_index))
+        
+        # The minute missing from one channel is a gap, not shifted data
+        gap = reader.read_vector(start + 2 * SAMPLES_PER_MINUTE, SAMPLES_PER_MINUTE, 'ch0', 0)
+        self.assertTrue(np.isnan(gap.real).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the fake radiod load generator.
+"""
+
+import socket
+import struct
+import sys
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.fake_radiod import (
+    FakeRadiod, FakeRadiodConfig, PAYLOAD_TYPE_FLOAT, synthesize_station_minute
+)
+
+
+class TestFakeRadiod(unittest.TestCase):
+
+    def receive(self, config: FakeRadiodConfig, seconds: float):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(('127.0.0.1', 0))
+        sock.settimeout(0.5)
+        config.port = sock.getsockname()[1]
+        config.unicast = True
+        
+        radiod = FakeRadiod(config)
+        radiod.start()
+        packets = []
+        deadline = time.time() + seconds
+        while time.time() < deadline:
+            packets.append(sock.recv(65536))
+        stats = radiod.stop()
+        try:
+            while True:
+                packets.append(sock.recv(65536))
+        except socket.timeout:
+            pass
+        sock.close()
+        return radiod, packets, stats
+    
+    def test_packets_are_radiod_float_iq(self):
+        radiod, packets, stats = self.receive(FakeRadiodConfig(channels=3), 0.5)
+        self.assertEqual(len(packets), stats['sent'])
+        self.assertEqual(stats['lost'], 0)
+        
+        by_ssrc = {}
+        for packet in packets:
+            first, pt, seq, ts, ssrc = struct.unpack('!BBHII', packet[:12])
+            self.assertEqual((first, pt), (0x80, PAYLOAD_TYPE_FLOAT))
+            self.assertEqual(len(packet) - 12, 400 * 8)  # 20 ms of float32 I/Q
+            by_ssrc.setdefault(ssrc, []).append((seq, ts, packet[12:]))
+        self.assertEqual(sorted(by_ssrc), [ch.ssrc for ch in radiod.channels])
+        
+        # RTP clock is the wall clock in samples; the payload is the station
+        # minute at that offset
+        minute = synthesize_station_minute('WWV', seed=radiod.config.seed)
+        now = round(time.time() * 20000)
+        for seq, ts, payload in by_ssrc[radiod.channels[0].ssrc]:
+            abs_sample = ts + round((now - ts) / 2 ** 32) * 2 ** 32
+            offset = abs_sample % (60 * 20000)
+            np.testing.assert_array_equal(np.frombuffer(payload, dtype=np.complex64),
+                                          minute[offset:offset + 400])
+        seqs = [seq for seq, _, _ in by_ssrc[radiod.channels[0].ssrc]]
+        self.assertEqual(seqs, list(range(seqs[0], seqs[0] + len(seqs))))
+    
+    def test_loss_and_reorder_are_injected(self):
+        radiod, packets, stats = self.receive(FakeRadiodConfig(channels=2, loss=0.1, reorder=0.1), 2.0)
+        self.assertEqual(len(packets), stats['sent'])
+        self.assertGreater(stats['lost'], 0)
+        self.assertGreater(stats['reordered'], 0)
+        
+        seqs = {}
+        for packet in packets:
+            _, _, seq, _, ssrc = struct.unpack('!BBHII', packet[:12])
+            seqs.setdefault(ssrc, []).append(seq)
+        out_of_order = sum(1 for s in seqs.values() for a, b in zip(s, s[1:]) if b < a)
+        self.assertGreater(out_of_order, 0)
+        self.assertLessEqual(out_of_order, stats['reordered'])
+        self.assertEqual((stats['sent'] + stats['lost']) % 2, 0)  # Every block, every channel
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests for minute-complete triggered fusion (Phase 2 -> fusion -> Chrony SHM).
+
+Simulated channel producers append a clock_offset row and notify the
+way Phase2AnalyticsService does; the fusion service must update SHM as
+soon as the last active channel reports, or after late_sec without it.
+"""
+
+import csv
+import random
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.minute_notify import FusionTrigger, MinuteNotifier
+from hf_timestd.core.multi_broadcast_fusion import FusionService, MultiBroadcastFusion
+from hf_timestd.core.stage_timing import get_stage_timing
+
+CHANNELS = {
+    'WWV_10_MHz': ('WWV', 10.0),
+    'WWV_15_MHz': ('WWV', 15.0),
+    'CHU_7.85_MHz': ('CHU', 7.85),
+}
+CSV_FIELDS = ['system_time', 'clock_offset_ms', 'station', 'frequency_mhz',
+              'propagation_delay_ms', 'propagation_mode', 'confidence', 'snr_db', 'quality_grade']
+
+
+class RecordingSHM:
+    """Chrony SHM stand-in: records when updates happen."""
+    
+    def __init__(self):
+        self.updates = []
+    
+    def update(self, reference_time, system_time, precision):
+        self.updates.append(time.time())
+        return True
+
+
+def producer(data_root: Path, channel: str, minute: int, delay: float):
+    """One Phase 2 channel finishing `minute` after `delay` seconds."""
+    time.sleep(delay)
+    station, freq = CHANNELS[channel]
+    csv_path = data_root / 'phase2' / channel / 'clock_offset' / 'clock_offset_series.csv'
+    with open(csv_path, 'a', newline='') as f:
+        csv.writer(f).writerow([minute, random.gauss(0.0, 0.2), station, freq,
+                                5.0, '1F', 0.9, 20.0, 'A'])
+    notifier = MinuteNotifier(data_root)
+    notifier.notify(channel, minute)
+    notifier.close()
+
+
+class TestFusionTrigger(unittest.TestCase):
+
+    def test_complete_deadline_and_fallback(self):
+        trigger = FusionTrigger(['a', 'b'], late_sec=10.0, fallback_sec=60.0)
+        t0 = time.time()
+        trigger.report('a', 600, now=t0)
+        self.assertIsNone(trigger.due(now=t0 + 1))
+        trigger.report('b', 600, now=t0 + 2)
+        self.assertEqual(trigger.due(now=t0 + 2), (600, 'complete'))
+        
+        # b late for the next minute: deadline after late_sec
+        trigger.report('a', 660, now=t0 + 60)
+        self.assertIsNone(trigger.due(now=t0 + 69))
+        self.assertEqual(trigger.next_deadline(), t0 + 70)
+        self.assertEqual(trigger.due(now=t0 + 70), (660, 'deadline'))
+        trigger.report('b', 660, now=t0 + 75)  # Already fused
+        self.assertEqual(trigger.late_reports, 1)
+        
+        # No reports at all: plain interval
+        self.assertEqual(trigger.due(now=t0 + 70 + 60), (None, 'fallback'))
+    
+    def test_silent_channel_expires(self):
+        t0 = time.time()
+        trigger = FusionTrigger(['a', 'dead'], late_sec=10.0, channel_ttl_minutes=3)
+        trigger.report('a', 600, now=t0 + 200)
+        self.assertEqual(trigger.due(now=t0 + 200), (600, 'complete'))
+
+
+class TestFusionService(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.data_root = Path(self._tmp.name)
+        for channel in CHANNELS:
+            csv_path = self.data_root / 'phase2' / channel / 'clock_offset' / 'clock_offset_series.csv'
+            csv_path.parent.mkdir(parents=True)
+            with open(csv_path, 'w', newline='') as f:
+                csv.writer(f).writerow(CSV_FIELDS)
+        get_stage_timing().reset()
+        
+        self.shm = RecordingSHM()
+        self.service = FusionService(MultiBroadcastFusion(self.data_root), self.shm,
+                                     interval_sec=3600.0, late_sec=0.5)
+        self.thread = threading.Thread(target=self.service.run, daemon=True)
+        self.thread.start()
+        self.minute = int(time.time() // 60) * 60 - 60  # Last complete minute
+    
+    def tearDown(self):
+        self.service.stop()
+        self.thread.join(timeout=2)
+        self.assertFalse(self.thread.is_alive())
+        self._tmp.cleanup()
+    
+    def run_producers(self, delays):
+        threads = [threading.Thread(target=producer, args=(self.data_root, ch, self.minute, d))
+                   for ch, d in delays.items()]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return time.time()
+    
+    def test_shm_updated_when_last_channel_reports(self):
+        last_report = self.run_producers({'WWV_10_MHz': 0.05, 'WWV_15_MHz': 0.1, 'CHU_7.85_MHz': 0.2})
+        time.sleep(0.2)
+        
+        self.assertEqual(len(self.shm.updates), 1)
+        self.assertLess(self.shm.updates[0] - last_report, 0.2)  # Not late_sec, not interval_sec
+        self.assertEqual(self.service.trigger.fired_complete, 1)
+        self.assertEqual(self.service.last_result.n_broadcasts, 3)
+        
+        snap = get_stage_timing().snapshot()
+        self.assertEqual(snap['stages']['minute_to_shm']['']['count'], 1)
+        self.assertTrue((self.data_root / 'status' / 'fusion-status.json').exists())
+    
+    def test_late_channel_falls_back_to_deadline(self):
+        first_report = time.time()
+        self.run_producers({'WWV_10_MHz': 0.0, 'WWV_15_MHz': 0.05})  # CHU silent
+        self.assertEqual(self.shm.updates, [])
+        time.sleep(0.7)
+        
+        self.assertEqual(len(self.shm.updates), 1)
+        self.assertGreaterEqual(self.shm.updates[0] - first_report, 0.5)
+        self.assertEqual(self.service.trigger.fired_deadline, 1)
+        self.assertEqual(self.service.last_result.n_broadcasts, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for correlation envelope sharing and cross-channel stacking.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core import global_station_voter
+from hf_timestd.core.global_station_voter import (
+    CorrelationEnvelope, FileBackend, GlobalStationVoter
+)
+
+SAMPLE_RATE = 20000
+MINUTE_RTP = 1000 * 60 * SAMPLE_RATE
+CHANNELS = ['WWV 5 MHz', 'WWV 10 MHz', 'WWV 15 MHz']
+
+
+def peak_envelope(n_bins: int, peak_bin: int, height: float = 5.0) -> np.ndarray:
+    """Noise-free envelope in sigma units with a single triangular peak."""
+    envelope = np.zeros(n_bins)
+    envelope[peak_bin - 1:peak_bin + 2] = [height / 2, height, height / 2]
+    return envelope
+
+
+class TestFileBackendEnvelopes(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.backend = FileBackend(Path(self._tmp.name))
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def test_npz_round_trip(self):
+        original = CorrelationEnvelope(
+            channel='WWV 10 MHz', station='WWV',
+            envelope=np.linspace(0.0, 3.0, 7),
+            start_offset_ms=-500.0, bin_ms=0.25,
+            predicted_delay_ms=8.5, reported_at=1234.5
+        )
+        self.backend.save_correlation(MINUTE_RTP, original)
+        
+        minute_dir = Path(self._tmp.name) / str(MINUTE_RTP)
+        self.assertEqual([p.name for p in minute_dir.iterdir()], ['corr_WWV_WWV_10_MHz.npz'])
+        # The envelope is stored without pickled objects
+        with np.load(minute_dir / 'corr_WWV_WWV_10_MHz.npz', allow_pickle=False) as data:
+            self.assertEqual(data['envelope'].dtype, np.float32)
+        
+        (loaded,) = self.backend.get_correlations(MINUTE_RTP, 'WWV')
+        self.assertEqual(loaded.channel, 'WWV 10 MHz')
+        self.assertEqual(loaded.station, 'WWV')
+        np.testing.assert_allclose(loaded.envelope, original.envelope, rtol=1e-6)
+        self.assertEqual(
+            (loaded.start_offset_ms, loaded.bin_ms, loaded.predicted_delay_ms, loaded.reported_at),
+            (-500.0, 0.25, 8.5, 1234.5)
+        )
+        self.assertEqual(self.backend.get_correlations(MINUTE_RTP, 'WWVH'), [])
+    
+    def test_corrupt_file_is_skipped(self):
+        self.backend.save_correlation(MINUTE_RTP, CorrelationEnvelope(
+            channel='WWV 5 MHz', station='WWV', envelope=np.ones(4),
+            start_offset_ms=0.0, bin_ms=1.0
+        ))
+        (Path(self._tmp.name) / str(MINUTE_RTP) / 'corr_WWV_WWV_10_MHz.npz').write_bytes(b'partial')
+        
+        envelopes = self.backend.get_correlations(MINUTE_RTP, 'WWV')
+        self.assertEqual([env.channel for env in envelopes], ['WWV 5 MHz'])
+    
+    def test_prune_removes_old_minutes(self):
+        for minute in range(3):
+            self.backend.save_correlation(MINUTE_RTP + minute, CorrelationEnvelope(
+                channel='WWV 5 MHz', station='WWV', envelope=np.ones(4),
+                start_offset_ms=0.0, bin_ms=1.0
+            ))
+        self.backend.prune(MINUTE_RTP + 2)
+        remaining = sorted(p.name for p in Path(self._tmp.name).iterdir())
+        self.assertEqual(remaining, [str(MINUTE_RTP + 2)])
+
+
+class TestStacking(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.ipc_root = Path(self._tmp.name)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def voter(self) -> GlobalStationVoter:
+        return GlobalStationVoter(CHANNELS, sample_rate=SAMPLE_RATE, ipc_root=self.ipc_root)
+    
+    def test_envelopes_align_on_emission_time(self):
+        # Same emission offset (+2 ms) seen through different path delays
+        voter = self.voter()
+        for channel, delay_ms in zip(CHANNELS, (6.0, 9.0, 12.0)):
+            arrival_ms = 2.0 + delay_ms
+            voter.report_correlation(
+                channel, MINUTE_RTP, 'WWV',
+                envelope=peak_envelope(100, int(arrival_ms + 20)),
+                start_offset_ms=-20.0, bin_ms=1.0, predicted_delay_ms=delay_ms
+            )
+        
+        stack = voter.get_stacked_correlation(MINUTE_RTP, 'WWV', channel='WWV 10 MHz')
+        self.assertEqual(stack['n_channels'], 3)
+        self.assertAlmostEqual(stack['peak_offset_ms'], 2.0, places=6)
+        # Three coherent 5-sigma peaks, normalised by sqrt(3)
+        self.assertAlmostEqual(stack['peak_sigma'], 15.0 / np.sqrt(3))
+        self.assertAlmostEqual(stack['snr_improvement_db'], 10 * np.log10(3))
+        self.assertIn('latency_ms', stack)
+    
+    def test_finer_envelopes_are_resampled(self):
+        stack = self.voter()._stack_envelopes([
+            CorrelationEnvelope('WWV 5 MHz', 'WWV', peak_envelope(40, 20), -10.0, 1.0),
+            CorrelationEnvelope('WWV 10 MHz', 'WWV', peak_envelope(160, 80), -10.0, 0.25),
+        ], normalize=True)
+        self.assertEqual(stack['bin_ms'], 1.0)
+        self.assertEqual(len(stack['stacked_correlation']), 40)
+        self.assertAlmostEqual(stack['peak_offset_ms'], 10.0, places=6)
+        self.assertAlmostEqual(stack['peak_sigma'], 10.0 / np.sqrt(2))
+    
+    def test_partial_coverage_is_normalised_per_bin(self):
+        stack = self.voter()._stack_envelopes([
+            CorrelationEnvelope('WWV 5 MHz', 'WWV', np.full(10, 2.0), 0.0, 1.0),
+            CorrelationEnvelope('WWV 10 MHz', 'WWV', np.full(10, 2.0), 5.0, 1.0),
+        ], normalize=True)
+        expected = np.array([2.0] * 5 + [4.0 / np.sqrt(2)] * 5 + [2.0] * 5)
+        np.testing.assert_allclose(stack['stacked_correlation'], expected)
+    
+    def test_stacks_other_processes_without_waiting(self):
+        other = self.voter()
+        other.report_correlation(
+            'WWV 5 MHz', MINUTE_RTP, 'WWV', peak_envelope(50, 25), -25.0, 1.0
+        )
+        voter = self.voter()
+        
+        with patch.object(global_station_voter.time, 'sleep') as sleep:
+            # Only one channel has shared so far: nothing to stack yet
+            self.assertIsNone(voter.get_stacked_correlation(MINUTE_RTP, 'WWV'))
+            voter.report_correlation(
+                'WWV 10 MHz', MINUTE_RTP, 'WWV', peak_envelope(50, 25), -25.0, 1.0
+            )
+            stack = voter.get_stacked_correlation(MINUTE_RTP, 'WWV')
+        sleep.assert_not_called()
+        
+        self.assertEqual(sorted(stack['channels_used']), ['WWV 10 MHz', 'WWV 5 MHz'])
+        self.assertAlmostEqual(stack['peak_offset_ms'], 0.0, places=6)
+        self.assertEqual(voter.stats['stacked_detections'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
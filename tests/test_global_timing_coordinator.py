@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the GlobalTimingCoordinator shared detection store.
+
+The stress test runs nine writer processes (one per channel, as in a
+full GRAPE station) appending to the same minutes at once and checks
+that every detection survives.
+"""
+
+import json
+import multiprocessing
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.global_timing_coordinator import GlobalTimingCoordinator
+
+GRID = 'EM38ww'
+MINUTE = datetime(2025, 12, 3, 12, 0, tzinfo=timezone.utc)
+N_WRITERS = 9
+MINUTES = 3
+RECORDS_PER_MINUTE = 100
+
+
+def writer(shared_dir: str, index: int, barrier):
+    coordinator = GlobalTimingCoordinator(Path(shared_dir), GRID)
+    barrier.wait()
+    for k in range(RECORDS_PER_MINUTE):
+        for m in range(MINUTES):
+            coordinator.write_detection(
+                minute_utc=MINUTE + timedelta(minutes=m),
+                channel=f"CH{index}",
+                station=f"S{k}",
+                frequency_mhz=5.0 + index,
+                timing_error_ms=index + k / 1000.0,
+                snr_db=20.0
+            )
+
+
+class TestDetectionStore(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.shared_dir = Path(self._tmp.name) / 'shared'
+        self.coordinator = GlobalTimingCoordinator(self.shared_dir, GRID)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def test_latest_record_per_channel_station_wins(self):
+        self.coordinator.write_detection(MINUTE, 'WWV 10 MHz', 'WWV', 10.0, 5.0)
+        self.coordinator.write_detection(MINUTE, 'WWV 10 MHz', 'WWVH', 10.0, 7.0)
+        self.coordinator.write_detection(MINUTE, 'WWV 10 MHz', 'WWV', 10.0, 5.5)
+        detections = {d['station']: d['timing_error_ms'] for d in self.coordinator.read_detections(MINUTE)}
+        self.assertEqual(detections, {'WWV': 5.5, 'WWVH': 7.0})
+    
+    def test_partial_append_and_legacy_file(self):
+        self.coordinator.write_detection(MINUTE, 'CHU 7.85 MHz', 'CHU', 7.85, 1.0)
+        stem = MINUTE.strftime('%Y%m%d_%H%M')
+        with open(self.coordinator.detections_dir / f'{stem}.jsonl', 'a') as f:
+            f.write('{"channel": "WWV 5 MHz", "sta')  # Append in flight
+        with open(self.coordinator.detections_dir / f'{stem}.json', 'w') as f:
+            json.dump({'detections': [{'channel': 'WWV 15 MHz', 'station': 'WWV',
+                                       'frequency_mhz': 15.0, 'timing_error_ms': 4.0}]}, f)
+        channels = sorted(d['channel'] for d in self.coordinator.read_detections(MINUTE))
+        self.assertEqual(channels, ['CHU 7.85 MHz', 'WWV 15 MHz'])
+    
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'needs fork')
+    def test_concurrent_writers_lose_nothing(self):
+        ctx = multiprocessing.get_context('fork')
+        barrier = ctx.Barrier(N_WRITERS)
+        procs = [ctx.Process(target=writer, args=(str(self.shared_dir), i, barrier))
+                 for i in range(N_WRITERS)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(timeout=60)
+            self.assertEqual(p.exitcode, 0)
+        
+        for m in range(MINUTES):
+            minute = MINUTE + timedelta(minutes=m)
+            stem = minute.strftime('%Y%m%d_%H%M')
+            lines = (self.coordinator.detections_dir / f'{stem}.jsonl').read_bytes().split(b'\n')
+            self.assertEqual(lines[-1], b'')
+            records = [json.loads(line) for line in lines[:-1]]  # No torn records
+            self.assertEqual(len(records), N_WRITERS * RECORDS_PER_MINUTE)
+            
+            detections = self.coordinator.read_detections(minute)
+            self.assertEqual(
+                {(d['channel'], d['station']) for d in detections},
+                {(f"CH{i}", f"S{k}") for i in range(N_WRITERS) for k in range(RECORDS_PER_MINUTE)}
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
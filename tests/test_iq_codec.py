@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the lossless IQ codec.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.iq_codec import (
+    ZSTD_AVAILABLE, block_method, decode_iq, decode_iq_into, detect_int_scale, encode_iq
+)
+
+
+def int16_iq(n: int, seed: int = 0, amplitude: int = 3000) -> np.ndarray:
+    """Narrowband int16-origin IQ (a slow tone plus a little noise)."""
+    rng = np.random.default_rng(seed)
+    phase = 2 * np.pi * 50.0 * np.arange(n) / 20000.0
+    i = np.round(amplitude * np.cos(phase) + rng.normal(0, 20, n))
+    q = np.round(amplitude * np.sin(phase) + rng.normal(0, 20, n))
+    return np.clip(np.stack([i, q], axis=1), -32768, 32767).astype(np.int16)
+
+
+def assert_bit_exact(test: unittest.TestCase, decoded: np.ndarray, original: np.ndarray):
+    test.assertEqual(decoded.dtype, np.complex64)
+    test.assertEqual(
+        decoded.view(np.uint32).tobytes(), original.view(np.uint32).tobytes()
+    )
+
+
+@unittest.skipUnless(ZSTD_AVAILABLE, "zstandard not installed")
+class TestIQCodecRoundTrip(unittest.TestCase):
+
+    def round_trip(self, samples: np.ndarray, expected_method: str) -> bytes:
+        blob = encode_iq(samples)
+        self.assertEqual(block_method(blob), expected_method)
+        assert_bit_exact(self, decode_iq(blob), samples)
+        return blob
+    
+    def test_int16_multiply_scale(self):
+        raw = int16_iq(20000)
+        samples = (raw.astype(np.float32) / 32768.0).view(np.complex64).reshape(-1)
+        blob = self.round_trip(samples, 'int')
+        # Integers in 2-byte planes compress well below the float32 size
+        self.assertLess(len(blob), samples.nbytes // 2)
+    
+    def test_int16_divide_scale(self):
+        raw = int16_iq(4000, seed=1)
+        samples = (raw.astype(np.float32) / np.float32(32767.0)).view(np.complex64).reshape(-1)
+        self.assertEqual(detect_int_scale(samples.view(np.float32)), (32767.0, True))
+        self.round_trip(samples, 'int')
+    
+    def test_white_noise_and_wide_integers(self):
+        rng = np.random.default_rng(2)
+        noise = rng.integers(-2 ** 20, 2 ** 20, size=(3000, 2)).astype(np.float32)
+        blob = self.round_trip(noise.view(np.complex64).reshape(-1), 'int')
+        self.assertEqual(blob[7], 4)  # Zigzag values above 16 bits: 4-byte planes
+    
+    def test_float_iq_is_shuffled(self):
+        rng = np.random.default_rng(3)
+        samples = (rng.normal(size=5000) + 1j * rng.normal(size=5000)).astype(np.complex64)
+        self.round_trip(samples, 'float')
+    
+    def test_special_values_force_float(self):
+        samples = (int16_iq(1000).astype(np.float32) / 32768.0).view(np.complex64).reshape(-1)
+        for special in (-0.0, np.nan, np.inf):
+            with self.subTest(value=special):
+                block = samples.copy()
+                block.view(np.float32)[7] = special
+                self.round_trip(block, 'float')
+    
+    def test_empty_block(self):
+        self.round_trip(np.zeros(0, dtype=np.complex64), 'int')
+    
+    def test_decode_into_larger_buffer(self):
+        samples = (int16_iq(100).astype(np.float32) / 32768.0).view(np.complex64).reshape(-1)
+        out = np.full(150, 7 + 7j, dtype=np.complex64)
+        self.assertEqual(decode_iq_into(encode_iq(samples), out), 100)
+        assert_bit_exact(self, out[:100], samples)
+        self.assertTrue(np.all(out[100:] == 7 + 7j))
+    
+    def test_invalid_blocks_are_rejected(self):
+        samples = (int16_iq(100).astype(np.float32) / 32768.0).view(np.complex64).reshape(-1)
+        blob = encode_iq(samples)
+        out = np.empty(100, dtype=np.complex64)
+        
+        with self.assertRaises(ValueError):
+            decode_iq_into(blob[:10], out)
+        with self.assertRaises(ValueError):
+            decode_iq_into(b'XXXX' + blob[4:], out)
+        with self.assertRaises(ValueError):
+            decode_iq_into(blob, np.empty(99, dtype=np.complex64))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded containers and the memory soak growth tracker.
+"""
+
+import sys
+import unittest
+from collections import deque
+from pathlib import Path
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.bounded_cache import LRUDict, RecentSet
+from hf_timestd.core.memory_soak import AllocationTracker
+
+
+class TestBoundedContainers(unittest.TestCase):
+
+    def test_lru_dict_evicts_least_recently_used(self):
+        cache = LRUDict(maxsize=3)
+        for key in 'abc':
+            cache[key] = key.upper()
+        self.assertEqual(cache['a'], 'A')   # 'a' is now most recent
+        cache['d'] = 'D'
+        self.assertEqual(list(cache), ['c', 'a', 'd'])
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.get('missing'), None)
+    
+    def test_recent_set_keeps_last_keys(self):
+        minutes = RecentSet(maxlen=5)
+        for minute in range(0, 600, 60):
+            minutes.add(minute)
+        self.assertEqual(len(minutes), 5)
+        self.assertNotIn(0, minutes)
+        self.assertIn(540, minutes)
+        minutes.add(300)   # Re-adding refreshes, no growth
+        self.assertEqual(list(minutes), [360, 420, 480, 540, 300])
+        minutes.discard(300)
+        self.assertNotIn(300, minutes)
+
+
+class TestAllocationTracker(unittest.TestCase):
+
+    def run_soak(self, container, minutes=12):
+        tracker = AllocationTracker({'tests': [f"*/{Path(__file__).name}"]}, nframe=5)
+        tracker.probe('container', container)
+        tracker.start()
+        try:
+            for minute in range(minutes):
+                container.append(bytearray(4096))
+                tracker.checkpoint(minute)
+        finally:
+            tracker.stop()
+        return tracker.report(max_growth_bytes=512, minutes=minutes)
+    
+    def test_leaking_list_is_flagged(self):
+        report = self.run_soak([])
+        self.assertFalse(report.passed)
+        self.assertEqual({s.name for s in report.unbounded}, {'tests', 'container'})
+        component = next(s for s in report.series if s.name == 'tests')
+        self.assertGreater(component.slope_per_minute, 4096)
+    
+    def test_bounded_deque_passes(self):
+        report = self.run_soak(deque(maxlen=3))
+        self.assertTrue(report.passed, [s.to_dict() for s in report.unbounded])
+        probe = next(s for s in report.series if s.name == 'container')
+        self.assertEqual((probe.peak, probe.bound), (3, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for watermark-based NPZ discovery.
+"""
+
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.npz_discovery import INOTIFY_AVAILABLE, NPZDiscovery
+
+
+def minute_name(dt: datetime) -> str:
+    return f"{dt.strftime('%Y%m%dT%H%M%SZ')}_10000000_iq.npz"
+
+
+class TestNPZDiscovery(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def touch(self, dt: datetime, daily: bool) -> Path:
+        directory = self.root / dt.strftime('%Y%m%d') if daily else self.root
+        directory.mkdir(exist_ok=True)
+        path = directory / minute_name(dt)
+        path.touch()
+        return path
+    
+    def test_daily_lists_only_from_watermark_day(self):
+        for days_ago in range(1, 11):
+            for minute in range(3):
+                self.touch(self.today - timedelta(days=days_ago, minutes=-minute), daily=True)
+        watermark = minute_name(self.today - timedelta(days=1, minutes=-1))
+        new = self.touch(self.today + timedelta(minutes=5), daily=True)
+        
+        discovery = NPZDiscovery(self.root, watermark=watermark)
+        found = discovery.discover()
+        self.assertEqual([f.name for f in found],
+                         [minute_name(self.today - timedelta(days=1, minutes=-2)), new.name])
+        self.assertEqual(discovery.layout, 'daily')
+        self.assertEqual(discovery.get_stats()['entries_listed'], 4)  # Yesterday + today
+    
+    def test_first_run_returns_everything_in_order(self):
+        paths = [self.touch(self.today - timedelta(days=d), daily=True) for d in (3, 1, 2)]
+        found = NPZDiscovery(self.root).discover()
+        self.assertEqual(found, sorted(paths, key=lambda p: p.name))
+    
+    def test_flat_without_inotify_lists_only_on_change(self):
+        self.touch(self.today - timedelta(minutes=1), daily=False)
+        discovery = NPZDiscovery(self.root, use_inotify=False)
+        self.assertEqual(len(discovery.discover()), 1)
+        discovery.advance(minute_name(self.today - timedelta(minutes=1)))
+        self.assertEqual(discovery.discover(), [])
+        self.assertEqual(discovery.listings, 1)
+        
+        time.sleep(0.01)
+        new = self.touch(self.today, daily=False)
+        self.assertEqual(discovery.discover(), [new])
+        self.assertEqual(discovery.listings, 2)
+    
+    @unittest.skipUnless(INOTIFY_AVAILABLE, "inotify not available")
+    def test_flat_inotify_reports_new_files_without_listing(self):
+        self.touch(self.today - timedelta(minutes=1), daily=False)
+        discovery = NPZDiscovery(self.root, watermark=minute_name(self.today - timedelta(minutes=1)))
+        self.assertEqual(discovery.discover(), [])
+        self.assertEqual(discovery.listings, 1)
+        
+        new = self.touch(self.today, daily=False)
+        started = time.monotonic()
+        discovery.wait(5.0)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(discovery.discover(), [new])
+        discovery.advance(new.name)
+        self.assertEqual(discovery.discover(), [])
+        self.assertEqual(discovery.listings, 1)
+        discovery.close()
+    
+    def test_pending_peek_does_not_hide_files(self):
+        for use_inotify in sorted({False, INOTIFY_AVAILABLE}):
+            with self.subTest(inotify=use_inotify):
+                old = self.touch(self.today - timedelta(minutes=1), daily=False)
+                discovery = NPZDiscovery(self.root, watermark=old.name, use_inotify=use_inotify)
+                self.assertEqual(discovery.discover(), [])
+                
+                time.sleep(0.01)
+                new = self.touch(self.today, daily=False)
+                self.assertEqual(discovery.pending(), 1)
+                self.assertEqual(discovery.pending(), 1)  # Status writes repeat
+                self.assertEqual(discovery.discover(), [new])
+                discovery.advance(new.name)
+                self.assertEqual(discovery.pending(), 0)
+                discovery.close()
+                new.unlink()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for pickle-free NPZ reading (NPZReader, NPZArchive.load).
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.npz_reader import NPZReader, decode_json_member
+
+
+def recorder_archive(path: Path, iq: np.ndarray, compressed: bool = False, **extra):
+    """Write an NPZ with the core recorder's member layout"""
+    save = np.savez_compressed if compressed else np.savez
+    save(
+        path,
+        iq=iq,
+        rtp_timestamp=123456,
+        rtp_ssrc=10000000,
+        sample_rate=20000,
+        frequency_hz=10e6,
+        channel_name='WWV 10 MHz',
+        unix_timestamp=1765000000.0,
+        gaps_filled=0,
+        gaps_count=0,
+        packets_received=3000,
+        packets_expected=3000,
+        gap_rtp_timestamps=np.array([], dtype=np.uint32),
+        gap_sample_indices=np.array([], dtype=np.uint64),
+        gap_samples_filled=np.array([], dtype=np.uint32),
+        gap_packets_lost=np.array([], dtype=np.uint32),
+        recorder_version='test',
+        created_timestamp=1765000060.0,
+        **extra
+    )
+
+
+class TestNPZReader(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        rng = np.random.default_rng(0)
+        self.iq = (rng.standard_normal(20000) + 1j * rng.standard_normal(20000)).astype(np.complex64)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def test_stored_iq_is_memory_mapped_copy_on_write(self):
+        path = self.dir / 'stored.npz'
+        recorder_archive(path, self.iq)
+        with NPZReader(path) as npz:
+            self.assertEqual(npz.shape('iq'), (20000,))
+            iq = npz.array('iq')
+            self.assertIsInstance(iq, np.memmap)
+            np.testing.assert_array_equal(iq, self.iq)
+            iq[0] = 0
+        with NPZReader(path) as npz:
+            self.assertEqual(npz.array('iq')[0], self.iq[0])
+    
+    def test_compressed_iq_is_decompressed(self):
+        path = self.dir / 'compressed.npz'
+        recorder_archive(path, self.iq, compressed=True)
+        with NPZReader(path) as npz:
+            iq = npz.array('iq')
+            self.assertNotIsInstance(iq, np.memmap)
+            np.testing.assert_array_equal(iq, self.iq)
+            self.assertEqual(npz.scalar('channel_name', str), 'WWV 10 MHz')
+    
+    def test_pickled_members_are_never_loaded(self):
+        path = self.dir / 'pickled.npz'
+        np.savez(path, legacy={'quality': 'A'}, nothing=None, meta=json.dumps({'quality': 'B'}))
+        with NPZReader(path) as npz:
+            self.assertTrue(npz.is_pickled('legacy'))
+            self.assertIsNone(npz.json_member('legacy'))
+            self.assertIsNone(npz.scalar('nothing', str))
+            self.assertEqual(npz.json_member('meta'), {'quality': 'B'})
+            with self.assertRaises(ValueError):
+                npz.array('legacy')
+    
+    def test_legacy_metadata_trusted_or_dropped_with_warning(self):
+        path = self.dir / 'legacy.npz'
+        np.savez(path, timing_metadata={'quality': 'TONE_LOCKED'})
+        with NPZReader(path) as npz:
+            with self.assertLogs('hf_timestd.core.npz_reader', level='DEBUG') as logs:
+                self.assertIsNone(npz.json_member('timing_metadata'))
+            self.assertIn('timing_metadata', logs.output[0])
+            self.assertEqual(npz.json_member('timing_metadata', trust_pickle=True),
+                             {'quality': 'TONE_LOCKED'})
+    
+    def test_decode_json_member_from_np_load(self):
+        """Scripts read decimated NPZs with np.load: JSON strings and legacy dicts."""
+        current = self.dir / 'current.npz'
+        legacy = self.dir / 'legacy.npz'
+        np.savez_compressed(current, timing_metadata=json.dumps({'ntp_offset_ms': 1.5}))
+        np.savez_compressed(legacy, timing_metadata={'ntp_offset_ms': 2.5})
+        with np.load(current, allow_pickle=True) as data:
+            self.assertEqual(decode_json_member(data['timing_metadata']), {'ntp_offset_ms': 1.5})
+        with np.load(legacy, allow_pickle=True) as data:
+            self.assertEqual(decode_json_member(data['timing_metadata'], trust_pickle=True),
+                             {'ntp_offset_ms': 2.5})
+            self.assertIsNone(decode_json_member(data['timing_metadata']))
+        self.assertIsNone(decode_json_member(np.array('not json')))
+    
+    def test_npz_archive_load(self):
+        from hf_timestd.core.analytics_service import NPZArchive
+        
+        path = self.dir / '20251206T120000Z_10000000_iq.npz'
+        recorder_archive(path, self.iq, time_snap_rtp=100, time_snap_source='wwv_tone',
+                         ntp_offset_ms=None)
+        archive = NPZArchive.load(path)
+        self.assertIsInstance(archive.iq_samples, np.memmap)
+        np.testing.assert_array_equal(archive.iq_samples, self.iq)
+        self.assertEqual(archive.rtp_timestamp, 123456)
+        self.assertEqual(archive.channel_name, 'WWV 10 MHz')
+        self.assertEqual(archive.time_snap_rtp, 100)
+        self.assertEqual(archive.time_snap_source, 'wwv_tone')
+        self.assertIsNone(archive.time_snap_utc)
+        self.assertIsNone(archive.ntp_offset_ms)  # Pickled None member: skipped
+
+
+if __name__ == '__main__':
+    unittest.main()
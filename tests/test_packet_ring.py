@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the RTP receive -> worker handoff ring.
+"""
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.packet_ring import PacketRing
+
+
+class TestPacketRing(unittest.TestCase):
+
+    def test_fifo_with_header_fields(self):
+        ring = PacketRing(capacity=4, slot_bytes=16)
+        for seq in range(3):
+            self.assertTrue(ring.push(bytes([seq]) * (seq + 1), seq, seq * 400, 11, 100.0 + seq))
+        items = [(bytes(p), s, t, pt, w) for p, s, t, pt, w in ring.drain(timeout=0)]
+        self.assertEqual(items, [
+            (b'\x00', 0, 0, 11, 100.0),
+            (b'\x01\x01', 1, 400, 11, 101.0),
+            (b'\x02\x02\x02', 2, 800, 11, 102.0),
+        ])
+        self.assertEqual(len(ring), 0)
+    
+    def test_overflow_drops_newest_and_counts(self):
+        ring = PacketRing(capacity=2, slot_bytes=8)
+        self.assertTrue(ring.push(b'a', 0, 0, 11))
+        self.assertTrue(ring.push(b'b', 1, 0, 11))
+        self.assertFalse(ring.push(b'cc', 2, 0, 11))
+        self.assertFalse(ring.push(b'x' * 9, 3, 0, 11))
+        stats = ring.get_stats()
+        self.assertEqual(stats['overflow_packets'], 1)
+        self.assertEqual(stats['oversize_packets'], 1)
+        self.assertEqual(stats['overflow_bytes'], 11)
+        self.assertEqual(stats['high_watermark'], 2)
+        self.assertEqual([s for _, s, _, _, _ in ring.drain(timeout=0)], [0, 1])
+    
+    def test_cross_thread_handoff_is_lossless_when_not_full(self):
+        ring = PacketRing(capacity=64, slot_bytes=8)
+        total = 20000
+        received = []
+        
+        def consume():
+            while len(received) < total:
+                for payload, seq, _, _, _ in ring.drain(timeout=1.0):
+                    self.assertEqual(int.from_bytes(payload, 'little'), seq)
+                    received.append(seq)
+        
+        worker = threading.Thread(target=consume)
+        worker.start()
+        seq = 0
+        while seq < total:
+            if ring.push(seq.to_bytes(4, 'little'), seq, 0, 11):
+                seq += 1
+        worker.join(timeout=30)
+        self.assertEqual(received, list(range(total)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for the product service JSON-RPC handlers.
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core import product_service
+from hf_timestd.core.decimated_buffer import DecimatedBuffer, SAMPLES_PER_MINUTE
+from hf_timestd.core.product_service import (
+    ProductService, INVALID_PARAMS, INVALID_REQUEST, MAX_SLICE_SAMPLES,
+    METHOD_NOT_FOUND, PARSE_ERROR
+)
+
+DAY_START = datetime(2026, 1, 15, tzinfo=timezone.utc).timestamp()
+CHANNEL = 'WWV 10 MHz'
+
+
+class TestProductServiceRPC(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        buffer = DecimatedBuffer(self.root, CHANNEL)
+        # Minutes 0 and 2 written, minute 1 missing
+        for minute in (0, 2):
+            iq = np.full(SAMPLES_PER_MINUTE, 10.0 ** (minute + 1), dtype=np.complex64)
+            buffer.write_minute(DAY_START + minute * 60, iq)
+        self.service = ProductService(self.root, socket_path=self.root / 'test.sock')
+    
+    def tearDown(self):
+        self.service.close()
+        self._tmp.cleanup()
+    
+    def call(self, method: str, params=None, request_id=1) -> dict:
+        request = {'jsonrpc': '2.0', 'id': request_id, 'method': method}
+        if params is not None:
+            request['params'] = params
+        return self.service.handle_request(json.dumps(request).encode())
+    
+    def assertRPCError(self, response: dict, code: int):
+        self.assertIn('error', response, response)
+        self.assertEqual(response['error']['code'], code)
+    
+    def test_slice_power_and_raw(self):
+        result = self.call('timeseries.slice', {
+            'channel': CHANNEL, 'start': DAY_START, 'end': DAY_START + 180,
+            'max_points': 3, 'raw': True
+        })['result']
+        
+        self.assertEqual(result['samples'], 3 * SAMPLES_PER_MINUTE)
+        self.assertEqual(result['point_interval_sec'], 60.0)
+        # |10|^2 -> 20 dB, missing minute -> None, |1000|^2 -> 60 dB
+        self.assertEqual(result['power_db'], [20.0, None, 60.0])
+        self.assertEqual(len(result['i']), 3 * SAMPLES_PER_MINUTE)
+        self.assertEqual(result['i'][0], 10.0)
+        self.assertEqual(result['q'][0], 0.0)
+    
+    def test_slice_across_midnight_without_next_day(self):
+        result = self.call('timeseries.slice', {
+            'channel': CHANNEL, 'start': DAY_START - 60, 'end': DAY_START + 60,
+            'max_points': 2
+        })['result']
+        self.assertEqual(result['power_db'], [None, 20.0])
+    
+    def test_slice_range_is_capped(self):
+        response = self.call('timeseries.slice', {
+            'channel': CHANNEL, 'start': 0, 'end': 1e12
+        })
+        self.assertRPCError(response, INVALID_PARAMS)
+        self.assertIn('range limited', response['error']['message'])
+        
+        with patch.object(product_service.np, 'zeros', wraps=np.zeros) as zeros:
+            end = DAY_START + MAX_SLICE_SAMPLES / 10 + 1
+            self.assertRPCError(
+                self.call('timeseries.slice', {'channel': CHANNEL, 'start': DAY_START, 'end': end}),
+                INVALID_PARAMS
+            )
+        zeros.assert_not_called()
+    
+    def test_slice_rejects_bad_params(self):
+        for params in (
+            {'start': DAY_START, 'end': DAY_START + 60},
+            {'channel': CHANNEL, 'start': DAY_START},
+            {'channel': CHANNEL, 'start': DAY_START, 'end': DAY_START},
+            {'channel': CHANNEL, 'start': DAY_START, 'end': 'inf'},
+            {'channel': CHANNEL, 'start': 'nan', 'end': DAY_START},
+            {'channel': CHANNEL, 'start': DAY_START, 'end': DAY_START + 60, 'max_points': 'x'},
+            {'channel': CHANNEL, 'start': DAY_START, 'end': DAY_START + 7200, 'raw': True},
+        ):
+            with self.subTest(params=params):
+                self.assertRPCError(self.call('timeseries.slice', params), INVALID_PARAMS)
+    
+    def test_dispatch_errors(self):
+        response = self.service.handle_request(b'{not json')
+        self.assertRPCError(response, PARSE_ERROR)
+        self.assertRPCError(self.service.handle_request(b'[1, 2]'), INVALID_REQUEST)
+        self.assertRPCError(self.call('no.such.method'), METHOD_NOT_FOUND)
+        self.assertRPCError(self.call('channels.list', [1]), INVALID_PARAMS)
+        
+        # Notifications (no id) get no response
+        notification = json.dumps({'jsonrpc': '2.0', 'method': 'status'}).encode()
+        self.assertIsNone(self.service.handle_request(notification))
+    
+    def test_channels_and_status(self):
+        self.assertEqual(self.call('channels.list')['result'], {'channels': [CHANNEL]})
+        
+        self.call('no.such.method')
+        status = self.call('status')['result']
+        self.assertEqual(status['service'], 'product-service')
+        self.assertEqual(status['methods']['channels.list']['errors'], 0)
+        self.assertEqual(status['methods']['no.such.method']['errors'], 1)
+    
+    def test_regenerate_reports_failed_channels(self):
+        def render(data_root, channel, receiver_grid, date_str, hours):
+            if channel == 'WWV 5 MHz':
+                raise RuntimeError("no data")
+            return f"/tmp/{channel}_{date_str}.png"
+        
+        self.service._render_pool = ThreadPoolExecutor(max_workers=1)
+        with patch.object(product_service, '_render_spectrogram', render):
+            result = self.call('spectrogram.regenerate', {'date': '2026-01-15'})['result']
+            self.assertEqual(result['count'], 1)
+            self.assertEqual(result['paths'], [f"/tmp/{CHANNEL}_20260115.png"])
+            
+            result = self.call('spectrogram.regenerate', {'channel': 'WWV_5_MHz'})['result']
+            self.assertEqual(result['count'], 0)
+            self.assertEqual(result['failed'], ['WWV 5 MHz'])
+        self.assertEqual(self.service.renders_in_flight, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for ledger-indexed, per-file quota enforcement.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.binary_archive_writer import (
+    BinaryArchiveConfig, BinaryArchiveWriter, MinuteBuffer
+)
+from hf_timestd.core.raw_archive_writer import (
+    DRF_AVAILABLE, RawArchiveConfig, RawArchiveWriter, StorageQuotaManager
+)
+from hf_timestd.quota_manager import QuotaManager
+
+
+class TestQuotaManager(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.channel_dir = self.root / 'analytics' / 'WWV_10_MHz'
+        self.channel_dir.mkdir(parents=True)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def write(self, name: str, days_old: float, size: int = 1000) -> Path:
+        path = self.channel_dir / name
+        path.write_bytes(b'\0' * size)
+        mtime = time.time() - days_old * 86400
+        os.utime(path, (mtime, mtime))
+        return path
+    
+    def test_flat_directory_still_receiving_files_is_cleaned(self):
+        old = [self.write(f"2026010{d}_decimated.npz", days_old=20 - d) for d in range(3)]
+        new = [self.write(f"2026020{d}_decimated.npz", days_old=d) for d in range(2)]
+        manager = QuotaManager(self.root, threshold_percent=0.0, background_reconcile=False)
+        
+        self.assertEqual(manager.get_status()['deletable_files'], 3)
+        result = manager.enforce_quota()
+        
+        self.assertEqual(result['files_deleted'], 3)
+        self.assertFalse(any(p.exists() for p in old))
+        self.assertTrue(all(p.exists() for p in new))
+        
+        # Ledger reflects what is left; nothing old remains to list
+        entries = manager.ledger.usage(['npz'])
+        self.assertEqual([(e.files, e.bytes) for e in entries], [(2, 2000)])
+        self.assertEqual(manager.deletion_candidates(), [])
+    
+    def test_stops_at_target_oldest_first(self):
+        oldest = self.write("20260101_a.npz", days_old=30, size=1500)
+        newer = self.write("20260102_a.npz", days_old=20)
+        manager = QuotaManager(self.root, threshold_percent=50.0, background_reconcile=False)
+        # Just over 50% of a 20 kB disk: 1001 bytes to free (5% headroom)
+        manager.get_disk_usage = lambda: (10001, 20000, 50.005)
+        
+        result = manager.enforce_quota()
+        self.assertEqual(result['files_deleted'], 1)
+        self.assertFalse(oldest.exists())
+        self.assertTrue(newer.exists())
+    
+    def test_dry_run_keeps_files_and_ledger(self):
+        old = self.write("20260101_a.csv", days_old=30)
+        manager = QuotaManager(self.root, threshold_percent=0.0, dry_run=True,
+                               background_reconcile=False)
+        self.assertEqual(manager.enforce_quota()['files_deleted'], 1)
+        self.assertTrue(old.exists())
+        self.assertEqual(len(manager.deletion_candidates()), 1)
+
+
+class TestStorageQuotaManagerLedger(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        old_day = self.root / 'raw_buffer' / 'WWV_10_MHz' / '20260110'
+        old_day.mkdir(parents=True)
+        (old_day / '1768003200.bin').write_bytes(b'\0' * 5000)
+        self.manager = StorageQuotaManager(
+            self.root, quota='1GB', archive_subdirs=('raw_buffer', 'raw_archive')
+        )
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def test_written_minute_updates_totals_without_walk(self):
+        total, date_dirs = self.manager.get_storage_usage()  # Initial reconcile
+        self.assertEqual(total, 5000)
+        
+        writer = BinaryArchiveWriter(BinaryArchiveConfig(
+            channel_name='WWV 10 MHz', frequency_hz=10e6,
+            output_dir=self.root / 'raw_buffer', size_ledger_dir=self.root / 'state'
+        ))
+        minute = int(datetime(2026, 1, 15, tzinfo=timezone.utc).timestamp())
+        buffer = MinuteBuffer(minute, np.zeros(1000, dtype=np.complex64), write_pos=1000)
+        self.assertTrue(writer._flush_minute(buffer))
+        day_dir = self.root / 'raw_buffer' / 'WWV_10_MHz' / '20260115'
+        written = sum(p.stat().st_size for p in day_dir.iterdir())
+        
+        with patch.object(StorageQuotaManager, '_scan_usage') as scan, \
+                patch.object(Path, 'rglob') as rglob:
+            total, date_dirs = self.manager.get_storage_usage()
+        scan.assert_not_called()
+        rglob.assert_not_called()
+        
+        self.assertEqual(total, 5000 + written)
+        self.assertEqual([(d[1], d[2]) for d in date_dirs], [('20260110', 5000), ('20260115', written)])
+    
+    def test_removed_directory_leaves_ledger(self):
+        self.manager.quota_bytes = 1000
+        result = self.manager.enforce_quota()
+        self.assertEqual(result['removed_dirs'], ['WWV_10_MHz/20260110'])
+        
+        with patch.object(StorageQuotaManager, '_scan_usage') as scan:
+            self.assertEqual(self.manager.get_storage_usage(), (0, []))
+        scan.assert_not_called()
+    
+    @unittest.skipUnless(DRF_AVAILABLE, "digital_rf not installed")
+    def test_closed_drf_files_are_recorded_once(self):
+        self.manager.get_storage_usage()
+        writer = RawArchiveWriter(RawArchiveConfig(
+            output_dir=self.root / 'raw_archive', channel_name='WWV 10 MHz',
+            frequency_hz=10e6, size_ledger_dir=self.root / 'state'
+        ))
+        writer.current_day = datetime(2026, 1, 15, tzinfo=timezone.utc).date()
+        hour_dir = writer.archive_dir / '20260115' / '2026-01-15T00-00-00'
+        hour_dir.mkdir(parents=True)
+        (hour_dir / 'rf@1768435200.000.h5').write_bytes(b'\0' * 3000)
+        
+        writer._report_closed_files()
+        (hour_dir / 'rf@1768435260.000.h5').write_bytes(b'\0' * 2000)
+        writer._report_closed_files()
+        
+        with patch.object(StorageQuotaManager, '_scan_usage') as scan:
+            total, date_dirs = self.manager.get_storage_usage()
+        scan.assert_not_called()
+        self.assertEqual(total, 10000)
+        self.assertIn(('20260115', 5000), [(d[1], d[2]) for d in date_dirs])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared radiod channel directory.
+
+A FakeRadiod on the loopback interface plays radiod's part of the status
+protocol: it answers polls on the status multicast group with one STATUS
+packet per channel, encoded with ka9q's own TLV encoders.
+"""
+
+import select
+import socket
+import struct
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from ka9q.control import encode_double, encode_eol, encode_int, encode_socket, encode_string
+from ka9q.types import StatusType
+
+from hf_timestd.radiod_directory import RadiodChannelDirectory
+from hf_timestd.stream import StreamManager, StreamRequest
+
+LOOPBACK = '127.0.0.1'
+STATUS_GROUP = '239.77.41.1'
+DATA_GROUP = '239.77.41.2'
+
+WWV_CHU_FREQUENCIES = [2.5e6, 3.33e6, 5.0e6, 7.85e6, 10.0e6, 14.67e6, 15.0e6, 20.0e6, 25.0e6]
+
+
+def free_udp_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(('0.0.0.0', 0))
+        return s.getsockname()[1]
+
+
+def multicast_socket(group: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind(('0.0.0.0', port))
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP,
+                    struct.pack('=4s4s', socket.inet_aton(group), socket.inet_aton(LOOPBACK)))
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(LOOPBACK))
+    return sock
+
+
+class FakeRadiod:
+    """radiod status side: answers polls with STATUS packets for its channels"""
+    
+    def __init__(self, port: int):
+        self.port = port
+        self.channels = {}  # ssrc -> (frequency, preset, sample_rate)
+        self.polls = 0
+        self._lock = threading.Lock()
+        self._sock = multicast_socket(STATUS_GROUP, port)
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+    
+    def add_channel(self, ssrc, frequency, preset='iq', sample_rate=20000):
+        with self._lock:
+            self.channels[ssrc] = (frequency, preset, sample_rate)
+    
+    def remove_channel(self, ssrc):
+        with self._lock:
+            self.channels.pop(ssrc, None)
+    
+    def status_packet(self, ssrc) -> bytes:
+        frequency, preset, sample_rate = self.channels[ssrc]
+        buf = bytearray([0])  # STATUS
+        encode_int(buf, StatusType.OUTPUT_SSRC, ssrc)
+        encode_double(buf, StatusType.RADIO_FREQUENCY, frequency)
+        encode_string(buf, StatusType.PRESET, preset)
+        encode_int(buf, StatusType.OUTPUT_SAMPRATE, sample_rate)
+        encode_socket(buf, StatusType.OUTPUT_DATA_DEST_SOCKET, DATA_GROUP, 5004)
+        encode_int(buf, StatusType.GPS_TIME, 1_400_000_000_000_000_000)
+        encode_int(buf, StatusType.RTP_TIMESNAP, 12345)
+        encode_eol(buf)
+        return bytes(buf)
+    
+    def _serve(self):
+        while self._running:
+            ready, _, _ = select.select([self._sock], [], [], 0.05)
+            if not ready:
+                continue
+            packet = self._sock.recv(8192)
+            if not packet or packet[0] != 1:  # Only commands
+                continue
+            self.polls += 1
+            with self._lock:
+                packets = [self.status_packet(ssrc) for ssrc in self.channels]
+            for p in packets:
+                self._sock.sendto(p, (STATUS_GROUP, self.port))
+    
+    def close(self):
+        self._running = False
+        self._thread.join(timeout=2)
+        self._sock.close()
+
+
+class FakeControl:
+    """RadiodControl stand-in: create_channel adds the channel to the FakeRadiod"""
+    
+    def __init__(self, radiod: FakeRadiod):
+        self.radiod = radiod
+        self.created = []
+    
+    def create_channel(self, ssrc, frequency_hz, preset, sample_rate, **kwargs):
+        self.created.append(ssrc)
+        self.radiod.add_channel(ssrc, frequency_hz, preset, sample_rate)
+        return ssrc
+    
+    def remove_channel(self, ssrc):
+        self.radiod.remove_channel(ssrc)
+    
+    def close(self):
+        pass
+
+
+class TestRadiodChannelDirectory(unittest.TestCase):
+
+    def setUp(self):
+        self.port = free_udp_port()
+        self.radiod = FakeRadiod(self.port)
+        for i, freq in enumerate(WWV_CHU_FREQUENCIES):
+            self.radiod.add_channel(1000 + i, freq)
+        self.directory = RadiodChannelDirectory(
+            STATUS_GROUP, interface=LOOPBACK, status_port=self.port,
+            poll_interval=0.5, expire_after=1.0, warmup=0.3
+        )
+    
+    def tearDown(self):
+        self.directory.close()
+        self.radiod.close()
+    
+    def test_populates_from_status_multicast(self):
+        channels = self.directory.channels()
+        self.assertEqual(sorted(channels), list(range(1000, 1009)))
+        info = channels[1004]
+        self.assertEqual(info.frequency, 10.0e6)
+        self.assertEqual(info.preset, 'iq')
+        self.assertEqual(info.sample_rate, 20000)
+        self.assertEqual((info.multicast_address, info.port), (DATA_GROUP, 5004))
+        self.assertEqual(info.rtp_timesnap, 12345)
+        self.assertTrue(self.directory.is_alive())
+    
+    def test_queries_do_not_block_after_warmup(self):
+        self.directory.wait_ready()
+        started = time.monotonic()
+        for _ in range(1000):
+            self.assertIsNotNone(self.directory.get(1004))
+            self.assertEqual(len(self.directory.find(10.0e6, 'iq', 20000)), 1)
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(self.directory.find(10.0e6, 'usb'), [])
+        self.assertEqual(self.directory.find(10.0e6 + 50, frequency_tolerance_hz=100)[0].ssrc, 1004)
+    
+    def test_wait_for_new_channel(self):
+        self.directory.wait_ready()
+        self.radiod.add_channel(2000, 60e3)
+        started = time.monotonic()
+        found = self.directory.wait_for([2000], timeout=3.0)
+        self.assertIn(2000, found)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(self.directory.wait_for([2001], timeout=0.3), {})
+    
+    def test_removed_channel_expires(self):
+        self.directory.wait_ready()
+        self.radiod.remove_channel(1000)
+        deadline = time.monotonic() + 5.0
+        while self.directory.get(1000) is not None and time.monotonic() < deadline:
+            time.sleep(0.1)
+        self.assertIsNone(self.directory.get(1000))
+        self.assertIsNotNone(self.directory.get(1001))
+        self.assertEqual(self.directory.find(2.5e6), [])
+
+
+class TestStreamManagerBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.port = free_udp_port()
+        self.radiod = FakeRadiod(self.port)
+        self.radiod.add_channel(1000, 2.5e6)  # Already in radiod
+        self.directory = RadiodChannelDirectory(
+            STATUS_GROUP, interface=LOOPBACK, status_port=self.port,
+            poll_interval=0.5, warmup=0.3
+        )
+        self.manager = StreamManager(STATUS_GROUP, channel_directory=self.directory)
+        self.control = self.manager._control = FakeControl(self.radiod)
+    
+    def tearDown(self):
+        self.manager.close()
+        self.directory.close()
+        self.radiod.close()
+    
+    def test_subscribe_batch_creates_missing_in_one_pass(self):
+        requests = [StreamRequest.create(f, sample_rate=20000) for f in WWV_CHU_FREQUENCIES]
+        requests.append(StreamRequest.create(10.0e6, sample_rate=20000))  # Duplicate
+        
+        started = time.monotonic()
+        handles = self.manager.subscribe_batch(requests)
+        elapsed = time.monotonic() - started
+        
+        self.assertEqual(len(handles), 10)
+        self.assertEqual(len(self.control.created), 8)  # 2.5 MHz adopted
+        self.assertEqual(handles[0]._ssrc, 1000)
+        self.assertEqual(handles[4]._ssrc, handles[9]._ssrc)
+        self.assertTrue(all(h.multicast_address == DATA_GROUP for h in handles))
+        self.assertLess(elapsed, 3.0)
+        
+        # Releasing removes the streams we created; the adopted one is not ours
+        for handle in handles:
+            handle.release()
+        self.assertEqual(sorted(self.radiod.channels), [1000])
+    
+    def test_subscribe_batch_reports_unconfirmed_channels(self):
+        self.control.create_channel = lambda ssrc, **kwargs: ssrc  # radiod never creates it
+        with self.assertRaises(RuntimeError):
+            self.manager.subscribe_batch([StreamRequest.create(5.0e6)], timeout=0.5)
+        self.assertEqual(self.manager.list_managed(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Tests for the reprocess engine: sharding, checkpoint/resume of shard
+outputs and the time-ordered merge stage.
+"""
+
+import csv
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.reprocess_engine import (
+    ReprocessChannel, ReprocessEngine, ReprocessJob, _SeriesWriters, make_shards
+)
+
+MINUTE0 = 1768435200  # 2026-01-15 00:00 UTC
+CHANNELS = [ReprocessChannel('WWV 10 MHz', 10e6), ReprocessChannel('WWV 5 MHz', 5e6)]
+
+
+def minute_record(minute: int, with_result: bool = True) -> dict:
+    """A pass-1 record as _minute_record() produces it."""
+    record = {
+        'minute': minute,
+        'rtp_timestamp': minute * 20000,
+        'power_db': -40.0,
+        'snr_db': 25.0,
+        'gap_samples': 0,
+        'result': None,
+    }
+    if with_result:
+        record['result'] = {
+            'd_clock_ms': 0.5 + (minute % 7) * 0.01,
+            'uncertainty_ms': 0.8,
+            'confidence': 0.9,
+            'station': 'WWV',
+            'propagation_delay_ms': 8.0,
+            'propagation_mode': '1F',
+            'n_hops': 1,
+            'solution_confidence': 0.9,
+            'wwv_tone_db': 20.0,
+            'wwvh_tone_db': None,
+        }
+    return record
+
+
+def shard_output(shard, missing=()) -> dict:
+    """Shard output as _process_shard() returns it, records in shuffled order."""
+    records = [
+        minute_record(minute, with_result=(minute // 60) % 5 != 0)
+        for minute in range(shard.start, shard.end, 60)
+        if minute not in missing
+    ]
+    random.Random(shard.start).shuffle(records)
+    return {
+        'shard_id': shard.shard_id,
+        'channel': shard.channel,
+        'start': shard.start,
+        'end': shard.end,
+        'minutes_missing': len(missing),
+        'cpu_sec': 0.1,
+        'records': records,
+    }
+
+
+def read_rows(path: Path) -> list:
+    with open(path, newline='') as f:
+        return list(csv.DictReader(f))
+
+
+class TestMakeShards(unittest.TestCase):
+
+    def test_shards_ordered_by_time_then_channel(self):
+        job = ReprocessJob(
+            data_root='/tmp/unused', channels=CHANNELS,
+            start=MINUTE0 + 17, end=MINUTE0 + 150 * 60, shard_minutes=60
+        )
+        shards = make_shards(job)
+        
+        self.assertEqual(
+            [(s.start - MINUTE0, s.channel) for s in shards],
+            [(t, ch.name) for t in (0, 3600, 7200) for ch in CHANNELS]
+        )
+        # Contiguous per channel, the last shard cut at the end of the job
+        for ch in CHANNELS:
+            own = [s for s in shards if s.channel == ch.name]
+            self.assertEqual([s.end for s in own[:-1]], [s.start for s in own[1:]])
+            self.assertEqual(own[-1].end, job.end)
+            self.assertEqual(own[-1].minutes, 30)
+        self.assertEqual(sum(s.minutes for s in shards), job.total_minutes)
+        self.assertEqual(len({s.shard_id for s in shards}), len(shards))
+    
+    def test_run_id_depends_on_shard_minutes(self):
+        # Analysis state restarts at every shard: different sharding, different results
+        jobs = [
+            ReprocessJob(data_root='/tmp/unused', channels=CHANNELS,
+                         start=MINUTE0, end=MINUTE0 + 7200, shard_minutes=minutes)
+            for minutes in (30, 60, 60)
+        ]
+        self.assertNotEqual(jobs[0].run_id, jobs[1].run_id)
+        self.assertEqual(jobs[1].run_id, jobs[2].run_id)
+
+
+class TestReprocessRun(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        # 23:00 - 01:00 UTC: the merge crosses a day boundary
+        self.job = ReprocessJob(
+            data_root=Path(self._tmp.name), channels=CHANNELS,
+            start=MINUTE0 - 3600, end=MINUTE0 + 3600, shard_minutes=30
+        )
+        self.missing = {MINUTE0 + 600}
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def fake_analyze(self, analyzed: list, stop_after: int = None):
+        """Stand-in for the worker pool: saves canned outputs like _analyze()."""
+        missing = self.missing
+        
+        def _analyze(engine, pending, report):
+            for shard in pending:
+                if stop_after is not None and len(analyzed) == stop_after:
+                    raise KeyboardInterrupt
+                engine._save_shard(shard, shard_output(shard, missing))
+                analyzed.append(shard.shard_id)
+                report.shards_processed += 1
+        return _analyze
+    
+    def test_interrupted_run_resumes_pending_shards(self):
+        engine = ReprocessEngine(self.job, workers=2)
+        shards = make_shards(self.job)
+        
+        first = []
+        with patch.object(ReprocessEngine, '_analyze', self.fake_analyze(first, stop_after=3)):
+            with self.assertRaises(KeyboardInterrupt):
+                engine.run()
+        # A shard whose write was cut short is not a checkpoint
+        engine._shard_file(shards[3]).with_suffix('.tmp').write_text('{"records": [')
+        self.assertEqual([s.shard_id for s in engine.pending_shards()],
+                         [s.shard_id for s in shards[3:]])
+        
+        second = []
+        with patch.object(ReprocessEngine, '_analyze', self.fake_analyze(second)):
+            report = ReprocessEngine(self.job, workers=2).run()
+        
+        self.assertEqual(first, [s.shard_id for s in shards[:3]])
+        self.assertEqual(second, [s.shard_id for s in shards[3:]])
+        self.assertEqual(report.shards_resumed, 3)
+        self.assertEqual(report.shards_processed, len(shards) - 3)
+        self.assertEqual(report.minutes_processed, self.job.total_minutes - 2)
+        self.assertEqual(report.minutes_missing, 2)
+        
+        # Nothing left to analyze: a third run only merges
+        with patch.object(ReprocessEngine, '_analyze') as analyze:
+            again = ReprocessEngine(self.job, workers=2).run()
+        analyze.assert_not_called()
+        self.assertEqual(again.shards_resumed, len(shards))
+        self.assertEqual(again.measurements, report.measurements)
+    
+    def test_merge_replays_records_in_time_order(self):
+        engine = ReprocessEngine(self.job, workers=1)
+        engine.shard_dir.mkdir(parents=True)
+        shards = make_shards(self.job)
+        for shard in reversed(shards):
+            engine._save_shard(shard, shard_output(shard, self.missing))
+        
+        order = [(record['minute'], channel) for channel, record in engine._iter_records(shards)]
+        self.assertEqual(order, sorted(order))
+        self.assertEqual(len(order), self.job.total_minutes - 2)
+        
+        report = engine.run()
+        self.assertEqual(report.shards_resumed, len(shards))
+        
+        for ch in CHANNELS:
+            out = self.job.output_dir(ch.name)
+            rows = read_rows(out / 'clock_offset' / 'clock_offset_series.csv')
+            minutes = [int(r['minute_boundary_utc']) for r in rows]
+            self.assertEqual(minutes, sorted(minutes))
+            # Minutes with a D_clock result only
+            self.assertEqual(len(rows), sum(
+                1 for m in range(self.job.start, self.job.end, 60)
+                if m not in self.missing and (m // 60) % 5 != 0
+            ))
+            
+            # Carrier power: every minute with data, split at midnight
+            for day, start, end in (('20260114', self.job.start, MINUTE0),
+                                    ('20260115', MINUTE0, self.job.end)):
+                rows = read_rows(out / 'carrier_power' / f'carrier_power_{day}.csv')
+                self.assertEqual(
+                    [int(r['timestamp']) for r in rows],
+                    [m for m in range(start, end, 60) if m not in self.missing]
+                )
+
+
+class TestSeriesWriters(unittest.TestCase):
+
+    def test_finished_days_are_closed(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            job = ReprocessJob(data_root=Path(tmp), channels=CHANNELS,
+                               start=MINUTE0, end=MINUTE0 + 3 * 86400)
+            writers = _SeriesWriters(job)
+            for day in range(3):
+                for minute in range(MINUTE0 + day * 86400, MINUTE0 + day * 86400 + 180, 60):
+                    for ch in CHANNELS:
+                        writers.carrier_power(ch.name, minute_record(minute), None, None)
+                # Only the current day's files stay open
+                self.assertEqual(writers.open_files(), len(CHANNELS))
+            
+            # Earlier days are complete on disk while the run goes on
+            first = job.output_dir(CHANNELS[0].name) / 'carrier_power' / 'carrier_power_20260115.csv'
+            self.assertEqual(len(read_rows(first)), 3)
+            writers.close()
+            self.assertEqual(writers.open_files(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
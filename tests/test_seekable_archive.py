@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Bit-exact round-trip tests for the seekable (.bin.seek) minute format.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core import seekable_archive
+from hf_timestd.core.seekable_archive import (
+    SeekableMinuteFile, read_seekable_range, seekable_chunk_sizes, write_seekable_minute
+)
+
+try:
+    import zstandard  # noqa: F401
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame  # noqa: F401
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+CHUNK = 1000
+TOTAL = 10 * CHUNK + 357  # Short last chunk
+
+
+def make_samples(n: int = TOTAL, seed: int = 0) -> np.ndarray:
+    """int16-origin IQ with a few bit patterns that must survive exactly."""
+    rng = np.random.default_rng(seed)
+    raw = rng.integers(-32768, 32767, size=(n, 2), dtype=np.int16)
+    samples = (raw.astype(np.float32) / 32768.0).view(np.complex64).reshape(-1)
+    values = samples.view(np.float32)
+    values[5] = -0.0
+    values[n // 3] = np.nan
+    values[n] = np.inf
+    values[-1] = np.float32(1e-42)  # Subnormal
+    return samples
+
+
+class SeekableRoundTripMixin:
+    """Round-trip tests shared by every codec."""
+    
+    codec = None
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / '20260115T000000Z.bin.seek'
+        self.samples = make_samples()
+        write_seekable_minute(
+            self.path, self.samples, codec=self.codec, chunk_samples=CHUNK, sample_rate=20000
+        )
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def assertBitExact(self, decoded: np.ndarray, expected: np.ndarray):
+        self.assertEqual(decoded.dtype, np.complex64)
+        self.assertEqual(decoded.view(np.uint32).tobytes(), expected.view(np.uint32).tobytes())
+    
+    def test_header_and_whole_minute(self):
+        self.assertEqual(list(Path(self._tmp.name).iterdir()), [self.path])
+        with SeekableMinuteFile(self.path) as f:
+            self.assertEqual(f.codec, self.codec)
+            self.assertEqual(
+                (f.sample_rate, f.chunk_samples, f.total_samples, f.num_chunks),
+                (20000, CHUNK, TOTAL, 11)
+            )
+            self.assertEqual(f.compressed_bytes, self.path.stat().st_size)
+            self.assertBitExact(f.read_all(), self.samples)
+            self.assertBitExact(f.read_all(parallel=False), self.samples)
+        self.assertEqual(len(seekable_chunk_sizes(self.path)), 11)
+    
+    def test_ranges(self):
+        cases = [
+            (0, CHUNK),                  # one aligned chunk
+            (2 * CHUNK, 3 * CHUNK),      # aligned, several chunks
+            (1, 1),                      # single sample
+            (CHUNK - 10, 20),            # across a chunk boundary
+            (1234, 5678),                # unaligned, several chunks
+            (10 * CHUNK, 357),           # short last chunk
+            (10 * CHUNK + 300, 1000),    # runs past the end: clipped
+            (-50, 100),                  # starts before 0: clipped
+        ]
+        with SeekableMinuteFile(self.path) as f:
+            for start, count in cases:
+                with self.subTest(start=start, count=count):
+                    lo, hi = max(0, start), min(TOTAL, start + count)
+                    self.assertBitExact(f.read_range(start, count), self.samples[lo:hi])
+            self.assertEqual(len(f.read_range(TOTAL, 10)), 0)
+        self.assertBitExact(read_seekable_range(self.path, 4321, 100), self.samples[4321:4421])
+    
+    def test_read_into_buffer(self):
+        with SeekableMinuteFile(self.path) as f:
+            for start, count in ((0, 2 * CHUNK), (150, 2500)):
+                with self.subTest(start=start, count=count):
+                    out = np.full(count + 5, 9 + 9j, dtype=np.complex64)
+                    result = f.read_range(start, count, out=out)
+                    self.assertTrue(np.shares_memory(result, out))
+                    self.assertBitExact(result, self.samples[start:start + count])
+                    self.assertTrue(np.all(out[count:] == 9 + 9j))
+    
+    def test_parallel_decode_matches(self):
+        with patch.object(seekable_archive, '_WORKERS', 4):
+            path = self.path.with_name('parallel.bin.seek')
+            write_seekable_minute(path, self.samples, codec=self.codec, chunk_samples=CHUNK)
+            self.assertEqual(path.read_bytes(), self.path.read_bytes())
+            with SeekableMinuteFile(path) as f:
+                self.assertBitExact(f.read_all(), self.samples)
+                self.assertBitExact(f.read_range(555, 8000), self.samples[555:8555])
+
+
+@unittest.skipUnless(ZSTD_AVAILABLE, "zstandard not installed")
+class TestZstdSeekable(SeekableRoundTripMixin, unittest.TestCase):
+    codec = 'zstd'
+
+
+@unittest.skipUnless(LZ4_AVAILABLE, "lz4 not installed")
+class TestLz4Seekable(SeekableRoundTripMixin, unittest.TestCase):
+    codec = 'lz4'
+
+
+@unittest.skipUnless(ZSTD_AVAILABLE, "zstandard not installed")
+class TestIQSeekable(SeekableRoundTripMixin, unittest.TestCase):
+    codec = 'iq'
+
+
+@unittest.skipUnless(ZSTD_AVAILABLE, "zstandard not installed")
+class TestSeekableValidation(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / 'minute.bin.seek'
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def test_empty_minute(self):
+        write_seekable_minute(self.path, np.zeros(0, dtype=np.complex64))
+        with SeekableMinuteFile(self.path) as f:
+            self.assertEqual((f.total_samples, f.num_chunks), (0, 0))
+            self.assertEqual(len(f.read_all()), 0)
+    
+    def test_bad_arguments(self):
+        samples = make_samples(100)
+        with self.assertRaises(ValueError):
+            write_seekable_minute(self.path, samples, codec='gzip')
+        with self.assertRaises(ValueError):
+            write_seekable_minute(self.path, samples, chunk_samples=0)
+    
+    def test_corrupt_files_are_rejected(self):
+        write_seekable_minute(self.path, make_samples(3000), chunk_samples=CHUNK)
+        data = self.path.read_bytes()
+        
+        for name, content in (
+            ('truncated header', data[:20]),
+            ('bad magic', b'XXXX' + data[4:]),
+            ('truncated table', data[:40]),
+        ):
+            with self.subTest(name):
+                self.path.write_bytes(content)
+                with self.assertRaises(ValueError):
+                    SeekableMinuteFile(self.path)
+        
+        # A damaged chunk fails loudly rather than returning wrong samples
+        self.path.write_bytes(data[:-10])
+        with SeekableMinuteFile(self.path) as f:
+            with self.assertRaises(Exception):
+                f.read_range(2 * CHUNK, CHUNK)
+
+
+if __name__ == '__main__':
+    unittest.main()
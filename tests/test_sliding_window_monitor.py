@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming sliding window monitor bank.
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.sliding_window_monitor import (
+    SNR_MARGINAL_DB, SignalQuality, StreamingMonitorBank
+)
+
+SAMPLE_RATE = 20000
+
+
+def tone_signal(seconds: float, tone_hz: float, amplitude: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    n = int(seconds * SAMPLE_RATE)
+    t = np.arange(n) / SAMPLE_RATE
+    noise = 0.5 * (rng.standard_normal(n) + 1j * rng.standard_normal(n))
+    return (1.0 + amplitude * np.sin(2 * np.pi * tone_hz * t) + noise).astype(np.complex64)
+
+
+class TestStreamingMonitorBank(unittest.TestCase):
+
+    def setUp(self):
+        self.status_dir = Path(tempfile.mkdtemp())
+    
+    def tearDown(self):
+        shutil.rmtree(self.status_dir)
+    
+    def feed_all(self, bank, signals, packet=400):
+        completed = []
+        for pos in range(0, len(next(iter(signals.values()))), packet):
+            for name, signal in signals.items():
+                completed += bank.feed(name, signal[pos:pos + packet], 1000.0 + pos / SAMPLE_RATE)
+        return completed
+    
+    def test_channels_share_fft_calls(self):
+        bank = StreamingMonitorBank(SAMPLE_RATE, output_dir=self.status_dir)
+        signals = {
+            'WWV 10 MHz': tone_signal(30, 1000.0, 0.3, seed=1),
+            'WWVH 10 MHz': tone_signal(30, 1200.0, 0.3, seed=2),
+            'Silent': tone_signal(30, 1000.0, 0.0, seed=3),
+        }
+        for name in signals:
+            bank.add_channel(name)
+        completed = self.feed_all(bank, signals)
+        
+        # Two complete 10 s windows per channel (the third needs frames past 30 s)
+        self.assertEqual(sorted(name for name, _ in completed), sorted(list(signals) * 2))
+        stats = bank.get_stats()
+        self.assertGreaterEqual(stats['frames_transformed'], 3 * 2 * 49)   # 49 frames start in a window
+        self.assertGreater(stats['frames_transformed'] / stats['ticks'], 3)
+        
+        by_channel = {name: m for name, m in completed}
+        self.assertGreater(by_channel['WWV 10 MHz'].wwv_snr_db, 15.0)
+        self.assertLess(abs(by_channel['WWV 10 MHz'].wwv_doppler_hz), 2.5)
+        self.assertGreater(by_channel['WWVH 10 MHz'].wwvh_snr_db, 15.0)
+        self.assertLess(by_channel['Silent'].dominant_snr_db, SNR_MARGINAL_DB)
+        self.assertEqual(by_channel['WWV 10 MHz'].timestamp, 1010.0)
+        self.assertEqual(by_channel['WWV 10 MHz'].samples_received, 10 * SAMPLE_RATE)
+    
+    def test_window_spectrum_matches_direct_average(self):
+        bank = StreamingMonitorBank(SAMPLE_RATE, tick_frames=1)
+        monitor = bank.add_channel('WWV 10 MHz')
+        signal = tone_signal(12, 1000.0, 0.3)
+        seen = []
+        monitor.process_spectrum = lambda freqs, power, **kw: seen.append(power)
+        self.feed_all(bank, {'WWV 10 MHz': signal}, packet=1234)
+        
+        frames = np.lib.stride_tricks.sliding_window_view(signal, 8192)[::4096]
+        frames = frames[:-(-10 * SAMPLE_RATE // 4096)] * np.hanning(8192)
+        expected = (np.abs(np.fft.fft(frames, axis=-1)) ** 2).mean(axis=0)[:4096]
+        np.testing.assert_allclose(seen[0], expected, rtol=1e-3)
+    
+    def test_status_written_only_on_change(self):
+        bank = StreamingMonitorBank(SAMPLE_RATE, output_dir=self.status_dir)
+        monitor = bank.add_channel('WWV 10 MHz')
+        steady = tone_signal(60, 1000.0, 0.3)
+        faded = tone_signal(20, 1000.0, 0.02, seed=5)
+        self.feed_all(bank, {'WWV 10 MHz': np.concatenate([steady, faded])})
+        
+        self.assertEqual(monitor.total_windows_processed, 7)
+        self.assertLess(monitor.status_writes, monitor.total_windows_processed)
+        self.assertGreaterEqual(monitor.status_writes, 2)   # First window, then the fade
+        status = json.loads((self.status_dir / 'WWV_10_MHz_monitor.json').read_text())
+        self.assertEqual(status['current_window']['window_number'], 7)
+        self.assertNotEqual(status['current_window']['quality'], SignalQuality.EXCELLENT.value)
+
+
+if __name__ == '__main__':
+    unittest.main()
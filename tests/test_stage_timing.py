@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Tests for stage timing: bucket quantiles, lap timing, snapshots and the
+Prometheus text rendering.
+"""
+
+import json
+import re
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core import stage_timing
+from hf_timestd.core.stage_timing import (
+    ALL_CHANNELS, BUCKET_BOUNDS_MS, METRIC_NAME, StageTimingRegistry,
+    bucket_quantile, prometheus_text
+)
+
+# name{labels} value
+SAMPLE_LINE = re.compile(r'^(\w+)\{((?:\w+="(?:[^"\\]|\\.)*",?)*)\} (\S+)$')
+LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def registry_with(durations_ms, stage='step1', channel='WWV 10 MHz', service='phase2'):
+    registry = StageTimingRegistry(service)
+    for ms in durations_ms:
+        registry.record_ns(stage, int(round(ms * 1e6)), channel)
+    return registry
+
+
+def parse_samples(text: str):
+    """(name, labels, value) of every sample line, checking the line syntax."""
+    samples = []
+    for line in text.splitlines():
+        if line.startswith('#'):
+            continue
+        match = SAMPLE_LINE.match(line)
+        if match is None:
+            raise AssertionError(f"Malformed sample line: {line!r}")
+        name, labels, value = match.groups()
+        samples.append((name, dict(LABEL.findall(labels)), float(value)))
+    return samples
+
+
+class TestBucketQuantile(unittest.TestCase):
+
+    def counts_for(self, durations_ms):
+        hist = registry_with(durations_ms)._series['step1']['WWV 10 MHz']
+        return hist.counts, hist.max_ns / 1e6
+    
+    def test_empty_histogram(self):
+        self.assertIsNone(bucket_quantile([0] * (len(BUCKET_BOUNDS_MS) + 1), 0.5))
+    
+    def test_bucket_upper_bound_is_inclusive(self):
+        counts, _ = self.counts_for([1.0] * 10)
+        self.assertEqual(counts[BUCKET_BOUNDS_MS.index(1.0)], 10)
+    
+    def test_single_bucket_interpolates_log_linearly(self):
+        counts, max_ms = self.counts_for([1.5] * 100)
+        lower, upper = 1.258925, 1.584893
+        self.assertAlmostEqual(bucket_quantile(counts, 0.5), lower * (upper / lower) ** 0.5, places=6)
+        self.assertAlmostEqual(bucket_quantile(counts, 0.99), lower * (upper / lower) ** 0.99, places=6)
+        # Capped at the largest value seen
+        self.assertLessEqual(bucket_quantile(counts, 0.99, max_ms), 1.5)
+        self.assertAlmostEqual(bucket_quantile(counts, 1.0, max_ms), 1.5, places=6)
+    
+    def test_p50_and_p99_of_two_modes(self):
+        counts, max_ms = self.counts_for([1.0] * 98 + [100.0] * 2)
+        self.assertTrue(0.794328 <= bucket_quantile(counts, 0.5, max_ms) <= 1.0)
+        self.assertTrue(79.432823 <= bucket_quantile(counts, 0.99, max_ms) <= 100.0)
+    
+    def test_overflow_bucket_uses_max(self):
+        counts, max_ms = self.counts_for([250_000.0] * 4)
+        self.assertEqual(counts[-1], 4)
+        p50 = bucket_quantile(counts, 0.5, max_ms)
+        self.assertTrue(BUCKET_BOUNDS_MS[-1] <= p50 <= 250_000.0)
+        self.assertEqual(bucket_quantile(counts, 0.5), BUCKET_BOUNDS_MS[-1])
+    
+    def test_within_bucket_resolution_of_exact_quantiles(self):
+        durations = np.random.default_rng(1).lognormal(mean=np.log(20.0), sigma=1.0, size=5000)
+        counts, max_ms = self.counts_for(durations)
+        for q in (0.5, 0.99):
+            with self.subTest(q=q):
+                exact = np.percentile(durations, q * 100)
+                self.assertAlmostEqual(bucket_quantile(counts, q, max_ms) / exact, 1.0, delta=0.12)
+
+
+class TestLapTimer(unittest.TestCase):
+
+    def test_mark_records_time_since_last_mark_or_skip(self):
+        registry = StageTimingRegistry()
+        ticks = [0, 2_000_000, 3_000_000, 7_000_000, 7_500_000]
+        with patch.object(stage_timing.time, 'perf_counter_ns', side_effect=ticks):
+            laps = registry.laps('WWV 10 MHz')
+            laps.mark('step2_bcd')          # 0 -> 2 ms
+            laps.skip()                     # section not run: 2 -> 3 ms dropped
+            laps.mark('step2_doppler')      # 3 -> 7 ms
+            laps.mark('step2_doppler')      # 7 -> 7.5 ms
+        
+        stages = registry.snapshot()['stages']
+        self.assertEqual(set(stages), {'step2_bcd', 'step2_doppler'})
+        bcd = stages['step2_bcd']['WWV 10 MHz']
+        doppler = stages['step2_doppler']['WWV 10 MHz']
+        self.assertEqual((bcd['count'], bcd['sum_ms']), (1, 2.0))
+        self.assertEqual((doppler['count'], doppler['sum_ms']), (2, 4.5))
+        self.assertEqual((doppler['max_ms'], doppler['last_ms']), (4.0, 0.5))
+    
+    def test_laps_without_channel_use_process_label(self):
+        registry = StageTimingRegistry()
+        registry.laps().mark('fusion')
+        self.assertEqual(list(registry.snapshot()['stages']['fusion']), [ALL_CHANNELS])
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def test_snapshot_is_json_round_trippable(self):
+        registry = registry_with([1.0, 2.0, 3.0, 100.0])
+        registry.record('step1', 0.004, 'WWV 5 MHz')
+        snap = json.loads(json.dumps(registry.snapshot()))
+        
+        self.assertEqual(snap['service'], 'phase2')
+        s = snap['stages']['step1']['WWV 10 MHz']
+        self.assertEqual(s['count'], 4)
+        self.assertEqual((s['sum_ms'], s['mean_ms'], s['max_ms'], s['last_ms']), (106.0, 26.5, 100.0, 100.0))
+        self.assertEqual(s['buckets'], {'1': 1, '2.51189': 1, '3.16228': 1, '100': 1})
+        self.assertTrue(1.995 <= s['p50_ms'] <= 2.512)  # Rounded to us
+        self.assertEqual(snap['stages']['step1']['WWV 5 MHz']['sum_ms'], 4.0)
+    
+    def test_snapshots_of_several_processes_merge(self):
+        first = registry_with([1.0] * 3).snapshot()
+        second = registry_with([1.0, 50.0]).snapshot()
+        other_service = registry_with([5.0], service='fusion').snapshot()
+        samples = parse_samples(prometheus_text([first, second, other_service]))
+        
+        def value(name, service, **labels):
+            return [v for n, l, v in samples
+                    if n == f'{METRIC_NAME}_{name}' and l['service'] == service
+                    and all(l.get(k) == x for k, x in labels.items())]
+        
+        self.assertEqual(value('count', 'phase2'), [5.0])
+        self.assertAlmostEqual(value('sum', 'phase2')[0], 0.054)
+        self.assertEqual(value('bucket', 'phase2', le='0.001'), [4.0])
+        self.assertEqual(value('bucket', 'phase2', le='+Inf'), [5.0])
+        # Same stage and channel in another service stays its own series
+        self.assertEqual(value('count', 'fusion'), [1.0])
+        # Merged p99 sits in the 50 ms bucket, capped by the largest max
+        self.assertTrue(0.0398 <= value('quantile', 'phase2', quantile='0.99')[0] <= 0.05)
+
+
+class TestPrometheusText(unittest.TestCase):
+
+    def test_histogram_format(self):
+        registry = registry_with([0.05, 1.0, 1.0, 20.0, 20.0, 20.0, 150_000.0])
+        text = registry.prometheus_text()
+        lines = text.splitlines()
+        self.assertTrue(text.endswith('\n'))
+        self.assertEqual(lines[:2], [
+            f"# HELP {METRIC_NAME} Minute pipeline stage latency.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ])
+        self.assertIn(f"# TYPE {METRIC_NAME}_quantile gauge", lines)
+        
+        samples = parse_samples(text)
+        buckets = [(l['le'], v) for n, l, v in samples if n == f'{METRIC_NAME}_bucket']
+        # Cumulative, le in seconds, only non-empty buckets plus +Inf
+        self.assertEqual(buckets, [
+            ('5.0119e-05', 1.0), ('0.001', 3.0), ('0.0251189', 6.0), ('+Inf', 7.0)
+        ])
+        sums = {n: v for n, l, v in samples if n in (f'{METRIC_NAME}_sum', f'{METRIC_NAME}_count')}
+        self.assertAlmostEqual(sums[f'{METRIC_NAME}_sum'], 150.06205, places=5)
+        self.assertEqual(sums[f'{METRIC_NAME}_count'], 7.0)
+        
+        quantiles = {l['quantile']: v for n, l, v in samples if n == f'{METRIC_NAME}_quantile'}
+        self.assertEqual(set(quantiles), {'0.5', '0.99'})
+        self.assertTrue(0.0199 <= quantiles['0.5'] <= 0.0252)
+        self.assertTrue(100.0 <= quantiles['0.99'] <= 150.0)
+    
+    def test_label_values_are_escaped(self):
+        channel = 'odd "name"\\path\nline'
+        text = registry_with([1.0], stage='step\\1', channel=channel).prometheus_text()
+        self.assertIn(r'channel="odd \"name\"\\path\nline"', text)
+        self.assertIn(r'stage="step\\1"', text)
+        # Escaped newlines keep one sample per line
+        for _, labels, _ in parse_samples(text):
+            self.assertEqual(labels['channel'], r'odd \"name\"\\path\nline')
+    
+    def test_no_series(self):
+        samples = parse_samples(prometheus_text([]))
+        self.assertEqual(samples, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the event-driven recorder supervisor.
+"""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core.supervisor import Supervisor
+
+
+class TestSupervisor(unittest.TestCase):
+
+    def setUp(self):
+        self.supervisor = Supervisor()
+        self.events = []
+        for kind in ('stall', 'recovered', 'writer_error'):
+            self.supervisor.on(kind, lambda key, data, kind=kind: self.events.append((kind, key, time.monotonic())))
+        self.thread = threading.Thread(target=self.supervisor.run, daemon=True)
+    
+    def tearDown(self):
+        self.supervisor.stop()
+        self.thread.join(timeout=2)
+        self.assertFalse(self.thread.is_alive())
+        self.supervisor.close()
+    
+    def test_posted_event_wakes_loop(self):
+        self.supervisor.every('idle', 60.0, lambda: None)
+        self.thread.start()
+        time.sleep(0.05)
+        wakeups = self.supervisor.wakeups
+        posted = time.monotonic()
+        self.supervisor.post('writer_error', 7, RuntimeError('disk full'))
+        time.sleep(0.05)
+        self.assertEqual([(k, key) for k, key, _ in self.events], [('writer_error', 7)])
+        self.assertLess(self.events[0][2] - posted, 0.05)
+        self.assertLessEqual(self.supervisor.wakeups - wakeups, 2)
+    
+    def test_periodic_task_runs_on_deadline(self):
+        runs = []
+        self.supervisor.every('status', 0.05, lambda: runs.append(time.monotonic()), first_delay=0.0)
+        self.thread.start()
+        time.sleep(0.28)
+        self.assertGreaterEqual(len(runs), 5)
+        self.assertLessEqual(len(runs), 7)
+        # Idle loop: one wakeup per deadline (plus registration)
+        self.assertLessEqual(self.supervisor.wakeups, len(runs) + 2)
+    
+    def test_stall_detected_after_timeout_and_recovery(self):
+        self.supervisor.watch('ch1', timeout=0.1)
+        self.supervisor.watch('ch2', timeout=0.1)
+        self.thread.start()
+        
+        # ch1 keeps feeding, ch2 goes silent
+        fed_until = time.monotonic() + 0.3
+        while time.monotonic() < fed_until:
+            self.supervisor.feed('ch1')
+            time.sleep(0.02)
+        stalls = [(key, t) for kind, key, t in self.events if kind == 'stall']
+        self.assertEqual([key for key, _ in stalls], ['ch2'])
+        self.assertEqual(self.supervisor.stalls, 1)
+        
+        self.supervisor.feed('ch2')
+        time.sleep(0.05)
+        self.assertEqual(self.events[-1][:2], ('recovered', 'ch2'))
+        
+        # Silent again after recovering: a second stall
+        time.sleep(0.25)
+        self.assertEqual(self.supervisor.stalls, 3)  # ch1 (stopped feeding) and ch2 again
+    
+    def test_stop_is_signal_safe_before_run(self):
+        self.supervisor.stop()
+        self.thread.start()
+        self.thread.join(timeout=1)
+        self.assertFalse(self.thread.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared timing calibration state.
+"""
+
+import json
+import multiprocessing
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core import timing_calibrator
+from hf_timestd.core.checkpoint_service import checkpoint_path, get_checkpoint_service
+from hf_timestd.core.timing_calibrator import TimingCalibrator
+
+UPDATES_PER_WRITER = 15
+
+
+def detect(calibrator: TimingCalibrator, channel_name: str, k: int):
+    calibrator.update_from_detection(
+        station='WWV', frequency_mhz=10.0, channel_name=channel_name,
+        d_clock_ms=0.0, propagation_delay_ms=8.0, snr_db=25.0, confidence=0.9,
+        rtp_timestamp=k * 1_200_000, minute_boundary=1_700_000_000 + 60 * k
+    )
+
+
+def record_detections(data_root: str, channel_name: str, start, count: int = UPDATES_PER_WRITER):
+    """One recorder process: its own calibrator on the shared state file."""
+    calibrator = TimingCalibrator(data_root=Path(data_root))
+    start.wait()
+    for k in range(count):
+        detect(calibrator, channel_name, k)
+        if k % 4 == 3:
+            # Interleave merges with the other writer (atexit does not run here)
+            get_checkpoint_service().flush()
+    get_checkpoint_service().flush()
+
+
+class TestSharedCalibrationState(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.data_root = self._tmp.name
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def test_concurrent_writers_lose_no_updates(self):
+        ctx = multiprocessing.get_context('fork')
+        start = ctx.Event()
+        writers = [
+            ctx.Process(target=record_detections, args=(self.data_root, name, start))
+            for name in ('WWV 10 MHz', 'WWV 5 MHz')
+        ]
+        for w in writers:
+            w.start()
+        start.set()
+        for w in writers:
+            w.join(timeout=60)
+            self.assertEqual(w.exitcode, 0)
+        
+        merged = TimingCalibrator(data_root=Path(self.data_root))
+        self.assertEqual(merged.station_calibration['WWV'].n_samples, 2 * UPDATES_PER_WRITER)
+        self.assertEqual(set(merged.rtp_calibration), {'WWV 10 MHz', 'WWV 5 MHz'})
+    
+    def test_detections_are_merged_by_the_writer_thread(self):
+        writer = TimingCalibrator(data_root=Path(self.data_root))
+        reader = TimingCalibrator(data_root=Path(self.data_root))
+        with patch.object(timing_calibrator, 'write_checkpoint',
+                          wraps=timing_calibrator.write_checkpoint) as write:
+            for k in range(3):
+                detect(writer, 'WWV 10 MHz', k)
+            # The minute path only queues the merge
+            write.assert_not_called()
+            self.assertTrue(writer._checkpoints.is_pending(writer.state_file))
+            
+            writer._checkpoints.flush()
+        write.assert_called_once()
+        self.assertEqual(writer._unsaved, [])
+        
+        reader._load_state()
+        self.assertEqual(reader.station_calibration['WWV'].n_samples, 3)
+        self.assertEqual(reader.stats['bootstrap_detections'], 3)
+    
+    def test_merge_keeps_other_writers_updates(self):
+        first = TimingCalibrator(data_root=Path(self.data_root))
+        second = TimingCalibrator(data_root=Path(self.data_root))
+        detect(first, 'WWV 10 MHz', 0)
+        first._checkpoints.flush()
+        detect(second, 'WWV 5 MHz', 0)
+        second._checkpoints.flush()
+        
+        # The first calibrator's next merge builds on the second's write
+        detect(first, 'WWV 10 MHz', 1)
+        first._checkpoints.flush()
+        self.assertEqual(first.station_calibration['WWV'].n_samples, 3)
+        self.assertEqual(first.stats['bootstrap_detections'], 3)
+        self.assertEqual(set(first.rtp_calibration), {'WWV 10 MHz', 'WWV 5 MHz'})
+        
+        merged = TimingCalibrator(data_root=Path(self.data_root))
+        self.assertEqual(merged.station_calibration['WWV'].n_samples, 3)
+        self.assertEqual(merged.stats, first.stats)
+    
+    def test_legacy_json_is_removed_once_migrated(self):
+        legacy = Path(self.data_root) / 'state' / 'timing_calibration.json'
+        legacy.parent.mkdir(parents=True)
+        legacy.write_text(json.dumps({
+            'phase': 'calibrated',
+            'station_calibration': {'WWV': {
+                'propagation_delay_ms': 8.0, 'propagation_delay_std_ms': 1.0,
+                'n_samples': 10, 'last_updated': 0.0,
+            }},
+            'stats': {'calibrated_detections': 10},
+        }))
+        
+        calibrator = TimingCalibrator(data_root=Path(self.data_root))
+        self.assertEqual(calibrator.station_calibration['WWV'].n_samples, 10)
+        detect(calibrator, 'WWV 10 MHz', 0)
+        calibrator._checkpoints.flush()
+        
+        # Only the checkpoint is left, so deleting it resets the state
+        self.assertFalse(legacy.exists())
+        self.assertTrue(checkpoint_path(legacy).exists())
+        reloaded = TimingCalibrator(data_root=Path(self.data_root))
+        self.assertEqual(reloaded.station_calibration['WWV'].n_samples, 11)
+        self.assertEqual(reloaded.stats['calibrated_detections'], 11)
+        
+        checkpoint_path(legacy).unlink()
+        self.assertEqual(TimingCalibrator(data_root=Path(self.data_root)).station_calibration, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
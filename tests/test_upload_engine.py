@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent, resumable upload engine.
+
+Uses LocalTransport as the loopback stand-in for the PSWS SFTP server.
+"""
+
+import unittest
+import tempfile
+import shutil
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.upload_engine import LocalTransport, UploadJournal
+from hf_timestd.uploader import UploadManager
+
+
+class FlakyTransport(LocalTransport):
+    """LocalTransport that fails every put after the first `budget` files"""
+
+    def __init__(self, root, budget):
+        super().__init__(root)
+        self.budget = budget
+        self.puts = []
+
+    def put(self, local_path, remote_path):
+        if len(self.puts) >= self.budget:
+            raise OSError("connection reset")
+        self.puts.append(remote_path)
+        super().put(local_path, remote_path)
+
+
+class RecordingStorageManager:
+    """Records the (date, band) the upload manager reports back"""
+
+    def __init__(self):
+        self.attempted = []
+        self.completed = []
+
+    def mark_upload_attempted(self, date, band):
+        self.attempted.append((date, band))
+
+    def mark_upload_complete(self, date, band):
+        self.completed.append((date, band))
+
+
+class TestUploadEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.remote = self.test_dir / 'remote'
+        self.date = (datetime.now(timezone.utc) - timedelta(days=1)).date()
+
+        # Minimal Digital RF layout: properties + hourly data files per channel
+        self.dataset = self.test_dir / 'upload' / self.date.strftime('%Y%m%d') / 'OBS2025-01-01T00-00'
+        ch = self.dataset / 'ch0'
+        (ch / '2025-01-01T00-00-00').mkdir(parents=True)
+        (ch / 'drf_properties.h5').write_bytes(b'properties')
+        for hour in range(12):
+            (ch / '2025-01-01T00-00-00' / f'rf@{1735689600 + hour * 3600}.000.h5').write_bytes(
+                bytes([hour]) * (10000 + hour))
+
+        self.config = {
+            'protocol': 'local',
+            'local_root': str(self.remote),
+            'host': 'localhost',
+            'user': 'S000000',
+            'max_concurrent_uploads': 3,
+            'retry_backoff_base': 0,
+            'create_trigger': True,
+            'queue_file': self.test_dir / 'queue' / 'queue.json',
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _enqueue(self, manager):
+        manager.enqueue(self.dataset, {'date': self.date.isoformat(), 'instrument_id': '1'})
+
+    def test_upload_and_verify(self):
+        manager = UploadManager(self.config, storage_manager=None)
+        self._enqueue(manager)
+        manager.process_queue()
+
+        status = manager.get_status()
+        self.assertEqual(status['completed'], 1)
+        self.assertEqual(status['backlog_days'], 0)
+        self.assertEqual(status['files_sent'], 13)
+        self.assertGreater(status['throughput_mbps'], 0)
+
+        for src in self.dataset.rglob('*.h5'):
+            dst = self.remote / self.dataset.name / src.relative_to(self.dataset)
+            self.assertEqual(src.read_bytes(), dst.read_bytes())
+        self.assertTrue((self.dataset.parent / '.upload_complete').exists())
+        self.assertEqual(len(list(self.remote.glob('cOBS*'))), 1)  # PSWS trigger dir
+
+    def test_resume_after_interruption(self):
+        manager = UploadManager(self.config, storage_manager=None)
+        self._enqueue(manager)
+        manager.engine.transport = FlakyTransport(self.remote, budget=5)
+        manager.process_queue()
+
+        self.assertEqual(manager.get_status()['pending'], 1)
+        self.assertEqual(manager.get_backlog_days(), 1)
+
+        # New process: queue is rebuilt from the journal
+        restarted = UploadManager(self.config, storage_manager=None)
+        flaky = FlakyTransport(self.remote, budget=100)
+        restarted.engine.transport = flaky
+        restarted.process_queue()
+
+        self.assertEqual(restarted.get_status()['completed'], 1)
+        self.assertEqual(len(flaky.puts), 13 - 5)  # Only the missing files were re-sent
+
+    def test_caller_date_is_kept(self):
+        storage = RecordingStorageManager()
+        manager = UploadManager(self.config, storage_manager=storage)
+        # A datetime.date, as the storage manager keys its state by it
+        manager.enqueue(self.dataset, {'date': self.date, 'band': 'WWV_10', 'instrument_id': '1'})
+
+        task = manager.queue[0]
+        self.assertIs(task.metadata['date'], self.date)
+        self.assertEqual(task.metadata['upload_date'], self.date.isoformat())
+
+        manager.engine.transport = FlakyTransport(self.remote, budget=5)
+        manager.process_queue()
+        self.assertEqual(storage.attempted, [(self.date, 'WWV_10')])
+        self.assertEqual(storage.completed, [])
+
+        # Replayed from the journal the date is a string, the backlog unchanged
+        restarted = UploadManager(self.config, storage_manager=storage)
+        self.assertEqual(restarted.queue[0].metadata['upload_date'], self.date.isoformat())
+        self.assertEqual(restarted.get_status()['oldest_pending_date'], self.date.isoformat())
+        self.assertEqual(restarted.get_backlog_days(), 1)
+        restarted.process_queue()
+        self.assertEqual(storage.completed, [(self.date.isoformat(), 'WWV_10')])
+
+    def test_journal_is_append_only(self):
+        manager = UploadManager(self.config, storage_manager=None)
+        self._enqueue(manager)
+        manager.process_queue()
+
+        journal = UploadJournal(self.config['queue_file'].with_suffix('.journal'))
+        ops = [line.split('"op":"')[1].split('"')[0]
+               for line in journal.path.read_text().splitlines()]
+        self.assertEqual(ops[0], 'enqueue')
+        self.assertEqual(ops.count('file'), 13)
+        self.assertEqual(ops[-1], 'done')
+
+        manager.clear_completed()
+        self.assertEqual(journal.replay(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
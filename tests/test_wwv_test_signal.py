@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for WWV/WWVH test signal detection: cached template spectra and
+polyphase resampling of the analysis span.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+from scipy import signal
+
+src_path = str(Path(__file__).parent.parent / 'src')
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from hf_timestd.core import wwv_test_signal
+from hf_timestd.core.wwv_test_signal import WWVTestSignalDetector, WWVTestSignalGenerator
+
+SAMPLE_RATE = 20000
+CHIRP_NAMES = ('short_up', 'short_down', 'long_up', 'long_down')
+
+
+def synthetic_minute(sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """AM IQ for minute 8: the test signal from the minute boundary, then carrier only."""
+    audio = WWVTestSignalGenerator(sample_rate).generate_full_signal(include_voice=True)
+    audio = np.concatenate([audio, np.zeros(60 * sample_rate - len(audio))])
+    return (1.0 + 0.3 * audio / np.max(np.abs(audio))).astype(np.complex64)
+
+
+class TestTemplateSpectrumCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.minute = synthetic_minute()
+    
+    def setUp(self):
+        self.detector = WWVTestSignalDetector(SAMPLE_RATE)
+    
+    def test_cache_warmed_for_nominal_segments(self):
+        names = {name for name, _ in self.detector._template_spectra}
+        self.assertEqual(names, {'multitone', *CHIRP_NAMES})
+        self.assertEqual(len(self.detector._template_spectra), 5)
+    
+    def test_detect_reuses_cached_spectra(self):
+        cached = dict(self.detector._template_spectra)
+        
+        for _ in range(2):
+            with patch.object(wwv_test_signal, '_rfft', wraps=wwv_test_signal._rfft) as rfft:
+                result = self.detector.detect(self.minute, 8, SAMPLE_RATE)
+            self.assertTrue(result.detected)
+            self.assertEqual(result.station, 'WWV')
+            # One transform of the multi-tone search segment and one shared
+            # by the four chirp filters; no template is transformed again
+            self.assertEqual(rfft.call_count, 2)
+            self.assertEqual(self.detector._template_spectra.keys(), cached.keys())
+            for key, spectrum in cached.items():
+                self.assertIs(self.detector._template_spectra[key], spectrum)
+    
+    def test_matched_filter_matches_correlate(self):
+        rng = np.random.default_rng(0)
+        segment = rng.normal(size=len(self.detector.short_chirp_up) + 777)
+        
+        before = len(self.detector._template_spectra)
+        correlations = self.detector._matched_filter(segment, CHIRP_NAMES)
+        # Off-nominal length: the short chirps get a spectrum at the new FFT
+        # size, the long ones do not fit and need none
+        self.assertEqual(len(self.detector._template_spectra), before + 2)
+        
+        for name in ('short_up', 'short_down'):
+            with self.subTest(name=name):
+                expected = signal.correlate(segment, self.detector._templates[name], mode='valid')
+                np.testing.assert_allclose(correlations[name], expected, atol=1e-9)
+        self.assertEqual((len(correlations['long_up']), len(correlations['long_down'])), (0, 0))
+        
+        with patch.object(wwv_test_signal, '_rfft', wraps=wwv_test_signal._rfft) as rfft:
+            self.detector._matched_filter(segment, CHIRP_NAMES)
+        self.assertEqual(rfft.call_count, 1)
+        self.assertEqual(len(self.detector._template_spectra), before + 2)
+    
+    def test_non_test_minute_does_no_work(self):
+        with patch.object(wwv_test_signal, '_rfft') as rfft:
+            result = self.detector.detect(self.minute, 9, SAMPLE_RATE)
+        self.assertFalse(result.detected)
+        rfft.assert_not_called()
+
+
+class TestAnalysisResampling(unittest.TestCase):
+
+    def setUp(self):
+        self.detector = WWVTestSignalDetector(SAMPLE_RATE)
+    
+    def test_native_rate_is_not_resampled(self):
+        minute = synthetic_minute()
+        with patch.object(wwv_test_signal.signal, 'resample_poly') as resample_poly:
+            audio = self.detector._extract_analysis_audio(minute, SAMPLE_RATE)
+        resample_poly.assert_not_called()
+        self.assertEqual(len(audio), int(WWVTestSignalDetector.ANALYSIS_END * SAMPLE_RATE))
+        self.assertAlmostEqual(np.max(np.abs(audio)), 1.0)
+    
+    def test_other_rates_resample_only_the_analysis_span(self):
+        cached = dict(self.detector._template_spectra)
+        
+        for input_rate, up, down in ((16000, 5, 4), (24000, 5, 6)):
+            with self.subTest(input_rate=input_rate):
+                minute = synthetic_minute(input_rate)
+                with patch.object(wwv_test_signal.signal, 'resample_poly',
+                                  wraps=signal.resample_poly) as resample_poly:
+                    result = self.detector.detect(minute, 44, input_rate)
+                
+                resample_poly.assert_called_once()
+                span, call_up, call_down = resample_poly.call_args.args
+                self.assertEqual(len(span), int(WWVTestSignalDetector.ANALYSIS_END * input_rate))
+                self.assertEqual((call_up, call_down), (up, down))
+                
+                self.assertTrue(result.detected)
+                self.assertEqual(result.station, 'WWVH')
+                # Audio comes out at the detector rate: the warmed spectra fit
+                self.assertEqual(self.detector._template_spectra.keys(), cached.keys())
+                for key, spectrum in cached.items():
+                    self.assertIs(self.detector._template_spectra[key], spectrum)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,11 +18,12 @@
 import express from 'express';
 import cors from 'cors';
 import fs from 'fs';
+import net from 'net';
 import { join, basename, dirname } from 'path';
 import { parse as csvParse } from 'csv-parse/sync';
 import { fileURLToPath } from 'url';
 import toml from 'toml';
-import { exec, execSync, spawn } from 'child_process';
+import { exec, execSync } from 'child_process';
 import { promisify } from 'util';
 import { WebSocketServer } from 'ws';
 import { GRAPEPaths, channelNameToKey } from './grape-paths.js';
@@ -2546,6 +2547,55 @@ app.get('/spectrograms/:channel/:filename', (req, res) => {
   }
 });
 
+/**
+ * Product service (hf_timestd.core.product_service) client
+ *
+ * Long-lived Python process on a Unix socket speaking newline-delimited
+ * JSON-RPC 2.0, so spectrogram renders and time-series reads don't pay
+ * interpreter start-up and import costs per request.
+ */
+const productServiceSocket = process.env.TIMESTD_PRODUCT_SOCKET ||
+  join(dataRoot, 'state', 'product-service.sock');
+let productServiceRequestId = 0;
+
+function callProductService(method, params = {}, timeoutMs = 30000) {
+  return new Promise((resolve, reject) => {
+    const id = ++productServiceRequestId;
+    const conn = net.createConnection(productServiceSocket);
+    let buffer = '';
+    
+    const timer = setTimeout(() => {
+      conn.destroy();
+      reject(new Error(`Product service ${method} timed out after ${timeoutMs} ms`));
+    }, timeoutMs);
+    
+    conn.on('connect', () => {
+      conn.write(JSON.stringify({ jsonrpc: '2.0', id, method, params }) + '\n');
+    });
+    conn.on('data', (chunk) => {
+      buffer += chunk;
+      const newline = buffer.indexOf('\n');
+      if (newline < 0) return;
+      clearTimeout(timer);
+      conn.end();
+      try {
+        const response = JSON.parse(buffer.slice(0, newline));
+        if (response.error) {
+          reject(new Error(response.error.message));
+        } else {
+          resolve(response.result);
+        }
+      } catch (e) {
+        reject(e);
+      }
+    });
+    conn.on('error', (err) => {
+      clearTimeout(timer);
+      reject(err);
+    });
+  });
+}
+
 /**
  * POST /api/v1/spectrograms/regenerate
  * Trigger spectrogram regeneration for all channels or specific channel
@@ -2556,57 +2606,15 @@ app.get('/spectrograms/:channel/:filename', (req, res) => {
  */
 app.post('/api/v1/spectrograms/regenerate', async (req, res) => {
   try {
-    const channel = req.query.channel || '';
-    const date = req.query.date || new Date().toISOString().slice(0, 10).replace(/-/g, '');
+    const params = {};
+    if (req.query.channel) params.channel = req.query.channel;
+    params.date = req.query.date || new Date().toISOString().slice(0, 10).replace(/-/g, '');
     
-    // Get receiver grid from config
-    const receiverGrid = config.recorder?.receiver_grid || config.recorder?.station_grid || 'EM28ww';
-    
-    // Build Python command
-    const pythonScript = `
-from src.grape_recorder.grape.carrier_spectrogram import generate_all_channel_spectrograms, CarrierSpectrogramGenerator
-from pathlib import Path
-import json
-
-data_root = Path('${dataRoot}')
-channel = '${channel}'
-date = '${date}'
-receiver_grid = '${receiverGrid}'
-
-if channel:
-    gen = CarrierSpectrogramGenerator(data_root, channel, receiver_grid)
-    result = gen.generate_daily(date)
-    print(json.dumps({'status': 'ok', 'channel': channel, 'path': str(result)}))
-else:
-    results = generate_all_channel_spectrograms(data_root, receiver_grid, date)
-    print(json.dumps({'status': 'ok', 'count': len(results), 'paths': [str(p) for p in results]}))
-`;
-    
-    const python = spawn('python3', ['-c', pythonScript], {
-      cwd: join(__dirname, '..'),
-      env: { ...process.env, PYTHONPATH: join(__dirname, '..') }
-    });
-    
-    let stdout = '';
-    let stderr = '';
-    
-    python.stdout.on('data', (data) => { stdout += data; });
-    python.stderr.on('data', (data) => { stderr += data; });
-    
-    python.on('close', (code) => {
-      if (code === 0) {
-        try {
-          const result = JSON.parse(stdout.trim().split('\n').pop());
-          res.json(result);
-        } catch (e) {
-          res.json({ status: 'ok', output: stdout });
-        }
-      } else {
-        res.status(500).json({ error: 'Regeneration failed', stderr, code });
-      }
-    });
+    const result = await callProductService('spectrogram.regenerate', params, 300000);
+    res.json(result);
   } catch (err) {
-    res.status(500).json({ error: err.message });
+    const status = err.code === 'ENOENT' || err.code === 'ECONNREFUSED' ? 503 : 500;
+    res.status(status).json({ error: 'Regeneration failed', detail: err.message });
   }
 });
 
@@ -2618,27 +2626,10 @@ function startSpectrogramAutoRegen() {
   const regenAll = async () => {
     try {
       const date = new Date().toISOString().slice(0, 10).replace(/-/g, '');
-      const receiverGrid = config.recorder?.receiver_grid || config.recorder?.station_grid || 'EM28ww';
-      
-      const pythonScript = `
-from src.grape_recorder.grape.carrier_spectrogram import generate_all_channel_spectrograms
-from pathlib import Path
-generate_all_channel_spectrograms(Path('${dataRoot}'), '${receiverGrid}', '${date}')
-print('Spectrograms regenerated')
-`;
-      
-      const python = spawn('python3', ['-c', pythonScript], {
-        cwd: join(__dirname, '..'),
-        env: { ...process.env, PYTHONPATH: join(__dirname, '..') }
-      });
-      
-      python.on('close', (code) => {
-        if (code === 0) {
-          console.log(`[${new Date().toISOString()}] Auto-regenerated spectrograms`);
-        }
-      });
+      const result = await callProductService('spectrogram.regenerate', { date }, 600000);
+      console.log(`[${new Date().toISOString()}] Auto-regenerated ${result.count} spectrograms`);
     } catch (err) {
-      console.error('Spectrogram auto-regen error:', err);
+      console.error('Spectrogram auto-regen error:', err.message);
     }
   };
   